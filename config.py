@@ -34,6 +34,44 @@ VERSION = "1.1.6"
 DEBUG = os.environ['SERVER_SOFTWARE'].startswith('Dev')
 logging.info("Starting application in DEBUG mode: %s", DEBUG)
 
+# How events are keyed in the datastore.
+#
+# "flat": every event is a root entity, found through the service/start
+# composite indexes in index.yaml.
+#
+# "bucketed": every event is a child of a per-service, per-day bucket key
+# and named by its timestamp, so reading a range of a service's events is
+# a scan over a range of keys. The service, start and informational
+# properties are then left unindexed, which cuts the index rows written
+# for every event. Existing events are moved over by /tasks/relayout.
+EVENT_LAYOUT = "flat"
+
+# The number of tasks the minutely ping is split into. Each service
+# belongs to one shard, and each shard pings its due services in its own
+# task, so more shards ping more services each minute.
+PING_SHARDS = 4
+
+# The most of a pinged page that a service's pattern is searched for
+PATTERN_MAX_BYTES = 1024 * 1024
+
+# Whether API responses are gzipped for clients that accept it. App Engine
+# compresses responses in production and drops any Content-Encoding the
+# app sets, so only turn this on when serving through something else,
+# such as the development server behind a proxy.
+GZIP_RESPONSES = False
+
+# Admission control for API writes, see utils/admission.py.
+#
+# Each user may make API_RATE_LIMIT writes a second, with bursts of up to
+# API_RATE_BURST. At most API_MAX_CONCURRENT_WRITES writes run at once;
+# low priority writes, such as batches and informational events, get half
+# of that, and are shed altogether while writes average more than
+# API_SHED_LATENCY seconds. Set a limit to None to turn it off.
+API_RATE_LIMIT = 5
+API_RATE_BURST = 50
+API_MAX_CONCURRENT_WRITES = 20
+API_SHED_LATENCY = 2.0
+
 SITE = {
     "html_type": "text/html",
     "charset": "utf-8",
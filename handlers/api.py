@@ -41,21 +41,60 @@ import cgi
 import urllib
 import logging
 import jsonpickle
-import status_images
+import simplejson
+from utils import images
 
 from wsgiref.handlers import format_date_time
-from time import mktime
+from time import mktime, sleep
 
 from google.appengine.ext import webapp
 from google.appengine.api import users
 from google.appengine.ext import db
+try:
+    from google.appengine.api import taskqueue
+except ImportError:
+    from google.appengine.api.labs import taskqueue
 
 from handlers import restful
 from utils import authorized
 from utils import slugify
-from models import Status, Event, Service, Level
+from utils import versions
+from utils import admission
+from utils import patterns
+from models import Status, Event, Service, Level, DailySummary
+from models import StatusInterval, DeletionJob, Change, PingSchedule
+from models import CheckSeries, CHECK_RESULTS
 import config
 
+# Events returned by one page of the Events List resource
+DEFAULT_EVENTS_PER_PAGE = 100
+MAX_EVENTS_PER_PAGE = 1000
+
+# Events accepted by one request to the Events Batch resource
+MAX_EVENTS_PER_BATCH = 500
+
+# Images returned by one page of the Status Images resource
+MAX_IMAGES_PER_PAGE = 500
+
+# Days of summaries returned by the Dashboard resource
+DEFAULT_DASHBOARD_DAYS = 5
+MAX_DASHBOARD_DAYS = 31
+
+# The longest range of ping results the Service Checks resource returns
+MAX_CHECKS_DAYS = 1
+
+# Changes returned by one poll of the Changes resource, and how long a
+# poll may wait for one
+DEFAULT_CHANGES_PER_PAGE = 100
+MAX_CHANGES_PER_PAGE = 1000
+MAX_CHANGES_WAIT = 20
+
+# Events read per query batch by the NDJSON exports, and the size after
+# which a response stops and hands back a cursor. App Engine buffers the
+# whole response, so this is what keeps memory flat.
+EXPORT_BATCH_SIZE = 200
+MAX_EXPORT_BYTES = 4 * 1024 * 1024
+
 def aware_to_naive(d):
     """Convert an aware date to an naive date, in UTC"""
     offset = d.utcoffset()
@@ -64,12 +103,100 @@ def aware_to_naive(d):
         d = d - offset
     return d
 
+def encode_search_cursor(after):
+    """ Turn the after argument of Event.search into a cursor string"""
+    when, count = after
+    delta = when - datetime(1970, 1, 1)
+    micros = (delta.days * 86400 + delta.seconds) * 1000000 + \
+        delta.microseconds
+    return "%d-%d" % (micros, count)
+
+def decode_search_cursor(cursor):
+    micros, count = cursor.split("-")
+    when = datetime(1970, 1, 1) + timedelta(microseconds=int(micros))
+    return (when, int(count))
+
+def encode_changes_token(seq, gaps):
+    """ Turn the last sequence number seen and the gaps returned by
+    Change.since into a Changes token, e.g. "1042" or "1042.1040-1277759826"
+    """
+    parts = [str(seq)] + ["%d-%d" % (g, t) for g, t in sorted(gaps.items())]
+    return ".".join(parts)
+
+def decode_changes_token(token):
+    """ The sequence number and gaps in a Changes token. Raises ValueError
+    for a malformed one. """
+    parts = token.split(".")
+    gaps = {}
+    for part in parts[1:]:
+        gap, noticed = part.split("-")
+        gaps[int(gap)] = int(noticed)
+    return int(parts[0]), gaps
+
+def start_deletion(kind, entity):
+    """ Queue the background deletion of a service or status, which must
+    already be marked as deleting, and return the job. """
+    job = DeletionJob(kind=kind, target=str(entity.key()), slug=entity.slug)
+    job.put()
+    taskqueue.add(url='/tasks/delete', params={'job': job.key().id()})
+    return job
+
+def event_priority(handler):
+    """ Informational events are shed before the ones that change a
+    service's status """
+    if handler.request.get("informational", default_value=None) == "true":
+        return admission.LOW
+    return admission.NORMAL
+
+# The version tags each kind of resource depends on, for restful.conditional
+
+# Editing a status bumps the tags of the services it appears in, see
+# Status.bump_generation, so only the status resources depend on its tag
+
+def services_tags(handler, version):
+    return [versions.SERVICES]
+
+def service_tags(handler, version, service_slug, *args):
+    return [versions.service(service_slug)]
+
+def search_tags(handler, version):
+    slugs = handler.request.get('services', default_value=None)
+    if not slugs:
+        return services_tags(handler, version)
+    return [versions.service(slug) for slug in sorted(set(slugs.split(",")))
+        if slug]
+
+def export_tags(handler, version, service_slug=None):
+    if service_slug:
+        return service_tags(handler, version, service_slug)
+    return services_tags(handler, version)
+
+def statuses_tags(handler, version, status_slug=None):
+    if status_slug:
+        return [versions.status(status_slug)]
+    return [versions.STATUSES]
+
+def static_tags(handler, version):
+    # Only changes when a new version of the app is deployed
+    return []
+
+def uptime_tags(handler, version, service_slug):
+    # Without an end in the past, the report changes as time goes by
+    end = handler.request.get('end', default_value=None)
+    try:
+        if not end or aware_to_naive(parse(end)) > datetime.utcnow():
+            return None
+    except:
+        return None
+    return [versions.service(service_slug)]
+
 class NotFoundHandler(restful.Controller):
     def get(self):
         logging.debug("NotFoundAPIHandler#get")
         self.error(404, "Can't find resouce")
 
 class ServicesListHandler(restful.Controller):
+    @restful.conditional(services_tags)
     def get(self, version):
         logging.debug("ServicesListHandler#get")
         if (self.valid_version(version)):
@@ -77,9 +204,13 @@ class ServicesListHandler(restful.Controller):
             query = Service.all().order('name')
             data = []
 
+            # Statuses come from the registry instead of a get per service
+            statuses = dict((s.slug, s) for s in Status.ordered())
+            options = self.rest_options()
 
-            for s in query:
-                data.append(s.rest(self.base_url(version)))
+            for s in Service.live(query):
+                data.append(s.rest(self.base_url(version), statuses,
+                    **options))
 
             data = { "services": data }
 
@@ -99,31 +230,105 @@ class ServicesListHandler(restful.Controller):
             serviceurl = self.request.get('serviceurl', default_value=None)
             pattern = self.request.get('pattern', default_value=None)
             freq = self.request.get('freq', default_value=None)
+
+            if pattern:
+                try:
+                    patterns.validate(pattern)
+                except patterns.InvalidPattern, e:
+                    self.error(400, "Invalid Pattern: %s" % e)
+                    return
             
             if name and description:
                 slug = slugify.slugify(name)
-                existing_s = Service.get_by_slug(slug)
+                existing_s = Service.get_by_slug(slug, deleting=True)
 
+                if existing_s and existing_s.deleting:
+                    self.error(409, "Service %s is being deleted" % slug)
                 # Update existing resource
-                if existing_s:
-                    existing_s.description = description
-                    existing_s.serviceurl = serviceurl
-                    existing_s.pattern = pattern
-                    existing_s.freq = freq
-                    existing_s.put()
-                    self.json(existing_s.rest(self.base_url(version)))
+                elif existing_s:
+                    def change(service):
+                        service.description = description
+                        service.serviceurl = serviceurl
+                        service.pattern = pattern
+                        service.freq = freq and int(freq) or None
+                        service.schedule_check()
+
+                    existing_s.update(change)
+                    patterns.forget(existing_s.key())
+                    PingSchedule.changed(existing_s.probe_shard)
+                    Service.forget_slug(slug)
+                    Service.bump_version(slug)
+                    Change.record(existing_s, "service")
+                    self.json(existing_s.rest(self.base_url(version),
+                        **self.rest_options()))
                 # Create new service
                 else:
                     s = Service(name=name, slug=slug, description=description, serviceurl=serviceurl)
+                    s.set_current(None)
+                    s.schedule_check()
                     s.put()
-                    self.json(s.rest(self.base_url(version)))
+                    PingSchedule.changed(s.probe_shard)
+                    Service.forget_slug(slug)
+                    Service.bump_version(slug)
+                    Change.record(s, "service")
+                    self.json(s.rest(self.base_url(version),
+                        **self.rest_options()))
             else:
                 self.error(400, "Bad Data: Name: %s, Description: %s" % (name, description))
         else:
             self.error(404, "API Version %s not supported" % version)
 
             
+class DashboardHandler(restful.Controller):
+    @restful.conditional(services_tags, daily=True)
+    def get(self, version):
+        logging.debug("DashboardHandler#get")
+
+        if (self.valid_version(version)):
+            try:
+                count = int(self.request.get('days',
+                    default_value=DEFAULT_DASHBOARD_DAYS))
+            except ValueError:
+                self.error(400, "Days must be a number")
+                return
+
+            if count < 0 or count > MAX_DASHBOARD_DAYS:
+                self.error(400, "Days must be between 0 and %d"
+                    % MAX_DASHBOARD_DAYS)
+                return
+
+            base_url = self.base_url(version)
+            services = Service.live(Service.all().order('name').fetch(1000))
+
+            # One registry read and one batch get of summaries, no matter
+            # how many services there are
+            statuses = dict((s.slug, s) for s in Status.ordered())
+
+            end_date = date.today() - timedelta(days=1)
+            days = DailySummary.days_between(end_date -
+                timedelta(days=count - 1), end_date)
+            summaries = DailySummary.get_days([s.key() for s in services],
+                days)
+            DailySummary.carry(services, summaries)
+
+            data = []
+            options = self.rest_options()
+            for service in services:
+                m = service.rest(base_url, statuses, **options)
+                m["days"] = [summaries[(service.key(), d)].rest(base_url)
+                    for d in days]
+                data.append(m)
+
+            self.json({
+                "days": [d.isoformat() for d in days],
+                "services": data,
+            })
+        else:
+            self.error(404, "API Version %s not supported" % version)
+
+
 class ServiceInstanceHandler(restful.Controller):
+    @restful.conditional(service_tags)
     def get(self, version, service_slug):
         logging.debug("ServiceInstanceHandler#get")
         
@@ -131,7 +336,8 @@ class ServiceInstanceHandler(restful.Controller):
             service = Service.get_by_slug(service_slug)
 
             if (service):
-                self.json(service.rest(self.base_url(version)))
+                self.json(service.rest(self.base_url(version),
+                    **self.rest_options()))
             else:
                 self.error(404, "Service %s does not exist" % service_slug)
         else:
@@ -146,29 +352,51 @@ class ServiceInstanceHandler(restful.Controller):
         serviceurl = self.request.get('serviceurl', default_value=None)
         pattern = self.request.get('pattern', default_value=None)
         freq = self.request.get('freq', default_value=None)
+
+        if pattern:
+            try:
+                patterns.validate(pattern)
+            except patterns.InvalidPattern, e:
+                self.error(400, "Invalid Pattern: %s" % e)
+                return
         
         if (self.valid_version(version)):
             service = Service.get_by_slug(service_slug)
             if service:
-                if description:
-                    service.description = description
-                
-                if name:
-                    service.name = name
+                def change(service):
+                    if description:
+                        service.description = description
                     
-                if serviceurl:
-                    service.serviceurl = serviceurl
-                
-                if pattern:
-                    service.pattern = pattern
+                    if name:
+                        service.name = name
+                        
+                    if serviceurl:
+                        service.serviceurl = serviceurl
+                    
+                    if pattern:
+                        service.pattern = pattern
+
+                    if freq:
+                        service.freq = int(freq)
 
-                if freq:
-                    service.freq = int(freq)
+                    if serviceurl or freq:
+                        service.schedule_check()
                 
                 if name or description or serviceurl or pattern or freq:
-                    service.put()
+                    # Saved in a transaction on a fresh copy, so a ping or
+                    # event recorded meanwhile isn't overwritten
+                    service.update(change)
+                    if pattern:
+                        patterns.forget(service.key())
+                    if serviceurl or freq:
+                        PingSchedule.changed(service.probe_shard)
+                    Service.forget_slug(service.slug)
+                    Service.bump_version(service.slug)
+                    Change.record(service, "service")
                     
-                self.json(service.rest(self.base_url(version)))   
+                self.json(service.rest(self.base_url(version),
+                    
+                    **self.rest_options()))   
             else:
                 self.error(404, "Service %s does not exist" % service_slug)
         else:
@@ -183,11 +411,23 @@ class ServiceInstanceHandler(restful.Controller):
             service = Service.get_by_slug(service_slug)
             
             if service:
-                query = Event.all(keys_only=True)
-                query.filter('service =', service)
-                db.delete(query)
-                service.delete()
-                self.json(service.rest(self.base_url(version)))
+                # Events are deleted in the background, so a busy service
+                # can't time out the request
+                def change(service):
+                    service.deleting = True
+                    service.next_check_at = None
+
+                service.update(change)
+                Service.bump_version(service.slug)
+                Change.record(service, "deleted")
+                job = start_deletion("service", service)
+
+                data = service.rest(self.base_url(version),
+                    **self.rest_options())
+                data["job"] = job.rest(self.base_url(version))
+                self.response.set_status(202)
+                self.response.headers["Location"] = data["job"]["url"]
+                self.json(data)
             else:
                 self.error(404, "Service %s not found" % service_slug)
         else:
@@ -198,6 +438,7 @@ class ServiceInstanceHandler(restful.Controller):
 
 
 class EventsListHandler(restful.Controller):
+    @restful.conditional(service_tags)
     def get(self, version, service_slug):
         logging.debug("StatusesListHandler#get")
         
@@ -207,38 +448,77 @@ class EventsListHandler(restful.Controller):
             if service:
                 start = self.request.get('start', default_value=None)
                 end = self.request.get('end', default_value=None)
+                limit = self.request.get('limit', default_value=None)
+                cursor = self.request.get('cursor', default_value=None)
                                  
-                query = Event.all().filter('service =', service)
+                _start = None
+                _end = None
                         
                 if start:
                     try:
                         _start = aware_to_naive(parse(start))
-                        query.filter("start >= ", _start)
                     except:
                         self.error(400, "Invalid Date: %s" % start)
                         return
 
                 if end:
                     try:
-                        _end  = aware_to_naive(parse(end))
-                        query.filter("start <=", _end)
+                        # The end of the range is inclusive
+                        _end  = aware_to_naive(parse(end)) + \
+                            timedelta(microseconds=1)
                     except:
                         self.error(400, "Invalid Date: %s" % end)
                         return
+
+                if limit:
+                    try:
+                        limit = int(limit)
+                        if limit < 1 or limit > MAX_EVENTS_PER_PAGE:
+                            raise ValueError
+                    except ValueError:
+                        self.error(400, "Invalid Limit: %s" % limit)
+                        return
+                else:
+                    limit = DEFAULT_EVENTS_PER_PAGE
                         
-                query.order('-start')
+                query = Event.range(service, _start, _end)
+
+                if cursor:
+                    try:
+                        query.with_cursor(cursor)
+                    except:
+                        self.error(400, "Invalid Cursor: %s" % cursor)
+                        return
                         
                 if query:
                     data = []
                     
-                    # Bizarre nonsense involving the query being built. 
-                    # For large datasets, must assign a max value to the fetch.
-                    query = query.fetch(100)
+                    events = Event.prefetch(query.fetch(limit))
+                    options = self.rest_options()
                     
-                    for s in query:
-                        data.append(s.rest(self.base_url(version)))
+                    for s in events:
+                        data.append(s.rest(self.base_url(version),
+                            **options))
+
+                    data = { "events": data, "next": None }
 
-                    data = { "events": data }
+                    # A full page means there may be more, so hand back a
+                    # link that continues from the end of this one
+                    if len(events) == limit:
+                        params = {"limit": limit, "cursor": query.cursor()}
+                        if start:
+                            params["start"] = start
+                        if end:
+                            params["end"] = end
+                        # An empty embed means something, so keep those
+                        # even when empty
+                        for name in ["fields", "embed"]:
+                            value = self.request.get(name, default_value=None)
+                            if value is not None:
+                                params[name] = value.encode("utf-8")
+                        data["next"] = self.base_url(version) + \
+                            service.resource_url() + "/events?" + \
+                            urllib.urlencode(params)
 
                     self.json(data) 
                 else:
@@ -249,7 +529,7 @@ class EventsListHandler(restful.Controller):
             self.error(404, "API Version %s not supported" % version)
         
 
-    @authorized.api("admin")
+    @authorized.api("admin", priority=event_priority)
     def post(self, version, service_slug):
         logging.debug("EventsListHandler#post")
         
@@ -265,20 +545,20 @@ class EventsListHandler(restful.Controller):
                     if not status_slug:
                         event = service.current_event()
                         if event:
-                            status = event.status
+                            status = event.cached_status()
                         else:
                             status = Status.default()
                     else:
                         status = Status.get_by_slug(status_slug)
 
                     if status:
-                        e = Event(status=status, service=service,
-                                message=message)
-
-                        e.informational = informational and informational == "true"
+                        e = Event.create(service, status, message,
+                            informational and informational == "true")
 
                         e.put()
-                        self.json(e.rest(self.base_url(version)))
+                        service.record_event(e)
+                        self.json(e.rest(self.base_url(version),
+                            **self.rest_options()))
                     else:
                         self.error(404, "Status %s not found" % status_slug)
                 else:
@@ -290,7 +570,406 @@ class EventsListHandler(restful.Controller):
         
 
         
+class EventsBatchHandler(restful.Controller):
+    @authorized.api("admin", priority=admission.LOW)
+    def post(self, version):
+        logging.debug("EventsBatchHandler#post")
+
+        if not self.valid_version(version):
+            self.error(404, "API Version %s not supported" % version)
+            return
+
+        try:
+            items = simplejson.loads(self.request.get("events") or
+                self.request.body)
+        except ValueError:
+            self.error(400, "Events must be a JSON array")
+            return
+
+        if not isinstance(items, list):
+            self.error(400, "Events must be a JSON array")
+            return
+
+        if len(items) > MAX_EVENTS_PER_BATCH:
+            self.error(400, "At most %d events are allowed per batch"
+                % MAX_EVENTS_PER_BATCH)
+            return
+
+        slugs = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            slug = item.get("service")
+            if isinstance(slug, basestring) and slug and slug not in slugs:
+                slugs.append(slug)
+        services = Service.get_by_slugs(slugs)
+
+        def failure(index, code, message):
+            return {"error": True, "code": code, "message": message,
+                "index": index}
+
+        # Events without a status keep the status of their service
+        defaults = {}
+        def default_status(service):
+            slug = service.slug
+            if slug not in defaults:
+                status = None
+                if service.current_synced:
+                    if service.current_status:
+                        status = Status.get_by_slug(service.current_status)
+                else:
+                    event = service.current_event()
+                    if event:
+                        status = event.cached_status()
+                defaults[slug] = status or Status.default()
+            return defaults[slug]
+
+        results = []
+        events = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results.append(failure(index, 400, "Event must be an object"))
+                continue
+
+            # Each field is checked here, so one bad event can't fail the
+            # whole batch
+            invalid = [name for name in ["service", "message", "status",
+                "timestamp"] if item.get(name) is not None and
+                not isinstance(item.get(name), basestring)]
+            if invalid:
+                results.append(failure(index, 400,
+                    "Event %s must be a string" % invalid[0]))
+                continue
+
+            service = services.get(item.get("service"))
+            if not service:
+                results.append(failure(index, 404,
+                    "Service %s not found" % item.get("service")))
+                continue
+
+            message = item.get("message")
+            if not message:
+                results.append(failure(index, 400, "Event message is required"))
+                continue
+
+            if item.get("status"):
+                status = Status.get_by_slug(item.get("status"))
+                if not status:
+                    results.append(failure(index, 404,
+                        "Status %s not found" % item.get("status")))
+                    continue
+            else:
+                status = default_status(service)
+                if not status:
+                    results.append(failure(index, 400,
+                        "Event status is required, there is no default"))
+                    continue
+
+            start = None
+            if item.get("timestamp"):
+                try:
+                    start = aware_to_naive(parse(item.get("timestamp")))
+                except (ValueError, TypeError, AttributeError):
+                    results.append(failure(index, 400,
+                        "Invalid timestamp %s" % item.get("timestamp")))
+                    continue
+
+            informational = item.get("informational") in (True, "true")
+            try:
+                event = Event.create(service, status, message,
+                    informational, start=start)
+            except db.BadValueError, e:
+                results.append(failure(index, 400, "Invalid event: %s" % e))
+                continue
+            events.append(event)
+            results.append(event)
+
+        by_service = {}
+        for event in events:
+            by_service.setdefault(event.service.slug, []).append(event)
+
+        # Events are saved a transaction's worth at a time, just before
+        # they are recorded, so a failure leaves at most one chunk saved
+        # without its summaries, changes and current event
+        per = Service.events_per_transaction
+        for slug, service_events in by_service.items():
+            service_events.sort(key=lambda e: e.start)
+            for i in range(0, len(service_events), per):
+                chunk = service_events[i:i + per]
+                db.put(chunk)
+                services[slug].record_events(chunk)
+
+        base_url = self.base_url(version)
+        options = self.rest_options()
+        for index, result in enumerate(results):
+            if isinstance(result, Event):
+                results[index] = result.rest(base_url, **options)
+
+        self.json({"events": results})
+
+
+class EventsSearchHandler(restful.Controller):
+    """
+    Lists the events of many services at once, newest first, optionally
+    only those with statuses of the given levels.
+    """
+
+    @restful.conditional(search_tags)
+    def get(self, version):
+        logging.debug("EventsSearchHandler#get")
+
+        if not self.valid_version(version):
+            self.error(404, "API Version %s not supported" % version)
+            return
+
+        slugs = self.request.get('services', default_value=None)
+        levels = self.request.get('level', default_value=None)
+        start = self.request.get('start', default_value=None)
+        end = self.request.get('end', default_value=None)
+        limit = self.request.get('limit', default_value=None)
+        cursor = self.request.get('cursor', default_value=None)
+
+        _start = None
+        _end = None
+        after = None
+
+        if start:
+            try:
+                _start = aware_to_naive(parse(start))
+            except:
+                self.error(400, "Invalid Date: %s" % start)
+                return
+
+        if end:
+            try:
+                # The end of the range is inclusive
+                _end = aware_to_naive(parse(end)) + \
+                    timedelta(microseconds=1)
+            except:
+                self.error(400, "Invalid Date: %s" % end)
+                return
+
+        if limit:
+            try:
+                limit = int(limit)
+                if limit < 1 or limit > MAX_EVENTS_PER_PAGE:
+                    raise ValueError
+            except ValueError:
+                self.error(400, "Invalid Limit: %s" % limit)
+                return
+        else:
+            limit = DEFAULT_EVENTS_PER_PAGE
+
+        if cursor:
+            try:
+                after = decode_search_cursor(cursor)
+            except ValueError:
+                self.error(400, "Invalid Cursor: %s" % cursor)
+                return
+
+        services = None
+        if slugs:
+            # Sorted, so that every page merges the services in the same
+            # order and the cursor stays valid
+            slugs = sorted(set([slug for slug in slugs.split(",") if slug]))
+            found = Service.get_by_slugs(slugs)
+            for slug in slugs:
+                if slug not in found:
+                    self.error(404, "Service %s not found" % slug)
+                    return
+            services = [found[slug].key() for slug in slugs]
+
+        statuses = None
+        if levels:
+            levels = [level.upper() for level in levels.split(",") if level]
+            for level in levels:
+                if not Level.get_severity(level):
+                    self.error(400, "Invalid Level: %s" % level)
+                    return
+            severities = [Level.get_severity(level) for level in levels]
+            statuses = [s.key() for s in Status.ordered()
+                if s.severity in severities]
+
+        events = Event.prefetch(Event.search(services, statuses, _start,
+            _end, limit, after))
+
+        base_url = self.base_url(version)
+        options = self.rest_options()
+        data = []
+        for event in events:
+            m = event.rest(base_url, **options)
+            m["service"] = str(event.service.slug)
+            data.append(m)
+
+        data = {"events": data, "next": None}
+
+        # A full page means there may be more, so hand back a link that
+        # continues from the end of this one
+        if len(events) == limit:
+            params = {"limit": limit,
+                "cursor": encode_search_cursor(Event.continuation(events,
+                    after))}
+            for name in ["services", "level", "start", "end"]:
+                value = self.request.get(name, default_value=None)
+                if value:
+                    params[name] = value.encode("utf-8")
+            # An empty embed means something, so keep those even when empty
+            for name in ["fields", "embed"]:
+                value = self.request.get(name, default_value=None)
+                if value is not None:
+                    params[name] = value.encode("utf-8")
+            data["next"] = base_url + "/events?" + urllib.urlencode(params)
+
+        self.json(data)
+
+
+class EventsExportHandler(restful.Controller):
+    """
+    Exports events as newline delimited JSON, one event per line, oldest
+    first. Each response holds as many events as fit in MAX_EXPORT_BYTES;
+    when there are more, a Link header points at the next part, which
+    carries on from a cursor.
+    """
+
+    @restful.conditional(export_tags, cache=False)
+    def get(self, version, service_slug=None):
+        logging.debug("EventsExportHandler#get")
+
+        if not self.valid_version(version):
+            self.error(404, "API Version %s not supported" % version)
+            return
+
+        url = self.base_url(version)
+        if service_slug:
+            service = Service.get_by_slug(service_slug)
+            if not service:
+                self.error(404, "Service %s not found" % service_slug)
+                return
+            query = Event.range(service, descending=False)
+            url += service.resource_url() + "/events.ndjson"
+        else:
+            # Bucketed events have no start index, but their keys are in
+            # time order within each service
+            query = Event.all()
+            if Event.bucketed():
+                query.order('__key__')
+            else:
+                query.order('start')
+            url += "/events.ndjson"
+
+        cursor = self.request.get('cursor', default_value=None)
+        if cursor:
+            try:
+                query.with_cursor(cursor)
+            except:
+                self.error(400, "Invalid Cursor: %s" % cursor)
+                return
+
+        options = self.rest_options()
+        base_url = self.base_url(version)
+        self.response.headers["Content-Type"] = \
+            "application/x-ndjson"
+
+        written = 0
+        while True:
+            events = Event.prefetch(query.fetch(EXPORT_BATCH_SIZE))
+            for event in events:
+                m = event.rest(base_url, **options)
+                if not service_slug:
+                    m["service"] = str(event.service.slug)
+                line = simplejson.dumps(m) + "\n"
+                self.response.out.write(line)
+                written += len(line)
+
+            if len(events) < EXPORT_BATCH_SIZE:
+                return
+
+            cursor = query.cursor()
+            if written >= MAX_EXPORT_BYTES:
+                break
+            query.with_cursor(cursor)
+
+        params = {"cursor": cursor}
+        for name in ["fields", "embed"]:
+            value = self.request.get(name, default_value=None)
+            if value is not None:
+                params[name] = value.encode("utf-8")
+        self.response.headers["Link"] = '<%s?%s>; rel="next"' % (url,
+            urllib.urlencode(params))
+
+
+class ChangesHandler(restful.Controller):
+    def get(self, version):
+        logging.debug("ChangesHandler#get")
+
+        if not self.valid_version(version):
+            self.error(404, "API Version %s not supported" % version)
+            return
+
+        since = self.request.get('since', default_value=None)
+        limit = self.request.get('limit', default_value=DEFAULT_CHANGES_PER_PAGE)
+        wait = self.request.get('wait', default_value=0)
+
+        try:
+            limit = int(limit)
+            if limit < 1 or limit > MAX_CHANGES_PER_PAGE:
+                raise ValueError
+        except ValueError:
+            self.error(400, "Limit must be between 1 and %d"
+                % MAX_CHANGES_PER_PAGE)
+            return
+
+        try:
+            wait = int(wait)
+            if wait < 0 or wait > MAX_CHANGES_WAIT:
+                raise ValueError
+        except ValueError:
+            self.error(400, "Wait must be between 0 and %d seconds"
+                % MAX_CHANGES_WAIT)
+            return
+
+        # Without a token, hand back one for the current end of the log
+        if since is None:
+            current = Change.current()
+            if current is None:
+                latest = Change.all().order('-seq').get()
+                current = latest and latest.seq or 0
+            self.json({"changes": [], "next": str(current)})
+            return
+
+        try:
+            since, gaps = decode_changes_token(since)
+        except ValueError:
+            self.error(400, "Invalid Token: %s" % since)
+            return
+
+        waited = 0
+        while True:
+            changes, gaps = Change.since(since, limit, gaps)
+            if changes or waited >= wait:
+                break
+
+            # Only query again once the sequence has moved
+            while waited < wait:
+                sleep(1)
+                waited += 1
+                current = Change.current()
+                if current is None or current > since:
+                    break
+
+        base_url = self.base_url(version)
+        last = since
+        if changes:
+            last = max(since, changes[-1].seq)
+
+        self.json({
+            "changes": [c.rest(base_url) for c in changes],
+            "next": encode_changes_token(last, gaps),
+        })
+
+
 class CurrentEventHandler(restful.Controller):
+    @restful.conditional(service_tags)
     def get(self, version, service_slug):
         logging.debug("CurrentStatusHandler#get")
         
@@ -302,7 +981,8 @@ class CurrentEventHandler(restful.Controller):
                 event = service.current_event()
         
                 if (event):
-                    self.json(event.rest(self.base_url(version))) 
+                    self.json(event.rest(self.base_url(version),
+                        **self.rest_options())) 
                 else:
                     self.error(404, "No current event for Service %s" % service_slug)
             else:
@@ -311,6 +991,7 @@ class CurrentEventHandler(restful.Controller):
             self.error(404, "Version %s not supported" % version)
     
 class EventInstanceHandler(restful.Controller):
+    @restful.conditional(service_tags)
     def get(self, version, service_slug, sid):
         logging.debug("EventInstanceHandler#get sid=%s" % sid)
         
@@ -320,7 +1001,8 @@ class EventInstanceHandler(restful.Controller):
             if (service):
                 event = Event.get(db.Key(sid))
                 if (event and service.key() == event.service.key()):
-                    self.json(event.rest(self.base_url(version))) 
+                    self.json(event.rest(self.base_url(version),
+                        **self.rest_options())) 
                 else:
                     self.error(404, "No event for Service %s with sid = %s" % (service_slug,sid))
             else:
@@ -340,7 +1022,12 @@ class EventInstanceHandler(restful.Controller):
                 event = Event.get(db.Key(sid))
                 if (event and service.key() == event.service.key()):
                     event.delete()
-                    self.success(event.rest(self.base_url(version)))
+                    if service.current_sid == event.sid() or not service.current_synced:
+                        service.refresh_current()
+                    DailySummary.rebuild(service, event.start.date())
+                    StatusInterval.rebuild(service, event.start)
+                    self.success(event.rest(self.base_url(version),
+                        **self.rest_options()))
                 else:
                     self.error(404, "No event for Service %s with sid = %s" % (service_slug,sid))
             else:
@@ -350,18 +1037,171 @@ class EventInstanceHandler(restful.Controller):
         
 
 
+class DaysListHandler(restful.Controller):
+    @restful.conditional(service_tags, daily=True)
+    def get(self, version, service_slug):
+        logging.debug("DaysListHandler#get")
+        
+        if (self.valid_version(version)):
+            service = Service.get_by_slug(service_slug)
+
+            if service:
+                start = self.request.get('start', default_value=None)
+                end = self.request.get('end', default_value=None)
+
+                # Days are UTC, defaulting to the five days before today
+                end_date = date.today() - timedelta(days=1)
+                start_date = end_date - timedelta(days=4)
+
+                if end:
+                    try:
+                        end_date = aware_to_naive(parse(end)).date()
+                    except:
+                        self.error(400, "Invalid Date: %s" % end)
+                        return
+
+                if start:
+                    try:
+                        start_date = aware_to_naive(parse(start)).date()
+                    except:
+                        self.error(400, "Invalid Date: %s" % start)
+                        return
+                elif end:
+                    start_date = end_date - timedelta(days=4)
+
+                if start_date > end_date or (end_date - start_date).days > 366:
+                    self.error(400, "Invalid Date Range: %s - %s" % (start_date, end_date))
+                    return
+
+                days = DailySummary.days_between(start_date, end_date)
+                summaries = DailySummary.get_days([service.key()], days)
+                DailySummary.carry([service], summaries)
+
+                data = []
+                for day in days:
+                    data.append(summaries[(service.key(), day)].rest(self.base_url(version)))
+
+                self.json({"days": data})
+            else:
+                self.error(404, "Service %s not found" % service_slug)
+        else:
+            self.error(404, "API Version %s not supported" % version)
+        
+
+class UptimeHandler(restful.Controller):
+    @restful.conditional(uptime_tags)
+    def get(self, version, service_slug):
+        logging.debug("UptimeHandler#get")
+        
+        if (self.valid_version(version)):
+            service = Service.get_by_slug(service_slug)
+
+            if service:
+                start = self.request.get('start', default_value=None)
+                end = self.request.get('end', default_value=None)
+
+                # Default to the last thirty days
+                _end = datetime.utcnow()
+                if end:
+                    try:
+                        _end = aware_to_naive(parse(end))
+                    except:
+                        self.error(400, "Invalid Date: %s" % end)
+                        return
+
+                _start = _end - timedelta(days=30)
+                if start:
+                    try:
+                        _start = aware_to_naive(parse(start))
+                    except:
+                        self.error(400, "Invalid Date: %s" % start)
+                        return
+
+                if _start >= _end:
+                    self.error(400, "Invalid Date Range: %s - %s" % (start, end))
+                    return
+
+                data = StatusInterval.report(service, _start, _end)
+                data["start"] = format_date_time(mktime(_start.timetuple()))
+                data["end"] = format_date_time(mktime(_end.timetuple()))
+                data["url"] = self.base_url(version) + service.resource_url() + "/uptime"
+
+                self.json(data)
+            else:
+                self.error(404, "Service %s not found" % service_slug)
+        else:
+            self.error(404, "API Version %s not supported" % version)
+        
+
+class ChecksListHandler(restful.Controller):
+    """
+    Lists a service's ping results, which are kept for every ping even
+    though only changes of status become events.
+    """
+
+    def get(self, version, service_slug):
+        logging.debug("ChecksListHandler#get")
+
+        if not self.valid_version(version):
+            self.error(404, "API Version %s not supported" % version)
+            return
+
+        service = Service.get_by_slug(service_slug)
+        if not service:
+            self.error(404, "Service %s not found" % service_slug)
+            return
+
+        start = self.request.get('start', default_value=None)
+        end = self.request.get('end', default_value=None)
+
+        # Default to the last hour
+        _end = datetime.utcnow()
+        if end:
+            try:
+                _end = aware_to_naive(parse(end))
+            except:
+                self.error(400, "Invalid Date: %s" % end)
+                return
+
+        _start = _end - timedelta(hours=1)
+        if start:
+            try:
+                _start = aware_to_naive(parse(start))
+            except:
+                self.error(400, "Invalid Date: %s" % start)
+                return
+
+        if _start >= _end or _end - _start > timedelta(days=MAX_CHECKS_DAYS):
+            self.error(400, "Invalid Date Range: %s - %s" % (start, end))
+            return
+
+        data = []
+        for when, result, code, latency in CheckSeries.points(service.key(),
+                _start, _end):
+            data.append({
+                "timestamp": format_date_time(mktime(when.timetuple())),
+                "result": CHECK_RESULTS.get(result),
+                "code": code or None,
+                "latency": latency,
+            })
+
+        self.json({"checks": data})
+
+
 class StatusesListHandler(restful.Controller):
+    @restful.conditional(statuses_tags)
     def get(self, version):
         logging.debug("StatusesListHandler#get")
         
         if (self.valid_version(version)):
-            query = Status.all().order('severity')
+            query = Status.ordered()
 
             if (query):
                 data = []
+                options = self.rest_options()
 
                 for s in query:
-                    data.append(s.rest(self.base_url(version)))
+                    data.append(s.rest(self.base_url(version), **options))
 
                 self.json({"statuses": data}) 
             else:
@@ -391,13 +1231,17 @@ class StatusesListHandler(restful.Controller):
                     status.image = image
                     status.name = name
                     status.put()
-                    self.json(status.rest(self.base_url(version)))
+                    Status.bump_generation(slug)
+                    self.json(status.rest(self.base_url(version),
+                        **self.rest_options()))
                 # Create new service
                 else:
                     status = Status(name=name, slug=slug, description=description, 
                         severity=severity, image=image)
                     status.put()
-                    self.json(status.rest(self.base_url(version)))
+                    Status.bump_generation(slug)
+                    self.json(status.rest(self.base_url(version),
+                        **self.rest_options()))
             else:
                 self.error(400, "Bad Data")
         else:
@@ -406,6 +1250,7 @@ class StatusesListHandler(restful.Controller):
 
 
 class StatusInstanceHandler(restful.Controller):
+    @restful.conditional(statuses_tags)
     def get(self, version, status_slug):
         logging.debug("CurrentStatusHandler#get")
         
@@ -413,7 +1258,8 @@ class StatusInstanceHandler(restful.Controller):
             status = Status.get_by_slug(status_slug)
 
             if (status):
-                self.json(status.rest(self.base_url(version))) 
+                self.json(status.rest(self.base_url(version),
+                    **self.rest_options())) 
             else:
                 self.error(404, "No status %s for Service %s" % status_slug)
         else:
@@ -447,8 +1293,11 @@ class StatusInstanceHandler(restful.Controller):
                 
                 if description or name or image or severity:
                     status.put()
+                    Status.bump_generation(status.slug)
                     
-                self.json(status.rest(self.base_url(version)))
+                self.json(status.rest(self.base_url(version),
+                    
+                    **self.rest_options()))
             else:
                 self.error(404, "Status %s not found" % status_slug)
         else:
@@ -463,40 +1312,99 @@ class StatusInstanceHandler(restful.Controller):
             status = Status.get_by_slug(status_slug)            
 
             if status:
-                # We may want to think more about this
-                events = Event.all().filter('status =', status).fetch(1000)
-                for event in events:
-                    event.delete()
-                status.delete()
-                self.json(status.rest(self.base_url(version)))
+                status.deleting = True
+                status.put()
+                Status.bump_generation(status.slug)
+                job = start_deletion("status", status)
+
+                data = status.rest(self.base_url(version),
+                    **self.rest_options())
+                data["job"] = job.rest(self.base_url(version))
+                self.response.set_status(202)
+                self.response.headers["Location"] = data["job"]["url"]
+                self.json(data)
             else:
-                self.error(404, "Status %s not found" % service_slug)
+                self.error(404, "Status %s not found" % status_slug)
         else:
             self.error(404, "API Version %s not supported" % version)
 
             
 
             
+class JobInstanceHandler(restful.Controller):
+    def get(self, version, job_id):
+        logging.debug("JobInstanceHandler#get id=%s" % job_id)
+
+        if (self.valid_version(version)):
+            job = None
+            if job_id.isdigit():
+                job = DeletionJob.get_by_id(int(job_id))
+
+            if job:
+                self.json(job.rest(self.base_url(version)))
+            else:
+                self.error(404, "Job %s not found" % job_id)
+        else:
+            self.error(404, "API Version %s not supported" % version)
+
 class ImagesListHandler(restful.Controller):
+    @restful.conditional(static_tags)
     def get(self, version):
         logging.debug("ImagesListHandler#get")
-        host = self.request.headers.get('host', 'nohost')
-        
+
         if (self.valid_version(version)):
-        
-            query = status_images.images
-        
-            for img in query:
-                img["url"] = "http://" + host + img["url"]
+            prefix = self.request.get('prefix', default_value=None)
+            q = self.request.get('q', default_value=None)
+            limit = self.request.get('limit', default_value=None)
+            offset = self.request.get('offset', default_value=None)
 
-            if (query):
-                self.json({"images": query}) 
+            try:
+                offset = int(offset or 0)
+                if offset < 0:
+                    raise ValueError
+            except ValueError:
+                self.error(400, "Invalid Offset: %s" % offset)
+                return
+
+            if limit:
+                try:
+                    limit = int(limit)
+                    if limit < 1 or limit > MAX_IMAGES_PER_PAGE:
+                        raise ValueError
+                except ValueError:
+                    self.error(400, "Limit must be between 1 and %d"
+                        % MAX_IMAGES_PER_PAGE)
+                    return
+
+            catalog = images.catalog()
+            found = catalog.find(prefix, q)
+
+            # The whole catalog unless a page is asked for
+            extra = ""
+            if limit:
+                page = found[offset:offset + limit]
+                if offset + limit < len(found):
+                    params = {"limit": limit, "offset": offset + limit}
+                    if prefix:
+                        params["prefix"] = prefix.encode("utf-8")
+                    if q:
+                        params["q"] = q.encode("utf-8")
+                    extra = ', "next": ' + simplejson.dumps(
+                        self.base_url(version) + "/status-images?" +
+                        urllib.urlencode(params))
+                else:
+                    extra = ', "next": null'
             else:
-                self.error(404, "No images")
+                page = found[offset:]
+
+            host = self.request.scheme + "://" + \
+                self.request.headers.get('host', 'nohost')
+            self.encoded_json(catalog.json(page, host, extra))
         else:
             self.error(404, "API Version %s not supported" % version)
             
 class LevelsListHandler(restful.Controller):
+    @restful.conditional(static_tags)
     def get(self, version):
         logging.debug("LevelsListHandler#get")
         
@@ -43,6 +43,42 @@ import logging
 import os
 import config
 import cgi
+import time
+import gzip
+import hashlib
+from StringIO import StringIO
+from datetime import date
+from email.utils import parsedate_tz, mktime_tz
+from wsgiref.handlers import format_date_time
+from utils import versions
+from utils.cache import LRUCache
+from utils.serializers import split_names
+from google.appengine.api import memcache
+
+# Responses cached by this instance, keyed by ETag. See conditional
+responses = LRUCache(200)
+
+# Bigger responses are only cached in memcache
+MAX_LOCAL_RESPONSE = 64 * 1024
+
+# Smaller responses aren't worth compressing
+MIN_GZIP_SIZE = 512
+
+def gzip_string(data):
+    "Returns data compressed in the gzip format"
+    buf = StringIO()
+    f = gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=6)
+    f.write(data)
+    f.close()
+    return buf.getvalue()
+
+def store_response(etag, cached, local_only=False):
+    "Keeps a (content type, body, gzipped body) response for conditional"
+    size = len(cached[1]) + len(cached[2] or "")
+    if size <= MAX_LOCAL_RESPONSE:
+        responses.set(etag, cached)
+    if not local_only:
+        memcache.set("response:" + etag, cached)
 
 # Some useful module methods
 def send_successful_response(handler, response):
@@ -128,9 +164,114 @@ def methods_via_query_allowed(handler_method):
             handler_method(self, *args, **kwargs)
     return redirect_if_needed
     
+def conditional(tags_for, daily=False, cache=True):
+    """
+    A decorator for GET methods whose response only changes when one of
+    a few version tags is bumped (see utils.versions).
+
+    tags_for is called with the same arguments as the GET method and
+    returns the tags the response depends on, or None if the response
+    can't be cached. The response gets a strong ETag and a Last-Modified
+    header built from the tag versions, and matching If-None-Match or
+    If-Modified-Since requests get a 304 without calling the method.
+
+    Pass daily=True for responses that also change at midnight (UTC).
+
+    Unless cache is False, successful responses are also kept by this
+    instance and in memcache. The ETag covers everything the response
+    depends on, so it doubles as the cache key: bumping a tag moves every
+    response under it to a new key, and the old entries are never read
+    again. The gzipped body is kept next to the plain one the first time
+    a client asks for it, so each version is compressed only once.
+    """
+    def decorator(handler_method):
+        def check_conditions(self, *args, **kwargs):
+            tags = tags_for(self, *args, **kwargs)
+            if tags is None:
+                return handler_method(self, *args, **kwargs)
+
+            stamps = versions.get(tags)
+            parts = ["%s=%s" % (t, stamps[t]) for t in sorted(stamps)]
+            modified = [v / 1000000.0 for v in stamps.values()]
+            if daily:
+                today = date.today()
+                parts.append(today.isoformat())
+                modified.append(time.mktime(today.timetuple()))
+
+            # Each encoding is a different body, so needs its own ETag
+            base_etag = self.etag(parts)
+            gzipped = self.accepts_gzip()
+            etag = base_etag
+            if gzipped:
+                etag = base_etag[:-1] + '-gzip"'
+            self.response.headers['ETag'] = etag
+            self.response.headers['Cache-Control'] = 'no-cache'
+            if config.GZIP_RESPONSES:
+                self.response.headers['Vary'] = 'Accept-Encoding'
+
+            # A Last-Modified in the current second could match a later
+            # write in the same second, so only send one once it's past
+            last_modified = None
+            if modified and int(max(modified)) + 1 <= time.time():
+                last_modified = int(max(modified)) + 1
+                self.response.headers['Last-Modified'] = \
+                    format_date_time(last_modified)
+
+            if self.not_modified(etag, last_modified):
+                self.response.set_status(304)
+                return
+
+            if not cache:
+                return handler_method(self, *args, **kwargs)
+
+            cache_key = "response:" + base_etag
+            cached = responses.get(base_etag)
+            if cached is None:
+                cached = memcache.get(cache_key)
+                if cached is not None:
+                    store_response(base_etag, cached, local_only=True)
+
+            if cached is None:
+                # Keep the plain body; it's compressed below if need be
+                self.compress_output = False
+                handler_method(self, *args, **kwargs)
+                self.compress_output = True
+
+                # Errors drop the ETag, and aren't worth caching
+                if self.response.headers.get('ETag') != etag:
+                    return
+
+                cached = (self.response.headers.get('Content-Type'),
+                    self.response.out.getvalue(), None)
+                self.response.clear()
+                if gzipped and len(cached[1]) >= MIN_GZIP_SIZE:
+                    cached = cached[:2] + (gzip_string(cached[1]),)
+                store_response(base_etag, cached)
+            elif gzipped and cached[2] is None and \
+                    len(cached[1]) >= MIN_GZIP_SIZE:
+                cached = cached[:2] + (gzip_string(cached[1]),)
+                store_response(base_etag, cached)
+
+            self.response.headers["Content-Type"] = cached[0]
+            if gzipped and cached[2] is not None:
+                self.response.headers["Content-Encoding"] = "gzip"
+                self.response.out.write(cached[2])
+            else:
+                self.response.out.write(cached[1])
+        return check_conditions
+    return decorator
+
+# Reasons for the status codes webapp doesn't know about
+STATUS_MESSAGES = {
+    429: "Too Many Requests",
+}
+
 class Controller(webapp.RequestHandler):
     """Responsible for handling all API requests"""
 
+    # Set to False by conditional, which compresses the response itself
+    compress_output = True
+
     def base_url(self, version):
         "Returns the base url for the given host and version"
         host = self.request.headers.get('host', 'nohost')
@@ -138,10 +279,21 @@ class Controller(webapp.RequestHandler):
         
     def valid_version(self, version):
         return version == "v1"
+
+    def rest_options(self):
+        "Returns the fields and embed parameters, for the models' rest()"
+        return {
+            "fields": split_names(self.request.get('fields', default_value=None)),
+            "embed": split_names(self.request.get('embed', default_value=None)),
+        }
     
     def error(self, code, message=None):
         "Returns the JSON representation of an error message"
-        self.response.set_status(code)
+        self.response.set_status(code, STATUS_MESSAGES.get(code))
+
+        # Errors must not be revalidated as if they were the resource
+        del self.response.headers['ETag']
+        del self.response.headers['Last-Modified']
         
         error = { "error": True, "code": code}
         if (message):
@@ -160,6 +312,35 @@ class Controller(webapp.RequestHandler):
         self.json(success)
         
     
+    def etag(self, parts):
+        "Returns a strong ETag for this request's URL and the given parts"
+        digest = hashlib.md5()
+        digest.update(os.environ.get('CURRENT_VERSION_ID', ''))
+        digest.update(self.request.headers.get('host', 'nohost'))
+        digest.update(self.request.path_qs)
+        for part in parts:
+            digest.update("\n" + part)
+        return '"' + digest.hexdigest() + '"'
+
+    def not_modified(self, etag, last_modified=None):
+        """
+        Returns True if the request's If-None-Match or If-Modified-Since
+        header shows the client already has this version. If-None-Match
+        wins when both are sent.
+        """
+        if_none_match = self.request.headers.get('If-None-Match')
+        if if_none_match:
+            tags = [t.strip() for t in if_none_match.split(",")]
+            return etag in tags or "*" in tags
+
+        if_modified_since = self.request.headers.get('If-Modified-Since')
+        if if_modified_since and last_modified:
+            parsed = parsedate_tz(if_modified_since.split(";")[0])
+            if parsed:
+                return last_modified <= mktime_tz(parsed)
+
+        return False
+
     def get(self, *params):
         self.redirect("/.html")
 
@@ -173,21 +354,66 @@ class Controller(webapp.RequestHandler):
         for p in args:
             path = os.path.join(path, p)
             
-        self.response.out.write(template.render(path, templateparams))
+        self.send(template.render(path, templateparams))
         
     def json(self, data):
         """
         Renders the given data as json. 
         If callback is valid, renders data as jsonp
         """
+        self.encoded_json(simplejson.dumps(data))
+
+    def encoded_json(self, body):
+        """
+        Renders a body that is already encoded as json. If callback is
+        valid, renders it as jsonp
+        """
         callback = self.request.get('callback', default_value=None)
 
         if callback:
-            self.response.headers.add_header("Content-Type", "application/javascript")
-            self.response.out.write(callback + "(" + simplejson.dumps(data) + ");")
+            self.response.headers["Content-Type"] = "application/javascript"
+            body = callback + "(" + body + ");"
         else:
-            self.response.headers.add_header("Content-Type", "application/json")
-            self.response.out.write(simplejson.dumps(data))
+            self.response.headers["Content-Type"] = "application/json"
+
+        self.send(body)
+
+    def send(self, body):
+        """
+        Writes body as the whole response, gzipped if the client accepts
+        it and the body is big enough to be worth it.
+        """
+        if isinstance(body, unicode):
+            body = body.encode("utf-8")
+
+        if self.compress_output and len(body) >= MIN_GZIP_SIZE and \
+                self.accepts_gzip() and not self.response.out.tell():
+            self.response.headers["Content-Encoding"] = "gzip"
+            self.response.headers["Vary"] = "Accept-Encoding"
+            body = gzip_string(body)
+
+        self.response.out.write(body)
+
+    def accepts_gzip(self):
+        """
+        Whether the response may be compressed. App Engine's front end
+        compresses responses itself and drops a Content-Encoding set by
+        the app, so this is off unless config.GZIP_RESPONSES is set.
+        """
+        if not config.GZIP_RESPONSES:
+            return False
+
+        accept = self.request.headers.get('Accept-Encoding', '')
+        for coding in accept.split(","):
+            params = [p.strip() for p in coding.split(";")]
+            if params[0] not in ("gzip", "*"):
+                continue
+            for param in params[1:]:
+                if param.replace(" ", "") in ("q=0", "q=0.0", "q=0.00",
+                        "q=0.000"):
+                    return False
+            return True
+        return False
         
     def text(self, data):
         "Renders the given data as text/plain"
@@ -40,24 +40,48 @@ __author__ = 'Kyle Conroy'
 
 from datetime import date, timedelta
 import datetime
+import time
 import calendar
-import re
 import os
 import cgi
 import logging
 from wsgiref.handlers import format_date_time
-from time import mktime, sleep
+from time import mktime
 
 from google.appengine.ext import webapp
-from google.appengine.api import users, urlfetch, mail
+from google.appengine.ext import db
+from google.appengine.api import users, mail, memcache
+try:
+    from google.appengine.api import taskqueue
+except ImportError:
+    from google.appengine.api.labs import taskqueue
 
 import oauth2 as oauth
 from handlers import restful
 from utils import authorized
-from models import Status, Service, Event, Profile, AuthRequest
+from utils.probes import Probe, ProbeExecutor
+from utils import patterns
+from models import Status, Service, Event, Profile, AuthRequest, DailySummary
+from models import Level, StatusInterval, DeletionJob, Change, PingShard
+from models import PingSchedule, CheckSeries
+from models import CHECK_PASSED, CHECK_FAILED_LOAD, CHECK_FAILED_REGEX
 
 import config
 
+# Services pinged by one run of a ping shard, the most overdue first
+PINGS_PER_RUN = 50
+
+# How often the notification cron runs, see cron.yaml, and how long a
+# sent notification is remembered
+NOTIFY_INTERVAL = timedelta(minutes=5)
+NOTIFY_CLAIM_EXPIRY = 24 * 60 * 60
+
+CHECK_NAMES = {
+    CHECK_PASSED: "Passed",
+    CHECK_FAILED_LOAD: "Failed page load",
+    CHECK_FAILED_REGEX: "Failed regex",
+}
+
 def default_template_data():
     user = users.get_current_user()
     
@@ -173,7 +197,24 @@ class ServiceHandler(restful.Controller):
             
         td = default_template_data()
         td["service"] = service_slug
+        td["service_slug"] = service_slug
+        td["show_events"] = True
         
+        # Month and year views only need a line per day, which the
+        # daily summaries provide without scanning the events
+        if year and not day:
+            last_date = min(end_date - timedelta(days=1), date.today())
+            days = DailySummary.days_between(start_date, last_date)
+            summaries = DailySummary.get_days([service.key()], days)
+            DailySummary.carry([service], summaries)
+            td["days"] = [summaries[(service.key(), d)] for d in days]
+            td["default"] = Status.default()
+            td["show_events"] = False
+        elif day:
+            summaries = DailySummary.get_days([service.key()], [start_date])
+            DailySummary.carry([service], summaries)
+            td["summary"] = summaries.values()[0]
+
         if start_date and end_date:
             start_stamp = mktime(start_date.timetuple())
             end_stamp = mktime(end_date.timetuple())
@@ -190,116 +231,481 @@ class ServiceHandler(restful.Controller):
         self.render(td, 'service.html')
 
 class PingHandler(restful.Controller):
+    """
+    The minutely cron: queues one ping task per shard, so pinging scales
+    with the number of shards rather than what one request can fetch.
+    """
+
     def post(self):
         return self.get()
         
     def get(self):
-        services = Service.all().fetch(50)
-        statuses = Status.all().fetch(10)
+        Service.schedule_unscheduled()
+
+        # Named by the minute, so a repeated cron run doesn't ping twice
+        minute = datetime.datetime.now().strftime("%Y%m%d%H%M")
+        for shard in range(config.PING_SHARDS):
+            try:
+                taskqueue.add(url='/tasks/ping', params={'shard': shard},
+                    name="ping-%d-%s" % (shard, minute))
+            except (taskqueue.TaskAlreadyExistsError,
+                    taskqueue.TombstonedTaskError):
+                pass
+
+        self.text("Queued %d ping shards" % config.PING_SHARDS)
+
+class PingShardHandler(restful.Controller):
+    """
+    Pings the due services of one shard. Every result goes into the
+    service's CheckSeries, but an Event is only written when the service's
+    status changes. A shard with more due services than one run handles
+    queues another run to carry on. Runs of the same shard take turns,
+    holding the shard's lease, and a run that finds it held does nothing.
+    """
+
+    def post(self):
+        return self.get()
+
+    def get(self):
+        try:
+            shard = int(self.request.get('shard'))
+        except ValueError:
+            self.error(400, "Invalid Shard: %s" % self.request.get('shard'))
+            return
+
+        # The cron queues a run every minute, whether or not the last one
+        # has finished
+        if not PingSchedule.lease(shard):
+            logging.info("Ping shard %d is already running", shard)
+            return
+
+        try:
+            keys = self.ping(shard)
+        finally:
+            PingSchedule.release(shard)
+
+        if len(keys) == PINGS_PER_RUN:
+            taskqueue.add(url='/tasks/ping', params={'shard': shard})
+
+    def ping(self, shard):
+        """ Ping the shard's due services, returning their keys"""
+        down = Status.get_by_slug("down") or \
+            Status.get_by_severity(Level.get_severity(Level.error))
+        up = Status.get_by_slug("up") or Status.default()
         now = datetime.datetime.now()
-        for loop_no, service in enumerate(services):
-            if service.serviceurl == None:
-                continue
-            
-            query = Event.all().filter('service =', service).order("-start").fetch(1)
-            if len(query) > 0 and (now - query.pop().start < timedelta(minutes=service.freq)):
-                continue
+        started = time.time()
+
+        schedule = PingSchedule(shard)
+        keys = schedule.due(now, PINGS_PER_RUN)
 
-            res = None
-            for i in range(3):
-                try:
-                    # TODO: move to using async, so we can handle lots of pings...
-                    res = urlfetch.fetch(service.serviceurl)
-                    break
-                except:
-                    logging.error('fetch num %d failed', i)
-                    sleep(1)
+        due = []
+        for key, service in zip(keys, db.get(keys)):
+            if service and service.serviceurl and not service.deleting \
+                    and service.probe_shard == shard:
+                due.append(service)
+            else:
+                schedule.drop(key)
+
+        # Every due service is fetched at once, so the round takes about
+        # as long as the slowest of them
+        probes = [Probe(service.serviceurl, service) for service in due]
+        ProbeExecutor().run(probes)
+
+        failed = 0
+        points = []
+        for probe in probes:
+            service, res = probe.key, probe.response
             if not res:
-                event = Event(service = service, status = statuses[0], message = "Failed page load.")
-                event.put()
-                continue
-            if res.status_code == 200:
+                status, message = down, "Failed page load."
+                result = CHECK_FAILED_LOAD
+                failed += 1
+            elif res.status_code == 200:
                 if service.pattern:
-                    result = re.search(service.pattern, res.content)
+                    regex = patterns.compiled(service.key(),
+                        service.pattern)
+                    found = patterns.search(regex, res.content)
                     
-                    if result:
-                        event = Event(service = service, status = statuses[1], message = "Passed. Page loaded. Regex found.")
-                        event.put()
+                    if found:
+                        status, message = up, "Passed. Page loaded. Regex found."
+                        result = CHECK_PASSED
                     else:
-                        event = Event(service = service, status = statuses[0], message = "Failed regex.")
-                        event.put()
+                        status, message = down, "Failed regex."
+                        result = CHECK_FAILED_REGEX
                 else:
-                    event = Event(service = service, status = statuses[1], message = "Passed. Page loaded.")
-                    event.put()
+                    status, message = up, "Passed. Page loaded."
+                    result = CHECK_PASSED
             else:
-                event = Event(service = service, status = statuses[0], message = "Failed page load.")
+                status, message = down, "Failed page load."
+                result = CHECK_FAILED_LOAD
+
+            points.append((service.key(), now, result,
+                res and res.status_code or 0, (probe.latency or 0) * 1000))
+
+            next_check_at = now + timedelta(minutes=service.freq or 1)
+            schedule.set(service.key(), next_check_at)
+
+            if service.current_status != status.slug:
+                event = Event.create(service, status, message)
                 event.put()
+                service.record_event(event, next_check_at)
+
+        CheckSeries.record(points)
+        schedule.save()
+
+        seconds = time.time() - started
+        logging.info("Ping shard %d pinged %d services in %.1fs", shard,
+            len(probes), seconds)
+        PingShard.record(shard, len(probes), failed, seconds)
+        return keys
                 
 class NotificationHandler(restful.Controller):
+    """
+    Mails the recipients when a service fails ERROR_COUNT_THRESHOLD pings
+    in a row, and again once it passes after that. Pings only write an
+    event when the status changes, so the failures are counted in the
+    ping results rather than in the events.
+    """
+
     def get(self):
         ERROR_COUNT_THRESHOLD = 3
         SENDER_ADDRESS = config.SITE["author"]+" <"+config.SITE["email"]+">"
-        services = Service.all().fetch(100)
+        services = Service.live(Service.all().fetch(100))
         recipient_addresses = config.SITE["recipients"]
-        send_notification = False
-        failures = []
+        now = datetime.datetime.now()
+
+        # Twice the cron interval, so results recorded while the last run
+        # was going are still seen. Each outage is only mailed once.
+        since = now - 2 * NOTIFY_INTERVAL
 
         for service in services:
-            error_count = 0
-            prev_error_count = 0
-            body = "Here's a listing of the site statuses for the last ten minutes:\n"
-            
-            # search through recent 5 events.
-            for event in Event.all().filter("service =", service).order("-start").fetch(5):
-                self.response.out.write(service.name+": "+event.status.name+"<br/>")
-                body += service.name+" "+event.start.strftime("%m/%d %H:%M")+" - "+event.status.name+": "+event.status.description+"\n"
-                if event.status.name == "Up":
-                    error_count = 0
-                    continue
-                error_count += 1
-                if error_count == ERROR_COUNT_THRESHOLD:
-                    break
-                
-            for event in Event.all().filter("service =", service).order("-start").fetch(limit=5, offset=5):
-                self.response.out.write(service.name+": "+event.status.name+"<br/>")
-                body += service.name+" "+event.start.strftime("%m/%d %H:%M")+" - "+event.status.name+": "+event.status.description+"\n"
-                if event.status.name == "Up":
-                    prev_error_count = 0
-                    continue
-                prev_error_count += 1
-                if prev_error_count == ERROR_COUNT_THRESHOLD:
-                    break
+            freq = timedelta(minutes=service.freq or 1)
+            points = CheckSeries.points(service.key(),
+                since - 2 * ERROR_COUNT_THRESHOLD * freq, now)
+            recent = points[::-1]
+
+            body = "Here's a listing of the site statuses for the last ten pings:\n"
+            for when, result, code, latency in recent[:10]:
+                self.response.out.write(service.name+": "+CHECK_NAMES[result]+"<br/>")
+                body += service.name+" "+when.strftime("%m/%d %H:%M")+" - "+CHECK_NAMES[result]+" ("+str(code)+")\n"
             body += "\n\n"
             if service.serviceurl:
                 body += "This message is in reference to this URL: "+service.serviceurl+"\n"
             body += "Stashboard: http://" + os.environ.get('APPLICATION_ID') + ".appspot.com/\n"
             body += "GAE system status: http://code.google.com/status/appengine\n"
 
+            # Newest first: the failures since the last pass, then the
+            # passes since the failures before them
+            error_count = 0
+            while error_count < len(recent) and \
+                    recent[error_count][1] != CHECK_PASSED:
+                error_count += 1
+            up_count = 0
+            while error_count + up_count < len(recent) and \
+                    recent[error_count + up_count][1] == CHECK_PASSED:
+                up_count += 1
+            prev_error_count = 0
+            older = error_count + up_count
+            while older + prev_error_count < len(recent) and \
+                    recent[older + prev_error_count][1] != CHECK_PASSED:
+                prev_error_count += 1
+
             self.response.out.write("prev: "+str(prev_error_count)+"  curr: "+str(error_count)+"<br/><br/>")
             self.response.out.write("\n\n"+body+"<br/><br/>")
-            
+
+            # The ping that crossed the threshold, or that ended an outage
+            # which had crossed it
+            if error_count >= ERROR_COUNT_THRESHOLD:
+                kind = "ERROR"
+                crossed = recent[error_count - ERROR_COUNT_THRESHOLD][0]
+            elif not error_count and prev_error_count >= ERROR_COUNT_THRESHOLD:
+                kind = "RESTORED"
+                crossed = recent[up_count - 1][0]
+            else:
+                continue
+
+            if crossed < since:
+                continue
+
+            # Runs overlap, so the first one to see the crossing claims it
+            claim = "notified:%s:%s:%s" % (service.key(), kind,
+                crossed.isoformat())
+            if not memcache.add(claim, 1, time=NOTIFY_CLAIM_EXPIRY):
+                continue
+
             # TODO: do we need to notified about failures across multiple services?
-            if error_count >= ERROR_COUNT_THRESHOLD or prev_error_count >= ERROR_COUNT_THRESHOLD:
-                if error_count == prev_error_count:
-                    continue
-                elif error_count > prev_error_count:
-                    subject = "BBF Status - ERROR system report for "+service.name
-                    self.response.out.write("ERROR NOTIFICATION SENT\n")
-                    result = mail.send_mail(SENDER_ADDRESS, recipient_addresses, subject, body)
-                elif error_count < prev_error_count:
-                    subject = "BBF Status - RESTORED system report for "+service.name
-                    self.response.out.write("RESTORED NOTIFICATION SENT\n")
-                    result = mail.send_mail(SENDER_ADDRESS, recipient_addresses, subject, body)
+            subject = "BBF Status - "+kind+" system report for "+service.name
+            self.response.out.write(kind+" NOTIFICATION SENT: "+service.slug+"\n")
+            result = mail.send_mail(SENDER_ADDRESS, recipient_addresses, subject, body)
                     
 class DataCleanupHandler(restful.Controller):
   def get(self):
     today = date.today()
     cutoff = today - timedelta(days=8)
-    events = Event.all().filter('start <', cutoff)
-    for event in events:
-      self.response.out.write(event.status.name)
-      event.delete()
+    if Event.bucketed():
+      queries = [Event.range(s, end=cutoff) for s in Service.all()]
+    else:
+      queries = [Event.all().filter('start <', cutoff)]
+
+    # Pings only write events when the status changes, so a stable
+    # service's current event can be its only one. It is kept however old
+    # it is, along with the status and interval it began.
+    current = set([s.current_sid for s in Service.all() if s.current_sid])
+
+    cleaned = set()
+    for events in queries:
+      for event in events:
+        if event.sid() in current:
+          continue
+        self.response.out.write(event.cached_status().name)
+        cleaned.add(Event.service.get_value_for_datastore(event))
+        event.delete()
+
+    for service in db.get(list(cleaned)):
+      if service:
+        Service.bump_version(service.slug)
+
+    midnight = datetime.datetime.combine(cutoff, datetime.time())
+    for old in [Change.all(keys_only=True).filter('created <', midnight),
+        CheckSeries.all(keys_only=True).filter('hour <', midnight)]:
+      keys = old.fetch(500)
+      while keys:
+        db.delete(keys)
+        keys = old.fetch(500)
                 
+class SummaryRebuildHandler(restful.Controller):
+    """
+    Computes the daily summaries from existing events, for installs that
+    have events from before summaries were kept. Started by visiting
+    /tasks/summaries, which queues a task per service; each task then
+    works through its days a month at a time, up to the day given as
+    until or else today.
+    """
+    DAYS_PER_TASK = 31
+
+    def post(self):
+        return self.get()
+
+    def get(self):
+        service_key = self.request.get('service', default_value=None)
+
+        if not service_key:
+            for key in Service.all(keys_only=True):
+                taskqueue.add(url='/tasks/summaries',
+                    params={'service': str(key)})
+            self.text("Queued summary rebuilds")
+            return
+
+        service = Service.get(db.Key(service_key))
+        if not service:
+            return
+
+        day = self.request.get('day', default_value=None)
+        if day:
+            day = datetime.datetime.strptime(day, "%Y-%m-%d").date()
+        else:
+            first = Event.range(service, descending=False).get()
+            if not first:
+                return
+            day = first.start.date()
+
+        until = self.request.get('until', default_value=None)
+        if until:
+            last = datetime.datetime.strptime(until, "%Y-%m-%d").date()
+        else:
+            last = date.today()
+
+        for i in range(self.DAYS_PER_TASK):
+            if day > last:
+                return
+            DailySummary.rebuild(service, day)
+            day = day + timedelta(days=1)
+
+        params = {'service': service_key, 'day': day.isoformat()}
+        if until:
+            params['until'] = until
+        taskqueue.add(url='/tasks/summaries', params=params)
+
+class IntervalRebuildHandler(restful.Controller):
+    """
+    Computes the status intervals from existing events, for installs that
+    have events from before intervals were kept. Started by visiting
+    /tasks/intervals, which queues a task per service.
+
+    A task given since only rebuilds the intervals from then on, and one
+    given day then rebuilds the summaries from that day to until, which
+    take their carried statuses from the intervals.
+    """
+
+    def post(self):
+        return self.get()
+
+    def get(self):
+        service_key = self.request.get('service', default_value=None)
+
+        if not service_key:
+            for key in Service.all(keys_only=True):
+                taskqueue.add(url='/tasks/intervals',
+                    params={'service': str(key)})
+            self.text("Queued interval rebuilds")
+            return
+
+        service = Service.get(db.Key(service_key))
+        if not service:
+            return
+
+        since = self.request.get('since', default_value=None)
+        if since:
+            since = datetime.datetime.strptime(since, "%Y-%m-%d %H:%M:%S")
+        StatusInterval.rebuild(service, since)
+
+        day = self.request.get('day', default_value=None)
+        if day:
+            params = {'service': service_key, 'day': day}
+            until = self.request.get('until', default_value=None)
+            if until:
+                params['until'] = until
+            taskqueue.add(url='/tasks/summaries', params=params)
+
+class DeletionHandler(restful.Controller):
+    """
+    Works through a DeletionJob, deleting a batch of events at a time and
+    queueing itself to carry on from a cursor. Once the events are gone it
+    deletes the service or status itself, and for statuses queues the
+    rebuilds of what the deleted events fed into. Started by the API's
+    DELETE methods.
+    """
+    BATCH_SIZE = 200
+    BATCHES_PER_TASK = 5
+
+    def post(self):
+        return self.get()
+
+    def get(self):
+        job = DeletionJob.get_by_id(int(self.request.get('job')))
+        if not job or job.state == "done":
+            return
+
+        target = db.Key(job.target)
+        if job.kind == "service":
+            query = Event.range(target, keys_only=True)
+        else:
+            # Events are needed, not just keys, to know what to rebuild
+            query = Event.all().filter('status =', target)
+
+        for i in range(self.BATCHES_PER_TASK):
+            if job.cursor:
+                query.with_cursor(job.cursor)
+
+            batch = query.fetch(self.BATCH_SIZE)
+            if job.kind == "status":
+                for event in batch:
+                    job.touch(event)
+                batch = [e.key() for e in batch]
+
+            db.delete(batch)
+            job.deleted += len(batch)
+            job.cursor = query.cursor()
+
+            if len(batch) < self.BATCH_SIZE:
+                self.finish(job, target)
+                return
+
+        job.put()
+        taskqueue.add(url='/tasks/delete', params={'job': job.key().id()})
+
+    def finish(self, job, target):
+        if job.kind == "service":
+            # Its change log stays until it ages out, so pollers still
+            # hear about the delete
+            for kind in [DailySummary, StatusInterval, CheckSeries]:
+                descendants = kind.all(keys_only=True).ancestor(target)
+                keys = descendants.fetch(500)
+                while keys:
+                    db.delete(keys)
+                    keys = descendants.fetch(500)
+            db.delete(target)
+            Service.forget_slug(job.slug)
+            Service.bump_version(job.slug)
+        else:
+            db.delete(target)
+            Status.bump_generation(job.slug)
+
+            # Services whose current event was just deleted
+            for service in Service.all().filter('current_status =', job.slug):
+                service.refresh_current()
+
+            # The intervals and summaries of the days the deleted events
+            # covered are rebuilt by a task per service, so a long range
+            # can't keep this one from finishing
+            for key, earliest, latest in zip(job.services, job.earliest,
+                    job.latest):
+                taskqueue.add(url='/tasks/intervals', params={
+                    'service': key,
+                    'since': earliest.strftime("%Y-%m-%d %H:%M:%S"),
+                    'day': earliest.date().isoformat(),
+                    'until': latest.date().isoformat(),
+                })
+
+        job.state = "done"
+        job.cursor = None
+        job.put()
+
+class EventRelayoutHandler(restful.Controller):
+    """
+    Moves flat events into buckets once EVENT_LAYOUT is "bucketed". Root
+    events sort before bucketed ones in key order, so each task moves the
+    first batch of events it finds and queues the next, until the batch
+    reaches the bucketed events. Visit /tasks/relayout to start.
+    """
+    BATCH_SIZE = 100
+
+    def post(self):
+        return self.get()
+
+    def get(self):
+        if not Event.bucketed():
+            self.text("EVENT_LAYOUT is not bucketed")
+            return
+
+        events = Event.all().order('__key__').fetch(self.BATCH_SIZE)
+        flat = [e for e in events if e.key().parent() is None]
+
+        moved = {}
+        copies = []
+        for event in flat:
+            copy = Event.create(Event.service.get_value_for_datastore(event),
+                Event.status.get_value_for_datastore(event), event.message,
+                event.informational, event.start)
+            copies.append(copy)
+
+        db.put(copies)
+        for event, copy in zip(flat, copies):
+            moved[event.sid()] = copy.sid()
+        db.delete(flat)
+
+        # Keep the denormalized current events pointing at the copies
+        service_keys = set([Event.service.get_value_for_datastore(e) for e in flat])
+        services = [s for s in db.get(list(service_keys)) if s]
+        def change(service):
+            if service.current_sid in moved:
+                service.current_sid = moved[service.current_sid]
+
+        # Changed on fresh copies in transactions, so an event recorded
+        # meanwhile isn't overwritten
+        for service in services:
+            if service.current_sid in moved:
+                service.update(change)
+
+        # Event ids have changed, so no cached copy is still valid
+        for service in services:
+            Service.bump_version(service.slug)
+
+        if flat and len(flat) == len(events):
+            taskqueue.add(url='/tasks/relayout')
+            self.text("Moved %d events, continuing" % len(flat))
+        else:
+            self.text("Moved %d events, done" % len(flat))
+
 class DebugHandler(restful.Controller):
     @authorized.force_ssl()
     def get(self):
@@ -315,16 +721,19 @@ class BasicRootHandler(restful.Controller):
 
         q = Service.all()
         q.order("name")
-        services = q.fetch(100)
-        
-        p = Status.all()
-        p.order("severity")
+        services = Service.live(q.fetch(100))
         
         past = get_past_days(5)
+
+        # One batch get covers the grid for every service
+        summaries = DailySummary.get_days([s.key() for s in services], past)
+        DailySummary.carry(services, summaries)
+        for service in services:
+            service.past_days = service.last_five_days(summaries)
         
         td = default_template_data()
-        td["services"] = q.fetch(100)
-        td["statuses"] = p.fetch(100)
+        td["services"] = services
+        td["statuses"] = Status.ordered()
         td["past"] = past
         td["default"] = Status.default()
 
@@ -343,7 +752,6 @@ class BasicServiceHandler(restful.Controller):
             self.render({}, "404.html")
             return
 
-        events = service.events
         show_admin = False
 
         try: 
@@ -365,17 +773,23 @@ class BasicServiceHandler(restful.Controller):
             self.render({},'404.html')
             return
             
-        if start_date and end_date:
-            events.filter('start >= ', start_date).filter('start <', end_date)
-
-        events.order("-start")
-
         td = default_template_data()
         td["service"] = service
-        td["events"] = events.fetch(100)
+        td["service_slug"] = service.slug
         td["start_date"] = start_date
         td["end_date"] = end_date
 
+        if year and not day:
+            last_date = min(end_date - timedelta(days=1), date.today())
+            days = DailySummary.days_between(start_date, last_date)
+            summaries = DailySummary.get_days([service.key()], days)
+            DailySummary.carry([service], summaries)
+            td["days"] = [summaries[(service.key(), d)] for d in days]
+            td["default"] = Status.default()
+        else:
+            events = Event.range(service, start_date, end_date)
+            td["events"] = Event.prefetch(events.fetch(100))
+
         self.render(td, 'basic','service.html')
         
 class DocumentationHandler(restful.Controller):
@@ -66,13 +66,23 @@ ROUTES = [
     ('/404.html', site.NotFoundHandler),
     (r'/api/(.+)/services', api.ServicesListHandler),
     (r'/api/(.+)/services/(.+)/events', api.EventsListHandler),
+    (r'/api/(.+)/services/(.+)/events\.ndjson', api.EventsExportHandler),
     (r'/api/(.+)/services/(.+)/events/current', api.CurrentEventHandler),
     (r'/api/(.+)/services/(.+)/events/(.+)', api.EventInstanceHandler),
+    (r'/api/(.+)/services/(.+)/days', api.DaysListHandler),
+    (r'/api/(.+)/services/(.+)/uptime', api.UptimeHandler),
+    (r'/api/(.+)/services/(.+)/checks', api.ChecksListHandler),
     (r'/api/(.+)/services/(.+)', api.ServiceInstanceHandler),
     (r'/api/(.+)/statuses', api.StatusesListHandler),
     (r'/api/(.+)/statuses/(.+)', api.StatusInstanceHandler),
     (r'/api/(.+)/status-images', api.ImagesListHandler),
     (r'/api/(.+)/levels', api.LevelsListHandler),
+    (r'/api/(.+)/events/batch', api.EventsBatchHandler),
+    (r'/api/(.+)/events\.ndjson', api.EventsExportHandler),
+    (r'/api/(.+)/events', api.EventsSearchHandler),
+    (r'/api/(.+)/dashboard', api.DashboardHandler),
+    (r'/api/(.+)/jobs/(.+)', api.JobInstanceHandler),
+    (r'/api/(.+)/changes', api.ChangesHandler),
     (r'/api/.*', api.NotFoundHandler),
     
     #SITE
@@ -83,6 +93,11 @@ ROUTES = [
     (r'/ping', pingHandler),
     (r'/notify', notificationHandler),
     (r'/clean_data', site.DataCleanupHandler),
+    (r'/tasks/summaries', site.SummaryRebuildHandler),
+    (r'/tasks/intervals', site.IntervalRebuildHandler),
+    (r'/tasks/relayout', site.EventRelayoutHandler),
+    (r'/tasks/delete', site.DeletionHandler),
+    (r'/tasks/ping', site.PingShardHandler),
     (r'/documentation/credentials', site.ProfileHandler),
     (r'/documentation/verify', site.VerifyAccessHandler),
     (r'/documentation/(.+)', site.DocumentationHandler),
@@ -19,13 +19,55 @@
 # THE SOFTWARE.
 
 from google.appengine.ext import db
+from google.appengine.api import memcache
 import datetime
+import time
+import os
+import random
+import heapq
+import zlib
+import sys
+import array
 from wsgiref.handlers import format_date_time
 from time import mktime
 from datetime import timedelta
 from datetime import date
 import config
 import urlparse
+from utils.cache import LRUCache
+from utils import versions
+from utils.serializers import Serializer, Field, Relation, Context
+
+def prefetch_references(entities, *properties):
+    """ Resolve ReferenceProperty values for a list of entities with a
+    single batch get. Each distinct referenced entity is fetched once, and
+    later dereferences are served from the property's cache instead of
+    costing a get each.
+
+    Arguments:
+    entities    -- list: Model instances of the same kind
+    properties  -- ReferenceProperty objects to resolve, e.g. Event.status
+
+    """
+    keys = set()
+    for entity in entities:
+        for prop in properties:
+            key = prop.get_value_for_datastore(entity)
+            if key:
+                keys.add(key)
+
+    referenced = {}
+    for ref in db.get(list(keys)):
+        if ref:
+            referenced[ref.key()] = ref
+
+    for entity in entities:
+        for prop in properties:
+            key = prop.get_value_for_datastore(entity)
+            if key in referenced:
+                prop.__set__(entity, referenced[key])
+
+    return entities
 
 class Level(object):
     """
@@ -77,52 +119,388 @@ class Service(db.Model):
         url            -- string: URL for the service cronjob
         pattern        -- string: Regex pattern for checks
         freq        -- int: minutes between pings
+        next_check_at -- datetime: When the service is next pinged
+        probe_shard -- int: Which ping task pings the service
+        deleting    -- bool: A DeletionJob is removing the service
 
     """
     @staticmethod
-    def get_by_slug(service_slug):
-        return Service.all().filter('slug = ', service_slug).get()
+    def get_by_slug(service_slug, deleting=False):
+        """ Return the service with the given slug, or None. Services
+        being deleted are left out unless deleting is True. """
+        key = Service.key_for_slug(service_slug)
+        if key is None:
+            return None
+
+        service = Service.get(key)
+        if service is None or service.slug != service_slug:
+            # Another instance deleted the service since we cached its key
+            Service.forget_slug(service_slug)
+            key = Service.key_for_slug(service_slug)
+            service = key and Service.get(key)
+
+        if service and service.deleting and not deleting:
+            return None
+        return service
+
+    @staticmethod
+    def live(services):
+        """ Leave out the services that are being deleted"""
+        return [s for s in services if not s.deleting]
+
+    @staticmethod
+    def key_for_slug(service_slug):
+        """ Resolve a slug to a service key, trying this instance's cache,
+        then memcache, then finally querying the datastore. Only found
+        services are cached.
+
+        Arguments:
+        service_slug -- string: The slug of the service
+
+        """
+        key = service_slugs.get(service_slug)
+        if key is not None:
+            return key
+
+        memcache_key = "service-slug:" + service_slug
+        value = memcache.get(memcache_key)
+        if value:
+            key = db.Key(value)
+        else:
+            key = Service.all(keys_only=True).filter('slug = ', service_slug).get()
+            if key is None:
+                return None
+            memcache.set(memcache_key, str(key))
+
+        service_slugs.set(service_slug, key)
+        return key
+
+    @staticmethod
+    def keys_for_slugs(slugs):
+        """ Resolve many slugs at once, like key_for_slug but with a single
+        memcache call for all the slugs this instance hasn't cached, and
+        a single query for those memcache hasn't either.
+
+        Arguments:
+        slugs       -- list: Slugs of the services
+
+        Returns a dict of slug to key, without the slugs that don't exist.
+        """
+        keys = {}
+        missing = []
+        for slug in slugs:
+            key = service_slugs.get(slug)
+            if key is not None:
+                keys[slug] = key
+            else:
+                missing.append(slug)
+
+        if missing:
+            cached = memcache.get_multi(missing, key_prefix="service-slug:")
+            for slug, value in cached.items():
+                keys[slug] = db.Key(value)
+                service_slugs.set(slug, keys[slug])
+
+            # The rest with one IN query per MAX_IN_VALUES slugs,
+            # rather than one query per slug
+            uncached = [slug for slug in missing if slug not in cached]
+            found = {}
+            for i in range(0, len(uncached), MAX_IN_VALUES):
+                query = Service.all().filter('slug IN',
+                    uncached[i:i + MAX_IN_VALUES])
+                for service in query:
+                    found[service.slug] = str(service.key())
+                    keys[service.slug] = service.key()
+                    service_slugs.set(service.slug, service.key())
+
+            if found:
+                memcache.set_multi(found, key_prefix="service-slug:")
+
+        return keys
+
+    @staticmethod
+    def get_by_slugs(slugs):
+        """ Fetch many services by slug with one batch get.
+
+        Returns a dict of slug to Service, without the slugs that don't
+        exist.
+        """
+        keys = Service.keys_for_slugs(slugs)
+        services = {}
+        for slug, service in zip(keys.keys(), db.get(keys.values())):
+            if service is None or service.slug != slug:
+                service = Service.get_by_slug(slug)
+            if service and not service.deleting:
+                services[slug] = service
+        return services
+
+    @staticmethod
+    def shard_for(service_slug):
+        """ The ping shard of a slug, spreading services evenly over
+        config.PING_SHARDS """
+        return (zlib.crc32(service_slug.encode("utf-8")) & 0xffffffff) % \
+            config.PING_SHARDS
+
+    @staticmethod
+    def schedule_unscheduled():
+        """ Make every service with a URL but no next_check_at due now, and
+        move services into the right shard after config.PING_SHARDS
+        changes. This fills in services saved before pings were scheduled,
+        so it only runs once for each deployed version of the app.
+        """
+        flag = "check-schedule:%s:%d" % (
+            os.environ.get('CURRENT_VERSION_ID', ''), config.PING_SHARDS)
+        if not memcache.add(flag, True):
+            return
+
+        for service in Service.all():
+            if not service.serviceurl:
+                continue
+            if service.next_check_at is not None and \
+                    service.probe_shard == Service.shard_for(service.slug):
+                continue
+
+            def txn(key=service.key()):
+                fresh = Service.get(key)
+                if fresh:
+                    fresh.schedule_check(fresh.next_check_at)
+                    fresh.put()
+            db.run_in_transaction(txn)
+
+        for shard in range(config.PING_SHARDS):
+            PingSchedule.changed(shard)
+
+    @staticmethod
+    def bump_version(service_slug):
+        """
+        Tell API clients that this service, its events or its summaries
+        have changed. Call this after the write has been committed.
+        """
+        versions.bump(versions.SERVICES, versions.service(service_slug))
+
+    @staticmethod
+    def forget_slug(service_slug):
+        """ Drop a slug from the caches after its service is created,
+        changed or deleted. Other instances notice a stale key when the
+        get for it fails.
+        """
+        service_slugs.delete(service_slug)
+        memcache.delete("service-slug:" + service_slug)
         
     def current_event(self):
-        event = self.events.order('-start').get()
+        if self.current_synced:
+            if self.current_sid:
+                return Event.get(db.Key(self.current_sid))
+            return None
+        event = Event.range(self).get()
         return event
 
+    def set_current(self, event, status=None):
+        """ Copy an event onto the denormalized current event properties.
+        Passing None marks the service as having no events.
+
+        Arguments:
+        event       -- Event object: The new current event, or None
+        status      -- Status object: The event's status, if already known
+
+        """
+        self.current_synced = True
+        if event:
+            status = status or event.cached_status()
+            self.current_sid = event.sid()
+            self.current_status = status.slug
+            self.current_severity = status.severity
+            self.current_start = event.start
+            self.current_message = event.message
+            self.current_informational = bool(event.informational)
+        else:
+            self.current_sid = None
+            self.current_status = None
+            self.current_severity = None
+            self.current_start = None
+            self.current_message = None
+            self.current_informational = False
+
+    def record_event(self, event, next_check_at=None):
+        """ Update the current event, the daily summary and the status
+        intervals after a new event has been written.
+
+        Arguments:
+        event         -- Event object: The event that was just written
+        next_check_at -- datetime: Optionally, when to ping the service next
+
+        """
+        self.record_events([event], next_check_at)
+
+    def record_events(self, events, next_check_at=None):
+        """ Update the current event, the daily summaries and the status
+        intervals after new events for this service have been written.
+
+        Runs in a transaction on the service so that two concurrent
+        writers can't leave an older event marked as current or lose a
+        count. More than events_per_transaction events are recorded in
+        several transactions, oldest first, so none grows too large.
+
+        Arguments:
+        events        -- list: Event objects that were just written
+        next_check_at -- datetime: Optionally, when to ping the service next
+
+        """
+        events = sorted(events, key=lambda e: e.start)
+
+        per = Service.events_per_transaction
+        if len(events) > per:
+            for i in range(0, len(events), per):
+                self.record_events(events[i:i + per], next_check_at)
+            return
+
+        # Look the statuses up outside the transaction, which can't run
+        # the registry's query
+        statuses = [e.cached_status() for e in events]
+        days = []
+        for event in events:
+            if event.start.date() not in days:
+                days.append(event.start.date())
+
+        # The change log is written in the same transaction, so pollers
+        # never see a change without its event or miss one
+        seqs = Change.allocate(len(events))
+
+        def txn():
+            service = Service.get(self.key())
+            summaries = DailySummary.get_days([self.key()], days)
+            entities = [service]
+
+            for event, status, seq in zip(events, statuses, seqs):
+                entities.append(Change.for_event(self, event, status, seq))
+
+            for event, status in zip(events, statuses):
+                summaries[(self.key(), event.start.date())].add(event,
+                    status.severity)
+
+                if service.current_synced and service.current_start \
+                        and service.current_start > event.start:
+                    continue
+
+                interval = service.close_interval(status, event.start)
+                if interval:
+                    entities.append(interval)
+                    # Written now, so reading the days it spans takes no
+                    # query for the intervals
+                    DailySummary.hold(summaries, self.key(),
+                        interval.severity, interval.start, interval.end)
+                service.set_current(event, status)
+
+            if next_check_at:
+                service.next_check_at = next_check_at
+
+            entities.extend(summaries.values())
+            for i in range(0, len(entities), Service.max_put):
+                db.put(entities[i:i + Service.max_put])
+            return service
+
+        service = db.run_in_transaction(txn)
+        for name in Service.current_properties:
+            setattr(self, name, getattr(service, name))
+        self.next_check_at = service.next_check_at
+        Service.bump_version(self.slug)
+
+    def close_interval(self, status, when):
+        """ Start a new status interval if status differs from the current
+        one, returning the interval that just closed, if any. Must be
+        called before set_current.
+
+        Arguments:
+        status      -- Status object: The status of the newest event
+        when        -- datetime: When the newest event occurred
+
+        """
+        if self.status_since and self.current_status == status.slug:
+            return None
+
+        interval = None
+        if self.status_since and self.current_status:
+            interval = StatusInterval(parent=self, status=self.current_status,
+                severity=self.current_severity, start=self.status_since,
+                end=when)
+
+        self.status_since = when
+        return interval
+
+    def update(self, change):
+        """ Apply change, a function taking a Service, to a fresh copy of
+        this service in a transaction and save it. Saving this copy
+        instead would overwrite whatever record_events committed since it
+        was read, such as a newer current event. This copy is then brought
+        up to date with what was saved.
+
+        Returns False, without calling change, if the service is gone.
+        """
+        def txn():
+            service = Service.get(self.key())
+            if service is None:
+                return None
+            change(service)
+            service.put()
+            return service
+
+        service = db.run_in_transaction(txn)
+        if service is None:
+            return False
+        for name in Service.properties():
+            setattr(self, name, getattr(service, name))
+        return True
+
+    def refresh_current(self):
+        """ Recompute the current event from the datastore, used after
+        events are deleted and to fill in services created before the
+        current event was denormalized.
+        """
+        event = Event.range(self).get()
+        seen = self.current_sid
+
+        def change(service):
+            # A newer event recorded since the query already is current
+            if service.current_sid == seen or not service.current_synced:
+                service.set_current(event)
+
+        self.update(change)
+        Service.bump_version(self.slug)
+
 
     #Specialty function for front page
-    def last_five_days(self):
-        
-        
+    def last_five_days(self, summaries=None):
+        """ Return the summary of each of the five days before today, most
+        recent first.
+
+        Arguments:
+        summaries   -- dict: Optional result of DailySummary.get_days, so a
+                       whole page of services can share one batch get,
+                       already passed through DailySummary.carry
+
+        """
         lowest = Status.default()
-        severity = lowest.severity
         
         yesterday = date.today() - timedelta(days=1)
-        ago = yesterday - timedelta(days=5)
-        
-        events = self.events.filter('start >', ago) \
-            .filter('start <', yesterday).fetch(100)
-        
-        stats = {}
-        
-        for i in range(5):
-            stats[yesterday.day] = {
-                "image": lowest.image,
-                "day": yesterday,
-            }
-            yesterday = yesterday - timedelta(days=1)
-        
-        for event in events:
-            if event.status.severity > severity:
-                stats[event.start.day]["image"] = "information"
-                stats[event.start.day]["information"] = True
+        days = [yesterday - timedelta(days=i) for i in range(5)]
+
+        if summaries is None:
+            summaries = DailySummary.get_days([self.key()], days)
+            DailySummary.carry([self], summaries)
 
         results = []
 
-        keys = stats.keys()
-        keys.sort()
-        keys.reverse()
+        for day in days:
+            stat = {
+                "image": lowest.image,
+                "day": day,
+            }
 
-        for k in keys:
-            results.append(stats[k])
+            if summaries[(self.key(), day)].flagged():
+                stat["image"] = "information"
+                stat["information"] = True
+
+            results.append(stat)
             
         return results
         
@@ -138,8 +516,7 @@ class Service(db.Model):
         
         next_day = day + timedelta(days=1)
         
-        return self.events.filter('start >=', day) \
-            .filter('start <', next_day).fetch(40)
+        return Event.range(self, day, next_day).fetch(40)
             
     def compare(self, other_status):
         return 0
@@ -150,35 +527,145 @@ class Service(db.Model):
     serviceurl = db.TextProperty(required=False)
     pattern = db.TextProperty(required=False)
     freq = db.IntegerProperty(required=False, default=1)
+    deleting = db.BooleanProperty(default=False)
+
+    # Services without a URL are never due, so the ping cron only reads
+    # the services it has to probe
+    next_check_at = db.DateTimeProperty()
+    probe_shard = db.IntegerProperty()
+
+    # The most recent event, copied here by record_event so that listing
+    # services doesn't cost an Event query and a Status get per service.
+    current_synced = db.BooleanProperty(default=False)
+    current_sid = db.StringProperty()
+    current_status = db.StringProperty()
+    current_severity = db.IntegerProperty()
+    current_start = db.DateTimeProperty()
+    current_message = db.TextProperty()
+    current_informational = db.BooleanProperty(default=False)
+
+    # When the current status began, i.e. the start of the open interval
+    status_since = db.DateTimeProperty()
+
+    current_properties = ["current_synced", "current_sid", "current_status",
+        "current_severity", "current_start", "current_message",
+        "current_informational", "status_since"]
+
+    # Events recorded by one transaction of record_events, which also
+    # writes a Change per event and the summaries and intervals they touch
+    events_per_transaction = 100
+
+    # The most entities one datastore put accepts
+    max_put = 500
     
     def sid(self):
         return str(self.key())
         
     def resource_url(self):
         return "/services/" + self.slug
-        
-    def rest(self, base_url):
-        """ Return a Python object representing this model"""
 
-        m = {}
-        m["name"] = str(self.name)
-        m["id"] = str(self.slug)
-        m["description"] = str(self.description)
-        m["url"] = base_url + self.resource_url()
-        if self.pattern:
-            m["pattern"] = str(self.pattern)
+    def schedule_check(self, when=None):
+        """ Set when the service is next pinged, now unless when is given.
+        Services without a URL are never pinged. Doesn't save the service.
+        """
+        self.probe_shard = Service.shard_for(self.slug)
         if self.serviceurl:
-            m["serviceurl"] = str(self.serviceurl)
-        if self.freq:
-            m["freq"] = str(self.freq)
-        
-        event = self.current_event()
-        if event:
-            m["current-event"] = event.rest(base_url)
+            self.next_check_at = when or datetime.datetime.now()
         else:
-            m["current-event"] = None
+            self.next_check_at = None
 
-        return m
+    def current_status_entity(self, statuses=None):
+        """ The Status of the current event, from statuses if given"""
+        if statuses is not None:
+            return statuses.get(self.current_status)
+        return Status.get_by_slug(self.current_status)
+
+    def current_event_rest(self, base_url, statuses=None, context=None):
+        """ Return a Python object representing the current event, built
+        from the denormalized properties instead of the Event itself.
+
+        Arguments:
+        base_url    -- string: The base url for resource urls
+        statuses    -- dict: Optional map of slug to Status, to avoid
+                       looking up the status for every service
+        context     -- Context: Optional fields and embeds to serialize
+
+        """
+        context = context or Context(base_url, statuses=statuses)
+
+        if not self.current_synced:
+            self.refresh_current()
+
+        if not self.current_sid:
+            return None
+
+        if not self.current_status_entity(context.statuses):
+            event = self.current_event()
+            if event:
+                return Event.serializer.serialize(event, context)
+            return None
+
+        return Service.current_serializer.serialize(self, context)
+
+    def current_event_reference(self, context):
+        if not self.current_synced:
+            self.refresh_current()
+
+        if not self.current_sid:
+            return None
+
+        return {"sid": self.current_sid, "url": context.base_url +
+            self.resource_url() + "/events/" + self.current_sid}
+
+    # The current event, from the denormalized properties
+    current_serializer = Serializer([
+        Field("sid", lambda s, c: s.current_sid),
+        Field("timestamp", lambda s, c:
+            format_date_time(mktime(s.current_start.timetuple()))),
+        Relation("status",
+            lambda s, c: Status.serializer.serialize(
+                s.current_status_entity(c.statuses), c),
+            lambda s, c: Status.reference(s.current_status, c.base_url)),
+        Field("message", lambda s, c: str(s.current_message)),
+        Field("url", lambda s, c: c.base_url + s.resource_url() +
+            "/events/" + s.current_sid),
+        Field("informational", lambda s, c: bool(s.current_informational)),
+    ])
+
+    serializer = Serializer([
+        Field("name", lambda s, c: str(s.name)),
+        Field("id", lambda s, c: str(s.slug)),
+        Field("description", lambda s, c: str(s.description)),
+        Field("url", lambda s, c: c.base_url + s.resource_url()),
+        Field("pattern", lambda s, c: s.pattern and str(s.pattern) or None,
+            optional=True),
+        Field("serviceurl", lambda s, c: s.serviceurl and str(s.serviceurl)
+            or None, optional=True),
+        Field("freq", lambda s, c: s.freq and str(s.freq) or None,
+            optional=True),
+        Relation("current-event",
+            lambda s, c: s.current_event_rest(c.base_url, context=c),
+            lambda s, c: s.current_event_reference(c)),
+    ])
+
+    def rest(self, base_url, statuses=None, fields=None, embed=None):
+        """ Return a Python object representing this model
+
+        Arguments:
+        base_url    -- string: The base url for resource urls
+        statuses    -- dict: Optional map of slug to Status
+        fields      -- list: Only include these fields, see utils.serializers
+        embed       -- list: Only embed these relations
+
+        """
+        return Service.serializer.serialize(self,
+            Context(base_url, fields, embed, statuses))
+
+# Slug to key, for this instance. See Service.key_for_slug
+service_slugs = LRUCache(1000)
+
+# The most values the datastore allows in one IN filter
+MAX_IN_VALUES = 30
 
 class Status(db.Model):
     """A possible system status
@@ -189,11 +676,33 @@ class Status(db.Model):
         description -- string: The state this status represents
         image       -- string: Image in /images/status
         severity    -- int: The serverity of this status
+        deleting    -- bool: A DeletionJob is removing the status
 
     """
     @staticmethod
     def get_by_slug(status_slug):
-        return Status.all().filter('slug = ', status_slug).get()
+        return status_registry.load().by_slug.get(status_slug)
+
+    @staticmethod
+    def get_by_key(status_key):
+        return status_registry.load().by_key.get(status_key)
+
+    @staticmethod
+    def get_by_severity(severity):
+        """
+        Return the first status with the given severity.
+        """
+        for status in status_registry.load().statuses:
+            if status.severity == severity:
+                return status
+        return None
+
+    @staticmethod
+    def ordered():
+        """
+        Return every status, ordered by severity.
+        """
+        return status_registry.load().statuses
         
     @staticmethod
     def default():
@@ -201,7 +710,41 @@ class Status(db.Model):
         Return the first status with a NORMAL level.
         """
         normal = Level.get_severity(Level.normal)
-        return Status.all().filter('severity == ', normal).get()
+        return Status.get_by_severity(normal)
+
+    @staticmethod
+    def bump_generation(status_slug=None):
+        """
+        Tell every instance to reload its status registry. Call this after
+        any status is created, changed or deleted, with its slug.
+
+        Besides the status list, only the responses that render the status
+        are invalidated: the status itself, and the services that are in
+        it or have been, as their status intervals record.
+        """
+        status_registry.bump()
+        tags = [versions.STATUSES]
+        if status_slug:
+            tags.append(versions.status(status_slug))
+            tags.extend(Status.service_tags(status_slug))
+        versions.bump(*tags)
+
+    @staticmethod
+    def service_tags(status_slug):
+        """ The version tags of the services whose responses include the
+        status, with the service list's if there are any """
+        keys = set(Service.all(keys_only=True)
+            .filter('current_status =', status_slug))
+        intervals = StatusInterval.all(keys_only=True) \
+            .filter('status =', status_slug)
+        for key in intervals:
+            keys.add(key.parent())
+
+        services = [s for s in db.get(list(keys)) if s]
+        tags = [versions.service(s.slug) for s in services]
+        if tags:
+            tags.append(versions.SERVICES)
+        return tags
 
     @staticmethod
     def install_defaults():
@@ -223,6 +766,7 @@ class Status(db.Model):
         d.put()
         u.put()
         w.put()
+        Status.bump_generation()
 
         s = Setting(name="installed_defaults")
         s.put()
@@ -233,6 +777,7 @@ class Status(db.Model):
     description = db.TextProperty(required=True)
     image = db.StringProperty(required=True)
     severity = db.IntegerProperty(required=True)
+    deleting = db.BooleanProperty(default=False)
     
     def image_url(self):
         return "/images/status/" + unicode(self.image) + ".png"
@@ -240,66 +785,1264 @@ class Status(db.Model):
     def resource_url(self):
         return "/statuses/" + str(self.slug)
         
-    def rest(self, base_url):
-        """ Return a Python object representing this model"""
+    @staticmethod
+    def reference(status_slug, base_url):
+        """ A reference to a status, for when it isn't embedded"""
+        return {"id": str(status_slug),
+            "url": base_url + "/statuses/" + str(status_slug)}
 
-        m = {}
-        m["name"] = str(self.name)
-        m["id"] = str(self.slug)
-        m["description"] = str(self.description)
-        m["level"] = Level.get_level(int(self.severity))
-        m["url"] = base_url + self.resource_url()
+    def absolute_image_url(self, base_url):
         # This link shouldn't be hardcoded
-        
         o = urlparse.urlparse(base_url)
-        m["image"] = o.scheme + "://" +  o.netloc + self.image_url()
-        
-        return m
+        return o.scheme + "://" +  o.netloc + self.image_url()
+
+    serializer = Serializer([
+        Field("name", lambda s, c: str(s.name)),
+        Field("id", lambda s, c: str(s.slug)),
+        Field("description", lambda s, c: str(s.description)),
+        Field("level", lambda s, c: Level.get_level(int(s.severity))),
+        Field("url", lambda s, c: c.base_url + s.resource_url()),
+        Field("image", lambda s, c: s.absolute_image_url(c.base_url)),
+    ])
+
+    def rest(self, base_url, fields=None, embed=None):
+        """ Return a Python object representing this model"""
+        return Status.serializer.serialize(self,
+            Context(base_url, fields, embed))
     
 
+class StatusRegistry(object):
+    """
+    An in-process copy of every Status, indexed by slug, key and severity.
+
+    Statuses almost never change, so rather than query for them on every
+    request the registry keeps them between requests and only checks a
+    generation counter in memcache, at most once every check_interval
+    seconds however many lookups there are. Any write to a status bumps
+    the counter, and every instance reloads on its first check after it.
+    """
+    generation_key = "status-generation"
+    check_interval = 1
+
+    def __init__(self):
+        self.generation = None
+        self.checked = 0
+        self.statuses = []
+        self.by_slug = {}
+        self.by_key = {}
+
+    def current_generation(self):
+        generation = memcache.get(self.generation_key)
+        if generation is None:
+            # Evicted or never set. Start from the clock so the new value
+            # can't match a generation some instance already loaded.
+            memcache.add(self.generation_key, int(time.time() * 1000))
+            generation = memcache.get(self.generation_key)
+        return generation
+
+    def bump(self):
+        if memcache.incr(self.generation_key) is None:
+            memcache.set(self.generation_key, int(time.time() * 1000))
+        # This instance sees its own change straight away
+        self.checked = 0
+
+    def load(self):
+        """ Reload the statuses if they have changed, and return self"""
+        now = time.time()
+        if self.generation is not None and \
+                now - self.checked < self.check_interval:
+            return self
+
+        generation = self.current_generation()
+        self.checked = now
+        if generation is not None and generation == self.generation:
+            return self
+
+        # Statuses being deleted can still be found by key, for the events
+        # that haven't been deleted yet, but can't be used for new ones
+        statuses = Status.all().order('severity').fetch(1000)
+        self.statuses = [s for s in statuses if not s.deleting]
+        self.by_slug = dict((s.slug, s) for s in self.statuses)
+        self.by_key = dict((s.key(), s) for s in statuses)
+        self.generation = generation
+        return self
+
+status_registry = StatusRegistry()
+
+# Bucketed events are only ever found by key, so they skip the indexes
+EVENT_INDEXED = config.EVENT_LAYOUT != "bucketed"
+
+# Events read by the first query of each stream merged by Event.search.
+# Later reads double in size, up to the number of events still wanted.
+EVENT_STREAM_BATCH = 20
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+def newest_first(when):
+    """ Return a number that sorts datetimes newest first, to the
+    microsecond, for heapq's smallest-first ordering. """
+    delta = when - EPOCH
+    return -((delta.days * 86400 + delta.seconds) * 1000000 +
+        delta.microseconds)
+
+class EventStream(object):
+    """
+    Reads the events of one query, newest first, in batches that grow as
+    more of them are wanted, so merging many streams only reads about as
+    many events as the merge returns.
+    """
+
+    def __init__(self, query, keep=None, batch_size=EVENT_STREAM_BATCH,
+            most=None):
+        self.query = query
+        self.keep = keep
+        self.batch_size = batch_size
+        self.most = most
+        self.events = []
+        self.done = False
+
+    def next_event(self):
+        """ Return the stream's next event, or None once it runs out"""
+        while not self.events and not self.done:
+            size = self.batch_size
+            if self.most:
+                size = min(size, self.most)
+            batch = self.query.fetch(size)
+            if len(batch) < size:
+                self.done = True
+            else:
+                self.query.with_cursor(self.query.cursor())
+                self.batch_size = size * 2
+
+            if self.keep:
+                batch = [e for e in batch if self.keep(e)]
+            self.events = batch
+            self.events.reverse()
+
+        if self.events:
+            return self.events.pop()
+        return None
+
 class Event(db.Model):
 
-    start = db.DateTimeProperty(required=True, auto_now_add=True)
+    start = db.DateTimeProperty(required=True, auto_now_add=True,
+        indexed=EVENT_INDEXED)
 
     # We want this to be required, but it would break all current installs
     # Instead, we handle it in the rest method
-    informational = db.BooleanProperty(default=False)
+    informational = db.BooleanProperty(default=False, indexed=EVENT_INDEXED)
 
     status = db.ReferenceProperty(Status, required=True)
     message = db.TextProperty(required=True)
     service = db.ReferenceProperty(Service, required=True, 
-        collection_name="events")
+        collection_name="events", indexed=EVENT_INDEXED)
+
+    @staticmethod
+    def bucketed(layout=None):
+        return (layout or config.EVENT_LAYOUT) == "bucketed"
+
+    @staticmethod
+    def bucket_key(service_key, day):
+        """ Return the parent key shared by a service's events for a day.
+        The bucket entity itself is never stored.
+        """
+        return db.Key.from_path("EventBucket", "s%s/%s" % (service_key,
+            day.isoformat()))
+
+    @staticmethod
+    def key_name_for(when, suffix=""):
+        # Names sort in time order within a bucket
+        return "t" + when.strftime("%Y%m%d%H%M%S") + \
+            "%06d" % when.microsecond + suffix
+
+    @staticmethod
+    def create(service, status, message, informational=False, start=None,
+            layout=None):
+        """ Build a new, unsaved event, keyed according to the event layout.
+
+        Arguments:
+        service       -- Service object or key: The service of the event
+        status        -- Status object or key: The status of the service
+        message       -- string: The event's message
+        informational -- bool: Whether the event is only informational
+        start         -- datetime: When the event occurred, defaults to now
+        layout        -- string: Override config.EVENT_LAYOUT
+
+        """
+        start = start or datetime.datetime.now()
+        kwargs = {}
+
+        if Event.bucketed(layout):
+            service_key = service
+            if isinstance(service, db.Model):
+                service_key = service.key()
+
+            # The random suffix keeps two events in the same microsecond
+            # from overwriting each other
+            suffix = "-%08x" % random.getrandbits(32)
+            kwargs["parent"] = Event.bucket_key(service_key, start.date())
+            kwargs["key_name"] = Event.key_name_for(start, suffix)
+
+        return Event(service=service, status=status, message=message,
+            informational=bool(informational), start=start, **kwargs)
+
+    @staticmethod
+    def range(service, start=None, end=None, descending=True,
+            keys_only=False, layout=None):
+        """ Return a query for a service's events in a range of time,
+        newest first unless descending is False. Flat events are found
+        through the service/start indexes, bucketed ones by key range.
+
+        Arguments:
+        service     -- Service object or key: The service
+        start       -- datetime: The earliest event to include
+        end         -- datetime: Include only events before this time
+        descending  -- bool: Order the events newest first
+        keys_only   -- bool: Return only the keys of the events
+        layout      -- string: Override config.EVENT_LAYOUT
+
+        """
+        if isinstance(service, db.Model):
+            service = service.key()
+
+        # Dates mean midnight
+        if start and not isinstance(start, datetime.datetime):
+            start = datetime.datetime.combine(start, datetime.time())
+        if end and not isinstance(end, datetime.datetime):
+            end = datetime.datetime.combine(end, datetime.time())
+
+        query = Event.all(keys_only=keys_only)
+
+        if not Event.bucketed(layout):
+            query.filter('service =', service)
+            if start:
+                query.filter('start >=', start)
+            if end:
+                query.filter('start <', end)
+            if descending:
+                query.order('-start')
+            else:
+                query.order('start')
+            return query
+
+        # Bucket names are "s<service key>/<day>", so "/" and "0" bound
+        # every bucket belonging to the service
+        prefix = "s%s" % service
+        if start:
+            lower = db.Key.from_path("Event", Event.key_name_for(start),
+                parent=Event.bucket_key(service, start.date()))
+        else:
+            lower = db.Key.from_path("EventBucket", prefix + "/")
+        if end:
+            upper = db.Key.from_path("Event", Event.key_name_for(end),
+                parent=Event.bucket_key(service, end.date()))
+        else:
+            upper = db.Key.from_path("EventBucket", prefix + "0")
+
+        query.filter('__key__ >=', lower).filter('__key__ <', upper)
+        if descending:
+            query.order('-__key__')
+        else:
+            query.order('__key__')
+        return query
+        
+    @staticmethod
+    def search(services=None, statuses=None, start=None, end=None,
+            limit=100, after=None, layout=None):
+        """ Return the newest events of many services at once, newest
+        first. Each service, or each status, is read as its own stream
+        through the indexes the layout has, and the streams are merged on
+        start, so no more events are read than the page needs.
+
+        Arguments:
+        services    -- list: Service keys, or None for every live service
+        statuses    -- list: Status keys to include, or None for every one
+        start       -- datetime: The earliest event to include
+        end         -- datetime: Include only events before this time
+        limit       -- int: The most events to return
+        after       -- tuple: (datetime, count) to carry on from the
+                       count-th event that starts at that time, as
+                       returned by Event.continuation
+        layout      -- string: Override config.EVENT_LAYOUT
+
+        """
+        skip = 0
+        if after:
+            when, skip = after
+            if end is None or end > when:
+                end = when + timedelta(microseconds=1)
+            else:
+                skip = 0
+
+        keep = None
+
+        if statuses is not None:
+            statuses = list(statuses)
+            if not statuses:
+                return []
+
+        if not Event.bucketed(layout):
+            if services is None:
+                # One global stream per status, reading the start index
+                # directly; only the services being deleted are filtered
+                deleting = set(Service.all(keys_only=True)
+                    .filter('deleting =', True))
+                if deleting:
+                    keep = lambda e: \
+                        Event.service.get_value_for_datastore(e) \
+                        not in deleting
+
+                queries = []
+                for status in statuses or [None]:
+                    query = Event.all()
+                    if status:
+                        query.filter('status =', status)
+                    if start:
+                        query.filter('start >=', start)
+                    if end:
+                        query.filter('start <', end)
+                    queries.append(query.order('-start'))
+            else:
+                queries = []
+                for service in services:
+                    for status in statuses or [None]:
+                        query = Event.range(service, start, end,
+                            layout=layout)
+                        if status:
+                            query.filter('status =', status)
+                        queries.append(query)
+        else:
+            # Bucketed events can only be found by key, so each service is
+            # one stream and statuses are filtered as the events are read
+            if services is None:
+                services = [s.key() for s in Service.live(Service.all())]
+            if statuses is not None:
+                wanted_statuses = set(statuses)
+                keep = lambda e: \
+                    Event.status.get_value_for_datastore(e) in wanted_statuses
+            queries = [Event.range(service, start, end, layout=layout)
+                for service in services]
+
+        wanted = limit + skip
+        batch_size = EVENT_STREAM_BATCH
+        if len(queries) == 1:
+            batch_size = wanted
+        streams = [EventStream(q, keep, batch_size, wanted) for q in queries]
+
+        heap = []
+        for i, stream in enumerate(streams):
+            event = stream.next_event()
+            if event:
+                heap.append((newest_first(event.start), i, event))
+        heapq.heapify(heap)
+
+        events = []
+        while heap and len(events) < limit:
+            order, i, event = heapq.heappop(heap)
+            if skip and event.start == when:
+                skip -= 1
+            else:
+                events.append(event)
+
+            stream = streams[i]
+            stream.most = max(1, limit - len(events) + skip)
+            following = stream.next_event()
+            if following:
+                heapq.heappush(heap, (newest_first(following.start), i,
+                    following))
+
+        return events
+
+    @staticmethod
+    def continuation(events, after=None):
+        """ Return the after argument for Event.search that carries on
+        from the end of a page of its results. """
+        last = events[-1].start
+        count = len([e for e in events if e.start == last])
+        if after and after[0] == last:
+            count += after[1]
+        return (last, count)
+        
+    @staticmethod
+    def prefetch(events):
+        """ Resolve the status and service of every event, so a list of
+        events can be serialized without a get per event. Statuses come
+        from the registry, services from one batch get.
+        """
+        missing = False
+        for event in events:
+            status = Status.get_by_key(Event.status.get_value_for_datastore(event))
+            if status:
+                Event.status.__set__(event, status)
+                event.prefetched_status = status
+            else:
+                missing = True
+
+        if missing:
+            return prefetch_references(events, Event.status, Event.service)
+        return prefetch_references(events, Event.service)
         
     def duration(self):
-        # calculate the difference between start and end
-        # should evantually be stored
-        pass
+        """ Return how long this event's status lasted, as a timedelta: the
+        time until the service's next event, or until now for the current
+        event. Use StatusInterval for durations over longer periods.
+        """
+        service_key = Event.service.get_value_for_datastore(self)
+        after = self.start + timedelta(microseconds=1)
+        following = Event.range(service_key, after, descending=False).get()
+
+        if following:
+            return following.start - self.start
+        return datetime.datetime.now() - self.start
         
     def sid(self):
         return str(self.key())
+
+    def cached_status(self):
+        """ Return the event's status as resolved by prefetch, or else from
+        the registry, falling back to the datastore for a status the
+        registry doesn't know about.
+        """
+        status = getattr(self, "prefetched_status", None)
+        if status is None:
+            status_key = Event.status.get_value_for_datastore(self)
+            status = Status.get_by_key(status_key) or Status.get(status_key)
+            self.prefetched_status = status
+        return status
         
     def resource_url(self):
         return self.service.resource_url() + "/events/" + self.sid()
     
+    serializer = Serializer([
+        Field("sid", lambda e, c: e.sid()),
+        Field("timestamp", lambda e, c:
+            format_date_time(mktime(e.start.timetuple()))),
+        Relation("status",
+            lambda e, c: Status.serializer.serialize(e.cached_status(), c),
+            lambda e, c: Status.reference(e.cached_status().slug,
+                c.base_url)),
+        Field("message", lambda e, c: str(e.message)),
+        Field("url", lambda e, c: c.base_url + e.resource_url()),
+        Field("informational", lambda e, c: bool(e.informational)),
+    ])
+
+    def rest(self, base_url, fields=None, embed=None):
+        """ Return a Python object representing this model"""
+        return Event.serializer.serialize(self,
+            Context(base_url, fields, embed))
+        
+class DailySummary(db.Model):
+    """A rollup of one service's events for one UTC day, stored as a child
+    of the service so it can be updated in the same transaction
+
+        Properties:
+        day           -- date: The day being summarized
+        severity      -- int: The largest severity of the day's events
+        count         -- int: The number of events that day
+        informational -- bool: Whether any of the events was informational
+        first         -- datetime: When the first event occurred
+        last          -- datetime: When the last event occurred
+        carried       -- int: The largest severity of the statuses the
+                         service held during the day, including one that
+                         began on an earlier day. Pings only write an
+                         event when the status changes, so a day spent
+                         down from start to finish has no events.
+
+    """
+    day = db.DateProperty(required=True)
+    severity = db.IntegerProperty(default=0)
+    count = db.IntegerProperty(default=0)
+    informational = db.BooleanProperty(default=False)
+    first = db.DateTimeProperty()
+    last = db.DateTimeProperty()
+    carried = db.IntegerProperty(default=0)
+
+    # Days of a long interval recorded when it closes, enough for the
+    # year view
+    MAX_CARRIED_DAYS = 366
+
+    @staticmethod
+    def key_for(service_key, day):
+        # Key names may not begin with a digit
+        return db.Key.from_path("DailySummary", "day:" + day.isoformat(),
+            parent=service_key)
+
+    @staticmethod
+    def get_days(service_keys, days):
+        """ Fetch the summaries for every service and day with a single
+        batch get. Days without any events get an empty, unsaved summary.
+
+        Arguments:
+        service_keys -- list: Keys of the services to summarize
+        days         -- list: Date objects to summarize
+
+        Returns a dict keyed by (service key, day).
+        """
+        pairs = [(k, d) for k in service_keys for d in days]
+        keys = [DailySummary.key_for(k, d) for k, d in pairs]
+
+        summaries = {}
+        for pair, key, summary in zip(pairs, keys, db.get(keys)):
+            if summary is None:
+                summary = DailySummary(parent=pair[0], key_name=key.name(),
+                    day=pair[1])
+            summaries[pair] = summary
+
+        return summaries
+
+    @staticmethod
+    def carry(services, summaries):
+        """ Fold each service's current status into the summaries of the
+        days since it began. Closed intervals are already recorded in the
+        summaries when they close, but the current one only ends with the
+        next status change. Uses the services as loaded, without a query.
+        The summaries are changed for display and must not be saved.
+
+        Arguments:
+        services    -- list: Service objects the summaries belong to
+        summaries   -- dict: The result of DailySummary.get_days
+
+        """
+        for service in services:
+            if not (service.status_since and service.current_status):
+                continue
+            since = service.status_since.date()
+            for (service_key, day), summary in summaries.items():
+                if day >= since and service_key == service.key():
+                    summary.carried = max(summary.carried or 0,
+                        service.current_severity or 0)
+
+    @staticmethod
+    def hold(summaries, service_key, severity, start, end):
+        """ Record in summaries, a dict as returned by get_days, that the
+        service held a status of severity from start until end, adding the
+        summaries of the days missing from it. Only the last
+        MAX_CARRIED_DAYS days of the interval are recorded.
+
+        Arguments:
+        summaries   -- dict: Summaries keyed by (service key, day)
+        service_key -- Key: The service's key
+        severity    -- int: The severity of the status
+        start       -- datetime: When the status began
+        end         -- datetime: When the next status began
+
+        """
+        last = end.date()
+        if end == datetime.datetime.combine(last, datetime.time()) \
+                and end > start:
+            last = last - timedelta(days=1)
+        first = max(start.date(),
+            last - timedelta(days=DailySummary.MAX_CARRIED_DAYS - 1))
+        days = DailySummary.days_between(first, last)
+
+        missing = [d for d in days if (service_key, d) not in summaries]
+        if missing:
+            summaries.update(DailySummary.get_days([service_key], missing))
+
+        for day in days:
+            summary = summaries[(service_key, day)]
+            summary.carried = max(summary.carried or 0, severity or 0)
+
+    @staticmethod
+    def days_between(start_date, end_date):
+        """ Return the days from end_date back to start_date, inclusive"""
+        days = []
+        day = end_date
+        while day >= start_date:
+            days.append(day)
+            day = day - timedelta(days=1)
+        return days
+
+    @staticmethod
+    def rebuild(service, day):
+        """ Recompute a summary from the day's events and status intervals,
+        for when events are deleted and for summarizing events written
+        before summaries existed.
+
+        Arguments:
+        service     -- Service object: The service to summarize
+        day         -- Date object: The day to summarize
+
+        """
+        summary = DailySummary(parent=service,
+            key_name=DailySummary.key_for(service.key(), day).name(), day=day)
+
+        next_day = day + timedelta(days=1)
+        query = Event.range(service, day, next_day, descending=False)
+
+        for event in query:
+            status = event.cached_status()
+            summary.add(event, status and status.severity or 0)
+
+        # The closed intervals that overlap the day. The current one is
+        # folded in by carry when the summary is read.
+        began = datetime.datetime.combine(day, datetime.time())
+        ended = began + timedelta(days=1)
+        intervals = StatusInterval.all().ancestor(service) \
+            .filter('end >', began).order('end')
+        for interval in intervals:
+            if interval.start >= ended:
+                break
+            summary.carried = max(summary.carried, interval.severity)
+
+        if summary.count or summary.carried:
+            summary.put()
+        else:
+            db.delete(summary.key())
+        Service.bump_version(service.slug)
+
+        return summary
+
+    def add(self, event, severity):
+        """ Fold a new event into the summary.
+
+        Arguments:
+        event       -- Event object: The event to add
+        severity    -- int: The severity of the event's status
+
+        """
+        self.count += 1
+        self.severity = max(self.severity, severity)
+        self.informational = bool(self.informational or event.informational)
+
+        if self.first is None or event.start < self.first:
+            self.first = event.start
+        if self.last is None or event.start > self.last:
+            self.last = event.start
+
+    def worst(self):
+        """ The largest severity of the day's events and statuses"""
+        return max(self.severity or 0, self.carried or 0)
+
+    def flagged(self):
+        """ Whether the day should be highlighted on the front page"""
+        normal = Level.get_severity(Level.normal)
+        return self.informational or self.worst() > normal
+
     def rest(self, base_url):
         """ Return a Python object representing this model"""
+
+        m = {}
+        m["day"] = self.day.isoformat()
+        m["count"] = self.count
+        m["level"] = Level.get_level(self.worst()) or Level.normal
+        m["informational"] = bool(self.informational)
+        m["information"] = self.flagged()
+
+        for name in ["first", "last"]:
+            value = getattr(self, name)
+            if value:
+                m[name] = format_date_time(mktime(value.timetuple()))
+            else:
+                m[name] = None
+
+        return m
         
+def total_seconds(delta):
+    return delta.days * 86400 + delta.seconds + delta.microseconds / 1000000.0
+
+class StatusInterval(db.Model):
+    """A closed period during which a service kept the same status, stored
+    as a child of the service when the status changes. The open interval
+    is the service's current status, which began at Service.status_since.
+
+        Properties:
+        status      -- string: The slug of the status
+        severity    -- int: The severity of the status
+        start       -- datetime: When the status began
+        end         -- datetime: When the next status began
+
+    """
+    status = db.StringProperty(required=True)
+    severity = db.IntegerProperty(required=True)
+    start = db.DateTimeProperty(required=True)
+    end = db.DateTimeProperty(required=True)
+
+    @staticmethod
+    def rebuild(service, since=None):
+        """ Recompute the intervals from the service's events, used after
+        events are deleted and for services with events from before
+        intervals were kept. Intervals that ended before since are kept,
+        so history survives the removal of old events.
+
+        Arguments:
+        service     -- Service object: The service to rebuild
+        since       -- datetime: Only rebuild from this time on
+
+        """
+        stale = StatusInterval.all(keys_only=True).ancestor(service)
+        if since:
+            stale.filter('end >', since)
+
+        keys = stale.fetch(500)
+        while keys:
+            db.delete(keys)
+            keys = stale.fetch(500)
+
+        previous = StatusInterval.all().ancestor(service).order('-end').get()
+
+        events = Event.range(service, previous and previous.end,
+            descending=False)
+
+        intervals = []
+        slug = severity = began = None
+
+        for event in events:
+            status = event.cached_status()
+            if status.slug == slug:
+                continue
+            if slug is not None:
+                intervals.append(StatusInterval(parent=service, status=slug,
+                    severity=severity, start=began, end=event.start))
+            slug, severity, began = status.slug, status.severity, event.start
+
+        for i in range(0, len(intervals), 500):
+            db.put(intervals[i:i + 500])
+
+        seen = service.current_sid
+
+        def change(fresh):
+            # An event recorded since the rebuild started already moved
+            # status_since on
+            if fresh.current_sid == seen:
+                fresh.status_since = began
+
+        service.update(change)
+        Service.bump_version(service.slug)
+
+    @staticmethod
+    def report(service, start, end):
+        """ Summarize how long the service spent at each level between
+        start and end, from the stored intervals rather than the events.
+
+        Arguments:
+        service     -- Service object: The service to report on
+        start       -- datetime: The beginning of the window
+        end         -- datetime: The end of the window
+
+        Returns a dict with the seconds observed, the seconds spent at each
+        level, the seconds of downtime (ERROR or worse) and the uptime as a
+        percentage of the observed time.
+        """
+        spans = []
+
+        query = StatusInterval.all().ancestor(service) \
+            .filter('end >', start).order('end')
+        for interval in query:
+            if interval.start < end:
+                spans.append((interval.severity, interval.start, interval.end))
+
+        if service.status_since and service.current_status:
+            spans.append((service.current_severity, service.status_since,
+                datetime.datetime.now()))
+
+        levels = {}
+        for severity, began, ended in spans:
+            seconds = total_seconds(min(ended, end) - max(began, start))
+            if seconds > 0:
+                level = Level.get_level(severity) or Level.normal
+                levels[level] = levels.get(level, 0) + seconds
+
+        error = Level.get_severity(Level.error)
+        observed = sum(levels.values())
+        downtime = sum([t for l, t in levels.items()
+            if Level.get_severity(l) >= error])
+
+        uptime = None
+        if observed:
+            uptime = round(100.0 * (observed - downtime) / observed, 3)
+
+        return {
+            "observed": observed,
+            "downtime": downtime,
+            "uptime": uptime,
+            "levels": levels,
+        }
+        
+class Change(db.Model):
+    """An entry in the change log read by the Changes resource, stored as
+    a child of its service
+
+        Properties:
+        seq         -- int: Increases with every change
+        kind        -- string: "event" for a new event, "service" when the
+                       service is created or changed, "deleted" when it
+                       is deleted
+        service     -- string: The slug of the service
+        sid         -- string: The key of the event, for event changes
+        status      -- string: The slug of the event's status
+        created     -- datetime: When the change was made
+
+    """
+    seq = db.IntegerProperty(required=True)
+    kind = db.StringProperty(required=True,
+        choices=["event", "service", "deleted"])
+    service = db.StringProperty(required=True)
+    sid = db.StringProperty(indexed=False)
+    status = db.StringProperty(indexed=False)
+    created = db.DateTimeProperty(required=True)
+
+    sequence_key = "change-sequence"
+
+    # Skipped when the sequence restarts, to stay clear of numbers that
+    # were handed out but not yet written when memcache lost the counter
+    restart_gap = 10000
+
+    # How long a poller keeps looking for a number it skipped, longer than
+    # any write takes to commit, and the most numbers it keeps looking for
+    gap_expiry = 60
+    max_gaps = 100
+
+    @staticmethod
+    def allocate(count=1):
+        """ Reserve count sequence numbers and return them in order"""
+        last = memcache.incr(Change.sequence_key, delta=count)
+        if last is None:
+            latest = Change.all().order('-seq').get()
+            start = (latest and latest.seq or 0) + Change.restart_gap
+            memcache.add(Change.sequence_key, start)
+            last = memcache.incr(Change.sequence_key, delta=count)
+            if last is None:
+                last = start + count
+        return range(last - count + 1, last + 1)
+
+    @staticmethod
+    def current():
+        """ The last sequence number handed out, or None if unknown"""
+        return memcache.get(Change.sequence_key)
+
+    @staticmethod
+    def since(seq, limit, gaps=None):
+        """ Return up to limit changes after seq, in order, and the numbers
+        up to the last of them that haven't been seen yet.
+
+        Numbers are handed out before their changes are committed, so a
+        change can show up after a higher number has been read. Each
+        missing number is kept as a gap, mapped to when it was first
+        missed, and is looked for again by later calls until it turns up
+        or has been missing for gap_expiry seconds, like numbers that were
+        handed out for a write that failed. Gaps that turn up are returned
+        before the newer changes.
+
+        Arguments:
+        seq         -- int: The last number already seen
+        limit       -- int: The most new changes to return
+        gaps        -- dict: The gaps returned by the previous call
+
+        Returns a tuple of the changes and the gaps still open.
+        """
+        gaps = dict(gaps or {})
+
+        late = []
+        missing = sorted(gaps)
+        for i in range(0, len(missing), MAX_IN_VALUES):
+            late.extend(Change.all().filter('seq IN',
+                missing[i:i + MAX_IN_VALUES]))
+        late.sort(key=lambda c: c.seq)
+
+        changes = Change.all().filter('seq >', seq).order('seq').fetch(limit)
+
+        now = int(time.time())
+        last = seq
+        for change in changes:
+            # A bigger jump is the sequence restarting, see restart_gap
+            if change.seq - last - 1 <= Change.max_gaps:
+                for missed in range(last + 1, change.seq):
+                    gaps[missed] = now
+            last = change.seq
+
+        for change in late:
+            gaps.pop(change.seq, None)
+        open_gaps = [(s, t) for s, t in gaps.items()
+            if now - t < Change.gap_expiry]
+        open_gaps.sort()
+        return late + changes, dict(open_gaps[-Change.max_gaps:])
+
+    @staticmethod
+    def for_event(service, event, status, seq):
+        return Change(parent=service, seq=seq, kind="event",
+            service=service.slug, sid=event.sid(), status=status.slug,
+            created=datetime.datetime.now())
+
+    @staticmethod
+    def record(service, kind):
+        """ Log a change to the service itself"""
+        change = Change(parent=service, seq=Change.allocate()[0], kind=kind,
+            service=service.slug, created=datetime.datetime.now())
+        change.put()
+        return change
+
+    def rest(self, base_url):
+        """ Return a Python object representing this model"""
+
         m = {}
-        m["sid"] = self.sid()
+        m["seq"] = str(self.seq)
+        m["kind"] = self.kind
+        m["service"] = str(self.service)
+        m["url"] = base_url + "/services/" + str(self.service)
+        m["timestamp"] = format_date_time(mktime(self.created.timetuple()))
 
-        stamp = mktime(self.start.timetuple())
-        m["timestamp"] = format_date_time(stamp)
-        m["status"] = self.status.rest(base_url)
-        m["message"] = str(self.message)
-        m["url"] = base_url + self.resource_url()
+        if self.sid:
+            m["event"] = {
+                "sid": self.sid,
+                "status": str(self.status),
+                "url": m["url"] + "/events/" + self.sid,
+            }
+
+        return m
+
+# What a ping found, as stored by CheckSeries
+CHECK_PASSED = 0
+CHECK_FAILED_LOAD = 1
+CHECK_FAILED_REGEX = 2
+
+CHECK_RESULTS = {
+    CHECK_PASSED: "passed",
+    CHECK_FAILED_LOAD: "failed-load",
+    CHECK_FAILED_REGEX: "failed-regex",
+}
+
+def pack(typecode, values):
+    """ Pack numbers into a little endian string"""
+    packed = array.array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tostring()
+
+def unpack(typecode, data):
+    """ The numbers in a string made by pack"""
+    packed = array.array(typecode)
+    packed.fromstring(data)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tolist()
+
+class CheckSeries(db.Model):
+    """
+    An hour of a service's ping results, as packed arrays, so a result
+    that doesn't change the service's status costs a few bytes instead of
+    an Event. Children of their service, named by the hour.
+
+    New results are buffered in memcache, holding the whole hour so far,
+    and written out every flush_every results and when the hour is over.
+    Results still in the buffer are lost if memcache drops it.
+
+        Properties:
+        hour        -- datetime: The start of the hour
+        count       -- int: The number of results
+        offsets     -- blob: Seconds into the hour of each ping, 16 bit
+        results     -- blob: CHECK_PASSED etc. for each ping, 8 bit
+        codes       -- blob: HTTP status codes, 0 for no response, 16 bit
+        latencies   -- blob: How long each fetch took in ms, 16 bit
+
+    """
+    hour = db.DateTimeProperty(required=True)
+    count = db.IntegerProperty(default=0, indexed=False)
+    offsets = db.BlobProperty(default="")
+    results = db.BlobProperty(default="")
+    codes = db.BlobProperty(default="")
+    latencies = db.BlobProperty(default="")
+
+    buffer_prefix = "checks:"
+    buffer_expiry = 2 * 60 * 60
+    flush_every = 15
+
+    arrays = [("offsets", "H"), ("results", "B"), ("codes", "H"),
+        ("latencies", "H")]
+
+    @staticmethod
+    def key_for(service_key, hour):
+        return db.Key.from_path("CheckSeries", hour.strftime("h%Y%m%d%H"),
+            parent=service_key)
+
+    @staticmethod
+    def hour_of(when):
+        return when.replace(minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def empty_buffer(hour):
+        return {"hour": hour, "count": 0, "flushed": 0, "offsets": "",
+            "results": "", "codes": "", "latencies": ""}
+
+    def buffer(self):
+        """ A memcache buffer holding this entity's results"""
+        buf = CheckSeries.empty_buffer(self.hour)
+        for name, typecode in CheckSeries.arrays:
+            buf[name] = getattr(self, name)
+        buf["count"] = buf["flushed"] = self.count
+        return buf
+
+    @staticmethod
+    def from_buffer(service_key, buf):
+        series = CheckSeries(key=CheckSeries.key_for(service_key,
+            buf["hour"]), hour=buf["hour"], count=buf["count"])
+        for name, typecode in CheckSeries.arrays:
+            setattr(series, name, buf[name])
+        return series
+
+    @staticmethod
+    def record(points):
+        """ Add ping results to their services' series.
+
+        Arguments:
+        points      -- list: (service key, datetime, result, HTTP status
+                       code, latency in ms) tuples, at most one per service
+
+        """
+        if not points:
+            return
+
+        names = [str(p[0]) for p in points]
+        buffers = memcache.get_multi(names,
+            key_prefix=CheckSeries.buffer_prefix)
 
-        if self.informational:
-            m["informational"] = self.informational
+        # A lost buffer starts again from what was last written out
+        missing = [p for p in points if str(p[0]) not in buffers]
+        if missing:
+            stored = db.get([CheckSeries.key_for(p[0],
+                CheckSeries.hour_of(p[1])) for p in missing])
+            for point, series in zip(missing, stored):
+                if series:
+                    buffers[str(point[0])] = series.buffer()
+                else:
+                    buffers[str(point[0])] = CheckSeries.empty_buffer(
+                        CheckSeries.hour_of(point[1]))
+
+        flushes = []
+        for service_key, when, result, code, latency in points:
+            buf = buffers[str(service_key)]
+            hour = CheckSeries.hour_of(when)
+            if buf["hour"] != hour:
+                if buf["count"] > buf["flushed"]:
+                    flushes.append((None, CheckSeries.from_buffer(
+                        service_key, buf)))
+                buf = CheckSeries.empty_buffer(hour)
+                buffers[str(service_key)] = buf
+
+            offset = (when - hour).seconds
+            values = [offset, result, code, min(int(latency), 65535)]
+            for (name, typecode), value in zip(CheckSeries.arrays, values):
+                buf[name] += pack(typecode, [value])
+            buf["count"] += 1
+
+            if buf["count"] - buf["flushed"] >= CheckSeries.flush_every:
+                flushes.append((buf, CheckSeries.from_buffer(service_key,
+                    buf)))
+
+        # Results are only marked as written once they have been
+        if flushes:
+            db.put([series for buf, series in flushes])
+            for buf, series in flushes:
+                if buf:
+                    buf["flushed"] = series.count
+
+        memcache.set_multi(buffers, key_prefix=CheckSeries.buffer_prefix,
+            time=CheckSeries.buffer_expiry)
+
+    @staticmethod
+    def points(service_key, start, end):
+        """ Return a service's ping results from start until end, oldest
+        first, as (datetime, result, code, latency) tuples. """
+        query = CheckSeries.all().ancestor(service_key)
+        query.filter('__key__ >=', CheckSeries.key_for(service_key,
+            CheckSeries.hour_of(start)))
+        query.filter('__key__ <=', CheckSeries.key_for(service_key,
+            CheckSeries.hour_of(end)))
+        hours = [s.buffer() for s in query.order('__key__')]
+
+        # The latest hour may have more results in memcache
+        buf = memcache.get(CheckSeries.buffer_prefix + str(service_key))
+        if buf and CheckSeries.hour_of(start) <= buf["hour"] <= end:
+            if hours and hours[-1]["hour"] == buf["hour"]:
+                if buf["count"] > hours[-1]["count"]:
+                    hours[-1] = buf
+            elif not hours or hours[-1]["hour"] < buf["hour"]:
+                hours.append(buf)
+
+        points = []
+        for buf in hours:
+            columns = [unpack(typecode, buf[name])
+                for name, typecode in CheckSeries.arrays]
+            for offset, result, code, latency in zip(*columns):
+                when = buf["hour"] + timedelta(seconds=offset)
+                if start <= when < end:
+                    points.append((when, result, code, latency))
+        return points
+
+class PingSchedule(object):
+    """
+    When each service of a ping shard is next due, kept in memcache as one
+    value, so a ping that doesn't change a service's status writes nothing
+    to the datastore. next_check_at is only written with status changes,
+    so when the schedule is lost, or a service is added or changed, it is
+    rebuilt from next_check_at and the services that haven't changed are
+    simply due at once.
+    """
+    key_prefix = "ping-schedule:"
+
+    # How long a run may hold its shard, the longest a task can run
+    lease_prefix = "ping-lease:"
+    lease_time = 10 * 60
+
+    def __init__(self, shard):
+        self.shard = shard
+        tag = versions.ping_shard(shard)
+        self.version = versions.get([tag])[tag]
+
+        stored = memcache.get(self.key_prefix + str(shard))
+        if stored and stored["version"] == self.version:
+            self.times = stored["times"]
         else:
-            m["informational"] = False
-        
+            self.times = self.rebuild()
+
+    @staticmethod
+    def lease(shard):
+        """ Claim the shard for one run, returning False if another run
+        holds it. Overlapping runs would each save the schedule they
+        started with, undoing each other's pings. Release it with
+        release once the schedule is saved. """
+        key = PingSchedule.lease_prefix + str(shard)
+        if memcache.add(key, 1, time=PingSchedule.lease_time):
+            return True
+
+        # Without memcache there is no schedule to race on either
+        return memcache.get(key) is None
+
+    @staticmethod
+    def release(shard):
+        memcache.delete(PingSchedule.lease_prefix + str(shard))
+
+    def rebuild(self):
+        query = Service.all().filter('probe_shard =', self.shard)
+        query.filter('next_check_at >', EPOCH)
+        return dict((str(s.key()), s.next_check_at) for s in query)
+
+    @staticmethod
+    def changed(shard):
+        """ Rebuild the shard's schedule from the datastore on its next
+        run. Call this after saving a change to a service's schedule. """
+        versions.bump(versions.ping_shard(shard))
+
+    def due(self, now, limit):
+        """ Return the keys of up to limit services due by now, the most
+        overdue first. """
+        due = [(when, key) for key, when in self.times.items()
+            if when <= now]
+        due.sort()
+        return [db.Key(key) for when, key in due[:limit]]
+
+    def set(self, service_key, when):
+        self.times[str(service_key)] = when
+
+    def drop(self, service_key):
+        self.times.pop(str(service_key), None)
+
+    def save(self):
+        # Saved with the version it was built for, so a change made while
+        # the shard was running still causes a rebuild
+        memcache.set(self.key_prefix + str(self.shard),
+            {"version": self.version, "times": self.times})
+
+class PingShard(db.Model):
+    """
+    Counts of the pings done by one shard, keyed by the shard's number, so
+    uneven shards show up.
+
+        Properties:
+        runs        -- int: Ping tasks run by the shard
+        pinged      -- int: Services pinged over all runs
+        failed      -- int: Pings that got no response
+        seconds     -- float: Time spent over all runs
+        last_pinged -- int: Services pinged by the latest run
+        last_seconds -- float: How long the latest run took
+        updated     -- datetime: When the latest run finished
+
+    """
+    runs = db.IntegerProperty(default=0)
+    pinged = db.IntegerProperty(default=0)
+    failed = db.IntegerProperty(default=0)
+    seconds = db.FloatProperty(default=0.0)
+    last_pinged = db.IntegerProperty(default=0)
+    last_seconds = db.FloatProperty(default=0.0)
+    updated = db.DateTimeProperty(auto_now=True)
+
+    @staticmethod
+    def record(shard, pinged, failed, seconds):
+        """ Add a finished run to the shard's counts"""
+        def txn():
+            stats = PingShard.get_by_key_name(str(shard)) or \
+                PingShard(key_name=str(shard))
+            stats.runs += 1
+            stats.pinged += pinged
+            stats.failed += failed
+            stats.seconds += seconds
+            stats.last_pinged = pinged
+            stats.last_seconds = seconds
+            stats.put()
+        db.run_in_transaction(txn)
+
+class DeletionJob(db.Model):
+    """A service or status being deleted in the background, along with
+    its events, by the /tasks/delete task
+
+        Properties:
+        kind        -- string: "service" or "status"
+        target      -- string: The key of the entity being deleted
+        slug        -- string: The slug of the entity being deleted
+        state       -- string: "running" until everything is deleted, then
+                       "done"
+        deleted     -- int: The number of events deleted so far
+        cursor      -- string: Where the next batch of events starts
+        services    -- list: For statuses, the keys of the services that
+                       lost events, so their summaries can be rebuilt
+        earliest    -- list: The earliest event each service lost
+        latest      -- list: The latest event each service lost
+
+    """
+    kind = db.StringProperty(required=True, choices=["service", "status"])
+    target = db.StringProperty(required=True)
+    slug = db.StringProperty(required=True)
+    state = db.StringProperty(default="running")
+    deleted = db.IntegerProperty(default=0)
+    cursor = db.TextProperty()
+    services = db.StringListProperty()
+    earliest = db.ListProperty(datetime.datetime)
+    latest = db.ListProperty(datetime.datetime)
+    created = db.DateTimeProperty(auto_now_add=True)
+    updated = db.DateTimeProperty(auto_now=True)
+
+    def touch(self, event):
+        """ Remember which service lost the event, and when"""
+        service_key = str(Event.service.get_value_for_datastore(event))
+        if service_key in self.services:
+            i = self.services.index(service_key)
+            self.earliest[i] = min(self.earliest[i], event.start)
+            self.latest[i] = max(self.latest[i], event.start)
+        else:
+            self.services.append(service_key)
+            self.earliest.append(event.start)
+            self.latest.append(event.start)
+
+    def resource_url(self):
+        return "/jobs/" + str(self.key().id())
+
+    def rest(self, base_url):
+        """ Return a Python object representing this model"""
+
+        m = {}
+        m["id"] = str(self.key().id())
+        m["kind"] = self.kind
+        m["target"] = str(self.slug)
+        m["state"] = self.state
+        m["deleted"] = self.deleted
+        m["url"] = base_url + self.resource_url()
+
+        for name in ["created", "updated"]:
+            value = getattr(self, name)
+            m[name] = format_date_time(mktime(value.timetuple()))
+
         return m
-        
+
 class Profile(db.Model):
     owner = db.UserProperty(required=True)
     token = db.StringProperty(required=True)
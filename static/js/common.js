@@ -253,16 +253,22 @@ stashboard.fillIndex = function() {
     for (var i=0; i < 5; i++) {
         $("<th />", {
             "class": "date",
-            text: (d.getMonth() + 1) + "/" + d.getDate() + "/" + d.getFullYear()
+            text: (d.getUTCMonth() + 1) + "/" + d.getUTCDate() + "/" + d.getUTCFullYear()
         }).appendTo(thead);
         d = new Date(d.getTime() - 86400000);
     }
 
-    var createServiceRow = function(data, fetchStatuses){
-        var informationImage = "/images/status/question-white.png";
+    var createServiceRow = function(data){
         var defaultImage = "/images/status/tick-circle.png";
-        var imageRow = defaultImage;
         var tr = $('<tr />', {id: data.id});
+        var evt = data["current-event"];
+        var status = $('<a />', {
+            href: 'services/' + data.id,
+            html: $("<img />", {
+                src: evt ? evt.status.image : defaultImage,
+                alt: evt ? evt.status.name : "Unknown Status"
+            })
+        });
 
         $('<td />').append(
             $('<a />', {
@@ -272,131 +278,54 @@ stashboard.fillIndex = function() {
             "<span style='font-size:10px'> - "+data.freq+" mins, <a href='"+data.serviceurl+"'>link</a></span>"
         ).appendTo(tr);
 
-        if (fetchStatuses) {
-            imageRow = informationImage;
-        }
-        
-        $('<td />', {"class": "status highlight"}).append(
-            $('<a />', {
-                href: 'services/' + data.id,
-                html: $("<img />", {
-                    src: imageRow,
-                    alt: "Unknown Status"
-                })
-            })
-        ).appendTo(tr);
-
-        for (var i=0; i < 5; i++) {
-            $("<td />", {"class": "status"}).append(
+        if (evt && evt.informational) {
+            status.append(
                 $("<img />", {
-                    src: imageRow,
-                    alt: "Unknown Status"
+                    src: "/images/small-information.png", 
+                    "class": "information"
                 })
-            ).appendTo(tr);
+            );
         }
 
-        $("#service-list").fadeIn('fast', function(){    
-            $("#services-body").append(tr);
-        });
-
-        if (fetchStatuses){
-
-            $.ajax({ 
-                type: "GET",
-                url: "/api/v1/services/" + data.id + "/events/current",
-                dataType: 'json', 
-                success: function(evt){ 
-                    $("#" + data.id + " td.highlight img")
-                        .attr("src", evt.status.image);
-
-                    if (evt.informational) {
-                        $("#" + data.id + " td.highlight a").append(
-                            $("<img />", {
-                                src: "/images/small-information.png", 
-                                "class": "information"
-                            })
-                        );
-                    }
-                },
-                error: function(evt){ 
-                    $("#" + data.id + " td.highlight img")
-                        .attr("src", defaultImage);
-                }
-            });
+        $('<td />', {"class": "status highlight"}).append(status).appendTo(tr);
 
-            var rightNow = new Date();
-            rightNow.setHours(0);
-            rightNow.setMinutes(0);
-        rightNow.setSeconds(0);
-            rightNow.setMilliseconds(0);
-
-            var endDate = new Date(rightNow.getTime());
-            var startDate = new Date(endDate.getTime() - 86400000 * 5);
-            var url = "/api/v1/services/" + data.id + "/events";
-            url += "?start=" + stashboard.rfc1123(startDate);
-            url += "&end=" + stashboard.rfc1123(endDate);
-
-            $.ajax({ 
-                type: "GET",
-                url: url,
-                dataType: 'json', 
-                success: function(results){ 
-                    var calendar = {};
-                    var days = [];
-
-            // Make end date the correct date
-            endDate = new Date(endDate.getTime() - 86400000);
-
-                    for (var i=0; i < 5; i++) {
-                        days.push(endDate);
-                        calendar[endDate.getDate()] = false;
-                        endDate = new Date(endDate.getTime() - 86400000);
-                    }
+        // New services don't have any days yet
+        var days = data.days || [];
 
-                    var events = results.events;
-
-                    for (i=0; i < events.length; i++) {
-                        var e = events[i];
-                        var evtDate = new Date(e.timestamp);
-                        calendar[evtDate.getDate()] = e.informational || e.status.level !== "NORMAL";
-                    }
-
-                    for (i= days.length-1; i >= 0; i--) {
-                        var d = days[i];
-                        var td = $("#" + data.id).children("td").eq(i+2);
-
-                        url = "/services/" + data.id + "/" + d.getFullYear() + "/";
-                        url += (d.getMonth() + 1) + "/" + d.getDate();
-
-                        if (calendar[d.getDate()]) {
-                            td.html($("<a />", {href: url}).append(
-                                $("<img />",{src: "/images/status/information.png"}))
-                            );
-                        } else {
-                            td.html($("<a />", {href: url}).append(
-                                $("<img />",{src: defaultImage}))
-                            );
-                        }
-                    }
+        for (var i=0; i < 5; i++) {
+            var td = $("<td />", {"class": "status"}).appendTo(tr);
+            var img = $("<img />", {src: defaultImage, alt: "No Issues"});
 
-                },
-                error: function(){ 
+            if (i < days.length) {
+                var url = "/services/" + data.id + "/";
+                url += days[i].day.replace(/-0?/g, "/");
 
+                if (days[i].information) {
+                    img.attr({src: "/images/status/information.png", alt: "Information"});
                 }
-            });
+                td.append($("<a />", {href: url}).append(img));
+            } else {
+                td.append(img);
+            }
         }
+
+        $("#service-list").fadeIn('fast', function(){    
+            $("#services-body").append(tr);
+        });
     };
 
+    // Services, their current events and their daily summaries all come
+    // back in a single request
     $.ajax({ 
         type: "GET",
-        url: "/api/v1/services",
+        url: "/api/v1/dashboard",
         dataType: 'json', 
         success: function(data){ 
 
             var services = data.services;
 
             for (var i=0; i < services.length; i++) {
-                createServiceRow(services[i], true);
+                createServiceRow(services[i]);
             }
 
         },
@@ -447,7 +376,7 @@ stashboard.fillIndex = function() {
                     context: $("#service-list"), 
                     success: function(data){ 
                         $("#add-service-modal").dialog('close');
-                        createServiceRow(data, false);
+                        createServiceRow(data);
                     },
                     error: function(evt){ 
                         $("#add-service-modal").dialog('close');
@@ -463,7 +392,7 @@ stashboard.fillIndex = function() {
     });
 };
 
-stashboard.fillService = function(serviceName, isAdmin, start_date, end_date) {
+stashboard.fillService = function(serviceName, isAdmin, start_date, end_date, showEvents) {
     var createRow = function(data) {
         var d = new Date(data.timestamp);
         var time = $.datepicker.formatDate("MM d, ", d);
@@ -566,39 +495,45 @@ stashboard.fillService = function(serviceName, isAdmin, start_date, end_date) {
                 
             };
 
-            eventsURL = "/api/v1/services/" + service.id + "/events";
+            if (showEvents === false) {
+                // Month and year pages list the days instead of events
+                var current = service["current-event"];
+                populatStatuses(current ? current.status.name : undefined);
+            } else {
+                eventsURL = "/api/v1/services/" + service.id + "/events";
 
-            if (start_date){
-                var start = stashboard.rfc1123(start_date);
-                var end = stashboard.rfc1123(end_date);
-                eventsURL += "?start=" + start;
-                eventsURL += "&end=" + end;
-            }
+                if (start_date){
+                    var start = stashboard.rfc1123(start_date);
+                    var end = stashboard.rfc1123(end_date);
+                    eventsURL += "?start=" + start;
+                    eventsURL += "&end=" + end;
+                }
 
-            $.ajax({ 
-                type: "GET",
-                url: eventsURL,
-                dataType: "json",
-                context: $(".event-log").children('tbody'), 
-                success: function(data){
-
-                    var events = data.events;
-                    var length = events.length;
-
-                    if (length > 0) {
-                        populatStatuses(events[0].status.name);
-                        for (var i=0; i < length; i++) {
-                            var tr = createRow(events[i]);
-                            $(this).append(tr);  
+                $.ajax({ 
+                    type: "GET",
+                    url: eventsURL,
+                    dataType: "json",
+                    context: $(".event-log").children('tbody'), 
+                    success: function(data){
+
+                        var events = data.events;
+                        var length = events.length;
+
+                        if (length > 0) {
+                            populatStatuses(events[0].status.name);
+                            for (var i=0; i < length; i++) {
+                                var tr = createRow(events[i]);
+                                $(this).append(tr);  
+                            }
+                        } else {
+                            populatStatuses();
                         }
-                    } else {
+                    },
+                    error: function(){
                         populatStatuses();
                     }
-                },
-                error: function(){
-                    populatStatuses();
-                }
-            });
+                });
+            }
 
             $("#delete-service").click(function(event){
                 $("#delete-service-modal").dialog({
@@ -9,9 +9,11 @@ stashboard.start = function(){
     previous.parentNode.removeChild(previous);
   }
   
+  // The API sends ETags with Cache-Control: no-cache, so the browser
+  // revalidates its copy and only downloads the services when they change
   var jsonp = document.createElement('script');
   jsonp.setAttribute("id", "stashboardJavascript");
-  jsonp.setAttribute("src", stashboard.host + "/api/v1/services?callback=stashboard.callback&random=" + Math.random());
+  jsonp.setAttribute("src", stashboard.host + "/api/v1/services?callback=stashboard.callback");
   jsonp.setAttribute("type", "text/javascript");
   document.body.appendChild(jsonp);
 };
@@ -0,0 +1,112 @@
+# Copyright (c) 2010 Twilio Inc.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Compares the cost of writing and reading events under the current
+# EVENT_LAYOUT. Which Event properties are indexed is fixed when models is
+# imported, so run this once with EVENT_LAYOUT = "flat" and once with
+# "bucketed" (restarting the SDK in between) and compare the two reports.
+#
+# Paste into the interactive development SDK console, found at
+# /_ah/admin/interactive, and press "Run Program"
+
+import os
+import time
+from datetime import datetime, timedelta
+
+from google.appengine.api import quota
+from google.appengine.ext import db
+
+import config
+from models import Status, Service, Event
+
+EVENTS = 300
+DAYS = 5
+
+def measure(label, func):
+    started = time.time()
+    megacycles = quota.get_request_api_cpu_usage()
+    result = func()
+    elapsed = (time.time() - started) * 1000
+    megacycles = quota.get_request_api_cpu_usage() - megacycles
+    print "%-32s %9.1f ms %9d api megacycles" % (label, elapsed, megacycles)
+    return result
+
+def index_rows():
+    """ Index rows written per event: the kind index, an ascending and a
+    descending row per indexed property, and a row per composite index in
+    index.yaml whose properties are all indexed.
+    """
+    indexed = set(["__key__"])
+    for name, prop in Event.properties().items():
+        if prop.indexed and not isinstance(prop, (db.TextProperty, db.BlobProperty)):
+            indexed.add(name)
+
+    rows = 1 + 2 * (len(indexed) - 1)
+
+    composites = []
+    kind = None
+    f = open(os.path.join(config.APP_ROOT_DIR, "index.yaml"))
+    for line in f:
+        line = line.strip()
+        if line.startswith("- kind:"):
+            kind = line.split(":", 1)[1].strip()
+            if kind == "Event":
+                composites.append([])
+        elif line.startswith("- name:") and kind == "Event":
+            composites[-1].append(line.split(":", 1)[1].strip())
+    f.close()
+
+    for names in composites:
+        if set(names) <= indexed:
+            rows += 1
+    return rows
+
+service = Service(name="Benchmark", slug="benchmark-events",
+    description="Scratch service for the event layout benchmark")
+service.put()
+status = Status.default()
+
+now = datetime.now()
+step = timedelta(days=DAYS) / EVENTS
+stamps = [now - step * i for i in range(EVENTS)]
+
+print "Layout: %s, %d events over %d days" % (config.EVENT_LAYOUT, EVENTS, DAYS)
+print "Index rows per event: %d" % index_rows()
+
+def write_singly():
+    for stamp in stamps[:EVENTS / 2]:
+        Event.create(service, status, "Benchmark", start=stamp).put()
+
+def write_batch():
+    db.put([Event.create(service, status, "Benchmark", start=stamp)
+        for stamp in stamps[EVENTS / 2:]])
+
+measure("%d single puts" % (EVENTS / 2), write_singly)
+measure("1 batch put of %d" % (EVENTS - EVENTS / 2), write_batch)
+
+measure("Newest event", lambda: Event.range(service).get())
+measure("Newest 100 events", lambda: Event.range(service).fetch(100))
+measure("One day, oldest first", lambda: Event.range(service,
+    now - timedelta(days=2), now - timedelta(days=1), descending=False).fetch(1000))
+measure("Whole range, keys only", lambda: Event.range(service,
+    keys_only=True).fetch(1000))
+
+db.delete(Event.range(service, keys_only=True).fetch(1000))
+service.delete()
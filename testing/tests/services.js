@@ -123,6 +123,35 @@ asyncTest("Deleting a service succeeds", function() {
     });
 });
 
+asyncTest("Deleting a service starts a deletion job", function() {
+    expect(3);
+    // Create the service here, so the test doesn't need a fixture
+    $.post("/api/v1/services", {
+        "name": "Delete Job",
+        "description": "Deleted by a background job"
+    }, function(){
+    $.ajax({ 
+        type: "DELETE",
+        url: "/api/v1/services/delete-job",
+        Datatype: 'json', 
+        success: function(service){ 
+        equals("service", service.job.kind);
+        // The task queue stub doesn't run tasks, so run the job by hand
+        $.get("/tasks/delete?job=" + service.job.id, function(){
+            $.getJSON(service.job.url, function(job){
+            equals("done", job.state);
+            equals("delete-job", job.target);
+            start();
+            });
+        });
+        },
+        error: function(evt){ 
+        start();
+        }
+    });
+    });
+});
+
 asyncTest("Accessing a url with a trailing slash fails",function() {
     expect(2);
     $.ajax({ 
@@ -327,4 +356,285 @@ asyncTest("GET Test that the event resource filters properly", 1, function(){
         start();
     }
     });    
-})
\ No newline at end of file
+})
+asyncTest("GET Test that the event resource pages with a cursor", 3, function(){
+    url = "/api/v1/services/service-bar/events?limit=1";
+
+    $.ajax({ 
+    type: "GET",
+    url: url,
+    Datatype: 'json', 
+    success: function(page){ 
+        equals(page.events.length, 1, "One event returned");
+        ok(page.next, "Next page link returned");
+        $.ajax({ 
+        type: "GET",
+        url: page.next,
+        Datatype: 'json', 
+        success: function(next){ 
+            ok(next.events[0].sid !== page.events[0].sid, "Next page starts after the first");
+            start();
+        },
+        error: function(evt){ 
+            start();
+        }
+        });
+    },
+    error: function(evt){ 
+        start();
+    }
+    });    
+});
+
+asyncTest("A batch with bad events still saves the good ones", 5, function(){
+    events = [
+        {"service": "service-foo", "status": "up", "message": "Batched"},
+        {"service": 123, "message": "Service isn't a string"},
+        {"service": "service-foo", "message": 123},
+        {"service": ["service-foo"], "message": "Unhashable service"},
+        "Not an event"
+    ];
+
+    $.ajax({ 
+    type: "POST",
+    url: "/api/v1/events/batch",
+    Datatype: 'json', 
+    data: {"events": JSON.stringify(events)},
+    success: function(data){ 
+        ok(data.events[0].sid, "The good event was saved");
+        equals(data.events[1].code, 400);
+        equals(data.events[2].code, 400);
+        equals(data.events[3].code, 400);
+        equals(data.events[4].code, 400);
+        start();
+    },
+    error: function(evt){ 
+        start();
+    }
+    });
+});
+
+module("Conditional Requests");
+
+function getWithETag(url, etag, callback){
+    $.ajax({ 
+    type: "GET",
+    url: url,
+    Datatype: 'json', 
+    beforeSend: function(xhr){
+        if (etag) {
+        xhr.setRequestHeader("If-None-Match", etag);
+        }
+    },
+    complete: function(xhr){
+        callback(xhr.status, xhr.getResponseHeader("ETag"));
+    }
+    });
+}
+
+asyncTest("GET with a current ETag returns 304", 2, function(){
+    url = "/api/v1/services/service-foo";
+
+    getWithETag(url, null, function(status, etag){
+    ok(etag, "ETag returned");
+    getWithETag(url, etag, function(status){
+        equals(status, 304, "Not Modified");
+        start();
+    });
+    });
+});
+
+asyncTest("Posting an event changes the ETag", 3, function(){
+    url = "/api/v1/services/service-foo";
+
+    getWithETag(url, null, function(status, etag){
+    $.post(url + "/events", {
+        "status": "down",
+        "message": "Changing the ETag"
+    }, function(){
+        getWithETag(url, etag, function(status, newEtag){
+        equals(status, 200, "The service is sent again");
+        ok(newEtag, "ETag returned");
+        ok(newEtag !== etag, "ETag changed");
+        start();
+        });
+    });
+    });
+});
+
+module("Notifications");
+
+// Makes the service due at once, then runs each of the four ping shards
+// (config.PING_SHARDS), since the test can't tell which one it is on
+function pingNow(slug, callback){
+    $.post("/api/v1/services/" + slug, {"freq": "1"}, function(){
+    var shard = 0;
+    var next = function(){
+        if (shard == 4) {
+        callback();
+        return;
+        }
+        $.get("/tasks/ping?shard=" + shard++, next);
+    };
+    next();
+    });
+}
+
+asyncTest("Three failed pings send a notification", 1, function(){
+    // Unresolvable, so every ping fails
+    $.post("/api/v1/services", {
+        "name": "Notify " + new Date().getTime(),
+        "description": "Never loads",
+        "serviceurl": "http://notify-test.invalid/"
+    }, function(service){
+    pingNow(service.id, function(){
+        pingNow(service.id, function(){
+        pingNow(service.id, function(){
+            $.get("/notify", function(text){
+            ok(text.indexOf("ERROR NOTIFICATION SENT: " + service.id) != -1,
+                "Error mail sent");
+            $.ajax({type: "DELETE", url: "/api/v1/services/" + service.id,
+                complete: function(){ start(); }});
+            });
+        });
+        });
+    });
+    }, "json");
+});
+
+module("Changes");
+
+asyncTest("Changes come back in order after the token", 3, function(){
+    $.getJSON("/api/v1/changes", function(first){
+    $.post("/api/v1/services/service-foo/events", {
+        "status": "down",
+        "message": "First change"
+    }, function(one){
+        $.post("/api/v1/services/service-foo/events", {
+        "status": "up",
+        "message": "Second change"
+        }, function(two){
+        $.getJSON("/api/v1/changes?since=" + first.next, function(data){
+            var sids = $.map(data.changes, function(c){
+            return c.event ? c.event.sid : null;
+            });
+            ok($.inArray(one.sid, sids) < $.inArray(two.sid, sids) &&
+            $.inArray(one.sid, sids) != -1, "Both events, oldest first");
+            var ordered = true;
+            for (var i = 1; i < data.changes.length; i++) {
+            if (parseInt(data.changes[i].seq, 10) <=
+                parseInt(data.changes[i - 1].seq, 10)) {
+                ordered = false;
+            }
+            }
+            ok(ordered, "Sequence numbers increase");
+            ok(data.next != first.next, "The token moved on");
+            start();
+        });
+        }, "json");
+    }, "json");
+    });
+});
+
+asyncTest("A poll with nothing new waits, then returns the same token", 3,
+        function(){
+    $.getJSON("/api/v1/changes", function(first){
+    var started = new Date().getTime();
+    $.getJSON("/api/v1/changes?wait=2&since=" + first.next, function(data){
+        equals(data.changes.length, 0, "No changes");
+        equals(data.next, first.next, "Same token");
+        ok(new Date().getTime() - started >= 1500, "Waited");
+        start();
+    });
+    });
+});
+
+module("Event Search");
+
+// Follows next links from url, collecting every event, then calls back
+function allPages(url, events, pages, callback){
+    $.getJSON(url, function(data){
+    pages.push(data.events);
+    events = events.concat(data.events);
+    if (data.next) {
+        allPages(data.next, events, pages, callback);
+    } else {
+        callback(events, pages);
+    }
+    });
+}
+
+asyncTest("Paging across services has no duplicates or gaps", 5, function(){
+    var stamp = new Date().getTime();
+    var a = "Search A " + stamp;
+    var b = "Search B " + stamp;
+
+    $.post("/api/v1/services", {"name": a, "description": "Searched"},
+        function(first){
+    $.post("/api/v1/services", {"name": b, "description": "Searched"},
+        function(second){
+        // Interleaved, with two events at the same time so that a page
+        // ends between them
+        var times = [
+            [first.id, "2010-06-01T10:00:00Z"],
+            [second.id, "2010-06-01T10:01:00Z"],
+            [first.id, "2010-06-01T10:02:00Z"],
+            [second.id, "2010-06-01T10:03:00Z"],
+            [first.id, "2010-06-01T10:04:00Z"],
+            [first.id, "2010-06-01T10:06:00Z"],
+            [second.id, "2010-06-01T10:06:00Z"],
+            [second.id, "2010-06-01T10:07:00Z"]
+        ];
+        var events = $.map(times, function(t, i){
+        return {"service": t[0], "status": "up", "timestamp": t[1],
+            "message": "Event " + i};
+        });
+
+        $.post("/api/v1/events/batch", {"events": JSON.stringify(events)},
+            function(){
+        var url = "/api/v1/events?limit=2&fields=sid,message&services=" +
+            first.id + "," + second.id;
+        allPages(url, [], [], function(found, pages){
+            var messages = $.map(found, function(e){ return e.message; });
+            var unique = {};
+            var duplicates = 0;
+            $.each(found, function(i, e){
+            if (unique[e.sid]) {
+                duplicates += 1;
+            }
+            unique[e.sid] = true;
+            });
+            equals(found.length, times.length, "Every event found");
+            equals(duplicates, 0, "No event found twice");
+            equals(messages[0], "Event 7", "Newest first");
+            equals(messages[messages.length - 1], "Event 0", "Oldest last");
+
+            var narrowed = true;
+            $.each(found, function(i, e){
+            for (var name in e) {
+                if (name != "sid" && name != "message") {
+                narrowed = false;
+                }
+            }
+            });
+            ok(narrowed && pages.length > 1, "Every page keeps the fields");
+
+            $.ajax({type: "DELETE", url: "/api/v1/services/" + first.id});
+            $.ajax({type: "DELETE", url: "/api/v1/services/" + second.id,
+            complete: function(){ start(); }});
+        });
+        }, "json");
+    }, "json");
+    }, "json");
+});
+
+asyncTest("The next link keeps an empty embed", 2, function(){
+    $.getJSON("/api/v1/events?limit=1&embed=", function(data){
+    ok(data.next.indexOf("embed=") != -1, "embed kept");
+    $.getJSON(data.next, function(page){
+        equals(typeof page.events[0].status.name, "undefined",
+        "Statuses still not embedded");
+        start();
+    });
+    });
+});
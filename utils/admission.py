@@ -0,0 +1,181 @@
+# Copyright (c) 2010 Twilio Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Admission control for the API's write requests
+
+Every credential gets a token bucket, so one misbehaving client can't use
+up the instances the front page needs. On top of that, a limit on the
+writes running at once across all instances sheds low priority writes as
+soon as writes start getting slow, and everything else once the limit is
+reached.
+
+Both are kept in memcache so they hold across instances. Buckets fall back
+to this instance's memory when memcache is unavailable.
+"""
+
+import time
+import logging
+
+from google.appengine.api import memcache
+
+from utils.cache import LRUCache
+import config
+
+# Priorities of writes, see authorized.api
+LOW = 0
+NORMAL = 1
+
+KEY_PREFIX = "admission:"
+INFLIGHT_KEY = KEY_PREFIX + "inflight"
+
+# The in flight count is dropped this often, so requests that died before
+# they could decrement it are forgotten
+INFLIGHT_EXPIRY = 60
+
+# How much each write's latency moves this instance's average, and how
+# long the average counts for once writes stop coming in. Without the
+# latter, shedding every low priority write could keep the average high
+# for good.
+LATENCY_WEIGHT = 0.2
+LATENCY_EXPIRY = 30
+
+local_buckets = LRUCache(1000)
+
+# This instance's average write latency, in seconds, and when it was
+# last updated
+latency = {"average": 0.0, "updated": 0}
+
+def now_ms():
+    return int(time.time() * 1000)
+
+class Rejected(Exception):
+    """ A request that should be turned away. retry_after is the number of
+    seconds after which the client may try again. """
+
+    def __init__(self, message, retry_after):
+        Exception.__init__(self, message)
+        self.retry_after = retry_after
+
+def take_token(credential, rate=None, burst=None):
+    """ Take a token from the credential's bucket, or raise Rejected with
+    the time until the next one.
+
+    The bucket is stored as the time at which it will be full again,
+    which moves forward by one interval per token taken. That holds the
+    whole bucket in a single number, so it can be updated with a
+    compare-and-set.
+
+    Arguments:
+    credential  -- string: Who is making the request
+    rate        -- float: Tokens added per second
+    burst       -- int: The most tokens the bucket holds
+
+    """
+    rate = rate or config.API_RATE_LIMIT
+    burst = burst or config.API_RATE_BURST
+    if not rate:
+        return
+
+    interval = int(1000 / rate)
+    capacity = interval * burst
+    key = KEY_PREFIX + "bucket:" + credential
+
+    client = memcache.Client()
+    for attempt in range(3):
+        current = now_ms()
+        if hasattr(client, "gets"):
+            full_at = client.gets(key)
+        else:
+            full_at = client.get(key)
+
+        full_at = max(full_at or 0, current)
+        wait = full_at + interval - current - capacity
+        if wait > 0:
+            raise Rejected("Rate limit exceeded for %s" % credential,
+                wait / 1000.0)
+
+        if full_at == current:
+            # Missing from memcache, or already full
+            stored = client.add(key, full_at + interval) or \
+                client.set(key, full_at + interval)
+        elif hasattr(client, "cas"):
+            stored = client.cas(key, full_at + interval)
+        else:
+            stored = client.set(key, full_at + interval)
+
+        if stored:
+            return
+
+        if client.get(key) is None:
+            break
+
+    # Memcache is unavailable, so only this instance's view is limited
+    logging.warning("Using a local rate limit for %s", credential)
+    current = now_ms()
+    full_at = max(local_buckets.get(key, 0), current)
+    wait = full_at + interval - current - capacity
+    if wait > 0:
+        raise Rejected("Rate limit exceeded for %s" % credential,
+            wait / 1000.0)
+    local_buckets.set(key, full_at + interval)
+
+def enter(priority=NORMAL):
+    """ Count a write as running, or raise Rejected if it should be shed.
+    Every call that returns must be followed by a call to leave. """
+    limit = config.API_MAX_CONCURRENT_WRITES
+    if not limit:
+        return
+
+    slow = config.API_SHED_LATENCY and \
+        latency["average"] > config.API_SHED_LATENCY and \
+        time.time() - latency["updated"] < LATENCY_EXPIRY
+
+    if priority <= LOW and slow:
+        raise Rejected("Low priority writes are being shed", 1)
+
+    running = memcache.incr(INFLIGHT_KEY)
+    if running is None:
+        memcache.add(INFLIGHT_KEY, 0, time=INFLIGHT_EXPIRY)
+        running = memcache.incr(INFLIGHT_KEY)
+        if running is None:
+            # Without memcache nothing can be counted, so let it through
+            return
+
+    # Low priority writes only get half of the room
+    if priority <= LOW:
+        limit = max(1, limit / 2)
+
+    if running > limit:
+        memcache.decr(INFLIGHT_KEY)
+        raise Rejected("Too many writes in progress", 1)
+
+def leave(started):
+    """ Count a write as finished and record how long it took"""
+    if not config.API_MAX_CONCURRENT_WRITES:
+        return
+
+    finished = time.time()
+    if finished - latency["updated"] >= LATENCY_EXPIRY:
+        latency["average"] = 0.0
+    latency["average"] += LATENCY_WEIGHT * \
+        (finished - started - latency["average"])
+    latency["updated"] = finished
+    memcache.decr(INFLIGHT_KEY)
@@ -31,8 +31,12 @@ __author__ = 'William T. Katz'
 from google.appengine.api import users
 from google.appengine.api import oauth
 
+from utils import admission
+
 import logging
+import math
 import os
+import time
 
 def force_ssl(only_admin = False):
     """
@@ -65,9 +69,31 @@ def force_ssl(only_admin = False):
         return check_ssl
     return wrapper
 
-def api(role):
+def admit(handler, user, priority):
+    """
+    Apply admission control to an authorized API request. Returns False,
+    having answered with a 429, if the request should be turned away.
+    """
+    if callable(priority):
+        priority = priority(handler)
+
+    try:
+        admission.take_token(user.email())
+        admission.enter(priority)
+    except admission.Rejected, e:
+        logging.warning("Rejected API request: %s", e)
+        handler.response.headers['Retry-After'] = \
+            str(int(math.ceil(e.retry_after)))
+        handler.error(429, str(e))
+        return False
+    return True
+
+def api(role, priority=admission.NORMAL):
     """
-    A decorator to enforce user roles in context of the API
+    A decorator to enforce user roles in context of the API. Authorized
+    requests then go through admission control, before any datastore
+    work is done; priority is an admission priority, or a function of the
+    handler that returns one.
     """
     def wrapper(handler_method):
         def check_login(self, *args, **kwargs):
@@ -93,7 +119,13 @@ def api(role):
                 self.error(403, "Authorization Failure")
             elif role == "admin" and admin:
                 logging.info("Role is %s so will allow handler", role)
-                handler_method(self, *args, **kwargs)
+                started = time.time()
+                if not admit(self, user, priority):
+                    return
+                try:
+                    handler_method(self, *args, **kwargs)
+                finally:
+                    admission.leave(started)
             elif user:
                 logging.error("User not in admin role")
                 self.error(403, "User not in admin role: %s" % role)
@@ -0,0 +1,72 @@
+# Copyright (c) 2010 Twilio Inc.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Per-instance caches
+
+App Engine keeps a module loaded between requests on the same instance, so
+anything stored at module level lives until the instance is recycled.
+These caches are bounded so a long-lived instance can't grow without limit.
+"""
+
+class LRUCache(object):
+    """
+    A dictionary that holds at most `capacity` entries, dropping the least
+    recently used ones when it fills up.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.data = {}
+        self.tick = 0
+
+    def get(self, key, default=None):
+        entry = self.data.get(key)
+        if entry is None:
+            return default
+        self.tick += 1
+        entry[1] = self.tick
+        return entry[0]
+
+    def set(self, key, value):
+        self.tick += 1
+        self.data[key] = [value, self.tick]
+        if len(self.data) > self.capacity:
+            self.evict()
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def clear(self):
+        self.data.clear()
+
+    def evict(self):
+        """ Drop the least recently used quarter of the entries. Evicting
+        in bulk keeps the sort off the common path.
+        """
+        entries = sorted(self.data.items(), key=lambda item: item[1][1])
+        for key, entry in entries[:max(1, len(entries) / 4)]:
+            del self.data[key]
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __len__(self):
+        return len(self.data)
@@ -20,10416 +20,536 @@
 
 images = [
     {
-        "url": "/images/status/address-book--arrow.png", 
-        "name": "address-book--arrow"
+        "url": "/images/status/broom--arrow.png", 
+        "name": "broom--arrow"
     }, 
     {
-        "url": "/images/status/address-book--exclamation.png", 
-        "name": "address-book--exclamation"
+        "url": "/images/status/broom--exclamation.png", 
+        "name": "broom--exclamation"
     }, 
     {
-        "url": "/images/status/address-book--minus.png", 
-        "name": "address-book--minus"
+        "url": "/images/status/broom--minus.png", 
+        "name": "broom--minus"
     }, 
     {
-        "url": "/images/status/address-book--pencil.png", 
-        "name": "address-book--pencil"
+        "url": "/images/status/broom--pencil.png", 
+        "name": "broom--pencil"
     }, 
     {
-        "url": "/images/status/address-book--plus.png", 
-        "name": "address-book--plus"
+        "url": "/images/status/broom--plus.png", 
+        "name": "broom--plus"
     }, 
     {
-        "url": "/images/status/address-book-blue.png", 
-        "name": "address-book-blue"
+        "url": "/images/status/broom-code.png", 
+        "name": "broom-code"
     }, 
     {
-        "url": "/images/status/address-book-open.png", 
-        "name": "address-book-open"
+        "url": "/images/status/broom.png", 
+        "name": "broom"
     }, 
     {
-        "url": "/images/status/address-book.png", 
-        "name": "address-book"
+        "url": "/images/status/bug--arrow.png", 
+        "name": "bug--arrow"
     }, 
     {
-        "url": "/images/status/alarm-clock--arrow.png", 
-        "name": "alarm-clock--arrow"
+        "url": "/images/status/bug--exclamation.png", 
+        "name": "bug--exclamation"
     }, 
     {
-        "url": "/images/status/alarm-clock--exclamation.png", 
-        "name": "alarm-clock--exclamation"
+        "url": "/images/status/bug--minus.png", 
+        "name": "bug--minus"
     }, 
     {
-        "url": "/images/status/alarm-clock--minus.png", 
-        "name": "alarm-clock--minus"
+        "url": "/images/status/bug--pencil.png", 
+        "name": "bug--pencil"
     }, 
     {
-        "url": "/images/status/alarm-clock--pencil.png", 
-        "name": "alarm-clock--pencil"
+        "url": "/images/status/bug--plus.png", 
+        "name": "bug--plus"
     }, 
     {
-        "url": "/images/status/alarm-clock--plus.png", 
-        "name": "alarm-clock--plus"
+        "url": "/images/status/bug.png", 
+        "name": "bug"
     }, 
     {
-        "url": "/images/status/alarm-clock-blue.png", 
-        "name": "alarm-clock-blue"
+        "url": "/images/status/clock--arrow.png", 
+        "name": "clock--arrow"
     }, 
     {
-        "url": "/images/status/alarm-clock-select-remain.png", 
-        "name": "alarm-clock-select-remain"
+        "url": "/images/status/clock--exclamation.png", 
+        "name": "clock--exclamation"
     }, 
     {
-        "url": "/images/status/alarm-clock-select.png", 
-        "name": "alarm-clock-select"
+        "url": "/images/status/clock--minus.png", 
+        "name": "clock--minus"
     }, 
     {
-        "url": "/images/status/alarm-clock.png", 
-        "name": "alarm-clock"
+        "url": "/images/status/clock--pencil.png", 
+        "name": "clock--pencil"
     }, 
     {
-        "url": "/images/status/anchor.png", 
-        "name": "anchor"
+        "url": "/images/status/clock--plus.png", 
+        "name": "clock--plus"
     }, 
     {
-        "url": "/images/status/application--arrow.png", 
-        "name": "application--arrow"
+        "url": "/images/status/clock-frame.png", 
+        "name": "clock-frame"
     }, 
     {
-        "url": "/images/status/application--exclamation.png", 
-        "name": "application--exclamation"
+        "url": "/images/status/clock-history-frame.png", 
+        "name": "clock-history-frame"
     }, 
     {
-        "url": "/images/status/application--minus.png", 
-        "name": "application--minus"
+        "url": "/images/status/clock-history.png", 
+        "name": "clock-history"
     }, 
     {
-        "url": "/images/status/application--pencil.png", 
-        "name": "application--pencil"
+        "url": "/images/status/clock-select-remain.png", 
+        "name": "clock-select-remain"
     }, 
     {
-        "url": "/images/status/application--plus.png", 
-        "name": "application--plus"
+        "url": "/images/status/clock-select.png", 
+        "name": "clock-select"
     }, 
     {
-        "url": "/images/status/application-block.png", 
-        "name": "application-block"
+        "url": "/images/status/clock-small.png", 
+        "name": "clock-small"
     }, 
     {
-        "url": "/images/status/application-blog.png", 
-        "name": "application-blog"
+        "url": "/images/status/clock.png", 
+        "name": "clock"
     }, 
     {
-        "url": "/images/status/application-blue.png", 
-        "name": "application-blue"
+        "url": "/images/status/cross-circle-frame.png", 
+        "name": "cross-circle-frame"
     }, 
     {
-        "url": "/images/status/application-browser.png", 
-        "name": "application-browser"
+        "url": "/images/status/cross-circle.png", 
+        "name": "cross-circle"
     }, 
     {
-        "url": "/images/status/application-detail.png", 
-        "name": "application-detail"
+        "url": "/images/status/exclamation--frame.png", 
+        "name": "exclamation--frame"
     }, 
     {
-        "url": "/images/status/application-dialog.png", 
-        "name": "application-dialog"
+        "url": "/images/status/exclamation-button.png", 
+        "name": "exclamation-button"
     }, 
     {
-        "url": "/images/status/application-dock-090.png", 
-        "name": "application-dock-090"
+        "url": "/images/status/exclamation-diamond-frame.png", 
+        "name": "exclamation-diamond-frame"
     }, 
     {
-        "url": "/images/status/application-dock-180.png", 
-        "name": "application-dock-180"
+        "url": "/images/status/exclamation-diamond.png", 
+        "name": "exclamation-diamond"
     }, 
     {
-        "url": "/images/status/application-dock-270.png", 
-        "name": "application-dock-270"
+        "url": "/images/status/exclamation-octagon-frame.png", 
+        "name": "exclamation-octagon-frame"
     }, 
     {
-        "url": "/images/status/application-dock-tab.png", 
-        "name": "application-dock-tab"
+        "url": "/images/status/exclamation-octagon.png", 
+        "name": "exclamation-octagon"
     }, 
     {
-        "url": "/images/status/application-dock.png", 
-        "name": "application-dock"
+        "url": "/images/status/exclamation-red-frame.png", 
+        "name": "exclamation-red-frame"
     }, 
     {
-        "url": "/images/status/application-document.png", 
-        "name": "application-document"
+        "url": "/images/status/exclamation-red.png", 
+        "name": "exclamation-red"
     }, 
     {
-        "url": "/images/status/application-documents.png", 
-        "name": "application-documents"
+        "url": "/images/status/exclamation-shield-frame.png", 
+        "name": "exclamation-shield-frame"
     }, 
     {
-        "url": "/images/status/application-export.png", 
-        "name": "application-export"
+        "url": "/images/status/exclamation-shield.png", 
+        "name": "exclamation-shield"
     }, 
     {
-        "url": "/images/status/application-form.png", 
-        "name": "application-form"
+        "url": "/images/status/exclamation-small-red.png", 
+        "name": "exclamation-small-red"
     }, 
     {
-        "url": "/images/status/application-home.png", 
-        "name": "application-home"
+        "url": "/images/status/exclamation-small-white.png", 
+        "name": "exclamation-small-white"
     }, 
     {
-        "url": "/images/status/application-icon.png", 
-        "name": "application-icon"
+        "url": "/images/status/exclamation-small.png", 
+        "name": "exclamation-small"
     }, 
     {
-        "url": "/images/status/application-image.png", 
-        "name": "application-image"
+        "url": "/images/status/exclamation-white.png", 
+        "name": "exclamation-white"
     }, 
     {
-        "url": "/images/status/application-import.png", 
-        "name": "application-import"
+        "url": "/images/status/exclamation.png", 
+        "name": "exclamation"
     }, 
     {
-        "url": "/images/status/application-list.png", 
-        "name": "application-list"
+        "url": "/images/status/flag--arrow.png", 
+        "name": "flag--arrow"
     }, 
     {
-        "url": "/images/status/application-monitor.png", 
-        "name": "application-monitor"
+        "url": "/images/status/flag--exclamation.png", 
+        "name": "flag--exclamation"
     }, 
     {
-        "url": "/images/status/application-network.png", 
-        "name": "application-network"
+        "url": "/images/status/flag--minus.png", 
+        "name": "flag--minus"
     }, 
     {
-        "url": "/images/status/application-rename.png", 
-        "name": "application-rename"
+        "url": "/images/status/flag--pencil.png", 
+        "name": "flag--pencil"
     }, 
     {
-        "url": "/images/status/application-resize-actual.png", 
-        "name": "application-resize-actual"
+        "url": "/images/status/flag--plus.png", 
+        "name": "flag--plus"
     }, 
     {
-        "url": "/images/status/application-resize-full.png", 
-        "name": "application-resize-full"
+        "url": "/images/status/flag-small.png", 
+        "name": "flag-small"
     }, 
     {
-        "url": "/images/status/application-resize.png", 
-        "name": "application-resize"
+        "url": "/images/status/flag.png", 
+        "name": "flag"
     }, 
     {
-        "url": "/images/status/application-run.png", 
-        "name": "application-run"
+        "url": "/images/status/hard-hat--arrow.png", 
+        "name": "hard-hat--arrow"
     }, 
     {
-        "url": "/images/status/application-search-result.png", 
-        "name": "application-search-result"
+        "url": "/images/status/hard-hat--exclamation.png", 
+        "name": "hard-hat--exclamation"
     }, 
     {
-        "url": "/images/status/application-share.png", 
-        "name": "application-share"
+        "url": "/images/status/hard-hat--minus.png", 
+        "name": "hard-hat--minus"
     }, 
     {
-        "url": "/images/status/application-sidebar-collapse.png", 
-        "name": "application-sidebar-collapse"
+        "url": "/images/status/hard-hat--pencil.png", 
+        "name": "hard-hat--pencil"
     }, 
     {
-        "url": "/images/status/application-sidebar-expand.png", 
-        "name": "application-sidebar-expand"
+        "url": "/images/status/hard-hat--plus.png", 
+        "name": "hard-hat--plus"
     }, 
     {
-        "url": "/images/status/application-sidebar-list.png", 
-        "name": "application-sidebar-list"
+        "url": "/images/status/hard-hat-military.png", 
+        "name": "hard-hat-military"
     }, 
     {
-        "url": "/images/status/application-sidebar.png", 
-        "name": "application-sidebar"
+        "url": "/images/status/hard-hat-mine.png", 
+        "name": "hard-hat-mine"
     }, 
     {
-        "url": "/images/status/application-small-blue.png", 
-        "name": "application-small-blue"
+        "url": "/images/status/hard-hat.png", 
+        "name": "hard-hat"
     }, 
     {
-        "url": "/images/status/application-small-list-blue.png", 
-        "name": "application-small-list-blue"
+        "url": "/images/status/heart--arrow.png", 
+        "name": "heart--arrow"
     }, 
     {
-        "url": "/images/status/application-small-list.png", 
-        "name": "application-small-list"
+        "url": "/images/status/heart--exclamation.png", 
+        "name": "heart--exclamation"
     }, 
     {
-        "url": "/images/status/application-small.png", 
-        "name": "application-small"
+        "url": "/images/status/heart--minus.png", 
+        "name": "heart--minus"
     }, 
     {
-        "url": "/images/status/application-split-tile.png", 
-        "name": "application-split-tile"
+        "url": "/images/status/heart--pencil.png", 
+        "name": "heart--pencil"
     }, 
     {
-        "url": "/images/status/application-split-vertical.png", 
-        "name": "application-split-vertical"
+        "url": "/images/status/heart--plus.png", 
+        "name": "heart--plus"
     }, 
     {
-        "url": "/images/status/application-split.png", 
-        "name": "application-split"
+        "url": "/images/status/heart-break.png", 
+        "name": "heart-break"
     }, 
     {
-        "url": "/images/status/application-table.png", 
-        "name": "application-table"
+        "url": "/images/status/heart-empty.png", 
+        "name": "heart-empty"
     }, 
     {
-        "url": "/images/status/application-task.png", 
-        "name": "application-task"
+        "url": "/images/status/heart-half.png", 
+        "name": "heart-half"
     }, 
     {
-        "url": "/images/status/application-terminal.png", 
-        "name": "application-terminal"
+        "url": "/images/status/heart-small-empty.png", 
+        "name": "heart-small-empty"
     }, 
     {
-        "url": "/images/status/application-text-image.png", 
-        "name": "application-text-image"
+        "url": "/images/status/heart-small-half.png", 
+        "name": "heart-small-half"
     }, 
     {
-        "url": "/images/status/application-text.png", 
-        "name": "application-text"
+        "url": "/images/status/heart-small.png", 
+        "name": "heart-small"
     }, 
     {
-        "url": "/images/status/application-tree.png", 
-        "name": "application-tree"
+        "url": "/images/status/heart.png", 
+        "name": "heart"
     }, 
     {
-        "url": "/images/status/application-wave.png", 
-        "name": "application-wave"
+        "url": "/images/status/information-balloon.png", 
+        "name": "information-balloon"
     }, 
     {
-        "url": "/images/status/application.png", 
-        "name": "application"
+        "url": "/images/status/information-button.png", 
+        "name": "information-button"
     }, 
     {
-        "url": "/images/status/applications-blue.png", 
-        "name": "applications-blue"
+        "url": "/images/status/information-frame.png", 
+        "name": "information-frame"
     }, 
     {
-        "url": "/images/status/applications-stack.png", 
-        "name": "applications-stack"
+        "url": "/images/status/information-octagon-frame.png", 
+        "name": "information-octagon-frame"
     }, 
     {
-        "url": "/images/status/applications.png", 
-        "name": "applications"
+        "url": "/images/status/information-octagon.png", 
+        "name": "information-octagon"
     }, 
     {
-        "url": "/images/status/arrow-000-medium.png", 
-        "name": "arrow-000-medium"
+        "url": "/images/status/information-shield.png", 
+        "name": "information-shield"
     }, 
     {
-        "url": "/images/status/arrow-000-small.png", 
-        "name": "arrow-000-small"
+        "url": "/images/status/information-small-white.png", 
+        "name": "information-small-white"
     }, 
     {
-        "url": "/images/status/arrow-045-medium.png", 
-        "name": "arrow-045-medium"
+        "url": "/images/status/information-small.png", 
+        "name": "information-small"
     }, 
     {
-        "url": "/images/status/arrow-045-small.png", 
-        "name": "arrow-045-small"
+        "url": "/images/status/information-white.png", 
+        "name": "information-white"
     }, 
     {
-        "url": "/images/status/arrow-045.png", 
-        "name": "arrow-045"
+        "url": "/images/status/information.png", 
+        "name": "information"
     }, 
     {
-        "url": "/images/status/arrow-090-medium.png", 
-        "name": "arrow-090-medium"
+        "url": "/images/status/lock--arrow.png", 
+        "name": "lock--arrow"
     }, 
     {
-        "url": "/images/status/arrow-090-small.png", 
-        "name": "arrow-090-small"
+        "url": "/images/status/lock--exclamation.png", 
+        "name": "lock--exclamation"
     }, 
     {
-        "url": "/images/status/arrow-090.png", 
-        "name": "arrow-090"
+        "url": "/images/status/lock--minus.png", 
+        "name": "lock--minus"
     }, 
     {
-        "url": "/images/status/arrow-135-medium.png", 
-        "name": "arrow-135-medium"
+        "url": "/images/status/lock--pencil.png", 
+        "name": "lock--pencil"
     }, 
     {
-        "url": "/images/status/arrow-135-small.png", 
-        "name": "arrow-135-small"
+        "url": "/images/status/lock--plus.png", 
+        "name": "lock--plus"
     }, 
     {
-        "url": "/images/status/arrow-135.png", 
-        "name": "arrow-135"
+        "url": "/images/status/lock-small.png", 
+        "name": "lock-small"
     }, 
     {
-        "url": "/images/status/arrow-180-medium.png", 
-        "name": "arrow-180-medium"
+        "url": "/images/status/lock-unlock.png", 
+        "name": "lock-unlock"
     }, 
     {
-        "url": "/images/status/arrow-180-small.png", 
-        "name": "arrow-180-small"
+        "url": "/images/status/lock.png", 
+        "name": "lock"
     }, 
     {
-        "url": "/images/status/arrow-180.png", 
-        "name": "arrow-180"
+        "url": "/images/status/minus-button.png", 
+        "name": "minus-button"
     }, 
     {
-        "url": "/images/status/arrow-225-medium.png", 
-        "name": "arrow-225-medium"
+        "url": "/images/status/minus-circle-frame.png", 
+        "name": "minus-circle-frame"
     }, 
     {
-        "url": "/images/status/arrow-225-small.png", 
-        "name": "arrow-225-small"
+        "url": "/images/status/minus-circle.png", 
+        "name": "minus-circle"
     }, 
     {
-        "url": "/images/status/arrow-225.png", 
-        "name": "arrow-225"
+        "url": "/images/status/minus-octagon-frame.png", 
+        "name": "minus-octagon-frame"
     }, 
     {
-        "url": "/images/status/arrow-270-medium.png", 
-        "name": "arrow-270-medium"
+        "url": "/images/status/minus-octagon.png", 
+        "name": "minus-octagon"
     }, 
     {
-        "url": "/images/status/arrow-270-small.png", 
-        "name": "arrow-270-small"
+        "url": "/images/status/minus-shield.png", 
+        "name": "minus-shield"
     }, 
     {
-        "url": "/images/status/arrow-270.png", 
-        "name": "arrow-270"
+        "url": "/images/status/minus-small-circle.png", 
+        "name": "minus-small-circle"
     }, 
     {
-        "url": "/images/status/arrow-315-medium.png", 
-        "name": "arrow-315-medium"
+        "url": "/images/status/minus-small-white.png", 
+        "name": "minus-small-white"
     }, 
     {
-        "url": "/images/status/arrow-315-small.png", 
-        "name": "arrow-315-small"
+        "url": "/images/status/minus-small.png", 
+        "name": "minus-small"
     }, 
     {
-        "url": "/images/status/arrow-315.png", 
-        "name": "arrow-315"
+        "url": "/images/status/minus-white.png", 
+        "name": "minus-white"
     }, 
     {
-        "url": "/images/status/arrow-branch-000-left.png", 
-        "name": "arrow-branch-000-left"
+        "url": "/images/status/minus.png", 
+        "name": "minus"
     }, 
     {
-        "url": "/images/status/arrow-branch-090-left.png", 
-        "name": "arrow-branch-090-left"
+        "url": "/images/status/plug--arrow.png", 
+        "name": "plug--arrow"
     }, 
     {
-        "url": "/images/status/arrow-branch-090.png", 
-        "name": "arrow-branch-090"
+        "url": "/images/status/plug--exclamation.png", 
+        "name": "plug--exclamation"
     }, 
     {
-        "url": "/images/status/arrow-branch-180-left.png", 
-        "name": "arrow-branch-180-left"
+        "url": "/images/status/plug--minus.png", 
+        "name": "plug--minus"
     }, 
     {
-        "url": "/images/status/arrow-branch-180.png", 
-        "name": "arrow-branch-180"
+        "url": "/images/status/plug--pencil.png", 
+        "name": "plug--pencil"
     }, 
     {
-        "url": "/images/status/arrow-branch-270-left.png", 
-        "name": "arrow-branch-270-left"
+        "url": "/images/status/plug--plus.png", 
+        "name": "plug--plus"
     }, 
     {
-        "url": "/images/status/arrow-branch-270.png", 
-        "name": "arrow-branch-270"
+        "url": "/images/status/plug.png", 
+        "name": "plug"
     }, 
     {
-        "url": "/images/status/arrow-branch.png", 
-        "name": "arrow-branch"
+        "url": "/images/status/plus-button.png", 
+        "name": "plus-button"
     }, 
     {
-        "url": "/images/status/arrow-circle-045-left.png", 
-        "name": "arrow-circle-045-left"
+        "url": "/images/status/plus-circle-frame.png", 
+        "name": "plus-circle-frame"
     }, 
     {
-        "url": "/images/status/arrow-circle-135-left.png", 
-        "name": "arrow-circle-135-left"
+        "url": "/images/status/plus-circle.png", 
+        "name": "plus-circle"
     }, 
     {
-        "url": "/images/status/arrow-circle-135.png", 
-        "name": "arrow-circle-135"
+        "url": "/images/status/plus-octagon-frame.png", 
+        "name": "plus-octagon-frame"
     }, 
     {
-        "url": "/images/status/arrow-circle-225-left.png", 
-        "name": "arrow-circle-225-left"
+        "url": "/images/status/plus-octagon.png", 
+        "name": "plus-octagon"
     }, 
     {
-        "url": "/images/status/arrow-circle-225.png", 
-        "name": "arrow-circle-225"
+        "url": "/images/status/plus-shield.png", 
+        "name": "plus-shield"
     }, 
     {
-        "url": "/images/status/arrow-circle-315-left.png", 
-        "name": "arrow-circle-315-left"
+        "url": "/images/status/plus-small-circle.png", 
+        "name": "plus-small-circle"
     }, 
     {
-        "url": "/images/status/arrow-circle-315.png", 
-        "name": "arrow-circle-315"
+        "url": "/images/status/plus-small-white.png", 
+        "name": "plus-small-white"
     }, 
     {
-        "url": "/images/status/arrow-circle-double-135.png", 
-        "name": "arrow-circle-double-135"
+        "url": "/images/status/plus-small.png", 
+        "name": "plus-small"
     }, 
     {
-        "url": "/images/status/arrow-circle-double.png", 
-        "name": "arrow-circle-double"
+        "url": "/images/status/plus-white.png", 
+        "name": "plus-white"
     }, 
     {
-        "url": "/images/status/arrow-circle.png", 
-        "name": "arrow-circle"
+        "url": "/images/status/plus.png", 
+        "name": "plus"
     }, 
     {
-        "url": "/images/status/arrow-continue-000-top.png", 
-        "name": "arrow-continue-000-top"
+        "url": "/images/status/question-balloon.png", 
+        "name": "question-balloon"
     }, 
     {
-        "url": "/images/status/arrow-continue-090-left.png", 
-        "name": "arrow-continue-090-left"
+        "url": "/images/status/question-button.png", 
+        "name": "question-button"
     }, 
     {
-        "url": "/images/status/arrow-continue-090.png", 
-        "name": "arrow-continue-090"
+        "url": "/images/status/question-frame.png", 
+        "name": "question-frame"
     }, 
     {
-        "url": "/images/status/arrow-continue-180-top.png", 
-        "name": "arrow-continue-180-top"
+        "url": "/images/status/question-octagon-frame.png", 
+        "name": "question-octagon-frame"
     }, 
     {
-        "url": "/images/status/arrow-continue-180.png", 
-        "name": "arrow-continue-180"
+        "url": "/images/status/question-octagon.png", 
+        "name": "question-octagon"
     }, 
     {
-        "url": "/images/status/arrow-continue-270-left.png", 
-        "name": "arrow-continue-270-left"
+        "url": "/images/status/question-shield.png", 
+        "name": "question-shield"
     }, 
     {
-        "url": "/images/status/arrow-continue-270.png", 
-        "name": "arrow-continue-270"
+        "url": "/images/status/question-small-white.png", 
+        "name": "question-small-white"
     }, 
     {
-        "url": "/images/status/arrow-continue.png", 
-        "name": "arrow-continue"
+        "url": "/images/status/question-small.png", 
+        "name": "question-small"
     }, 
     {
-        "url": "/images/status/arrow-curve-000-double.png", 
-        "name": "arrow-curve-000-double"
+        "url": "/images/status/question-white.png", 
+        "name": "question-white"
     }, 
     {
-        "url": "/images/status/arrow-curve-000-left.png", 
-        "name": "arrow-curve-000-left"
+        "url": "/images/status/question.png", 
+        "name": "question"
     }, 
     {
-        "url": "/images/status/arrow-curve-090-left.png", 
-        "name": "arrow-curve-090-left"
+        "url": "/images/status/tick-circle-frame.png", 
+        "name": "tick-circle-frame"
     }, 
     {
-        "url": "/images/status/arrow-curve-090.png", 
-        "name": "arrow-curve-090"
+        "url": "/images/status/tick-circle.png", 
+        "name": "tick-circle"
     }, 
     {
-        "url": "/images/status/arrow-curve-180-double.png", 
-        "name": "arrow-curve-180-double"
+        "url": "/images/status/traffic-cone--arrow.png", 
+        "name": "traffic-cone--arrow"
     }, 
     {
-        "url": "/images/status/arrow-curve-180-left.png", 
-        "name": "arrow-curve-180-left"
-    }, 
-    {
-        "url": "/images/status/arrow-curve-180.png", 
-        "name": "arrow-curve-180"
-    }, 
-    {
-        "url": "/images/status/arrow-curve-270-left.png", 
-        "name": "arrow-curve-270-left"
-    }, 
-    {
-        "url": "/images/status/arrow-curve-270.png", 
-        "name": "arrow-curve-270"
-    }, 
-    {
-        "url": "/images/status/arrow-curve.png", 
-        "name": "arrow-curve"
-    }, 
-    {
-        "url": "/images/status/arrow-in.png", 
-        "name": "arrow-in"
-    }, 
-    {
-        "url": "/images/status/arrow-join-090.png", 
-        "name": "arrow-join-090"
-    }, 
-    {
-        "url": "/images/status/arrow-join-180.png", 
-        "name": "arrow-join-180"
-    }, 
-    {
-        "url": "/images/status/arrow-join-270.png", 
-        "name": "arrow-join-270"
-    }, 
-    {
-        "url": "/images/status/arrow-join.png", 
-        "name": "arrow-join"
-    }, 
-    {
-        "url": "/images/status/arrow-merge-000-left.png", 
-        "name": "arrow-merge-000-left"
-    }, 
-    {
-        "url": "/images/status/arrow-merge-090-left.png", 
-        "name": "arrow-merge-090-left"
-    }, 
-    {
-        "url": "/images/status/arrow-merge-090.png", 
-        "name": "arrow-merge-090"
-    }, 
-    {
-        "url": "/images/status/arrow-merge-180-left.png", 
-        "name": "arrow-merge-180-left"
-    }, 
-    {
-        "url": "/images/status/arrow-merge-180.png", 
-        "name": "arrow-merge-180"
-    }, 
-    {
-        "url": "/images/status/arrow-merge-270-left.png", 
-        "name": "arrow-merge-270-left"
-    }, 
-    {
-        "url": "/images/status/arrow-merge-270.png", 
-        "name": "arrow-merge-270"
-    }, 
-    {
-        "url": "/images/status/arrow-merge.png", 
-        "name": "arrow-merge"
-    }, 
-    {
-        "url": "/images/status/arrow-move.png", 
-        "name": "arrow-move"
-    }, 
-    {
-        "url": "/images/status/arrow-out.png", 
-        "name": "arrow-out"
-    }, 
-    {
-        "url": "/images/status/arrow-repeat-once.png", 
-        "name": "arrow-repeat-once"
-    }, 
-    {
-        "url": "/images/status/arrow-repeat.png", 
-        "name": "arrow-repeat"
-    }, 
-    {
-        "url": "/images/status/arrow-resize-045.png", 
-        "name": "arrow-resize-045"
-    }, 
-    {
-        "url": "/images/status/arrow-resize-090.png", 
-        "name": "arrow-resize-090"
-    }, 
-    {
-        "url": "/images/status/arrow-resize-135.png", 
-        "name": "arrow-resize-135"
-    }, 
-    {
-        "url": "/images/status/arrow-resize.png", 
-        "name": "arrow-resize"
-    }, 
-    {
-        "url": "/images/status/arrow-return-000-left.png", 
-        "name": "arrow-return-000-left"
-    }, 
-    {
-        "url": "/images/status/arrow-return-090-left.png", 
-        "name": "arrow-return-090-left"
-    }, 
-    {
-        "url": "/images/status/arrow-return-090.png", 
-        "name": "arrow-return-090"
-    }, 
-    {
-        "url": "/images/status/arrow-return-180-left.png", 
-        "name": "arrow-return-180-left"
-    }, 
-    {
-        "url": "/images/status/arrow-return-180.png", 
-        "name": "arrow-return-180"
-    }, 
-    {
-        "url": "/images/status/arrow-return-270-left.png", 
-        "name": "arrow-return-270-left"
-    }, 
-    {
-        "url": "/images/status/arrow-return-270.png", 
-        "name": "arrow-return-270"
-    }, 
-    {
-        "url": "/images/status/arrow-return.png", 
-        "name": "arrow-return"
-    }, 
-    {
-        "url": "/images/status/arrow-retweet.png", 
-        "name": "arrow-retweet"
-    }, 
-    {
-        "url": "/images/status/arrow-skip-090.png", 
-        "name": "arrow-skip-090"
-    }, 
-    {
-        "url": "/images/status/arrow-skip-180.png", 
-        "name": "arrow-skip-180"
-    }, 
-    {
-        "url": "/images/status/arrow-skip-270.png", 
-        "name": "arrow-skip-270"
-    }, 
-    {
-        "url": "/images/status/arrow-skip.png", 
-        "name": "arrow-skip"
-    }, 
-    {
-        "url": "/images/status/arrow-split-090.png", 
-        "name": "arrow-split-090"
-    }, 
-    {
-        "url": "/images/status/arrow-split-180.png", 
-        "name": "arrow-split-180"
-    }, 
-    {
-        "url": "/images/status/arrow-split-270.png", 
-        "name": "arrow-split-270"
-    }, 
-    {
-        "url": "/images/status/arrow-split.png", 
-        "name": "arrow-split"
-    }, 
-    {
-        "url": "/images/status/arrow-step-out.png", 
-        "name": "arrow-step-out"
-    }, 
-    {
-        "url": "/images/status/arrow-step-over.png", 
-        "name": "arrow-step-over"
-    }, 
-    {
-        "url": "/images/status/arrow-step.png", 
-        "name": "arrow-step"
-    }, 
-    {
-        "url": "/images/status/arrow-stop-090.png", 
-        "name": "arrow-stop-090"
-    }, 
-    {
-        "url": "/images/status/arrow-stop-180.png", 
-        "name": "arrow-stop-180"
-    }, 
-    {
-        "url": "/images/status/arrow-stop-270.png", 
-        "name": "arrow-stop-270"
-    }, 
-    {
-        "url": "/images/status/arrow-stop.png", 
-        "name": "arrow-stop"
-    }, 
-    {
-        "url": "/images/status/arrow-switch-090.png", 
-        "name": "arrow-switch-090"
-    }, 
-    {
-        "url": "/images/status/arrow-switch-180.png", 
-        "name": "arrow-switch-180"
-    }, 
-    {
-        "url": "/images/status/arrow-switch-270.png", 
-        "name": "arrow-switch-270"
-    }, 
-    {
-        "url": "/images/status/arrow-switch.png", 
-        "name": "arrow-switch"
-    }, 
-    {
-        "url": "/images/status/arrow-transition-090.png", 
-        "name": "arrow-transition-090"
-    }, 
-    {
-        "url": "/images/status/arrow-transition-180.png", 
-        "name": "arrow-transition-180"
-    }, 
-    {
-        "url": "/images/status/arrow-transition-270.png", 
-        "name": "arrow-transition-270"
-    }, 
-    {
-        "url": "/images/status/arrow-transition.png", 
-        "name": "arrow-transition"
-    }, 
-    {
-        "url": "/images/status/arrow-turn-000-left.png", 
-        "name": "arrow-turn-000-left"
-    }, 
-    {
-        "url": "/images/status/arrow-turn-090-left.png", 
-        "name": "arrow-turn-090-left"
-    }, 
-    {
-        "url": "/images/status/arrow-turn-090.png", 
-        "name": "arrow-turn-090"
-    }, 
-    {
-        "url": "/images/status/arrow-turn-180-left.png", 
-        "name": "arrow-turn-180-left"
-    }, 
-    {
-        "url": "/images/status/arrow-turn-180.png", 
-        "name": "arrow-turn-180"
-    }, 
-    {
-        "url": "/images/status/arrow-turn-270-left.png", 
-        "name": "arrow-turn-270-left"
-    }, 
-    {
-        "url": "/images/status/arrow-turn-270.png", 
-        "name": "arrow-turn-270"
-    }, 
-    {
-        "url": "/images/status/arrow-turn.png", 
-        "name": "arrow-turn"
-    }, 
-    {
-        "url": "/images/status/arrow.png", 
-        "name": "arrow"
-    }, 
-    {
-        "url": "/images/status/asterisk.png", 
-        "name": "asterisk"
-    }, 
-    {
-        "url": "/images/status/auction-hammer--arrow.png", 
-        "name": "auction-hammer--arrow"
-    }, 
-    {
-        "url": "/images/status/auction-hammer--exclamation.png", 
-        "name": "auction-hammer--exclamation"
-    }, 
-    {
-        "url": "/images/status/auction-hammer--minus.png", 
-        "name": "auction-hammer--minus"
-    }, 
-    {
-        "url": "/images/status/auction-hammer--pencil.png", 
-        "name": "auction-hammer--pencil"
-    }, 
-    {
-        "url": "/images/status/auction-hammer--plus.png", 
-        "name": "auction-hammer--plus"
-    }, 
-    {
-        "url": "/images/status/auction-hammer-gavel.png", 
-        "name": "auction-hammer-gavel"
-    }, 
-    {
-        "url": "/images/status/auction-hammer.png", 
-        "name": "auction-hammer"
-    }, 
-    {
-        "url": "/images/status/balance--arrow.png", 
-        "name": "balance--arrow"
-    }, 
-    {
-        "url": "/images/status/balance--exclamation.png", 
-        "name": "balance--exclamation"
-    }, 
-    {
-        "url": "/images/status/balance--minus.png", 
-        "name": "balance--minus"
-    }, 
-    {
-        "url": "/images/status/balance--pencil.png", 
-        "name": "balance--pencil"
-    }, 
-    {
-        "url": "/images/status/balance--plus.png", 
-        "name": "balance--plus"
-    }, 
-    {
-        "url": "/images/status/balance-unbalance.png", 
-        "name": "balance-unbalance"
-    }, 
-    {
-        "url": "/images/status/balance.png", 
-        "name": "balance"
-    }, 
-    {
-        "url": "/images/status/balloon--arrow.png", 
-        "name": "balloon--arrow"
-    }, 
-    {
-        "url": "/images/status/balloon--exclamation.png", 
-        "name": "balloon--exclamation"
-    }, 
-    {
-        "url": "/images/status/balloon--minus.png", 
-        "name": "balloon--minus"
-    }, 
-    {
-        "url": "/images/status/balloon--pencil.png", 
-        "name": "balloon--pencil"
-    }, 
-    {
-        "url": "/images/status/balloon--plus.png", 
-        "name": "balloon--plus"
-    }, 
-    {
-        "url": "/images/status/balloon-ellipsis.png", 
-        "name": "balloon-ellipsis"
-    }, 
-    {
-        "url": "/images/status/balloon-facebook-left.png", 
-        "name": "balloon-facebook-left"
-    }, 
-    {
-        "url": "/images/status/balloon-facebook.png", 
-        "name": "balloon-facebook"
-    }, 
-    {
-        "url": "/images/status/balloon-left.png", 
-        "name": "balloon-left"
-    }, 
-    {
-        "url": "/images/status/balloon-quotation.png", 
-        "name": "balloon-quotation"
-    }, 
-    {
-        "url": "/images/status/balloon-small-left.png", 
-        "name": "balloon-small-left"
-    }, 
-    {
-        "url": "/images/status/balloon-small.png", 
-        "name": "balloon-small"
-    }, 
-    {
-        "url": "/images/status/balloon-smiley.png", 
-        "name": "balloon-smiley"
-    }, 
-    {
-        "url": "/images/status/balloon-sound.png", 
-        "name": "balloon-sound"
-    }, 
-    {
-        "url": "/images/status/balloon-twitter-left.png", 
-        "name": "balloon-twitter-left"
-    }, 
-    {
-        "url": "/images/status/balloon-twitter-retweet.png", 
-        "name": "balloon-twitter-retweet"
-    }, 
-    {
-        "url": "/images/status/balloon-twitter.png", 
-        "name": "balloon-twitter"
-    }, 
-    {
-        "url": "/images/status/balloon.png", 
-        "name": "balloon"
-    }, 
-    {
-        "url": "/images/status/balloons-facebook.png", 
-        "name": "balloons-facebook"
-    }, 
-    {
-        "url": "/images/status/balloons-twitter.png", 
-        "name": "balloons-twitter"
-    }, 
-    {
-        "url": "/images/status/balloons.png", 
-        "name": "balloons"
-    }, 
-    {
-        "url": "/images/status/bandaid--arrow.png", 
-        "name": "bandaid--arrow"
-    }, 
-    {
-        "url": "/images/status/bandaid--exclamation.png", 
-        "name": "bandaid--exclamation"
-    }, 
-    {
-        "url": "/images/status/bandaid--minus.png", 
-        "name": "bandaid--minus"
-    }, 
-    {
-        "url": "/images/status/bandaid--pencil.png", 
-        "name": "bandaid--pencil"
-    }, 
-    {
-        "url": "/images/status/bandaid--plus.png", 
-        "name": "bandaid--plus"
-    }, 
-    {
-        "url": "/images/status/bandaid-small.png", 
-        "name": "bandaid-small"
-    }, 
-    {
-        "url": "/images/status/bandaid.png", 
-        "name": "bandaid"
-    }, 
-    {
-        "url": "/images/status/bank--arrow.png", 
-        "name": "bank--arrow"
-    }, 
-    {
-        "url": "/images/status/bank--exclamation.png", 
-        "name": "bank--exclamation"
-    }, 
-    {
-        "url": "/images/status/bank--minus.png", 
-        "name": "bank--minus"
-    }, 
-    {
-        "url": "/images/status/bank--pencil.png", 
-        "name": "bank--pencil"
-    }, 
-    {
-        "url": "/images/status/bank--plus.png", 
-        "name": "bank--plus"
-    }, 
-    {
-        "url": "/images/status/bank.png", 
-        "name": "bank"
-    }, 
-    {
-        "url": "/images/status/barcode-2d.png", 
-        "name": "barcode-2d"
-    }, 
-    {
-        "url": "/images/status/barcode.png", 
-        "name": "barcode"
-    }, 
-    {
-        "url": "/images/status/battery--arrow.png", 
-        "name": "battery--arrow"
-    }, 
-    {
-        "url": "/images/status/battery--exclamation.png", 
-        "name": "battery--exclamation"
-    }, 
-    {
-        "url": "/images/status/battery--minus.png", 
-        "name": "battery--minus"
-    }, 
-    {
-        "url": "/images/status/battery--pencil.png", 
-        "name": "battery--pencil"
-    }, 
-    {
-        "url": "/images/status/battery--plus.png", 
-        "name": "battery--plus"
-    }, 
-    {
-        "url": "/images/status/battery-charge.png", 
-        "name": "battery-charge"
-    }, 
-    {
-        "url": "/images/status/battery-empty.png", 
-        "name": "battery-empty"
-    }, 
-    {
-        "url": "/images/status/battery-full.png", 
-        "name": "battery-full"
-    }, 
-    {
-        "url": "/images/status/battery-low.png", 
-        "name": "battery-low"
-    }, 
-    {
-        "url": "/images/status/battery-plug.png", 
-        "name": "battery-plug"
-    }, 
-    {
-        "url": "/images/status/battery.png", 
-        "name": "battery"
-    }, 
-    {
-        "url": "/images/status/beaker--arrow.png", 
-        "name": "beaker--arrow"
-    }, 
-    {
-        "url": "/images/status/beaker--exclamation.png", 
-        "name": "beaker--exclamation"
-    }, 
-    {
-        "url": "/images/status/beaker--minus.png", 
-        "name": "beaker--minus"
-    }, 
-    {
-        "url": "/images/status/beaker--pencil.png", 
-        "name": "beaker--pencil"
-    }, 
-    {
-        "url": "/images/status/beaker--plus.png", 
-        "name": "beaker--plus"
-    }, 
-    {
-        "url": "/images/status/beaker-empty.png", 
-        "name": "beaker-empty"
-    }, 
-    {
-        "url": "/images/status/beaker.png", 
-        "name": "beaker"
-    }, 
-    {
-        "url": "/images/status/bean--arrow.png", 
-        "name": "bean--arrow"
-    }, 
-    {
-        "url": "/images/status/bean--exclamation.png", 
-        "name": "bean--exclamation"
-    }, 
-    {
-        "url": "/images/status/bean--minus.png", 
-        "name": "bean--minus"
-    }, 
-    {
-        "url": "/images/status/bean--pencil.png", 
-        "name": "bean--pencil"
-    }, 
-    {
-        "url": "/images/status/bean--plus.png", 
-        "name": "bean--plus"
-    }, 
-    {
-        "url": "/images/status/bean-green.png", 
-        "name": "bean-green"
-    }, 
-    {
-        "url": "/images/status/bean-small-green.png", 
-        "name": "bean-small-green"
-    }, 
-    {
-        "url": "/images/status/bean-small.png", 
-        "name": "bean-small"
-    }, 
-    {
-        "url": "/images/status/bean.png", 
-        "name": "bean"
-    }, 
-    {
-        "url": "/images/status/beans.png", 
-        "name": "beans"
-    }, 
-    {
-        "url": "/images/status/bell--arrow.png", 
-        "name": "bell--arrow"
-    }, 
-    {
-        "url": "/images/status/bell--exclamation.png", 
-        "name": "bell--exclamation"
-    }, 
-    {
-        "url": "/images/status/bell--minus.png", 
-        "name": "bell--minus"
-    }, 
-    {
-        "url": "/images/status/bell--pencil.png", 
-        "name": "bell--pencil"
-    }, 
-    {
-        "url": "/images/status/bell--plus.png", 
-        "name": "bell--plus"
-    }, 
-    {
-        "url": "/images/status/bell-small.png", 
-        "name": "bell-small"
-    }, 
-    {
-        "url": "/images/status/bell.png", 
-        "name": "bell"
-    }, 
-    {
-        "url": "/images/status/bin--arrow.png", 
-        "name": "bin--arrow"
-    }, 
-    {
-        "url": "/images/status/bin--exclamation.png", 
-        "name": "bin--exclamation"
-    }, 
-    {
-        "url": "/images/status/bin--minus.png", 
-        "name": "bin--minus"
-    }, 
-    {
-        "url": "/images/status/bin--pencil.png", 
-        "name": "bin--pencil"
-    }, 
-    {
-        "url": "/images/status/bin--plus.png", 
-        "name": "bin--plus"
-    }, 
-    {
-        "url": "/images/status/bin-full.png", 
-        "name": "bin-full"
-    }, 
-    {
-        "url": "/images/status/bin-metal-full.png", 
-        "name": "bin-metal-full"
-    }, 
-    {
-        "url": "/images/status/bin-metal.png", 
-        "name": "bin-metal"
-    }, 
-    {
-        "url": "/images/status/bin.png", 
-        "name": "bin"
-    }, 
-    {
-        "url": "/images/status/binocular--arrow.png", 
-        "name": "binocular--arrow"
-    }, 
-    {
-        "url": "/images/status/binocular--exclamation.png", 
-        "name": "binocular--exclamation"
-    }, 
-    {
-        "url": "/images/status/binocular--minus.png", 
-        "name": "binocular--minus"
-    }, 
-    {
-        "url": "/images/status/binocular--pencil.png", 
-        "name": "binocular--pencil"
-    }, 
-    {
-        "url": "/images/status/binocular--plus.png", 
-        "name": "binocular--plus"
-    }, 
-    {
-        "url": "/images/status/binocular-small.png", 
-        "name": "binocular-small"
-    }, 
-    {
-        "url": "/images/status/binocular.png", 
-        "name": "binocular"
-    }, 
-    {
-        "url": "/images/status/block--arrow.png", 
-        "name": "block--arrow"
-    }, 
-    {
-        "url": "/images/status/block--exclamation.png", 
-        "name": "block--exclamation"
-    }, 
-    {
-        "url": "/images/status/block--minus.png", 
-        "name": "block--minus"
-    }, 
-    {
-        "url": "/images/status/block--pencil.png", 
-        "name": "block--pencil"
-    }, 
-    {
-        "url": "/images/status/block--plus.png", 
-        "name": "block--plus"
-    }, 
-    {
-        "url": "/images/status/block-share.png", 
-        "name": "block-share"
-    }, 
-    {
-        "url": "/images/status/block-small.png", 
-        "name": "block-small"
-    }, 
-    {
-        "url": "/images/status/block.png", 
-        "name": "block"
-    }, 
-    {
-        "url": "/images/status/blog--arrow.png", 
-        "name": "blog--arrow"
-    }, 
-    {
-        "url": "/images/status/blog--exclamation.png", 
-        "name": "blog--exclamation"
-    }, 
-    {
-        "url": "/images/status/blog--minus.png", 
-        "name": "blog--minus"
-    }, 
-    {
-        "url": "/images/status/blog--pencil.png", 
-        "name": "blog--pencil"
-    }, 
-    {
-        "url": "/images/status/blog--plus.png", 
-        "name": "blog--plus"
-    }, 
-    {
-        "url": "/images/status/blog-blue.png", 
-        "name": "blog-blue"
-    }, 
-    {
-        "url": "/images/status/blog.png", 
-        "name": "blog"
-    }, 
-    {
-        "url": "/images/status/blogs-stack.png", 
-        "name": "blogs-stack"
-    }, 
-    {
-        "url": "/images/status/blogs.png", 
-        "name": "blogs"
-    }, 
-    {
-        "url": "/images/status/blueprint--arrow.png", 
-        "name": "blueprint--arrow"
-    }, 
-    {
-        "url": "/images/status/blueprint--exclamation.png", 
-        "name": "blueprint--exclamation"
-    }, 
-    {
-        "url": "/images/status/blueprint--minus.png", 
-        "name": "blueprint--minus"
-    }, 
-    {
-        "url": "/images/status/blueprint--pencil.png", 
-        "name": "blueprint--pencil"
-    }, 
-    {
-        "url": "/images/status/blueprint--plus.png", 
-        "name": "blueprint--plus"
-    }, 
-    {
-        "url": "/images/status/blueprint-horizontal.png", 
-        "name": "blueprint-horizontal"
-    }, 
-    {
-        "url": "/images/status/blueprint.png", 
-        "name": "blueprint"
-    }, 
-    {
-        "url": "/images/status/blueprints.png", 
-        "name": "blueprints"
-    }, 
-    {
-        "url": "/images/status/bluetooth.png", 
-        "name": "bluetooth"
-    }, 
-    {
-        "url": "/images/status/bomb.png", 
-        "name": "bomb"
-    }, 
-    {
-        "url": "/images/status/book--arrow.png", 
-        "name": "book--arrow"
-    }, 
-    {
-        "url": "/images/status/book--exclamation.png", 
-        "name": "book--exclamation"
-    }, 
-    {
-        "url": "/images/status/book--minus.png", 
-        "name": "book--minus"
-    }, 
-    {
-        "url": "/images/status/book--pencil.png", 
-        "name": "book--pencil"
-    }, 
-    {
-        "url": "/images/status/book--plus.png", 
-        "name": "book--plus"
-    }, 
-    {
-        "url": "/images/status/book-bookmark.png", 
-        "name": "book-bookmark"
-    }, 
-    {
-        "url": "/images/status/book-brown.png", 
-        "name": "book-brown"
-    }, 
-    {
-        "url": "/images/status/book-open-bookmark.png", 
-        "name": "book-open-bookmark"
-    }, 
-    {
-        "url": "/images/status/book-open-next.png", 
-        "name": "book-open-next"
-    }, 
-    {
-        "url": "/images/status/book-open-previous.png", 
-        "name": "book-open-previous"
-    }, 
-    {
-        "url": "/images/status/book-open.png", 
-        "name": "book-open"
-    }, 
-    {
-        "url": "/images/status/book-question.png", 
-        "name": "book-question"
-    }, 
-    {
-        "url": "/images/status/book-small-brown.png", 
-        "name": "book-small-brown"
-    }, 
-    {
-        "url": "/images/status/book-small.png", 
-        "name": "book-small"
-    }, 
-    {
-        "url": "/images/status/book.png", 
-        "name": "book"
-    }, 
-    {
-        "url": "/images/status/bookmark--arrow.png", 
-        "name": "bookmark--arrow"
-    }, 
-    {
-        "url": "/images/status/bookmark--exclamation.png", 
-        "name": "bookmark--exclamation"
-    }, 
-    {
-        "url": "/images/status/bookmark--minus.png", 
-        "name": "bookmark--minus"
-    }, 
-    {
-        "url": "/images/status/bookmark--pencil.png", 
-        "name": "bookmark--pencil"
-    }, 
-    {
-        "url": "/images/status/bookmark--plus.png", 
-        "name": "bookmark--plus"
-    }, 
-    {
-        "url": "/images/status/bookmark-export.png", 
-        "name": "bookmark-export"
-    }, 
-    {
-        "url": "/images/status/bookmark-import.png", 
-        "name": "bookmark-import"
-    }, 
-    {
-        "url": "/images/status/bookmark-small.png", 
-        "name": "bookmark-small"
-    }, 
-    {
-        "url": "/images/status/bookmark.png", 
-        "name": "bookmark"
-    }, 
-    {
-        "url": "/images/status/books-brown.png", 
-        "name": "books-brown"
-    }, 
-    {
-        "url": "/images/status/books-stack.png", 
-        "name": "books-stack"
-    }, 
-    {
-        "url": "/images/status/books.png", 
-        "name": "books"
-    }, 
-    {
-        "url": "/images/status/border-all.png", 
-        "name": "border-all"
-    }, 
-    {
-        "url": "/images/status/border-bottom-double.png", 
-        "name": "border-bottom-double"
-    }, 
-    {
-        "url": "/images/status/border-bottom-thick.png", 
-        "name": "border-bottom-thick"
-    }, 
-    {
-        "url": "/images/status/border-bottom.png", 
-        "name": "border-bottom"
-    }, 
-    {
-        "url": "/images/status/border-color.png", 
-        "name": "border-color"
-    }, 
-    {
-        "url": "/images/status/border-dash.png", 
-        "name": "border-dash"
-    }, 
-    {
-        "url": "/images/status/border-down.png", 
-        "name": "border-down"
-    }, 
-    {
-        "url": "/images/status/border-draw.png", 
-        "name": "border-draw"
-    }, 
-    {
-        "url": "/images/status/border-horizontal-all.png", 
-        "name": "border-horizontal-all"
-    }, 
-    {
-        "url": "/images/status/border-horizontal.png", 
-        "name": "border-horizontal"
-    }, 
-    {
-        "url": "/images/status/border-inside.png", 
-        "name": "border-inside"
-    }, 
-    {
-        "url": "/images/status/border-left.png", 
-        "name": "border-left"
-    }, 
-    {
-        "url": "/images/status/border-outside-thick.png", 
-        "name": "border-outside-thick"
-    }, 
-    {
-        "url": "/images/status/border-outside.png", 
-        "name": "border-outside"
-    }, 
-    {
-        "url": "/images/status/border-right.png", 
-        "name": "border-right"
-    }, 
-    {
-        "url": "/images/status/border-top-bottom-double.png", 
-        "name": "border-top-bottom-double"
-    }, 
-    {
-        "url": "/images/status/border-top-bottom-thick.png", 
-        "name": "border-top-bottom-thick"
-    }, 
-    {
-        "url": "/images/status/border-top-bottom.png", 
-        "name": "border-top-bottom"
-    }, 
-    {
-        "url": "/images/status/border-top.png", 
-        "name": "border-top"
-    }, 
-    {
-        "url": "/images/status/border-up.png", 
-        "name": "border-up"
-    }, 
-    {
-        "url": "/images/status/border-vertical-all.png", 
-        "name": "border-vertical-all"
-    }, 
-    {
-        "url": "/images/status/border-vertical.png", 
-        "name": "border-vertical"
-    }, 
-    {
-        "url": "/images/status/border-weight.png", 
-        "name": "border-weight"
-    }, 
-    {
-        "url": "/images/status/border.png", 
-        "name": "border"
-    }, 
-    {
-        "url": "/images/status/box--arrow.png", 
-        "name": "box--arrow"
-    }, 
-    {
-        "url": "/images/status/box--exclamation.png", 
-        "name": "box--exclamation"
-    }, 
-    {
-        "url": "/images/status/box--minus.png", 
-        "name": "box--minus"
-    }, 
-    {
-        "url": "/images/status/box--pencil.png", 
-        "name": "box--pencil"
-    }, 
-    {
-        "url": "/images/status/box--plus.png", 
-        "name": "box--plus"
-    }, 
-    {
-        "url": "/images/status/box-label.png", 
-        "name": "box-label"
-    }, 
-    {
-        "url": "/images/status/box-search-result.png", 
-        "name": "box-search-result"
-    }, 
-    {
-        "url": "/images/status/box-share.png", 
-        "name": "box-share"
-    }, 
-    {
-        "url": "/images/status/box-small.png", 
-        "name": "box-small"
-    }, 
-    {
-        "url": "/images/status/box.png", 
-        "name": "box"
-    }, 
-    {
-        "url": "/images/status/briefcase--arrow.png", 
-        "name": "briefcase--arrow"
-    }, 
-    {
-        "url": "/images/status/briefcase--exclamation.png", 
-        "name": "briefcase--exclamation"
-    }, 
-    {
-        "url": "/images/status/briefcase--minus.png", 
-        "name": "briefcase--minus"
-    }, 
-    {
-        "url": "/images/status/briefcase--pencil.png", 
-        "name": "briefcase--pencil"
-    }, 
-    {
-        "url": "/images/status/briefcase--plus.png", 
-        "name": "briefcase--plus"
-    }, 
-    {
-        "url": "/images/status/briefcase-small.png", 
-        "name": "briefcase-small"
-    }, 
-    {
-        "url": "/images/status/briefcase.png", 
-        "name": "briefcase"
-    }, 
-    {
-        "url": "/images/status/brightness-control-up.png", 
-        "name": "brightness-control-up"
-    }, 
-    {
-        "url": "/images/status/brightness-control.png", 
-        "name": "brightness-control"
-    }, 
-    {
-        "url": "/images/status/brightness-low.png", 
-        "name": "brightness-low"
-    }, 
-    {
-        "url": "/images/status/brightness-small-low.png", 
-        "name": "brightness-small-low"
-    }, 
-    {
-        "url": "/images/status/brightness-small.png", 
-        "name": "brightness-small"
-    }, 
-    {
-        "url": "/images/status/brightness.png", 
-        "name": "brightness"
-    }, 
-    {
-        "url": "/images/status/broom--arrow.png", 
-        "name": "broom--arrow"
-    }, 
-    {
-        "url": "/images/status/broom--exclamation.png", 
-        "name": "broom--exclamation"
-    }, 
-    {
-        "url": "/images/status/broom--minus.png", 
-        "name": "broom--minus"
-    }, 
-    {
-        "url": "/images/status/broom--pencil.png", 
-        "name": "broom--pencil"
-    }, 
-    {
-        "url": "/images/status/broom--plus.png", 
-        "name": "broom--plus"
-    }, 
-    {
-        "url": "/images/status/broom-code.png", 
-        "name": "broom-code"
-    }, 
-    {
-        "url": "/images/status/broom.png", 
-        "name": "broom"
-    }, 
-    {
-        "url": "/images/status/bug--arrow.png", 
-        "name": "bug--arrow"
-    }, 
-    {
-        "url": "/images/status/bug--exclamation.png", 
-        "name": "bug--exclamation"
-    }, 
-    {
-        "url": "/images/status/bug--minus.png", 
-        "name": "bug--minus"
-    }, 
-    {
-        "url": "/images/status/bug--pencil.png", 
-        "name": "bug--pencil"
-    }, 
-    {
-        "url": "/images/status/bug--plus.png", 
-        "name": "bug--plus"
-    }, 
-    {
-        "url": "/images/status/bug.png", 
-        "name": "bug"
-    }, 
-    {
-        "url": "/images/status/building--arrow.png", 
-        "name": "building--arrow"
-    }, 
-    {
-        "url": "/images/status/building--exclamation.png", 
-        "name": "building--exclamation"
-    }, 
-    {
-        "url": "/images/status/building--minus.png", 
-        "name": "building--minus"
-    }, 
-    {
-        "url": "/images/status/building--pencil.png", 
-        "name": "building--pencil"
-    }, 
-    {
-        "url": "/images/status/building--plus.png", 
-        "name": "building--plus"
-    }, 
-    {
-        "url": "/images/status/building-low.png", 
-        "name": "building-low"
-    }, 
-    {
-        "url": "/images/status/building-medium.png", 
-        "name": "building-medium"
-    }, 
-    {
-        "url": "/images/status/building-network.png", 
-        "name": "building-network"
-    }, 
-    {
-        "url": "/images/status/building-old.png", 
-        "name": "building-old"
-    }, 
-    {
-        "url": "/images/status/building-small.png", 
-        "name": "building-small"
-    }, 
-    {
-        "url": "/images/status/building.png", 
-        "name": "building"
-    }, 
-    {
-        "url": "/images/status/burn--arrow.png", 
-        "name": "burn--arrow"
-    }, 
-    {
-        "url": "/images/status/burn--exclamation.png", 
-        "name": "burn--exclamation"
-    }, 
-    {
-        "url": "/images/status/burn--minus.png", 
-        "name": "burn--minus"
-    }, 
-    {
-        "url": "/images/status/burn--pencil.png", 
-        "name": "burn--pencil"
-    }, 
-    {
-        "url": "/images/status/burn--plus.png", 
-        "name": "burn--plus"
-    }, 
-    {
-        "url": "/images/status/burn-small.png", 
-        "name": "burn-small"
-    }, 
-    {
-        "url": "/images/status/burn.png", 
-        "name": "burn"
-    }, 
-    {
-        "url": "/images/status/cake--arrow.png", 
-        "name": "cake--arrow"
-    }, 
-    {
-        "url": "/images/status/cake--exclamation.png", 
-        "name": "cake--exclamation"
-    }, 
-    {
-        "url": "/images/status/cake--minus.png", 
-        "name": "cake--minus"
-    }, 
-    {
-        "url": "/images/status/cake--pencil.png", 
-        "name": "cake--pencil"
-    }, 
-    {
-        "url": "/images/status/cake--plus.png", 
-        "name": "cake--plus"
-    }, 
-    {
-        "url": "/images/status/cake-plain.png", 
-        "name": "cake-plain"
-    }, 
-    {
-        "url": "/images/status/cake.png", 
-        "name": "cake"
-    }, 
-    {
-        "url": "/images/status/calculator--arrow.png", 
-        "name": "calculator--arrow"
-    }, 
-    {
-        "url": "/images/status/calculator--exclamation.png", 
-        "name": "calculator--exclamation"
-    }, 
-    {
-        "url": "/images/status/calculator--minus.png", 
-        "name": "calculator--minus"
-    }, 
-    {
-        "url": "/images/status/calculator--pencil.png", 
-        "name": "calculator--pencil"
-    }, 
-    {
-        "url": "/images/status/calculator--plus.png", 
-        "name": "calculator--plus"
-    }, 
-    {
-        "url": "/images/status/calculator-gray.png", 
-        "name": "calculator-gray"
-    }, 
-    {
-        "url": "/images/status/calculator-scientific.png", 
-        "name": "calculator-scientific"
-    }, 
-    {
-        "url": "/images/status/calculator.png", 
-        "name": "calculator"
-    }, 
-    {
-        "url": "/images/status/calendar--arrow.png", 
-        "name": "calendar--arrow"
-    }, 
-    {
-        "url": "/images/status/calendar--exclamation.png", 
-        "name": "calendar--exclamation"
-    }, 
-    {
-        "url": "/images/status/calendar--minus.png", 
-        "name": "calendar--minus"
-    }, 
-    {
-        "url": "/images/status/calendar--pencil.png", 
-        "name": "calendar--pencil"
-    }, 
-    {
-        "url": "/images/status/calendar--plus.png", 
-        "name": "calendar--plus"
-    }, 
-    {
-        "url": "/images/status/calendar-blue.png", 
-        "name": "calendar-blue"
-    }, 
-    {
-        "url": "/images/status/calendar-day.png", 
-        "name": "calendar-day"
-    }, 
-    {
-        "url": "/images/status/calendar-delete.png", 
-        "name": "calendar-delete"
-    }, 
-    {
-        "url": "/images/status/calendar-empty.png", 
-        "name": "calendar-empty"
-    }, 
-    {
-        "url": "/images/status/calendar-export.png", 
-        "name": "calendar-export"
-    }, 
-    {
-        "url": "/images/status/calendar-import.png", 
-        "name": "calendar-import"
-    }, 
-    {
-        "url": "/images/status/calendar-insert.png", 
-        "name": "calendar-insert"
-    }, 
-    {
-        "url": "/images/status/calendar-list.png", 
-        "name": "calendar-list"
-    }, 
-    {
-        "url": "/images/status/calendar-month.png", 
-        "name": "calendar-month"
-    }, 
-    {
-        "url": "/images/status/calendar-next.png", 
-        "name": "calendar-next"
-    }, 
-    {
-        "url": "/images/status/calendar-previous.png", 
-        "name": "calendar-previous"
-    }, 
-    {
-        "url": "/images/status/calendar-relation.png", 
-        "name": "calendar-relation"
-    }, 
-    {
-        "url": "/images/status/calendar-search-result.png", 
-        "name": "calendar-search-result"
-    }, 
-    {
-        "url": "/images/status/calendar-select-days-span.png", 
-        "name": "calendar-select-days-span"
-    }, 
-    {
-        "url": "/images/status/calendar-select-days.png", 
-        "name": "calendar-select-days"
-    }, 
-    {
-        "url": "/images/status/calendar-select-month.png", 
-        "name": "calendar-select-month"
-    }, 
-    {
-        "url": "/images/status/calendar-select-week.png", 
-        "name": "calendar-select-week"
-    }, 
-    {
-        "url": "/images/status/calendar-select.png", 
-        "name": "calendar-select"
-    }, 
-    {
-        "url": "/images/status/calendar-small-month.png", 
-        "name": "calendar-small-month"
-    }, 
-    {
-        "url": "/images/status/calendar-small.png", 
-        "name": "calendar-small"
-    }, 
-    {
-        "url": "/images/status/calendar-task.png", 
-        "name": "calendar-task"
-    }, 
-    {
-        "url": "/images/status/calendar.png", 
-        "name": "calendar"
-    }, 
-    {
-        "url": "/images/status/camcorder--arrow.png", 
-        "name": "camcorder--arrow"
-    }, 
-    {
-        "url": "/images/status/camcorder--exclamation.png", 
-        "name": "camcorder--exclamation"
-    }, 
-    {
-        "url": "/images/status/camcorder--minus.png", 
-        "name": "camcorder--minus"
-    }, 
-    {
-        "url": "/images/status/camcorder--pencil.png", 
-        "name": "camcorder--pencil"
-    }, 
-    {
-        "url": "/images/status/camcorder--plus.png", 
-        "name": "camcorder--plus"
-    }, 
-    {
-        "url": "/images/status/camcorder-image.png", 
-        "name": "camcorder-image"
-    }, 
-    {
-        "url": "/images/status/camcorder.png", 
-        "name": "camcorder"
-    }, 
-    {
-        "url": "/images/status/camera--arrow.png", 
-        "name": "camera--arrow"
-    }, 
-    {
-        "url": "/images/status/camera--exclamation.png", 
-        "name": "camera--exclamation"
-    }, 
-    {
-        "url": "/images/status/camera--minus.png", 
-        "name": "camera--minus"
-    }, 
-    {
-        "url": "/images/status/camera--pencil.png", 
-        "name": "camera--pencil"
-    }, 
-    {
-        "url": "/images/status/camera--plus.png", 
-        "name": "camera--plus"
-    }, 
-    {
-        "url": "/images/status/camera-black.png", 
-        "name": "camera-black"
-    }, 
-    {
-        "url": "/images/status/camera-lens.png", 
-        "name": "camera-lens"
-    }, 
-    {
-        "url": "/images/status/camera-small-black.png", 
-        "name": "camera-small-black"
-    }, 
-    {
-        "url": "/images/status/camera-small.png", 
-        "name": "camera-small"
-    }, 
-    {
-        "url": "/images/status/camera.png", 
-        "name": "camera"
-    }, 
-    {
-        "url": "/images/status/car--arrow.png", 
-        "name": "car--arrow"
-    }, 
-    {
-        "url": "/images/status/car--exclamation.png", 
-        "name": "car--exclamation"
-    }, 
-    {
-        "url": "/images/status/car--minus.png", 
-        "name": "car--minus"
-    }, 
-    {
-        "url": "/images/status/car--pencil.png", 
-        "name": "car--pencil"
-    }, 
-    {
-        "url": "/images/status/car--plus.png", 
-        "name": "car--plus"
-    }, 
-    {
-        "url": "/images/status/car-red.png", 
-        "name": "car-red"
-    }, 
-    {
-        "url": "/images/status/car.png", 
-        "name": "car"
-    }, 
-    {
-        "url": "/images/status/card--arrow.png", 
-        "name": "card--arrow"
-    }, 
-    {
-        "url": "/images/status/card--exclamation.png", 
-        "name": "card--exclamation"
-    }, 
-    {
-        "url": "/images/status/card--minus.png", 
-        "name": "card--minus"
-    }, 
-    {
-        "url": "/images/status/card--pencil.png", 
-        "name": "card--pencil"
-    }, 
-    {
-        "url": "/images/status/card--plus.png", 
-        "name": "card--plus"
-    }, 
-    {
-        "url": "/images/status/card-address.png", 
-        "name": "card-address"
-    }, 
-    {
-        "url": "/images/status/card-export.png", 
-        "name": "card-export"
-    }, 
-    {
-        "url": "/images/status/card-import.png", 
-        "name": "card-import"
-    }, 
-    {
-        "url": "/images/status/card-small.png", 
-        "name": "card-small"
-    }, 
-    {
-        "url": "/images/status/card.png", 
-        "name": "card"
-    }, 
-    {
-        "url": "/images/status/cards-address.png", 
-        "name": "cards-address"
-    }, 
-    {
-        "url": "/images/status/cards-bind-address.png", 
-        "name": "cards-bind-address"
-    }, 
-    {
-        "url": "/images/status/cards-bind.png", 
-        "name": "cards-bind"
-    }, 
-    {
-        "url": "/images/status/cards-stack.png", 
-        "name": "cards-stack"
-    }, 
-    {
-        "url": "/images/status/cards.png", 
-        "name": "cards"
-    }, 
-    {
-        "url": "/images/status/cassette--arrow.png", 
-        "name": "cassette--arrow"
-    }, 
-    {
-        "url": "/images/status/cassette--exclamation.png", 
-        "name": "cassette--exclamation"
-    }, 
-    {
-        "url": "/images/status/cassette--minus.png", 
-        "name": "cassette--minus"
-    }, 
-    {
-        "url": "/images/status/cassette--pencil.png", 
-        "name": "cassette--pencil"
-    }, 
-    {
-        "url": "/images/status/cassette--plus.png", 
-        "name": "cassette--plus"
-    }, 
-    {
-        "url": "/images/status/cassette-label.png", 
-        "name": "cassette-label"
-    }, 
-    {
-        "url": "/images/status/cassette-small.png", 
-        "name": "cassette-small"
-    }, 
-    {
-        "url": "/images/status/cassette.png", 
-        "name": "cassette"
-    }, 
-    {
-        "url": "/images/status/category.png", 
-        "name": "category"
-    }, 
-    {
-        "url": "/images/status/chain--arrow.png", 
-        "name": "chain--arrow"
-    }, 
-    {
-        "url": "/images/status/chain--exclamation.png", 
-        "name": "chain--exclamation"
-    }, 
-    {
-        "url": "/images/status/chain--minus.png", 
-        "name": "chain--minus"
-    }, 
-    {
-        "url": "/images/status/chain--pencil.png", 
-        "name": "chain--pencil"
-    }, 
-    {
-        "url": "/images/status/chain--plus.png", 
-        "name": "chain--plus"
-    }, 
-    {
-        "url": "/images/status/chain-small.png", 
-        "name": "chain-small"
-    }, 
-    {
-        "url": "/images/status/chain-unchain.png", 
-        "name": "chain-unchain"
-    }, 
-    {
-        "url": "/images/status/chain.png", 
-        "name": "chain"
-    }, 
-    {
-        "url": "/images/status/chart--arrow.png", 
-        "name": "chart--arrow"
-    }, 
-    {
-        "url": "/images/status/chart--exclamation.png", 
-        "name": "chart--exclamation"
-    }, 
-    {
-        "url": "/images/status/chart--minus.png", 
-        "name": "chart--minus"
-    }, 
-    {
-        "url": "/images/status/chart--pencil.png", 
-        "name": "chart--pencil"
-    }, 
-    {
-        "url": "/images/status/chart--plus.png", 
-        "name": "chart--plus"
-    }, 
-    {
-        "url": "/images/status/chart-down-color.png", 
-        "name": "chart-down-color"
-    }, 
-    {
-        "url": "/images/status/chart-down.png", 
-        "name": "chart-down"
-    }, 
-    {
-        "url": "/images/status/chart-up-color.png", 
-        "name": "chart-up-color"
-    }, 
-    {
-        "url": "/images/status/chart-up.png", 
-        "name": "chart-up"
-    }, 
-    {
-        "url": "/images/status/chart.png", 
-        "name": "chart"
-    }, 
-    {
-        "url": "/images/status/chevron-expand.png", 
-        "name": "chevron-expand"
-    }, 
-    {
-        "url": "/images/status/chevron-small-expand.png", 
-        "name": "chevron-small-expand"
-    }, 
-    {
-        "url": "/images/status/chevron-small.png", 
-        "name": "chevron-small"
-    }, 
-    {
-        "url": "/images/status/chevron.png", 
-        "name": "chevron"
-    }, 
-    {
-        "url": "/images/status/cigarette-stop.png", 
-        "name": "cigarette-stop"
-    }, 
-    {
-        "url": "/images/status/cigarette.png", 
-        "name": "cigarette"
-    }, 
-    {
-        "url": "/images/status/clapperboard--arrow.png", 
-        "name": "clapperboard--arrow"
-    }, 
-    {
-        "url": "/images/status/clapperboard--exclamation.png", 
-        "name": "clapperboard--exclamation"
-    }, 
-    {
-        "url": "/images/status/clapperboard--minus.png", 
-        "name": "clapperboard--minus"
-    }, 
-    {
-        "url": "/images/status/clapperboard--pencil.png", 
-        "name": "clapperboard--pencil"
-    }, 
-    {
-        "url": "/images/status/clapperboard--plus.png", 
-        "name": "clapperboard--plus"
-    }, 
-    {
-        "url": "/images/status/clapperboard.png", 
-        "name": "clapperboard"
-    }, 
-    {
-        "url": "/images/status/clipboard--arrow.png", 
-        "name": "clipboard--arrow"
-    }, 
-    {
-        "url": "/images/status/clipboard--exclamation.png", 
-        "name": "clipboard--exclamation"
-    }, 
-    {
-        "url": "/images/status/clipboard--minus.png", 
-        "name": "clipboard--minus"
-    }, 
-    {
-        "url": "/images/status/clipboard--pencil.png", 
-        "name": "clipboard--pencil"
-    }, 
-    {
-        "url": "/images/status/clipboard--plus.png", 
-        "name": "clipboard--plus"
-    }, 
-    {
-        "url": "/images/status/clipboard-empty.png", 
-        "name": "clipboard-empty"
-    }, 
-    {
-        "url": "/images/status/clipboard-list.png", 
-        "name": "clipboard-list"
-    }, 
-    {
-        "url": "/images/status/clipboard-paste-document-text.png", 
-        "name": "clipboard-paste-document-text"
-    }, 
-    {
-        "url": "/images/status/clipboard-paste-image.png", 
-        "name": "clipboard-paste-image"
-    }, 
-    {
-        "url": "/images/status/clipboard-paste-word.png", 
-        "name": "clipboard-paste-word"
-    }, 
-    {
-        "url": "/images/status/clipboard-paste.png", 
-        "name": "clipboard-paste"
-    }, 
-    {
-        "url": "/images/status/clipboard-search-result.png", 
-        "name": "clipboard-search-result"
-    }, 
-    {
-        "url": "/images/status/clipboard-sign-out.png", 
-        "name": "clipboard-sign-out"
-    }, 
-    {
-        "url": "/images/status/clipboard-sign.png", 
-        "name": "clipboard-sign"
-    }, 
-    {
-        "url": "/images/status/clipboard-task.png", 
-        "name": "clipboard-task"
-    }, 
-    {
-        "url": "/images/status/clipboard-text.png", 
-        "name": "clipboard-text"
-    }, 
-    {
-        "url": "/images/status/clipboard.png", 
-        "name": "clipboard"
-    }, 
-    {
-        "url": "/images/status/clock--arrow.png", 
-        "name": "clock--arrow"
-    }, 
-    {
-        "url": "/images/status/clock--exclamation.png", 
-        "name": "clock--exclamation"
-    }, 
-    {
-        "url": "/images/status/clock--minus.png", 
-        "name": "clock--minus"
-    }, 
-    {
-        "url": "/images/status/clock--pencil.png", 
-        "name": "clock--pencil"
-    }, 
-    {
-        "url": "/images/status/clock--plus.png", 
-        "name": "clock--plus"
-    }, 
-    {
-        "url": "/images/status/clock-frame.png", 
-        "name": "clock-frame"
-    }, 
-    {
-        "url": "/images/status/clock-history-frame.png", 
-        "name": "clock-history-frame"
-    }, 
-    {
-        "url": "/images/status/clock-history.png", 
-        "name": "clock-history"
-    }, 
-    {
-        "url": "/images/status/clock-select-remain.png", 
-        "name": "clock-select-remain"
-    }, 
-    {
-        "url": "/images/status/clock-select.png", 
-        "name": "clock-select"
-    }, 
-    {
-        "url": "/images/status/clock-small.png", 
-        "name": "clock-small"
-    }, 
-    {
-        "url": "/images/status/clock.png", 
-        "name": "clock"
-    }, 
-    {
-        "url": "/images/status/color--arrow.png", 
-        "name": "color--arrow"
-    }, 
-    {
-        "url": "/images/status/color--exclamation.png", 
-        "name": "color--exclamation"
-    }, 
-    {
-        "url": "/images/status/color--minus.png", 
-        "name": "color--minus"
-    }, 
-    {
-        "url": "/images/status/color--pencil.png", 
-        "name": "color--pencil"
-    }, 
-    {
-        "url": "/images/status/color--plus.png", 
-        "name": "color--plus"
-    }, 
-    {
-        "url": "/images/status/color-adjustment-green.png", 
-        "name": "color-adjustment-green"
-    }, 
-    {
-        "url": "/images/status/color-adjustment-red.png", 
-        "name": "color-adjustment-red"
-    }, 
-    {
-        "url": "/images/status/color-adjustment.png", 
-        "name": "color-adjustment"
-    }, 
-    {
-        "url": "/images/status/color-small.png", 
-        "name": "color-small"
-    }, 
-    {
-        "url": "/images/status/color-swatch-small.png", 
-        "name": "color-swatch-small"
-    }, 
-    {
-        "url": "/images/status/color-swatch.png", 
-        "name": "color-swatch"
-    }, 
-    {
-        "url": "/images/status/color-swatches.png", 
-        "name": "color-swatches"
-    }, 
-    {
-        "url": "/images/status/color.png", 
-        "name": "color"
-    }, 
-    {
-        "url": "/images/status/compass--arrow.png", 
-        "name": "compass--arrow"
-    }, 
-    {
-        "url": "/images/status/compass--exclamation.png", 
-        "name": "compass--exclamation"
-    }, 
-    {
-        "url": "/images/status/compass--minus.png", 
-        "name": "compass--minus"
-    }, 
-    {
-        "url": "/images/status/compass--pencil.png", 
-        "name": "compass--pencil"
-    }, 
-    {
-        "url": "/images/status/compass--plus.png", 
-        "name": "compass--plus"
-    }, 
-    {
-        "url": "/images/status/compass.png", 
-        "name": "compass"
-    }, 
-    {
-        "url": "/images/status/compile-error.png", 
-        "name": "compile-error"
-    }, 
-    {
-        "url": "/images/status/compile-warning.png", 
-        "name": "compile-warning"
-    }, 
-    {
-        "url": "/images/status/compile.png", 
-        "name": "compile"
-    }, 
-    {
-        "url": "/images/status/computer--arrow.png", 
-        "name": "computer--arrow"
-    }, 
-    {
-        "url": "/images/status/computer--exclamation.png", 
-        "name": "computer--exclamation"
-    }, 
-    {
-        "url": "/images/status/computer--minus.png", 
-        "name": "computer--minus"
-    }, 
-    {
-        "url": "/images/status/computer--pencil.png", 
-        "name": "computer--pencil"
-    }, 
-    {
-        "url": "/images/status/computer--plus.png", 
-        "name": "computer--plus"
-    }, 
-    {
-        "url": "/images/status/computer-network.png", 
-        "name": "computer-network"
-    }, 
-    {
-        "url": "/images/status/computer-off.png", 
-        "name": "computer-off"
-    }, 
-    {
-        "url": "/images/status/computer.png", 
-        "name": "computer"
-    }, 
-    {
-        "url": "/images/status/construction.png", 
-        "name": "construction"
-    }, 
-    {
-        "url": "/images/status/contrast-control-up.png", 
-        "name": "contrast-control-up"
-    }, 
-    {
-        "url": "/images/status/contrast-control.png", 
-        "name": "contrast-control"
-    }, 
-    {
-        "url": "/images/status/contrast-low.png", 
-        "name": "contrast-low"
-    }, 
-    {
-        "url": "/images/status/contrast-small-low.png", 
-        "name": "contrast-small-low"
-    }, 
-    {
-        "url": "/images/status/contrast-small.png", 
-        "name": "contrast-small"
-    }, 
-    {
-        "url": "/images/status/contrast.png", 
-        "name": "contrast"
-    }, 
-    {
-        "url": "/images/status/control-000-small.png", 
-        "name": "control-000-small"
-    }, 
-    {
-        "url": "/images/status/control-090-small.png", 
-        "name": "control-090-small"
-    }, 
-    {
-        "url": "/images/status/control-090.png", 
-        "name": "control-090"
-    }, 
-    {
-        "url": "/images/status/control-180-small.png", 
-        "name": "control-180-small"
-    }, 
-    {
-        "url": "/images/status/control-180.png", 
-        "name": "control-180"
-    }, 
-    {
-        "url": "/images/status/control-270-small.png", 
-        "name": "control-270-small"
-    }, 
-    {
-        "url": "/images/status/control-270.png", 
-        "name": "control-270"
-    }, 
-    {
-        "url": "/images/status/control-cursor.png", 
-        "name": "control-cursor"
-    }, 
-    {
-        "url": "/images/status/control-double-000-small.png", 
-        "name": "control-double-000-small"
-    }, 
-    {
-        "url": "/images/status/control-double-090-small.png", 
-        "name": "control-double-090-small"
-    }, 
-    {
-        "url": "/images/status/control-double-090.png", 
-        "name": "control-double-090"
-    }, 
-    {
-        "url": "/images/status/control-double-180-small.png", 
-        "name": "control-double-180-small"
-    }, 
-    {
-        "url": "/images/status/control-double-180.png", 
-        "name": "control-double-180"
-    }, 
-    {
-        "url": "/images/status/control-double-270-small.png", 
-        "name": "control-double-270-small"
-    }, 
-    {
-        "url": "/images/status/control-double-270.png", 
-        "name": "control-double-270"
-    }, 
-    {
-        "url": "/images/status/control-double.png", 
-        "name": "control-double"
-    }, 
-    {
-        "url": "/images/status/control-eject-small.png", 
-        "name": "control-eject-small"
-    }, 
-    {
-        "url": "/images/status/control-eject.png", 
-        "name": "control-eject"
-    }, 
-    {
-        "url": "/images/status/control-pause-record-small.png", 
-        "name": "control-pause-record-small"
-    }, 
-    {
-        "url": "/images/status/control-pause-record.png", 
-        "name": "control-pause-record"
-    }, 
-    {
-        "url": "/images/status/control-pause-small.png", 
-        "name": "control-pause-small"
-    }, 
-    {
-        "url": "/images/status/control-pause.png", 
-        "name": "control-pause"
-    }, 
-    {
-        "url": "/images/status/control-power-small.png", 
-        "name": "control-power-small"
-    }, 
-    {
-        "url": "/images/status/control-power.png", 
-        "name": "control-power"
-    }, 
-    {
-        "url": "/images/status/control-record-small.png", 
-        "name": "control-record-small"
-    }, 
-    {
-        "url": "/images/status/control-record.png", 
-        "name": "control-record"
-    }, 
-    {
-        "url": "/images/status/control-skip-000-small.png", 
-        "name": "control-skip-000-small"
-    }, 
-    {
-        "url": "/images/status/control-skip-090-small.png", 
-        "name": "control-skip-090-small"
-    }, 
-    {
-        "url": "/images/status/control-skip-090.png", 
-        "name": "control-skip-090"
-    }, 
-    {
-        "url": "/images/status/control-skip-180-small.png", 
-        "name": "control-skip-180-small"
-    }, 
-    {
-        "url": "/images/status/control-skip-180.png", 
-        "name": "control-skip-180"
-    }, 
-    {
-        "url": "/images/status/control-skip-270-small.png", 
-        "name": "control-skip-270-small"
-    }, 
-    {
-        "url": "/images/status/control-skip-270.png", 
-        "name": "control-skip-270"
-    }, 
-    {
-        "url": "/images/status/control-skip.png", 
-        "name": "control-skip"
-    }, 
-    {
-        "url": "/images/status/control-stop-000-small.png", 
-        "name": "control-stop-000-small"
-    }, 
-    {
-        "url": "/images/status/control-stop-090-small.png", 
-        "name": "control-stop-090-small"
-    }, 
-    {
-        "url": "/images/status/control-stop-090.png", 
-        "name": "control-stop-090"
-    }, 
-    {
-        "url": "/images/status/control-stop-180-small.png", 
-        "name": "control-stop-180-small"
-    }, 
-    {
-        "url": "/images/status/control-stop-180.png", 
-        "name": "control-stop-180"
-    }, 
-    {
-        "url": "/images/status/control-stop-270-small.png", 
-        "name": "control-stop-270-small"
-    }, 
-    {
-        "url": "/images/status/control-stop-270.png", 
-        "name": "control-stop-270"
-    }, 
-    {
-        "url": "/images/status/control-stop-square-small.png", 
-        "name": "control-stop-square-small"
-    }, 
-    {
-        "url": "/images/status/control-stop-square.png", 
-        "name": "control-stop-square"
-    }, 
-    {
-        "url": "/images/status/control-stop.png", 
-        "name": "control-stop"
-    }, 
-    {
-        "url": "/images/status/control.png", 
-        "name": "control"
-    }, 
-    {
-        "url": "/images/status/controller.png", 
-        "name": "controller"
-    }, 
-    {
-        "url": "/images/status/cookie--arrow.png", 
-        "name": "cookie--arrow"
-    }, 
-    {
-        "url": "/images/status/cookie--exclamation.png", 
-        "name": "cookie--exclamation"
-    }, 
-    {
-        "url": "/images/status/cookie--minus.png", 
-        "name": "cookie--minus"
-    }, 
-    {
-        "url": "/images/status/cookie--pencil.png", 
-        "name": "cookie--pencil"
-    }, 
-    {
-        "url": "/images/status/cookie--plus.png", 
-        "name": "cookie--plus"
-    }, 
-    {
-        "url": "/images/status/cookie-bite.png", 
-        "name": "cookie-bite"
-    }, 
-    {
-        "url": "/images/status/cookie-chocolate.png", 
-        "name": "cookie-chocolate"
-    }, 
-    {
-        "url": "/images/status/cookie.png", 
-        "name": "cookie"
-    }, 
-    {
-        "url": "/images/status/cookies.png", 
-        "name": "cookies"
-    }, 
-    {
-        "url": "/images/status/counter-count-up.png", 
-        "name": "counter-count-up"
-    }, 
-    {
-        "url": "/images/status/counter-count.png", 
-        "name": "counter-count"
-    }, 
-    {
-        "url": "/images/status/counter-reset.png", 
-        "name": "counter-reset"
-    }, 
-    {
-        "url": "/images/status/counter-stop.png", 
-        "name": "counter-stop"
-    }, 
-    {
-        "url": "/images/status/counter.png", 
-        "name": "counter"
-    }, 
-    {
-        "url": "/images/status/create-json.py", 
-        "name": "create-json"
-    }, 
-    {
-        "url": "/images/status/creative-commons.png", 
-        "name": "creative-commons"
-    }, 
-    {
-        "url": "/images/status/credit-card--arrow.png", 
-        "name": "credit-card--arrow"
-    }, 
-    {
-        "url": "/images/status/credit-card--exclamation.png", 
-        "name": "credit-card--exclamation"
-    }, 
-    {
-        "url": "/images/status/credit-card--minus.png", 
-        "name": "credit-card--minus"
-    }, 
-    {
-        "url": "/images/status/credit-card--pencil.png", 
-        "name": "credit-card--pencil"
-    }, 
-    {
-        "url": "/images/status/credit-card--plus.png", 
-        "name": "credit-card--plus"
-    }, 
-    {
-        "url": "/images/status/credit-card-green.png", 
-        "name": "credit-card-green"
-    }, 
-    {
-        "url": "/images/status/credit-card.png", 
-        "name": "credit-card"
-    }, 
-    {
-        "url": "/images/status/credit-cards.png", 
-        "name": "credit-cards"
-    }, 
-    {
-        "url": "/images/status/cross-button.png", 
-        "name": "cross-button"
-    }, 
-    {
-        "url": "/images/status/cross-circle-frame.png", 
-        "name": "cross-circle-frame"
-    }, 
-    {
-        "url": "/images/status/cross-circle.png", 
-        "name": "cross-circle"
-    }, 
-    {
-        "url": "/images/status/cross-octagon-frame.png", 
-        "name": "cross-octagon-frame"
-    }, 
-    {
-        "url": "/images/status/cross-octagon.png", 
-        "name": "cross-octagon"
-    }, 
-    {
-        "url": "/images/status/cross-script.png", 
-        "name": "cross-script"
-    }, 
-    {
-        "url": "/images/status/cross-shield.png", 
-        "name": "cross-shield"
-    }, 
-    {
-        "url": "/images/status/cross-small-circle.png", 
-        "name": "cross-small-circle"
-    }, 
-    {
-        "url": "/images/status/cross-small-white.png", 
-        "name": "cross-small-white"
-    }, 
-    {
-        "url": "/images/status/cross-small.png", 
-        "name": "cross-small"
-    }, 
-    {
-        "url": "/images/status/cross-white.png", 
-        "name": "cross-white"
-    }, 
-    {
-        "url": "/images/status/cross.png", 
-        "name": "cross"
-    }, 
-    {
-        "url": "/images/status/crown--arrow.png", 
-        "name": "crown--arrow"
-    }, 
-    {
-        "url": "/images/status/crown--exclamation.png", 
-        "name": "crown--exclamation"
-    }, 
-    {
-        "url": "/images/status/crown--minus.png", 
-        "name": "crown--minus"
-    }, 
-    {
-        "url": "/images/status/crown--pencil.png", 
-        "name": "crown--pencil"
-    }, 
-    {
-        "url": "/images/status/crown--plus.png", 
-        "name": "crown--plus"
-    }, 
-    {
-        "url": "/images/status/crown-bronze.png", 
-        "name": "crown-bronze"
-    }, 
-    {
-        "url": "/images/status/crown-silver.png", 
-        "name": "crown-silver"
-    }, 
-    {
-        "url": "/images/status/crown.png", 
-        "name": "crown"
-    }, 
-    {
-        "url": "/images/status/cup--arrow.png", 
-        "name": "cup--arrow"
-    }, 
-    {
-        "url": "/images/status/cup--exclamation.png", 
-        "name": "cup--exclamation"
-    }, 
-    {
-        "url": "/images/status/cup--minus.png", 
-        "name": "cup--minus"
-    }, 
-    {
-        "url": "/images/status/cup--pencil.png", 
-        "name": "cup--pencil"
-    }, 
-    {
-        "url": "/images/status/cup--plus.png", 
-        "name": "cup--plus"
-    }, 
-    {
-        "url": "/images/status/cup-empty.png", 
-        "name": "cup-empty"
-    }, 
-    {
-        "url": "/images/status/cup.png", 
-        "name": "cup"
-    }, 
-    {
-        "url": "/images/status/currency-dollar-aud.png", 
-        "name": "currency-dollar-aud"
-    }, 
-    {
-        "url": "/images/status/currency-dollar-cad.png", 
-        "name": "currency-dollar-cad"
-    }, 
-    {
-        "url": "/images/status/currency-dollar-nzd.png", 
-        "name": "currency-dollar-nzd"
-    }, 
-    {
-        "url": "/images/status/currency-dollar-usd.png", 
-        "name": "currency-dollar-usd"
-    }, 
-    {
-        "url": "/images/status/currency-euro.png", 
-        "name": "currency-euro"
-    }, 
-    {
-        "url": "/images/status/currency-pound.png", 
-        "name": "currency-pound"
-    }, 
-    {
-        "url": "/images/status/currency-yen.png", 
-        "name": "currency-yen"
-    }, 
-    {
-        "url": "/images/status/currency.png", 
-        "name": "currency"
-    }, 
-    {
-        "url": "/images/status/cursor-question.png", 
-        "name": "cursor-question"
-    }, 
-    {
-        "url": "/images/status/cursor-small.png", 
-        "name": "cursor-small"
-    }, 
-    {
-        "url": "/images/status/cursor.png", 
-        "name": "cursor"
-    }, 
-    {
-        "url": "/images/status/cutlery-fork.png", 
-        "name": "cutlery-fork"
-    }, 
-    {
-        "url": "/images/status/cutlery-knife.png", 
-        "name": "cutlery-knife"
-    }, 
-    {
-        "url": "/images/status/cutlery-spoon.png", 
-        "name": "cutlery-spoon"
-    }, 
-    {
-        "url": "/images/status/cutlery.png", 
-        "name": "cutlery"
-    }, 
-    {
-        "url": "/images/status/dashboard--arrow.png", 
-        "name": "dashboard--arrow"
-    }, 
-    {
-        "url": "/images/status/dashboard--exclamation.png", 
-        "name": "dashboard--exclamation"
-    }, 
-    {
-        "url": "/images/status/dashboard--minus.png", 
-        "name": "dashboard--minus"
-    }, 
-    {
-        "url": "/images/status/dashboard--pencil.png", 
-        "name": "dashboard--pencil"
-    }, 
-    {
-        "url": "/images/status/dashboard--plus.png", 
-        "name": "dashboard--plus"
-    }, 
-    {
-        "url": "/images/status/dashboard.png", 
-        "name": "dashboard"
-    }, 
-    {
-        "url": "/images/status/database--arrow.png", 
-        "name": "database--arrow"
-    }, 
-    {
-        "url": "/images/status/database--exclamation.png", 
-        "name": "database--exclamation"
-    }, 
-    {
-        "url": "/images/status/database--minus.png", 
-        "name": "database--minus"
-    }, 
-    {
-        "url": "/images/status/database--pencil.png", 
-        "name": "database--pencil"
-    }, 
-    {
-        "url": "/images/status/database--plus.png", 
-        "name": "database--plus"
-    }, 
-    {
-        "url": "/images/status/database-delete.png", 
-        "name": "database-delete"
-    }, 
-    {
-        "url": "/images/status/database-export.png", 
-        "name": "database-export"
-    }, 
-    {
-        "url": "/images/status/database-import.png", 
-        "name": "database-import"
-    }, 
-    {
-        "url": "/images/status/database-insert.png", 
-        "name": "database-insert"
-    }, 
-    {
-        "url": "/images/status/database-network.png", 
-        "name": "database-network"
-    }, 
-    {
-        "url": "/images/status/database-share.png", 
-        "name": "database-share"
-    }, 
-    {
-        "url": "/images/status/database-small.png", 
-        "name": "database-small"
-    }, 
-    {
-        "url": "/images/status/database.png", 
-        "name": "database"
-    }, 
-    {
-        "url": "/images/status/databases-relation.png", 
-        "name": "databases-relation"
-    }, 
-    {
-        "url": "/images/status/databases.png", 
-        "name": "databases"
-    }, 
-    {
-        "url": "/images/status/desktop-empty.png", 
-        "name": "desktop-empty"
-    }, 
-    {
-        "url": "/images/status/desktop-image.png", 
-        "name": "desktop-image"
-    }, 
-    {
-        "url": "/images/status/desktop-network.png", 
-        "name": "desktop-network"
-    }, 
-    {
-        "url": "/images/status/desktop.png", 
-        "name": "desktop"
-    }, 
-    {
-        "url": "/images/status/diamond.png", 
-        "name": "diamond"
-    }, 
-    {
-        "url": "/images/status/direction--arrow.png", 
-        "name": "direction--arrow"
-    }, 
-    {
-        "url": "/images/status/direction--exclamation.png", 
-        "name": "direction--exclamation"
-    }, 
-    {
-        "url": "/images/status/direction--minus.png", 
-        "name": "direction--minus"
-    }, 
-    {
-        "url": "/images/status/direction--pencil.png", 
-        "name": "direction--pencil"
-    }, 
-    {
-        "url": "/images/status/direction--plus.png", 
-        "name": "direction--plus"
-    }, 
-    {
-        "url": "/images/status/direction.png", 
-        "name": "direction"
-    }, 
-    {
-        "url": "/images/status/disc--arrow.png", 
-        "name": "disc--arrow"
-    }, 
-    {
-        "url": "/images/status/disc--exclamation.png", 
-        "name": "disc--exclamation"
-    }, 
-    {
-        "url": "/images/status/disc--minus.png", 
-        "name": "disc--minus"
-    }, 
-    {
-        "url": "/images/status/disc--pencil.png", 
-        "name": "disc--pencil"
-    }, 
-    {
-        "url": "/images/status/disc--plus.png", 
-        "name": "disc--plus"
-    }, 
-    {
-        "url": "/images/status/disc-blue.png", 
-        "name": "disc-blue"
-    }, 
-    {
-        "url": "/images/status/disc-case-label.png", 
-        "name": "disc-case-label"
-    }, 
-    {
-        "url": "/images/status/disc-case.png", 
-        "name": "disc-case"
-    }, 
-    {
-        "url": "/images/status/disc-label.png", 
-        "name": "disc-label"
-    }, 
-    {
-        "url": "/images/status/disc-small.png", 
-        "name": "disc-small"
-    }, 
-    {
-        "url": "/images/status/disc.png", 
-        "name": "disc"
-    }, 
-    {
-        "url": "/images/status/discs.png", 
-        "name": "discs"
-    }, 
-    {
-        "url": "/images/status/disk--arrow.png", 
-        "name": "disk--arrow"
-    }, 
-    {
-        "url": "/images/status/disk--exclamation.png", 
-        "name": "disk--exclamation"
-    }, 
-    {
-        "url": "/images/status/disk--minus.png", 
-        "name": "disk--minus"
-    }, 
-    {
-        "url": "/images/status/disk--pencil.png", 
-        "name": "disk--pencil"
-    }, 
-    {
-        "url": "/images/status/disk--plus.png", 
-        "name": "disk--plus"
-    }, 
-    {
-        "url": "/images/status/disk-black.png", 
-        "name": "disk-black"
-    }, 
-    {
-        "url": "/images/status/disk-return-black.png", 
-        "name": "disk-return-black"
-    }, 
-    {
-        "url": "/images/status/disk-return.png", 
-        "name": "disk-return"
-    }, 
-    {
-        "url": "/images/status/disk-small-black.png", 
-        "name": "disk-small-black"
-    }, 
-    {
-        "url": "/images/status/disk-small.png", 
-        "name": "disk-small"
-    }, 
-    {
-        "url": "/images/status/disk.png", 
-        "name": "disk"
-    }, 
-    {
-        "url": "/images/status/disks-black.png", 
-        "name": "disks-black"
-    }, 
-    {
-        "url": "/images/status/disks.png", 
-        "name": "disks"
-    }, 
-    {
-        "url": "/images/status/do-not-disturb-sign-cross.png", 
-        "name": "do-not-disturb-sign-cross"
-    }, 
-    {
-        "url": "/images/status/do-not-disturb-sign.png", 
-        "name": "do-not-disturb-sign"
-    }, 
-    {
-        "url": "/images/status/document--arrow.png", 
-        "name": "document--arrow"
-    }, 
-    {
-        "url": "/images/status/document--exclamation.png", 
-        "name": "document--exclamation"
-    }, 
-    {
-        "url": "/images/status/document--minus.png", 
-        "name": "document--minus"
-    }, 
-    {
-        "url": "/images/status/document--pencil.png", 
-        "name": "document--pencil"
-    }, 
-    {
-        "url": "/images/status/document--plus.png", 
-        "name": "document--plus"
-    }, 
-    {
-        "url": "/images/status/document-access.png", 
-        "name": "document-access"
-    }, 
-    {
-        "url": "/images/status/document-attribute-b.png", 
-        "name": "document-attribute-b"
-    }, 
-    {
-        "url": "/images/status/document-attribute-c.png", 
-        "name": "document-attribute-c"
-    }, 
-    {
-        "url": "/images/status/document-attribute-d.png", 
-        "name": "document-attribute-d"
-    }, 
-    {
-        "url": "/images/status/document-attribute-e.png", 
-        "name": "document-attribute-e"
-    }, 
-    {
-        "url": "/images/status/document-attribute-f.png", 
-        "name": "document-attribute-f"
-    }, 
-    {
-        "url": "/images/status/document-attribute-g.png", 
-        "name": "document-attribute-g"
-    }, 
-    {
-        "url": "/images/status/document-attribute-h.png", 
-        "name": "document-attribute-h"
-    }, 
-    {
-        "url": "/images/status/document-attribute-i.png", 
-        "name": "document-attribute-i"
-    }, 
-    {
-        "url": "/images/status/document-attribute-j.png", 
-        "name": "document-attribute-j"
-    }, 
-    {
-        "url": "/images/status/document-attribute-k.png", 
-        "name": "document-attribute-k"
-    }, 
-    {
-        "url": "/images/status/document-attribute-l.png", 
-        "name": "document-attribute-l"
-    }, 
-    {
-        "url": "/images/status/document-attribute-m.png", 
-        "name": "document-attribute-m"
-    }, 
-    {
-        "url": "/images/status/document-attribute-n.png", 
-        "name": "document-attribute-n"
-    }, 
-    {
-        "url": "/images/status/document-attribute-o.png", 
-        "name": "document-attribute-o"
-    }, 
-    {
-        "url": "/images/status/document-attribute-p.png", 
-        "name": "document-attribute-p"
-    }, 
-    {
-        "url": "/images/status/document-attribute-q.png", 
-        "name": "document-attribute-q"
-    }, 
-    {
-        "url": "/images/status/document-attribute-r.png", 
-        "name": "document-attribute-r"
-    }, 
-    {
-        "url": "/images/status/document-attribute-s.png", 
-        "name": "document-attribute-s"
-    }, 
-    {
-        "url": "/images/status/document-attribute-t.png", 
-        "name": "document-attribute-t"
-    }, 
-    {
-        "url": "/images/status/document-attribute-u.png", 
-        "name": "document-attribute-u"
-    }, 
-    {
-        "url": "/images/status/document-attribute-v.png", 
-        "name": "document-attribute-v"
-    }, 
-    {
-        "url": "/images/status/document-attribute-w.png", 
-        "name": "document-attribute-w"
-    }, 
-    {
-        "url": "/images/status/document-attribute-x.png", 
-        "name": "document-attribute-x"
-    }, 
-    {
-        "url": "/images/status/document-attribute-y.png", 
-        "name": "document-attribute-y"
-    }, 
-    {
-        "url": "/images/status/document-attribute-z.png", 
-        "name": "document-attribute-z"
-    }, 
-    {
-        "url": "/images/status/document-attribute.png", 
-        "name": "document-attribute"
-    }, 
-    {
-        "url": "/images/status/document-binary.png", 
-        "name": "document-binary"
-    }, 
-    {
-        "url": "/images/status/document-block.png", 
-        "name": "document-block"
-    }, 
-    {
-        "url": "/images/status/document-bookmark.png", 
-        "name": "document-bookmark"
-    }, 
-    {
-        "url": "/images/status/document-break.png", 
-        "name": "document-break"
-    }, 
-    {
-        "url": "/images/status/document-clock.png", 
-        "name": "document-clock"
-    }, 
-    {
-        "url": "/images/status/document-code.png", 
-        "name": "document-code"
-    }, 
-    {
-        "url": "/images/status/document-convert.png", 
-        "name": "document-convert"
-    }, 
-    {
-        "url": "/images/status/document-copy.png", 
-        "name": "document-copy"
-    }, 
-    {
-        "url": "/images/status/document-excel-csv.png", 
-        "name": "document-excel-csv"
-    }, 
-    {
-        "url": "/images/status/document-excel-table.png", 
-        "name": "document-excel-table"
-    }, 
-    {
-        "url": "/images/status/document-excel.png", 
-        "name": "document-excel"
-    }, 
-    {
-        "url": "/images/status/document-export.png", 
-        "name": "document-export"
-    }, 
-    {
-        "url": "/images/status/document-film.png", 
-        "name": "document-film"
-    }, 
-    {
-        "url": "/images/status/document-flash-movie.png", 
-        "name": "document-flash-movie"
-    }, 
-    {
-        "url": "/images/status/document-flash.png", 
-        "name": "document-flash"
-    }, 
-    {
-        "url": "/images/status/document-globe.png", 
-        "name": "document-globe"
-    }, 
-    {
-        "url": "/images/status/document-hf-delete-footer.png", 
-        "name": "document-hf-delete-footer"
-    }, 
-    {
-        "url": "/images/status/document-hf-delete.png", 
-        "name": "document-hf-delete"
-    }, 
-    {
-        "url": "/images/status/document-hf-insert-footer.png", 
-        "name": "document-hf-insert-footer"
-    }, 
-    {
-        "url": "/images/status/document-hf-insert.png", 
-        "name": "document-hf-insert"
-    }, 
-    {
-        "url": "/images/status/document-hf-select-footer.png", 
-        "name": "document-hf-select-footer"
-    }, 
-    {
-        "url": "/images/status/document-hf-select.png", 
-        "name": "document-hf-select"
-    }, 
-    {
-        "url": "/images/status/document-hf.png", 
-        "name": "document-hf"
-    }, 
-    {
-        "url": "/images/status/document-horizontal-text.png", 
-        "name": "document-horizontal-text"
-    }, 
-    {
-        "url": "/images/status/document-horizontal.png", 
-        "name": "document-horizontal"
-    }, 
-    {
-        "url": "/images/status/document-illustrator.png", 
-        "name": "document-illustrator"
-    }, 
-    {
-        "url": "/images/status/document-image.png", 
-        "name": "document-image"
-    }, 
-    {
-        "url": "/images/status/document-import.png", 
-        "name": "document-import"
-    }, 
-    {
-        "url": "/images/status/document-insert.png", 
-        "name": "document-insert"
-    }, 
-    {
-        "url": "/images/status/document-invoice.png", 
-        "name": "document-invoice"
-    }, 
-    {
-        "url": "/images/status/document-list.png", 
-        "name": "document-list"
-    }, 
-    {
-        "url": "/images/status/document-music-playlist.png", 
-        "name": "document-music-playlist"
-    }, 
-    {
-        "url": "/images/status/document-music.png", 
-        "name": "document-music"
-    }, 
-    {
-        "url": "/images/status/document-number.png", 
-        "name": "document-number"
-    }, 
-    {
-        "url": "/images/status/document-office-text.png", 
-        "name": "document-office-text"
-    }, 
-    {
-        "url": "/images/status/document-office.png", 
-        "name": "document-office"
-    }, 
-    {
-        "url": "/images/status/document-outlook.png", 
-        "name": "document-outlook"
-    }, 
-    {
-        "url": "/images/status/document-page-last.png", 
-        "name": "document-page-last"
-    }, 
-    {
-        "url": "/images/status/document-page-next.png", 
-        "name": "document-page-next"
-    }, 
-    {
-        "url": "/images/status/document-page-previous.png", 
-        "name": "document-page-previous"
-    }, 
-    {
-        "url": "/images/status/document-page.png", 
-        "name": "document-page"
-    }, 
-    {
-        "url": "/images/status/document-pdf-text.png", 
-        "name": "document-pdf-text"
-    }, 
-    {
-        "url": "/images/status/document-pdf.png", 
-        "name": "document-pdf"
-    }, 
-    {
-        "url": "/images/status/document-photoshop-image.png", 
-        "name": "document-photoshop-image"
-    }, 
-    {
-        "url": "/images/status/document-photoshop.png", 
-        "name": "document-photoshop"
-    }, 
-    {
-        "url": "/images/status/document-php.png", 
-        "name": "document-php"
-    }, 
-    {
-        "url": "/images/status/document-powerpoint.png", 
-        "name": "document-powerpoint"
-    }, 
-    {
-        "url": "/images/status/document-rename.png", 
-        "name": "document-rename"
-    }, 
-    {
-        "url": "/images/status/document-resize-actual.png", 
-        "name": "document-resize-actual"
-    }, 
-    {
-        "url": "/images/status/document-resize.png", 
-        "name": "document-resize"
-    }, 
-    {
-        "url": "/images/status/document-search-result.png", 
-        "name": "document-search-result"
-    }, 
-    {
-        "url": "/images/status/document-share.png", 
-        "name": "document-share"
-    }, 
-    {
-        "url": "/images/status/document-shred.png", 
-        "name": "document-shred"
-    }, 
-    {
-        "url": "/images/status/document-small-list.png", 
-        "name": "document-small-list"
-    }, 
-    {
-        "url": "/images/status/document-small.png", 
-        "name": "document-small"
-    }, 
-    {
-        "url": "/images/status/document-snippet.png", 
-        "name": "document-snippet"
-    }, 
-    {
-        "url": "/images/status/document-stamp.png", 
-        "name": "document-stamp"
-    }, 
-    {
-        "url": "/images/status/document-stand.png", 
-        "name": "document-stand"
-    }, 
-    {
-        "url": "/images/status/document-sub.png", 
-        "name": "document-sub"
-    }, 
-    {
-        "url": "/images/status/document-table.png", 
-        "name": "document-table"
-    }, 
-    {
-        "url": "/images/status/document-tag.png", 
-        "name": "document-tag"
-    }, 
-    {
-        "url": "/images/status/document-task.png", 
-        "name": "document-task"
-    }, 
-    {
-        "url": "/images/status/document-template.png", 
-        "name": "document-template"
-    }, 
-    {
-        "url": "/images/status/document-text-image.png", 
-        "name": "document-text-image"
-    }, 
-    {
-        "url": "/images/status/document-text.png", 
-        "name": "document-text"
-    }, 
-    {
-        "url": "/images/status/document-view-book.png", 
-        "name": "document-view-book"
-    }, 
-    {
-        "url": "/images/status/document-view-thumbnail.png", 
-        "name": "document-view-thumbnail"
-    }, 
-    {
-        "url": "/images/status/document-view.png", 
-        "name": "document-view"
-    }, 
-    {
-        "url": "/images/status/document-visual-studio.png", 
-        "name": "document-visual-studio"
-    }, 
-    {
-        "url": "/images/status/document-word-text.png", 
-        "name": "document-word-text"
-    }, 
-    {
-        "url": "/images/status/document-word.png", 
-        "name": "document-word"
-    }, 
-    {
-        "url": "/images/status/document-zipper.png", 
-        "name": "document-zipper"
-    }, 
-    {
-        "url": "/images/status/document.png", 
-        "name": "document"
-    }, 
-    {
-        "url": "/images/status/documents-stack.png", 
-        "name": "documents-stack"
-    }, 
-    {
-        "url": "/images/status/documents-text.png", 
-        "name": "documents-text"
-    }, 
-    {
-        "url": "/images/status/documents.png", 
-        "name": "documents"
-    }, 
-    {
-        "url": "/images/status/door--arrow.png", 
-        "name": "door--arrow"
-    }, 
-    {
-        "url": "/images/status/door--exclamation.png", 
-        "name": "door--exclamation"
-    }, 
-    {
-        "url": "/images/status/door--minus.png", 
-        "name": "door--minus"
-    }, 
-    {
-        "url": "/images/status/door--pencil.png", 
-        "name": "door--pencil"
-    }, 
-    {
-        "url": "/images/status/door--plus.png", 
-        "name": "door--plus"
-    }, 
-    {
-        "url": "/images/status/door-open-in.png", 
-        "name": "door-open-in"
-    }, 
-    {
-        "url": "/images/status/door-open-out.png", 
-        "name": "door-open-out"
-    }, 
-    {
-        "url": "/images/status/door-open.png", 
-        "name": "door-open"
-    }, 
-    {
-        "url": "/images/status/door.png", 
-        "name": "door"
-    }, 
-    {
-        "url": "/images/status/drawer--arrow.png", 
-        "name": "drawer--arrow"
-    }, 
-    {
-        "url": "/images/status/drawer--exclamation.png", 
-        "name": "drawer--exclamation"
-    }, 
-    {
-        "url": "/images/status/drawer--minus.png", 
-        "name": "drawer--minus"
-    }, 
-    {
-        "url": "/images/status/drawer--pencil.png", 
-        "name": "drawer--pencil"
-    }, 
-    {
-        "url": "/images/status/drawer--plus.png", 
-        "name": "drawer--plus"
-    }, 
-    {
-        "url": "/images/status/drawer-open.png", 
-        "name": "drawer-open"
-    }, 
-    {
-        "url": "/images/status/drawer.png", 
-        "name": "drawer"
-    }, 
-    {
-        "url": "/images/status/drill--arrow.png", 
-        "name": "drill--arrow"
-    }, 
-    {
-        "url": "/images/status/drill--exclamation.png", 
-        "name": "drill--exclamation"
-    }, 
-    {
-        "url": "/images/status/drill--minus.png", 
-        "name": "drill--minus"
-    }, 
-    {
-        "url": "/images/status/drill--pencil.png", 
-        "name": "drill--pencil"
-    }, 
-    {
-        "url": "/images/status/drill--plus.png", 
-        "name": "drill--plus"
-    }, 
-    {
-        "url": "/images/status/drill.png", 
-        "name": "drill"
-    }, 
-    {
-        "url": "/images/status/drive--arrow.png", 
-        "name": "drive--arrow"
-    }, 
-    {
-        "url": "/images/status/drive--exclamation.png", 
-        "name": "drive--exclamation"
-    }, 
-    {
-        "url": "/images/status/drive--minus.png", 
-        "name": "drive--minus"
-    }, 
-    {
-        "url": "/images/status/drive--pencil.png", 
-        "name": "drive--pencil"
-    }, 
-    {
-        "url": "/images/status/drive--plus.png", 
-        "name": "drive--plus"
-    }, 
-    {
-        "url": "/images/status/drive-download.png", 
-        "name": "drive-download"
-    }, 
-    {
-        "url": "/images/status/drive-globe.png", 
-        "name": "drive-globe"
-    }, 
-    {
-        "url": "/images/status/drive-network.png", 
-        "name": "drive-network"
-    }, 
-    {
-        "url": "/images/status/drive-rename.png", 
-        "name": "drive-rename"
-    }, 
-    {
-        "url": "/images/status/drive-small.png", 
-        "name": "drive-small"
-    }, 
-    {
-        "url": "/images/status/drive-upload.png", 
-        "name": "drive-upload"
-    }, 
-    {
-        "url": "/images/status/drive.png", 
-        "name": "drive"
-    }, 
-    {
-        "url": "/images/status/dummy.png", 
-        "name": "dummy"
-    }, 
-    {
-        "url": "/images/status/e-book-reader-white.png", 
-        "name": "e-book-reader-white"
-    }, 
-    {
-        "url": "/images/status/e-book-reader.png", 
-        "name": "e-book-reader"
-    }, 
-    {
-        "url": "/images/status/edit-alignment-center.png", 
-        "name": "edit-alignment-center"
-    }, 
-    {
-        "url": "/images/status/edit-alignment-justify-distribute.png", 
-        "name": "edit-alignment-justify-distribute"
-    }, 
-    {
-        "url": "/images/status/edit-alignment-justify.png", 
-        "name": "edit-alignment-justify"
-    }, 
-    {
-        "url": "/images/status/edit-alignment-right.png", 
-        "name": "edit-alignment-right"
-    }, 
-    {
-        "url": "/images/status/edit-alignment.png", 
-        "name": "edit-alignment"
-    }, 
-    {
-        "url": "/images/status/edit-all-caps.png", 
-        "name": "edit-all-caps"
-    }, 
-    {
-        "url": "/images/status/edit-bold.png", 
-        "name": "edit-bold"
-    }, 
-    {
-        "url": "/images/status/edit-code.png", 
-        "name": "edit-code"
-    }, 
-    {
-        "url": "/images/status/edit-color.png", 
-        "name": "edit-color"
-    }, 
-    {
-        "url": "/images/status/edit-column.png", 
-        "name": "edit-column"
-    }, 
-    {
-        "url": "/images/status/edit-comma.png", 
-        "name": "edit-comma"
-    }, 
-    {
-        "url": "/images/status/edit-decimal-decrease.png", 
-        "name": "edit-decimal-decrease"
-    }, 
-    {
-        "url": "/images/status/edit-decimal.png", 
-        "name": "edit-decimal"
-    }, 
-    {
-        "url": "/images/status/edit-diff.png", 
-        "name": "edit-diff"
-    }, 
-    {
-        "url": "/images/status/edit-direction-rtl.png", 
-        "name": "edit-direction-rtl"
-    }, 
-    {
-        "url": "/images/status/edit-direction.png", 
-        "name": "edit-direction"
-    }, 
-    {
-        "url": "/images/status/edit-drop-cap.png", 
-        "name": "edit-drop-cap"
-    }, 
-    {
-        "url": "/images/status/edit-heading.png", 
-        "name": "edit-heading"
-    }, 
-    {
-        "url": "/images/status/edit-hyphenation.png", 
-        "name": "edit-hyphenation"
-    }, 
-    {
-        "url": "/images/status/edit-image-center.png", 
-        "name": "edit-image-center"
-    }, 
-    {
-        "url": "/images/status/edit-image-right.png", 
-        "name": "edit-image-right"
-    }, 
-    {
-        "url": "/images/status/edit-image.png", 
-        "name": "edit-image"
-    }, 
-    {
-        "url": "/images/status/edit-indent.png", 
-        "name": "edit-indent"
-    }, 
-    {
-        "url": "/images/status/edit-italic.png", 
-        "name": "edit-italic"
-    }, 
-    {
-        "url": "/images/status/edit-kerning.png", 
-        "name": "edit-kerning"
-    }, 
-    {
-        "url": "/images/status/edit-language.png", 
-        "name": "edit-language"
-    }, 
-    {
-        "url": "/images/status/edit-letter-spacing.png", 
-        "name": "edit-letter-spacing"
-    }, 
-    {
-        "url": "/images/status/edit-line-spacing.png", 
-        "name": "edit-line-spacing"
-    }, 
-    {
-        "url": "/images/status/edit-list-order.png", 
-        "name": "edit-list-order"
-    }, 
-    {
-        "url": "/images/status/edit-list.png", 
-        "name": "edit-list"
-    }, 
-    {
-        "url": "/images/status/edit-lowercase.png", 
-        "name": "edit-lowercase"
-    }, 
-    {
-        "url": "/images/status/edit-mathematics.png", 
-        "name": "edit-mathematics"
-    }, 
-    {
-        "url": "/images/status/edit-number.png", 
-        "name": "edit-number"
-    }, 
-    {
-        "url": "/images/status/edit-outdent.png", 
-        "name": "edit-outdent"
-    }, 
-    {
-        "url": "/images/status/edit-outline.png", 
-        "name": "edit-outline"
-    }, 
-    {
-        "url": "/images/status/edit-overline.png", 
-        "name": "edit-overline"
-    }, 
-    {
-        "url": "/images/status/edit-padding-left.png", 
-        "name": "edit-padding-left"
-    }, 
-    {
-        "url": "/images/status/edit-padding-right.png", 
-        "name": "edit-padding-right"
-    }, 
-    {
-        "url": "/images/status/edit-padding-top.png", 
-        "name": "edit-padding-top"
-    }, 
-    {
-        "url": "/images/status/edit-padding.png", 
-        "name": "edit-padding"
-    }, 
-    {
-        "url": "/images/status/edit-percent.png", 
-        "name": "edit-percent"
-    }, 
-    {
-        "url": "/images/status/edit-pilcrow.png", 
-        "name": "edit-pilcrow"
-    }, 
-    {
-        "url": "/images/status/edit-quotation.png", 
-        "name": "edit-quotation"
-    }, 
-    {
-        "url": "/images/status/edit-replace.png", 
-        "name": "edit-replace"
-    }, 
-    {
-        "url": "/images/status/edit-rotate.png", 
-        "name": "edit-rotate"
-    }, 
-    {
-        "url": "/images/status/edit-rule.png", 
-        "name": "edit-rule"
-    }, 
-    {
-        "url": "/images/status/edit-scale-vertical.png", 
-        "name": "edit-scale-vertical"
-    }, 
-    {
-        "url": "/images/status/edit-scale.png", 
-        "name": "edit-scale"
-    }, 
-    {
-        "url": "/images/status/edit-shade.png", 
-        "name": "edit-shade"
-    }, 
-    {
-        "url": "/images/status/edit-shadow.png", 
-        "name": "edit-shadow"
-    }, 
-    {
-        "url": "/images/status/edit-signiture.png", 
-        "name": "edit-signiture"
-    }, 
-    {
-        "url": "/images/status/edit-size-down.png", 
-        "name": "edit-size-down"
-    }, 
-    {
-        "url": "/images/status/edit-size-up.png", 
-        "name": "edit-size-up"
-    }, 
-    {
-        "url": "/images/status/edit-size.png", 
-        "name": "edit-size"
-    }, 
-    {
-        "url": "/images/status/edit-small-caps.png", 
-        "name": "edit-small-caps"
-    }, 
-    {
-        "url": "/images/status/edit-space.png", 
-        "name": "edit-space"
-    }, 
-    {
-        "url": "/images/status/edit-strike-double.png", 
-        "name": "edit-strike-double"
-    }, 
-    {
-        "url": "/images/status/edit-strike.png", 
-        "name": "edit-strike"
-    }, 
-    {
-        "url": "/images/status/edit-subscript.png", 
-        "name": "edit-subscript"
-    }, 
-    {
-        "url": "/images/status/edit-superscript.png", 
-        "name": "edit-superscript"
-    }, 
-    {
-        "url": "/images/status/edit-symbol.png", 
-        "name": "edit-symbol"
-    }, 
-    {
-        "url": "/images/status/edit-underline-double.png", 
-        "name": "edit-underline-double"
-    }, 
-    {
-        "url": "/images/status/edit-underline.png", 
-        "name": "edit-underline"
-    }, 
-    {
-        "url": "/images/status/edit-uppercase.png", 
-        "name": "edit-uppercase"
-    }, 
-    {
-        "url": "/images/status/edit-vertical-alignment-middle.png", 
-        "name": "edit-vertical-alignment-middle"
-    }, 
-    {
-        "url": "/images/status/edit-vertical-alignment-top.png", 
-        "name": "edit-vertical-alignment-top"
-    }, 
-    {
-        "url": "/images/status/edit-vertical-alignment.png", 
-        "name": "edit-vertical-alignment"
-    }, 
-    {
-        "url": "/images/status/edit-writing-mode-tbrl.png", 
-        "name": "edit-writing-mode-tbrl"
-    }, 
-    {
-        "url": "/images/status/edit-writing-mode.png", 
-        "name": "edit-writing-mode"
-    }, 
-    {
-        "url": "/images/status/edit.png", 
-        "name": "edit"
-    }, 
-    {
-        "url": "/images/status/envelope--arrow.png", 
-        "name": "envelope--arrow"
-    }, 
-    {
-        "url": "/images/status/envelope--exclamation.png", 
-        "name": "envelope--exclamation"
-    }, 
-    {
-        "url": "/images/status/envelope--minus.png", 
-        "name": "envelope--minus"
-    }, 
-    {
-        "url": "/images/status/envelope--pencil.png", 
-        "name": "envelope--pencil"
-    }, 
-    {
-        "url": "/images/status/envelope--plus.png", 
-        "name": "envelope--plus"
-    }, 
-    {
-        "url": "/images/status/envelope-label.png", 
-        "name": "envelope-label"
-    }, 
-    {
-        "url": "/images/status/envelope.png", 
-        "name": "envelope"
-    }, 
-    {
-        "url": "/images/status/equalizer--arrow.png", 
-        "name": "equalizer--arrow"
-    }, 
-    {
-        "url": "/images/status/equalizer--exclamation.png", 
-        "name": "equalizer--exclamation"
-    }, 
-    {
-        "url": "/images/status/equalizer--minus.png", 
-        "name": "equalizer--minus"
-    }, 
-    {
-        "url": "/images/status/equalizer--pencil.png", 
-        "name": "equalizer--pencil"
-    }, 
-    {
-        "url": "/images/status/equalizer--plus.png", 
-        "name": "equalizer--plus"
-    }, 
-    {
-        "url": "/images/status/equalizer-flat.png", 
-        "name": "equalizer-flat"
-    }, 
-    {
-        "url": "/images/status/equalizer-high.png", 
-        "name": "equalizer-high"
-    }, 
-    {
-        "url": "/images/status/equalizer-low.png", 
-        "name": "equalizer-low"
-    }, 
-    {
-        "url": "/images/status/equalizer.png", 
-        "name": "equalizer"
-    }, 
-    {
-        "url": "/images/status/eraser--arrow.png", 
-        "name": "eraser--arrow"
-    }, 
-    {
-        "url": "/images/status/eraser--exclamation.png", 
-        "name": "eraser--exclamation"
-    }, 
-    {
-        "url": "/images/status/eraser--minus.png", 
-        "name": "eraser--minus"
-    }, 
-    {
-        "url": "/images/status/eraser--pencil.png", 
-        "name": "eraser--pencil"
-    }, 
-    {
-        "url": "/images/status/eraser--plus.png", 
-        "name": "eraser--plus"
-    }, 
-    {
-        "url": "/images/status/eraser-small.png", 
-        "name": "eraser-small"
-    }, 
-    {
-        "url": "/images/status/eraser.png", 
-        "name": "eraser"
-    }, 
-    {
-        "url": "/images/status/exclamation--frame.png", 
-        "name": "exclamation--frame"
-    }, 
-    {
-        "url": "/images/status/exclamation-button.png", 
-        "name": "exclamation-button"
-    }, 
-    {
-        "url": "/images/status/exclamation-diamond-frame.png", 
-        "name": "exclamation-diamond-frame"
-    }, 
-    {
-        "url": "/images/status/exclamation-diamond.png", 
-        "name": "exclamation-diamond"
-    }, 
-    {
-        "url": "/images/status/exclamation-octagon-frame.png", 
-        "name": "exclamation-octagon-frame"
-    }, 
-    {
-        "url": "/images/status/exclamation-octagon.png", 
-        "name": "exclamation-octagon"
-    }, 
-    {
-        "url": "/images/status/exclamation-red-frame.png", 
-        "name": "exclamation-red-frame"
-    }, 
-    {
-        "url": "/images/status/exclamation-red.png", 
-        "name": "exclamation-red"
-    }, 
-    {
-        "url": "/images/status/exclamation-shield-frame.png", 
-        "name": "exclamation-shield-frame"
-    }, 
-    {
-        "url": "/images/status/exclamation-shield.png", 
-        "name": "exclamation-shield"
-    }, 
-    {
-        "url": "/images/status/exclamation-small-red.png", 
-        "name": "exclamation-small-red"
-    }, 
-    {
-        "url": "/images/status/exclamation-small-white.png", 
-        "name": "exclamation-small-white"
-    }, 
-    {
-        "url": "/images/status/exclamation-small.png", 
-        "name": "exclamation-small"
-    }, 
-    {
-        "url": "/images/status/exclamation-white.png", 
-        "name": "exclamation-white"
-    }, 
-    {
-        "url": "/images/status/exclamation.png", 
-        "name": "exclamation"
-    }, 
-    {
-        "url": "/images/status/external-small.png", 
-        "name": "external-small"
-    }, 
-    {
-        "url": "/images/status/external.png", 
-        "name": "external"
-    }, 
-    {
-        "url": "/images/status/eye--arrow.png", 
-        "name": "eye--arrow"
-    }, 
-    {
-        "url": "/images/status/eye--exclamation.png", 
-        "name": "eye--exclamation"
-    }, 
-    {
-        "url": "/images/status/eye--minus.png", 
-        "name": "eye--minus"
-    }, 
-    {
-        "url": "/images/status/eye--pencil.png", 
-        "name": "eye--pencil"
-    }, 
-    {
-        "url": "/images/status/eye--plus.png", 
-        "name": "eye--plus"
-    }, 
-    {
-        "url": "/images/status/eye-close.png", 
-        "name": "eye-close"
-    }, 
-    {
-        "url": "/images/status/eye-half.png", 
-        "name": "eye-half"
-    }, 
-    {
-        "url": "/images/status/eye-red.png", 
-        "name": "eye-red"
-    }, 
-    {
-        "url": "/images/status/eye.png", 
-        "name": "eye"
-    }, 
-    {
-        "url": "/images/status/feed--arrow.png", 
-        "name": "feed--arrow"
-    }, 
-    {
-        "url": "/images/status/feed--exclamation.png", 
-        "name": "feed--exclamation"
-    }, 
-    {
-        "url": "/images/status/feed--minus.png", 
-        "name": "feed--minus"
-    }, 
-    {
-        "url": "/images/status/feed--pencil.png", 
-        "name": "feed--pencil"
-    }, 
-    {
-        "url": "/images/status/feed--plus.png", 
-        "name": "feed--plus"
-    }, 
-    {
-        "url": "/images/status/feed-balloon.png", 
-        "name": "feed-balloon"
-    }, 
-    {
-        "url": "/images/status/feed-document.png", 
-        "name": "feed-document"
-    }, 
-    {
-        "url": "/images/status/feed-small.png", 
-        "name": "feed-small"
-    }, 
-    {
-        "url": "/images/status/feed.png", 
-        "name": "feed"
-    }, 
-    {
-        "url": "/images/status/fill-090.png", 
-        "name": "fill-090"
-    }, 
-    {
-        "url": "/images/status/fill-180.png", 
-        "name": "fill-180"
-    }, 
-    {
-        "url": "/images/status/fill-270.png", 
-        "name": "fill-270"
-    }, 
-    {
-        "url": "/images/status/fill.png", 
-        "name": "fill"
-    }, 
-    {
-        "url": "/images/status/film--arrow.png", 
-        "name": "film--arrow"
-    }, 
-    {
-        "url": "/images/status/film--exclamation.png", 
-        "name": "film--exclamation"
-    }, 
-    {
-        "url": "/images/status/film--minus.png", 
-        "name": "film--minus"
-    }, 
-    {
-        "url": "/images/status/film--pencil.png", 
-        "name": "film--pencil"
-    }, 
-    {
-        "url": "/images/status/film--plus.png", 
-        "name": "film--plus"
-    }, 
-    {
-        "url": "/images/status/film-cast.png", 
-        "name": "film-cast"
-    }, 
-    {
-        "url": "/images/status/film-small.png", 
-        "name": "film-small"
-    }, 
-    {
-        "url": "/images/status/film.png", 
-        "name": "film"
-    }, 
-    {
-        "url": "/images/status/films.png", 
-        "name": "films"
-    }, 
-    {
-        "url": "/images/status/fingerprint-recognition.png", 
-        "name": "fingerprint-recognition"
-    }, 
-    {
-        "url": "/images/status/fingerprint.png", 
-        "name": "fingerprint"
-    }, 
-    {
-        "url": "/images/status/fire--arrow.png", 
-        "name": "fire--arrow"
-    }, 
-    {
-        "url": "/images/status/fire--exclamation.png", 
-        "name": "fire--exclamation"
-    }, 
-    {
-        "url": "/images/status/fire--minus.png", 
-        "name": "fire--minus"
-    }, 
-    {
-        "url": "/images/status/fire--pencil.png", 
-        "name": "fire--pencil"
-    }, 
-    {
-        "url": "/images/status/fire--plus.png", 
-        "name": "fire--plus"
-    }, 
-    {
-        "url": "/images/status/fire-big.png", 
-        "name": "fire-big"
-    }, 
-    {
-        "url": "/images/status/fire-small.png", 
-        "name": "fire-small"
-    }, 
-    {
-        "url": "/images/status/fire.png", 
-        "name": "fire"
-    }, 
-    {
-        "url": "/images/status/flag--arrow.png", 
-        "name": "flag--arrow"
-    }, 
-    {
-        "url": "/images/status/flag--exclamation.png", 
-        "name": "flag--exclamation"
-    }, 
-    {
-        "url": "/images/status/flag--minus.png", 
-        "name": "flag--minus"
-    }, 
-    {
-        "url": "/images/status/flag--pencil.png", 
-        "name": "flag--pencil"
-    }, 
-    {
-        "url": "/images/status/flag--plus.png", 
-        "name": "flag--plus"
-    }, 
-    {
-        "url": "/images/status/flag-small.png", 
-        "name": "flag-small"
-    }, 
-    {
-        "url": "/images/status/flag.png", 
-        "name": "flag"
-    }, 
-    {
-        "url": "/images/status/flashlight--arrow.png", 
-        "name": "flashlight--arrow"
-    }, 
-    {
-        "url": "/images/status/flashlight--exclamation.png", 
-        "name": "flashlight--exclamation"
-    }, 
-    {
-        "url": "/images/status/flashlight--minus.png", 
-        "name": "flashlight--minus"
-    }, 
-    {
-        "url": "/images/status/flashlight--pencil.png", 
-        "name": "flashlight--pencil"
-    }, 
-    {
-        "url": "/images/status/flashlight--plus.png", 
-        "name": "flashlight--plus"
-    }, 
-    {
-        "url": "/images/status/flashlight-shine.png", 
-        "name": "flashlight-shine"
-    }, 
-    {
-        "url": "/images/status/flashlight.png", 
-        "name": "flashlight"
-    }, 
-    {
-        "url": "/images/status/flask--arrow.png", 
-        "name": "flask--arrow"
-    }, 
-    {
-        "url": "/images/status/flask--exclamation.png", 
-        "name": "flask--exclamation"
-    }, 
-    {
-        "url": "/images/status/flask--minus.png", 
-        "name": "flask--minus"
-    }, 
-    {
-        "url": "/images/status/flask--pencil.png", 
-        "name": "flask--pencil"
-    }, 
-    {
-        "url": "/images/status/flask--plus.png", 
-        "name": "flask--plus"
-    }, 
-    {
-        "url": "/images/status/flask-empty.png", 
-        "name": "flask-empty"
-    }, 
-    {
-        "url": "/images/status/flask.png", 
-        "name": "flask"
-    }, 
-    {
-        "url": "/images/status/foaf.png", 
-        "name": "foaf"
-    }, 
-    {
-        "url": "/images/status/folder--arrow.png", 
-        "name": "folder--arrow"
-    }, 
-    {
-        "url": "/images/status/folder--exclamation.png", 
-        "name": "folder--exclamation"
-    }, 
-    {
-        "url": "/images/status/folder--minus.png", 
-        "name": "folder--minus"
-    }, 
-    {
-        "url": "/images/status/folder--pencil.png", 
-        "name": "folder--pencil"
-    }, 
-    {
-        "url": "/images/status/folder--plus.png", 
-        "name": "folder--plus"
-    }, 
-    {
-        "url": "/images/status/folder-bookmark.png", 
-        "name": "folder-bookmark"
-    }, 
-    {
-        "url": "/images/status/folder-export.png", 
-        "name": "folder-export"
-    }, 
-    {
-        "url": "/images/status/folder-horizontal-open.png", 
-        "name": "folder-horizontal-open"
-    }, 
-    {
-        "url": "/images/status/folder-horizontal.png", 
-        "name": "folder-horizontal"
-    }, 
-    {
-        "url": "/images/status/folder-import.png", 
-        "name": "folder-import"
-    }, 
-    {
-        "url": "/images/status/folder-network.png", 
-        "name": "folder-network"
-    }, 
-    {
-        "url": "/images/status/folder-open-document-music-playlist.png", 
-        "name": "folder-open-document-music-playlist"
-    }, 
-    {
-        "url": "/images/status/folder-open-document-music.png", 
-        "name": "folder-open-document-music"
-    }, 
-    {
-        "url": "/images/status/folder-open-document-text.png", 
-        "name": "folder-open-document-text"
-    }, 
-    {
-        "url": "/images/status/folder-open-document.png", 
-        "name": "folder-open-document"
-    }, 
-    {
-        "url": "/images/status/folder-open-film.png", 
-        "name": "folder-open-film"
-    }, 
-    {
-        "url": "/images/status/folder-open-image.png", 
-        "name": "folder-open-image"
-    }, 
-    {
-        "url": "/images/status/folder-open-slide.png", 
-        "name": "folder-open-slide"
-    }, 
-    {
-        "url": "/images/status/folder-open-table.png", 
-        "name": "folder-open-table"
-    }, 
-    {
-        "url": "/images/status/folder-open.png", 
-        "name": "folder-open"
-    }, 
-    {
-        "url": "/images/status/folder-rename.png", 
-        "name": "folder-rename"
-    }, 
-    {
-        "url": "/images/status/folder-search-result.png", 
-        "name": "folder-search-result"
-    }, 
-    {
-        "url": "/images/status/folder-share.png", 
-        "name": "folder-share"
-    }, 
-    {
-        "url": "/images/status/folder-shred.png", 
-        "name": "folder-shred"
-    }, 
-    {
-        "url": "/images/status/folder-small-horizontal.png", 
-        "name": "folder-small-horizontal"
-    }, 
-    {
-        "url": "/images/status/folder-small.png", 
-        "name": "folder-small"
-    }, 
-    {
-        "url": "/images/status/folder-stamp.png", 
-        "name": "folder-stamp"
-    }, 
-    {
-        "url": "/images/status/folder-stand.png", 
-        "name": "folder-stand"
-    }, 
-    {
-        "url": "/images/status/folder-zipper.png", 
-        "name": "folder-zipper"
-    }, 
-    {
-        "url": "/images/status/folder.png", 
-        "name": "folder"
-    }, 
-    {
-        "url": "/images/status/folders-stack.png", 
-        "name": "folders-stack"
-    }, 
-    {
-        "url": "/images/status/folders.png", 
-        "name": "folders"
-    }, 
-    {
-        "url": "/images/status/fruit-orange.png", 
-        "name": "fruit-orange"
-    }, 
-    {
-        "url": "/images/status/fruit.png", 
-        "name": "fruit"
-    }, 
-    {
-        "url": "/images/status/function.png", 
-        "name": "function"
-    }, 
-    {
-        "url": "/images/status/funnel--arrow.png", 
-        "name": "funnel--arrow"
-    }, 
-    {
-        "url": "/images/status/funnel--exclamation.png", 
-        "name": "funnel--exclamation"
-    }, 
-    {
-        "url": "/images/status/funnel--minus.png", 
-        "name": "funnel--minus"
-    }, 
-    {
-        "url": "/images/status/funnel--pencil.png", 
-        "name": "funnel--pencil"
-    }, 
-    {
-        "url": "/images/status/funnel--plus.png", 
-        "name": "funnel--plus"
-    }, 
-    {
-        "url": "/images/status/funnel-small.png", 
-        "name": "funnel-small"
-    }, 
-    {
-        "url": "/images/status/funnel.png", 
-        "name": "funnel"
-    }, 
-    {
-        "url": "/images/status/game-monitor.png", 
-        "name": "game-monitor"
-    }, 
-    {
-        "url": "/images/status/game.png", 
-        "name": "game"
-    }, 
-    {
-        "url": "/images/status/gear--arrow.png", 
-        "name": "gear--arrow"
-    }, 
-    {
-        "url": "/images/status/gear--exclamation.png", 
-        "name": "gear--exclamation"
-    }, 
-    {
-        "url": "/images/status/gear--minus.png", 
-        "name": "gear--minus"
-    }, 
-    {
-        "url": "/images/status/gear--pencil.png", 
-        "name": "gear--pencil"
-    }, 
-    {
-        "url": "/images/status/gear--plus.png", 
-        "name": "gear--plus"
-    }, 
-    {
-        "url": "/images/status/gear-small.png", 
-        "name": "gear-small"
-    }, 
-    {
-        "url": "/images/status/gear.png", 
-        "name": "gear"
-    }, 
-    {
-        "url": "/images/status/gender-female.png", 
-        "name": "gender-female"
-    }, 
-    {
-        "url": "/images/status/gender.png", 
-        "name": "gender"
-    }, 
-    {
-        "url": "/images/status/geotag-balloon.png", 
-        "name": "geotag-balloon"
-    }, 
-    {
-        "url": "/images/status/geotag-document.png", 
-        "name": "geotag-document"
-    }, 
-    {
-        "url": "/images/status/geotag-small.png", 
-        "name": "geotag-small"
-    }, 
-    {
-        "url": "/images/status/geotag.png", 
-        "name": "geotag"
-    }, 
-    {
-        "url": "/images/status/ghost-small.png", 
-        "name": "ghost-small"
-    }, 
-    {
-        "url": "/images/status/ghost.png", 
-        "name": "ghost"
-    }, 
-    {
-        "url": "/images/status/glass--arrow.png", 
-        "name": "glass--arrow"
-    }, 
-    {
-        "url": "/images/status/glass--exclamation.png", 
-        "name": "glass--exclamation"
-    }, 
-    {
-        "url": "/images/status/glass--minus.png", 
-        "name": "glass--minus"
-    }, 
-    {
-        "url": "/images/status/glass--pencil.png", 
-        "name": "glass--pencil"
-    }, 
-    {
-        "url": "/images/status/glass--plus.png", 
-        "name": "glass--plus"
-    }, 
-    {
-        "url": "/images/status/glass-empty.png", 
-        "name": "glass-empty"
-    }, 
-    {
-        "url": "/images/status/glass.png", 
-        "name": "glass"
-    }, 
-    {
-        "url": "/images/status/globe--arrow.png", 
-        "name": "globe--arrow"
-    }, 
-    {
-        "url": "/images/status/globe--exclamation.png", 
-        "name": "globe--exclamation"
-    }, 
-    {
-        "url": "/images/status/globe--minus.png", 
-        "name": "globe--minus"
-    }, 
-    {
-        "url": "/images/status/globe--pencil.png", 
-        "name": "globe--pencil"
-    }, 
-    {
-        "url": "/images/status/globe--plus.png", 
-        "name": "globe--plus"
-    }, 
-    {
-        "url": "/images/status/globe-green.png", 
-        "name": "globe-green"
-    }, 
-    {
-        "url": "/images/status/globe-medium-green.png", 
-        "name": "globe-medium-green"
-    }, 
-    {
-        "url": "/images/status/globe-medium.png", 
-        "name": "globe-medium"
-    }, 
-    {
-        "url": "/images/status/globe-model.png", 
-        "name": "globe-model"
-    }, 
-    {
-        "url": "/images/status/globe-network.png", 
-        "name": "globe-network"
-    }, 
-    {
-        "url": "/images/status/globe-place.png", 
-        "name": "globe-place"
-    }, 
-    {
-        "url": "/images/status/globe-small-green.png", 
-        "name": "globe-small-green"
-    }, 
-    {
-        "url": "/images/status/globe-small.png", 
-        "name": "globe-small"
-    }, 
-    {
-        "url": "/images/status/globe.png", 
-        "name": "globe"
-    }, 
-    {
-        "url": "/images/status/gradient-small.png", 
-        "name": "gradient-small"
-    }, 
-    {
-        "url": "/images/status/gradient.png", 
-        "name": "gradient"
-    }, 
-    {
-        "url": "/images/status/grid-dot.png", 
-        "name": "grid-dot"
-    }, 
-    {
-        "url": "/images/status/grid-small-dot.png", 
-        "name": "grid-small-dot"
-    }, 
-    {
-        "url": "/images/status/grid-small.png", 
-        "name": "grid-small"
-    }, 
-    {
-        "url": "/images/status/grid-snap-dot.png", 
-        "name": "grid-snap-dot"
-    }, 
-    {
-        "url": "/images/status/grid-snap.png", 
-        "name": "grid-snap"
-    }, 
-    {
-        "url": "/images/status/grid.png", 
-        "name": "grid"
-    }, 
-    {
-        "url": "/images/status/guide-snap.png", 
-        "name": "guide-snap"
-    }, 
-    {
-        "url": "/images/status/guide.png", 
-        "name": "guide"
-    }, 
-    {
-        "url": "/images/status/guitar--arrow.png", 
-        "name": "guitar--arrow"
-    }, 
-    {
-        "url": "/images/status/guitar--exclamation.png", 
-        "name": "guitar--exclamation"
-    }, 
-    {
-        "url": "/images/status/guitar--minus.png", 
-        "name": "guitar--minus"
-    }, 
-    {
-        "url": "/images/status/guitar--pencil.png", 
-        "name": "guitar--pencil"
-    }, 
-    {
-        "url": "/images/status/guitar--plus.png", 
-        "name": "guitar--plus"
-    }, 
-    {
-        "url": "/images/status/guitar.png", 
-        "name": "guitar"
-    }, 
-    {
-        "url": "/images/status/hammer--arrow.png", 
-        "name": "hammer--arrow"
-    }, 
-    {
-        "url": "/images/status/hammer--exclamation.png", 
-        "name": "hammer--exclamation"
-    }, 
-    {
-        "url": "/images/status/hammer--minus.png", 
-        "name": "hammer--minus"
-    }, 
-    {
-        "url": "/images/status/hammer--pencil.png", 
-        "name": "hammer--pencil"
-    }, 
-    {
-        "url": "/images/status/hammer--plus.png", 
-        "name": "hammer--plus"
-    }, 
-    {
-        "url": "/images/status/hammer-left.png", 
-        "name": "hammer-left"
-    }, 
-    {
-        "url": "/images/status/hammer-screwdriver.png", 
-        "name": "hammer-screwdriver"
-    }, 
-    {
-        "url": "/images/status/hammer.png", 
-        "name": "hammer"
-    }, 
-    {
-        "url": "/images/status/hand-point-090.png", 
-        "name": "hand-point-090"
-    }, 
-    {
-        "url": "/images/status/hand-point-180.png", 
-        "name": "hand-point-180"
-    }, 
-    {
-        "url": "/images/status/hand-point-270.png", 
-        "name": "hand-point-270"
-    }, 
-    {
-        "url": "/images/status/hand-point.png", 
-        "name": "hand-point"
-    }, 
-    {
-        "url": "/images/status/hand-property.png", 
-        "name": "hand-property"
-    }, 
-    {
-        "url": "/images/status/hand-share.png", 
-        "name": "hand-share"
-    }, 
-    {
-        "url": "/images/status/hand.png", 
-        "name": "hand"
-    }, 
-    {
-        "url": "/images/status/hard-hat--arrow.png", 
-        "name": "hard-hat--arrow"
-    }, 
-    {
-        "url": "/images/status/hard-hat--exclamation.png", 
-        "name": "hard-hat--exclamation"
-    }, 
-    {
-        "url": "/images/status/hard-hat--minus.png", 
-        "name": "hard-hat--minus"
-    }, 
-    {
-        "url": "/images/status/hard-hat--pencil.png", 
-        "name": "hard-hat--pencil"
-    }, 
-    {
-        "url": "/images/status/hard-hat--plus.png", 
-        "name": "hard-hat--plus"
-    }, 
-    {
-        "url": "/images/status/hard-hat-military.png", 
-        "name": "hard-hat-military"
-    }, 
-    {
-        "url": "/images/status/hard-hat-mine.png", 
-        "name": "hard-hat-mine"
-    }, 
-    {
-        "url": "/images/status/hard-hat.png", 
-        "name": "hard-hat"
-    }, 
-    {
-        "url": "/images/status/headphone--arrow.png", 
-        "name": "headphone--arrow"
-    }, 
-    {
-        "url": "/images/status/headphone--exclamation.png", 
-        "name": "headphone--exclamation"
-    }, 
-    {
-        "url": "/images/status/headphone--minus.png", 
-        "name": "headphone--minus"
-    }, 
-    {
-        "url": "/images/status/headphone--pencil.png", 
-        "name": "headphone--pencil"
-    }, 
-    {
-        "url": "/images/status/headphone--plus.png", 
-        "name": "headphone--plus"
-    }, 
-    {
-        "url": "/images/status/headphone-microphone.png", 
-        "name": "headphone-microphone"
-    }, 
-    {
-        "url": "/images/status/headphone.png", 
-        "name": "headphone"
-    }, 
-    {
-        "url": "/images/status/heart--arrow.png", 
-        "name": "heart--arrow"
-    }, 
-    {
-        "url": "/images/status/heart--exclamation.png", 
-        "name": "heart--exclamation"
-    }, 
-    {
-        "url": "/images/status/heart--minus.png", 
-        "name": "heart--minus"
-    }, 
-    {
-        "url": "/images/status/heart--pencil.png", 
-        "name": "heart--pencil"
-    }, 
-    {
-        "url": "/images/status/heart--plus.png", 
-        "name": "heart--plus"
-    }, 
-    {
-        "url": "/images/status/heart-break.png", 
-        "name": "heart-break"
-    }, 
-    {
-        "url": "/images/status/heart-empty.png", 
-        "name": "heart-empty"
-    }, 
-    {
-        "url": "/images/status/heart-half.png", 
-        "name": "heart-half"
-    }, 
-    {
-        "url": "/images/status/heart-small-empty.png", 
-        "name": "heart-small-empty"
-    }, 
-    {
-        "url": "/images/status/heart-small-half.png", 
-        "name": "heart-small-half"
-    }, 
-    {
-        "url": "/images/status/heart-small.png", 
-        "name": "heart-small"
-    }, 
-    {
-        "url": "/images/status/heart.png", 
-        "name": "heart"
-    }, 
-    {
-        "url": "/images/status/highlighter--arrow.png", 
-        "name": "highlighter--arrow"
-    }, 
-    {
-        "url": "/images/status/highlighter--exclamation.png", 
-        "name": "highlighter--exclamation"
-    }, 
-    {
-        "url": "/images/status/highlighter--minus.png", 
-        "name": "highlighter--minus"
-    }, 
-    {
-        "url": "/images/status/highlighter--plus.png", 
-        "name": "highlighter--plus"
-    }, 
-    {
-        "url": "/images/status/highlighter-color.png", 
-        "name": "highlighter-color"
-    }, 
-    {
-        "url": "/images/status/highlighter-small.png", 
-        "name": "highlighter-small"
-    }, 
-    {
-        "url": "/images/status/highlighter-text.png", 
-        "name": "highlighter-text"
-    }, 
-    {
-        "url": "/images/status/highlighter.png", 
-        "name": "highlighter"
-    }, 
-    {
-        "url": "/images/status/home--arrow.png", 
-        "name": "home--arrow"
-    }, 
-    {
-        "url": "/images/status/home--exclamation.png", 
-        "name": "home--exclamation"
-    }, 
-    {
-        "url": "/images/status/home--minus.png", 
-        "name": "home--minus"
-    }, 
-    {
-        "url": "/images/status/home--pencil.png", 
-        "name": "home--pencil"
-    }, 
-    {
-        "url": "/images/status/home--plus.png", 
-        "name": "home--plus"
-    }, 
-    {
-        "url": "/images/status/home-network.png", 
-        "name": "home-network"
-    }, 
-    {
-        "url": "/images/status/home-small.png", 
-        "name": "home-small"
-    }, 
-    {
-        "url": "/images/status/home.png", 
-        "name": "home"
-    }, 
-    {
-        "url": "/images/status/hourglass--arrow.png", 
-        "name": "hourglass--arrow"
-    }, 
-    {
-        "url": "/images/status/hourglass--exclamation.png", 
-        "name": "hourglass--exclamation"
-    }, 
-    {
-        "url": "/images/status/hourglass--minus.png", 
-        "name": "hourglass--minus"
-    }, 
-    {
-        "url": "/images/status/hourglass--pencil.png", 
-        "name": "hourglass--pencil"
-    }, 
-    {
-        "url": "/images/status/hourglass--plus.png", 
-        "name": "hourglass--plus"
-    }, 
-    {
-        "url": "/images/status/hourglass-select-remain.png", 
-        "name": "hourglass-select-remain"
-    }, 
-    {
-        "url": "/images/status/hourglass-select.png", 
-        "name": "hourglass-select"
-    }, 
-    {
-        "url": "/images/status/hourglass.png", 
-        "name": "hourglass"
-    }, 
-    {
-        "url": "/images/status/ice--arrow.png", 
-        "name": "ice--arrow"
-    }, 
-    {
-        "url": "/images/status/ice--exclamation.png", 
-        "name": "ice--exclamation"
-    }, 
-    {
-        "url": "/images/status/ice--minus.png", 
-        "name": "ice--minus"
-    }, 
-    {
-        "url": "/images/status/ice--pencil.png", 
-        "name": "ice--pencil"
-    }, 
-    {
-        "url": "/images/status/ice--plus.png", 
-        "name": "ice--plus"
-    }, 
-    {
-        "url": "/images/status/ice.png", 
-        "name": "ice"
-    }, 
-    {
-        "url": "/images/status/image--arrow.png", 
-        "name": "image--arrow"
-    }, 
-    {
-        "url": "/images/status/image--exclamation.png", 
-        "name": "image--exclamation"
-    }, 
-    {
-        "url": "/images/status/image--minus.png", 
-        "name": "image--minus"
-    }, 
-    {
-        "url": "/images/status/image--pencil.png", 
-        "name": "image--pencil"
-    }, 
-    {
-        "url": "/images/status/image--plus.png", 
-        "name": "image--plus"
-    }, 
-    {
-        "url": "/images/status/image-balloon.png", 
-        "name": "image-balloon"
-    }, 
-    {
-        "url": "/images/status/image-blur.png", 
-        "name": "image-blur"
-    }, 
-    {
-        "url": "/images/status/image-cast.png", 
-        "name": "image-cast"
-    }, 
-    {
-        "url": "/images/status/image-crop.png", 
-        "name": "image-crop"
-    }, 
-    {
-        "url": "/images/status/image-empty.png", 
-        "name": "image-empty"
-    }, 
-    {
-        "url": "/images/status/image-export.png", 
-        "name": "image-export"
-    }, 
-    {
-        "url": "/images/status/image-import.png", 
-        "name": "image-import"
-    }, 
-    {
-        "url": "/images/status/image-reflection.png", 
-        "name": "image-reflection"
-    }, 
-    {
-        "url": "/images/status/image-resize-actual.png", 
-        "name": "image-resize-actual"
-    }, 
-    {
-        "url": "/images/status/image-resize.png", 
-        "name": "image-resize"
-    }, 
-    {
-        "url": "/images/status/image-select.png", 
-        "name": "image-select"
-    }, 
-    {
-        "url": "/images/status/image-sharpen.png", 
-        "name": "image-sharpen"
-    }, 
-    {
-        "url": "/images/status/image-small-sunset.png", 
-        "name": "image-small-sunset"
-    }, 
-    {
-        "url": "/images/status/image-small.png", 
-        "name": "image-small"
-    }, 
-    {
-        "url": "/images/status/image-sunset.png", 
-        "name": "image-sunset"
-    }, 
-    {
-        "url": "/images/status/image-vertical-sunset.png", 
-        "name": "image-vertical-sunset"
-    }, 
-    {
-        "url": "/images/status/image-vertical.png", 
-        "name": "image-vertical"
-    }, 
-    {
-        "url": "/images/status/image.png", 
-        "name": "image"
-    }, 
-    {
-        "url": "/images/status/images-flickr.png", 
-        "name": "images-flickr"
-    }, 
-    {
-        "url": "/images/status/images-stack.png", 
-        "name": "images-stack"
-    }, 
-    {
-        "url": "/images/status/images.png", 
-        "name": "images"
-    }, 
-    {
-        "url": "/images/status/inbox--arrow.png", 
-        "name": "inbox--arrow"
-    }, 
-    {
-        "url": "/images/status/inbox--exclamation.png", 
-        "name": "inbox--exclamation"
-    }, 
-    {
-        "url": "/images/status/inbox--minus.png", 
-        "name": "inbox--minus"
-    }, 
-    {
-        "url": "/images/status/inbox--pencil.png", 
-        "name": "inbox--pencil"
-    }, 
-    {
-        "url": "/images/status/inbox--plus.png", 
-        "name": "inbox--plus"
-    }, 
-    {
-        "url": "/images/status/inbox-document-music-playlist.png", 
-        "name": "inbox-document-music-playlist"
-    }, 
-    {
-        "url": "/images/status/inbox-document-music.png", 
-        "name": "inbox-document-music"
-    }, 
-    {
-        "url": "/images/status/inbox-document-text.png", 
-        "name": "inbox-document-text"
-    }, 
-    {
-        "url": "/images/status/inbox-document.png", 
-        "name": "inbox-document"
-    }, 
-    {
-        "url": "/images/status/inbox-film.png", 
-        "name": "inbox-film"
-    }, 
-    {
-        "url": "/images/status/inbox-image.png", 
-        "name": "inbox-image"
-    }, 
-    {
-        "url": "/images/status/inbox-slide.png", 
-        "name": "inbox-slide"
-    }, 
-    {
-        "url": "/images/status/inbox-table.png", 
-        "name": "inbox-table"
-    }, 
-    {
-        "url": "/images/status/inbox.png", 
-        "name": "inbox"
-    }, 
-    {
-        "url": "/images/status/infocard-small.png", 
-        "name": "infocard-small"
-    }, 
-    {
-        "url": "/images/status/infocard.png", 
-        "name": "infocard"
-    }, 
-    {
-        "url": "/images/status/information-balloon.png", 
-        "name": "information-balloon"
-    }, 
-    {
-        "url": "/images/status/information-button.png", 
-        "name": "information-button"
-    }, 
-    {
-        "url": "/images/status/information-frame.png", 
-        "name": "information-frame"
-    }, 
-    {
-        "url": "/images/status/information-octagon-frame.png", 
-        "name": "information-octagon-frame"
-    }, 
-    {
-        "url": "/images/status/information-octagon.png", 
-        "name": "information-octagon"
-    }, 
-    {
-        "url": "/images/status/information-shield.png", 
-        "name": "information-shield"
-    }, 
-    {
-        "url": "/images/status/information-small-white.png", 
-        "name": "information-small-white"
-    }, 
-    {
-        "url": "/images/status/information-small.png", 
-        "name": "information-small"
-    }, 
-    {
-        "url": "/images/status/information-white.png", 
-        "name": "information-white"
-    }, 
-    {
-        "url": "/images/status/information.png", 
-        "name": "information"
-    }, 
-    {
-        "url": "/images/status/jar--arrow.png", 
-        "name": "jar--arrow"
-    }, 
-    {
-        "url": "/images/status/jar--exclamation.png", 
-        "name": "jar--exclamation"
-    }, 
-    {
-        "url": "/images/status/jar--minus.png", 
-        "name": "jar--minus"
-    }, 
-    {
-        "url": "/images/status/jar--pencil.png", 
-        "name": "jar--pencil"
-    }, 
-    {
-        "url": "/images/status/jar--plus.png", 
-        "name": "jar--plus"
-    }, 
-    {
-        "url": "/images/status/jar-empty.png", 
-        "name": "jar-empty"
-    }, 
-    {
-        "url": "/images/status/jar-label.png", 
-        "name": "jar-label"
-    }, 
-    {
-        "url": "/images/status/jar-open.png", 
-        "name": "jar-open"
-    }, 
-    {
-        "url": "/images/status/jar.png", 
-        "name": "jar"
-    }, 
-    {
-        "url": "/images/status/json.png", 
-        "name": "json"
-    }, 
-    {
-        "url": "/images/status/key--arrow.png", 
-        "name": "key--arrow"
-    }, 
-    {
-        "url": "/images/status/key--exclamation.png", 
-        "name": "key--exclamation"
-    }, 
-    {
-        "url": "/images/status/key--minus.png", 
-        "name": "key--minus"
-    }, 
-    {
-        "url": "/images/status/key--pencil.png", 
-        "name": "key--pencil"
-    }, 
-    {
-        "url": "/images/status/key--plus.png", 
-        "name": "key--plus"
-    }, 
-    {
-        "url": "/images/status/key-solid.png", 
-        "name": "key-solid"
-    }, 
-    {
-        "url": "/images/status/key.png", 
-        "name": "key"
-    }, 
-    {
-        "url": "/images/status/keyboard--arrow.png", 
-        "name": "keyboard--arrow"
-    }, 
-    {
-        "url": "/images/status/keyboard--exclamation.png", 
-        "name": "keyboard--exclamation"
-    }, 
-    {
-        "url": "/images/status/keyboard--minus.png", 
-        "name": "keyboard--minus"
-    }, 
-    {
-        "url": "/images/status/keyboard--pencil.png", 
-        "name": "keyboard--pencil"
-    }, 
-    {
-        "url": "/images/status/keyboard--plus.png", 
-        "name": "keyboard--plus"
-    }, 
-    {
-        "url": "/images/status/keyboard-space.png", 
-        "name": "keyboard-space"
-    }, 
-    {
-        "url": "/images/status/keyboard.png", 
-        "name": "keyboard"
-    }, 
-    {
-        "url": "/images/status/language-balloon.png", 
-        "name": "language-balloon"
-    }, 
-    {
-        "url": "/images/status/language-document.png", 
-        "name": "language-document"
-    }, 
-    {
-        "url": "/images/status/language-small.png", 
-        "name": "language-small"
-    }, 
-    {
-        "url": "/images/status/language.png", 
-        "name": "language"
-    }, 
-    {
-        "url": "/images/status/layer--arrow.png", 
-        "name": "layer--arrow"
-    }, 
-    {
-        "url": "/images/status/layer--exclamation.png", 
-        "name": "layer--exclamation"
-    }, 
-    {
-        "url": "/images/status/layer--minus.png", 
-        "name": "layer--minus"
-    }, 
-    {
-        "url": "/images/status/layer--pencil.png", 
-        "name": "layer--pencil"
-    }, 
-    {
-        "url": "/images/status/layer--plus.png", 
-        "name": "layer--plus"
-    }, 
-    {
-        "url": "/images/status/layer-flip-vertical.png", 
-        "name": "layer-flip-vertical"
-    }, 
-    {
-        "url": "/images/status/layer-flip.png", 
-        "name": "layer-flip"
-    }, 
-    {
-        "url": "/images/status/layer-mask.png", 
-        "name": "layer-mask"
-    }, 
-    {
-        "url": "/images/status/layer-resize-actual.png", 
-        "name": "layer-resize-actual"
-    }, 
-    {
-        "url": "/images/status/layer-resize-replicate-vertical.png", 
-        "name": "layer-resize-replicate-vertical"
-    }, 
-    {
-        "url": "/images/status/layer-resize-replicate.png", 
-        "name": "layer-resize-replicate"
-    }, 
-    {
-        "url": "/images/status/layer-resize.png", 
-        "name": "layer-resize"
-    }, 
-    {
-        "url": "/images/status/layer-rotate-left.png", 
-        "name": "layer-rotate-left"
-    }, 
-    {
-        "url": "/images/status/layer-rotate.png", 
-        "name": "layer-rotate"
-    }, 
-    {
-        "url": "/images/status/layer-select-point.png", 
-        "name": "layer-select-point"
-    }, 
-    {
-        "url": "/images/status/layer-select.png", 
-        "name": "layer-select"
-    }, 
-    {
-        "url": "/images/status/layer-shade.png", 
-        "name": "layer-shade"
-    }, 
-    {
-        "url": "/images/status/layer-shape-curve.png", 
-        "name": "layer-shape-curve"
-    }, 
-    {
-        "url": "/images/status/layer-shape-ellipse.png", 
-        "name": "layer-shape-ellipse"
-    }, 
-    {
-        "url": "/images/status/layer-shape-line.png", 
-        "name": "layer-shape-line"
-    }, 
-    {
-        "url": "/images/status/layer-shape-polygon.png", 
-        "name": "layer-shape-polygon"
-    }, 
-    {
-        "url": "/images/status/layer-shape-polyline.png", 
-        "name": "layer-shape-polyline"
-    }, 
-    {
-        "url": "/images/status/layer-shape-round.png", 
-        "name": "layer-shape-round"
-    }, 
-    {
-        "url": "/images/status/layer-shape-text.png", 
-        "name": "layer-shape-text"
-    }, 
-    {
-        "url": "/images/status/layer-shape.png", 
-        "name": "layer-shape"
-    }, 
-    {
-        "url": "/images/status/layer-shred.png", 
-        "name": "layer-shred"
-    }, 
-    {
-        "url": "/images/status/layer-small.png", 
-        "name": "layer-small"
-    }, 
-    {
-        "url": "/images/status/layer-transparent.png", 
-        "name": "layer-transparent"
-    }, 
-    {
-        "url": "/images/status/layer-vector.png", 
-        "name": "layer-vector"
-    }, 
-    {
-        "url": "/images/status/layer.png", 
-        "name": "layer"
-    }, 
-    {
-        "url": "/images/status/layers-alignment-bottom.png", 
-        "name": "layers-alignment-bottom"
-    }, 
-    {
-        "url": "/images/status/layers-alignment-center.png", 
-        "name": "layers-alignment-center"
-    }, 
-    {
-        "url": "/images/status/layers-alignment-left.png", 
-        "name": "layers-alignment-left"
-    }, 
-    {
-        "url": "/images/status/layers-alignment-middle.png", 
-        "name": "layers-alignment-middle"
-    }, 
-    {
-        "url": "/images/status/layers-alignment-right.png", 
-        "name": "layers-alignment-right"
-    }, 
-    {
-        "url": "/images/status/layers-alignment.png", 
-        "name": "layers-alignment"
-    }, 
-    {
-        "url": "/images/status/layers-arrange-back.png", 
-        "name": "layers-arrange-back"
-    }, 
-    {
-        "url": "/images/status/layers-arrange.png", 
-        "name": "layers-arrange"
-    }, 
-    {
-        "url": "/images/status/layers-group.png", 
-        "name": "layers-group"
-    }, 
-    {
-        "url": "/images/status/layers-small.png", 
-        "name": "layers-small"
-    }, 
-    {
-        "url": "/images/status/layers-stack-arrange-back.png", 
-        "name": "layers-stack-arrange-back"
-    }, 
-    {
-        "url": "/images/status/layers-stack-arrange.png", 
-        "name": "layers-stack-arrange"
-    }, 
-    {
-        "url": "/images/status/layers-stack.png", 
-        "name": "layers-stack"
-    }, 
-    {
-        "url": "/images/status/layers-ungroup.png", 
-        "name": "layers-ungroup"
-    }, 
-    {
-        "url": "/images/status/layers.png", 
-        "name": "layers"
-    }, 
-    {
-        "url": "/images/status/layout-2-equal.png", 
-        "name": "layout-2-equal"
-    }, 
-    {
-        "url": "/images/status/layout-2.png", 
-        "name": "layout-2"
-    }, 
-    {
-        "url": "/images/status/layout-3-mix.png", 
-        "name": "layout-3-mix"
-    }, 
-    {
-        "url": "/images/status/layout-3.png", 
-        "name": "layout-3"
-    }, 
-    {
-        "url": "/images/status/layout-design.png", 
-        "name": "layout-design"
-    }, 
-    {
-        "url": "/images/status/layout-header-2-equal.png", 
-        "name": "layout-header-2-equal"
-    }, 
-    {
-        "url": "/images/status/layout-header-2.png", 
-        "name": "layout-header-2"
-    }, 
-    {
-        "url": "/images/status/layout-header-3-mix.png", 
-        "name": "layout-header-3-mix"
-    }, 
-    {
-        "url": "/images/status/layout-header-3.png", 
-        "name": "layout-header-3"
-    }, 
-    {
-        "url": "/images/status/layout-header.png", 
-        "name": "layout-header"
-    }, 
-    {
-        "url": "/images/status/layout-hf-2-equal.png", 
-        "name": "layout-hf-2-equal"
-    }, 
-    {
-        "url": "/images/status/layout-hf-2.png", 
-        "name": "layout-hf-2"
-    }, 
-    {
-        "url": "/images/status/layout-hf-3-mix.png", 
-        "name": "layout-hf-3-mix"
-    }, 
-    {
-        "url": "/images/status/layout-hf-3.png", 
-        "name": "layout-hf-3"
-    }, 
-    {
-        "url": "/images/status/layout-hf.png", 
-        "name": "layout-hf"
-    }, 
-    {
-        "url": "/images/status/layout-join-vertical.png", 
-        "name": "layout-join-vertical"
-    }, 
-    {
-        "url": "/images/status/layout-join.png", 
-        "name": "layout-join"
-    }, 
-    {
-        "url": "/images/status/layout-select-content.png", 
-        "name": "layout-select-content"
-    }, 
-    {
-        "url": "/images/status/layout-select-footer.png", 
-        "name": "layout-select-footer"
-    }, 
-    {
-        "url": "/images/status/layout-select-sidebar.png", 
-        "name": "layout-select-sidebar"
-    }, 
-    {
-        "url": "/images/status/layout-select.png", 
-        "name": "layout-select"
-    }, 
-    {
-        "url": "/images/status/layout-split-vertical.png", 
-        "name": "layout-split-vertical"
-    }, 
-    {
-        "url": "/images/status/layout-split.png", 
-        "name": "layout-split"
-    }, 
-    {
-        "url": "/images/status/layout.png", 
-        "name": "layout"
-    }, 
-    {
-        "url": "/images/status/leaf--arrow.png", 
-        "name": "leaf--arrow"
-    }, 
-    {
-        "url": "/images/status/leaf--exclamation.png", 
-        "name": "leaf--exclamation"
-    }, 
-    {
-        "url": "/images/status/leaf--minus.png", 
-        "name": "leaf--minus"
-    }, 
-    {
-        "url": "/images/status/leaf--pencil.png", 
-        "name": "leaf--pencil"
-    }, 
-    {
-        "url": "/images/status/leaf--plus.png", 
-        "name": "leaf--plus"
-    }, 
-    {
-        "url": "/images/status/leaf-wormhole.png", 
-        "name": "leaf-wormhole"
-    }, 
-    {
-        "url": "/images/status/leaf.png", 
-        "name": "leaf"
-    }, 
-    {
-        "url": "/images/status/license-key.png", 
-        "name": "license-key"
-    }, 
-    {
-        "url": "/images/status/lifebuoy--arrow.png", 
-        "name": "lifebuoy--arrow"
-    }, 
-    {
-        "url": "/images/status/lifebuoy--exclamation.png", 
-        "name": "lifebuoy--exclamation"
-    }, 
-    {
-        "url": "/images/status/lifebuoy--minus.png", 
-        "name": "lifebuoy--minus"
-    }, 
-    {
-        "url": "/images/status/lifebuoy--pencil.png", 
-        "name": "lifebuoy--pencil"
-    }, 
-    {
-        "url": "/images/status/lifebuoy--plus.png", 
-        "name": "lifebuoy--plus"
-    }, 
-    {
-        "url": "/images/status/lifebuoy.png", 
-        "name": "lifebuoy"
-    }, 
-    {
-        "url": "/images/status/light-bulb--arrow.png", 
-        "name": "light-bulb--arrow"
-    }, 
-    {
-        "url": "/images/status/light-bulb--exclamation.png", 
-        "name": "light-bulb--exclamation"
-    }, 
-    {
-        "url": "/images/status/light-bulb--minus.png", 
-        "name": "light-bulb--minus"
-    }, 
-    {
-        "url": "/images/status/light-bulb--pencil.png", 
-        "name": "light-bulb--pencil"
-    }, 
-    {
-        "url": "/images/status/light-bulb--plus.png", 
-        "name": "light-bulb--plus"
-    }, 
-    {
-        "url": "/images/status/light-bulb-code.png", 
-        "name": "light-bulb-code"
-    }, 
-    {
-        "url": "/images/status/light-bulb-off.png", 
-        "name": "light-bulb-off"
-    }, 
-    {
-        "url": "/images/status/light-bulb-small-off.png", 
-        "name": "light-bulb-small-off"
-    }, 
-    {
-        "url": "/images/status/light-bulb-small.png", 
-        "name": "light-bulb-small"
-    }, 
-    {
-        "url": "/images/status/light-bulb.png", 
-        "name": "light-bulb"
-    }, 
-    {
-        "url": "/images/status/lightning--arrow.png", 
-        "name": "lightning--arrow"
-    }, 
-    {
-        "url": "/images/status/lightning--exclamation.png", 
-        "name": "lightning--exclamation"
-    }, 
-    {
-        "url": "/images/status/lightning--minus.png", 
-        "name": "lightning--minus"
-    }, 
-    {
-        "url": "/images/status/lightning--pencil.png", 
-        "name": "lightning--pencil"
-    }, 
-    {
-        "url": "/images/status/lightning--plus.png", 
-        "name": "lightning--plus"
-    }, 
-    {
-        "url": "/images/status/lightning-small.png", 
-        "name": "lightning-small"
-    }, 
-    {
-        "url": "/images/status/lightning.png", 
-        "name": "lightning"
-    }, 
-    {
-        "url": "/images/status/locale.png", 
-        "name": "locale"
-    }, 
-    {
-        "url": "/images/status/lock--arrow.png", 
-        "name": "lock--arrow"
-    }, 
-    {
-        "url": "/images/status/lock--exclamation.png", 
-        "name": "lock--exclamation"
-    }, 
-    {
-        "url": "/images/status/lock--minus.png", 
-        "name": "lock--minus"
-    }, 
-    {
-        "url": "/images/status/lock--pencil.png", 
-        "name": "lock--pencil"
-    }, 
-    {
-        "url": "/images/status/lock--plus.png", 
-        "name": "lock--plus"
-    }, 
-    {
-        "url": "/images/status/lock-small.png", 
-        "name": "lock-small"
-    }, 
-    {
-        "url": "/images/status/lock-unlock.png", 
-        "name": "lock-unlock"
-    }, 
-    {
-        "url": "/images/status/lock.png", 
-        "name": "lock"
-    }, 
-    {
-        "url": "/images/status/luggage--arrow.png", 
-        "name": "luggage--arrow"
-    }, 
-    {
-        "url": "/images/status/luggage--exclamation.png", 
-        "name": "luggage--exclamation"
-    }, 
-    {
-        "url": "/images/status/luggage--minus.png", 
-        "name": "luggage--minus"
-    }, 
-    {
-        "url": "/images/status/luggage--pencil.png", 
-        "name": "luggage--pencil"
-    }, 
-    {
-        "url": "/images/status/luggage--plus.png", 
-        "name": "luggage--plus"
-    }, 
-    {
-        "url": "/images/status/luggage-tag.png", 
-        "name": "luggage-tag"
-    }, 
-    {
-        "url": "/images/status/luggage.png", 
-        "name": "luggage"
-    }, 
-    {
-        "url": "/images/status/magnet--arrow.png", 
-        "name": "magnet--arrow"
-    }, 
-    {
-        "url": "/images/status/magnet--exclamation.png", 
-        "name": "magnet--exclamation"
-    }, 
-    {
-        "url": "/images/status/magnet--minus.png", 
-        "name": "magnet--minus"
-    }, 
-    {
-        "url": "/images/status/magnet--pencil.png", 
-        "name": "magnet--pencil"
-    }, 
-    {
-        "url": "/images/status/magnet--plus.png", 
-        "name": "magnet--plus"
-    }, 
-    {
-        "url": "/images/status/magnet-blue.png", 
-        "name": "magnet-blue"
-    }, 
-    {
-        "url": "/images/status/magnet-small.png", 
-        "name": "magnet-small"
-    }, 
-    {
-        "url": "/images/status/magnet.png", 
-        "name": "magnet"
-    }, 
-    {
-        "url": "/images/status/magnifier--arrow.png", 
-        "name": "magnifier--arrow"
-    }, 
-    {
-        "url": "/images/status/magnifier--exclamation.png", 
-        "name": "magnifier--exclamation"
-    }, 
-    {
-        "url": "/images/status/magnifier--minus.png", 
-        "name": "magnifier--minus"
-    }, 
-    {
-        "url": "/images/status/magnifier--pencil.png", 
-        "name": "magnifier--pencil"
-    }, 
-    {
-        "url": "/images/status/magnifier--plus.png", 
-        "name": "magnifier--plus"
-    }, 
-    {
-        "url": "/images/status/magnifier-history-left.png", 
-        "name": "magnifier-history-left"
-    }, 
-    {
-        "url": "/images/status/magnifier-history.png", 
-        "name": "magnifier-history"
-    }, 
-    {
-        "url": "/images/status/magnifier-left.png", 
-        "name": "magnifier-left"
-    }, 
-    {
-        "url": "/images/status/magnifier-medium-left.png", 
-        "name": "magnifier-medium-left"
-    }, 
-    {
-        "url": "/images/status/magnifier-medium.png", 
-        "name": "magnifier-medium"
-    }, 
-    {
-        "url": "/images/status/magnifier-small.png", 
-        "name": "magnifier-small"
-    }, 
-    {
-        "url": "/images/status/magnifier-zoom-actual-equal.png", 
-        "name": "magnifier-zoom-actual-equal"
-    }, 
-    {
-        "url": "/images/status/magnifier-zoom-actual.png", 
-        "name": "magnifier-zoom-actual"
-    }, 
-    {
-        "url": "/images/status/magnifier-zoom-fit.png", 
-        "name": "magnifier-zoom-fit"
-    }, 
-    {
-        "url": "/images/status/magnifier-zoom-in.png", 
-        "name": "magnifier-zoom-in"
-    }, 
-    {
-        "url": "/images/status/magnifier-zoom-out.png", 
-        "name": "magnifier-zoom-out"
-    }, 
-    {
-        "url": "/images/status/magnifier-zoom.png", 
-        "name": "magnifier-zoom"
-    }, 
-    {
-        "url": "/images/status/magnifier.png", 
-        "name": "magnifier"
-    }, 
-    {
-        "url": "/images/status/mahjong--arrow.png", 
-        "name": "mahjong--arrow"
-    }, 
-    {
-        "url": "/images/status/mahjong--exclamation.png", 
-        "name": "mahjong--exclamation"
-    }, 
-    {
-        "url": "/images/status/mahjong--minus.png", 
-        "name": "mahjong--minus"
-    }, 
-    {
-        "url": "/images/status/mahjong--pencil.png", 
-        "name": "mahjong--pencil"
-    }, 
-    {
-        "url": "/images/status/mahjong--plus.png", 
-        "name": "mahjong--plus"
-    }, 
-    {
-        "url": "/images/status/mahjong-white.png", 
-        "name": "mahjong-white"
-    }, 
-    {
-        "url": "/images/status/mahjong.png", 
-        "name": "mahjong"
-    }, 
-    {
-        "url": "/images/status/mail--arrow.png", 
-        "name": "mail--arrow"
-    }, 
-    {
-        "url": "/images/status/mail--exclamation.png", 
-        "name": "mail--exclamation"
-    }, 
-    {
-        "url": "/images/status/mail--minus.png", 
-        "name": "mail--minus"
-    }, 
-    {
-        "url": "/images/status/mail--pencil.png", 
-        "name": "mail--pencil"
-    }, 
-    {
-        "url": "/images/status/mail--plus.png", 
-        "name": "mail--plus"
-    }, 
-    {
-        "url": "/images/status/mail-open-document-music-playlist.png", 
-        "name": "mail-open-document-music-playlist"
-    }, 
-    {
-        "url": "/images/status/mail-open-document-music.png", 
-        "name": "mail-open-document-music"
-    }, 
-    {
-        "url": "/images/status/mail-open-document-text.png", 
-        "name": "mail-open-document-text"
-    }, 
-    {
-        "url": "/images/status/mail-open-document.png", 
-        "name": "mail-open-document"
-    }, 
-    {
-        "url": "/images/status/mail-open-film.png", 
-        "name": "mail-open-film"
-    }, 
-    {
-        "url": "/images/status/mail-open-image.png", 
-        "name": "mail-open-image"
-    }, 
-    {
-        "url": "/images/status/mail-open-table.png", 
-        "name": "mail-open-table"
-    }, 
-    {
-        "url": "/images/status/mail-open.png", 
-        "name": "mail-open"
-    }, 
-    {
-        "url": "/images/status/mail-small.png", 
-        "name": "mail-small"
-    }, 
-    {
-        "url": "/images/status/mail.png", 
-        "name": "mail"
-    }, 
-    {
-        "url": "/images/status/mails-stack.png", 
-        "name": "mails-stack"
-    }, 
-    {
-        "url": "/images/status/mails.png", 
-        "name": "mails"
-    }, 
-    {
-        "url": "/images/status/map--arrow.png", 
-        "name": "map--arrow"
-    }, 
-    {
-        "url": "/images/status/map--exclamation.png", 
-        "name": "map--exclamation"
-    }, 
-    {
-        "url": "/images/status/map--minus.png", 
-        "name": "map--minus"
-    }, 
-    {
-        "url": "/images/status/map--pencil.png", 
-        "name": "map--pencil"
-    }, 
-    {
-        "url": "/images/status/map--plus.png", 
-        "name": "map--plus"
-    }, 
-    {
-        "url": "/images/status/map-pin.png", 
-        "name": "map-pin"
-    }, 
-    {
-        "url": "/images/status/map.png", 
-        "name": "map"
-    }, 
-    {
-        "url": "/images/status/maps-stack.png", 
-        "name": "maps-stack"
-    }, 
-    {
-        "url": "/images/status/maps.png", 
-        "name": "maps"
-    }, 
-    {
-        "url": "/images/status/marker--arrow.png", 
-        "name": "marker--arrow"
-    }, 
-    {
-        "url": "/images/status/marker--exclamation.png", 
-        "name": "marker--exclamation"
-    }, 
-    {
-        "url": "/images/status/marker--minus.png", 
-        "name": "marker--minus"
-    }, 
-    {
-        "url": "/images/status/marker--pencil.png", 
-        "name": "marker--pencil"
-    }, 
-    {
-        "url": "/images/status/marker--plus.png", 
-        "name": "marker--plus"
-    }, 
-    {
-        "url": "/images/status/marker.png", 
-        "name": "marker"
-    }, 
-    {
-        "url": "/images/status/mask.png", 
-        "name": "mask"
-    }, 
-    {
-        "url": "/images/status/medal--arrow.png", 
-        "name": "medal--arrow"
-    }, 
-    {
-        "url": "/images/status/medal--exclamation.png", 
-        "name": "medal--exclamation"
-    }, 
-    {
-        "url": "/images/status/medal--minus.png", 
-        "name": "medal--minus"
-    }, 
-    {
-        "url": "/images/status/medal--pencil.png", 
-        "name": "medal--pencil"
-    }, 
-    {
-        "url": "/images/status/medal--plus.png", 
-        "name": "medal--plus"
-    }, 
-    {
-        "url": "/images/status/medal-bronze-red.png", 
-        "name": "medal-bronze-red"
-    }, 
-    {
-        "url": "/images/status/medal-bronze.png", 
-        "name": "medal-bronze"
-    }, 
-    {
-        "url": "/images/status/medal-red.png", 
-        "name": "medal-red"
-    }, 
-    {
-        "url": "/images/status/medal-silver-red.png", 
-        "name": "medal-silver-red"
-    }, 
-    {
-        "url": "/images/status/medal-silver.png", 
-        "name": "medal-silver"
-    }, 
-    {
-        "url": "/images/status/medal.png", 
-        "name": "medal"
-    }, 
-    {
-        "url": "/images/status/media-player--arrow.png", 
-        "name": "media-player--arrow"
-    }, 
-    {
-        "url": "/images/status/media-player--exclamation.png", 
-        "name": "media-player--exclamation"
-    }, 
-    {
-        "url": "/images/status/media-player--minus.png", 
-        "name": "media-player--minus"
-    }, 
-    {
-        "url": "/images/status/media-player--pencil.png", 
-        "name": "media-player--pencil"
-    }, 
-    {
-        "url": "/images/status/media-player--plus.png", 
-        "name": "media-player--plus"
-    }, 
-    {
-        "url": "/images/status/media-player-black.png", 
-        "name": "media-player-black"
-    }, 
-    {
-        "url": "/images/status/media-player-cast.png", 
-        "name": "media-player-cast"
-    }, 
-    {
-        "url": "/images/status/media-player-medium-black.png", 
-        "name": "media-player-medium-black"
-    }, 
-    {
-        "url": "/images/status/media-player-medium-blue.png", 
-        "name": "media-player-medium-blue"
-    }, 
-    {
-        "url": "/images/status/media-player-medium-green.png", 
-        "name": "media-player-medium-green"
-    }, 
-    {
-        "url": "/images/status/media-player-medium-orange.png", 
-        "name": "media-player-medium-orange"
-    }, 
-    {
-        "url": "/images/status/media-player-medium-pink.png", 
-        "name": "media-player-medium-pink"
-    }, 
-    {
-        "url": "/images/status/media-player-medium-purple.png", 
-        "name": "media-player-medium-purple"
-    }, 
-    {
-        "url": "/images/status/media-player-medium-red.png", 
-        "name": "media-player-medium-red"
-    }, 
-    {
-        "url": "/images/status/media-player-medium-yellow.png", 
-        "name": "media-player-medium-yellow"
-    }, 
-    {
-        "url": "/images/status/media-player-medium.png", 
-        "name": "media-player-medium"
-    }, 
-    {
-        "url": "/images/status/media-player-phone-horizontal.png", 
-        "name": "media-player-phone-horizontal"
-    }, 
-    {
-        "url": "/images/status/media-player-phone.png", 
-        "name": "media-player-phone"
-    }, 
-    {
-        "url": "/images/status/media-player-small-blue.png", 
-        "name": "media-player-small-blue"
-    }, 
-    {
-        "url": "/images/status/media-player-small-green.png", 
-        "name": "media-player-small-green"
-    }, 
-    {
-        "url": "/images/status/media-player-small-pink.png", 
-        "name": "media-player-small-pink"
-    }, 
-    {
-        "url": "/images/status/media-player-small-red.png", 
-        "name": "media-player-small-red"
-    }, 
-    {
-        "url": "/images/status/media-player-small.png", 
-        "name": "media-player-small"
-    }, 
-    {
-        "url": "/images/status/media-player-xsmall-black.png", 
-        "name": "media-player-xsmall-black"
-    }, 
-    {
-        "url": "/images/status/media-player-xsmall-blue.png", 
-        "name": "media-player-xsmall-blue"
-    }, 
-    {
-        "url": "/images/status/media-player-xsmall-green.png", 
-        "name": "media-player-xsmall-green"
-    }, 
-    {
-        "url": "/images/status/media-player-xsmall-pink.png", 
-        "name": "media-player-xsmall-pink"
-    }, 
-    {
-        "url": "/images/status/media-player-xsmall-polish.png", 
-        "name": "media-player-xsmall-polish"
-    }, 
-    {
-        "url": "/images/status/media-player-xsmall.png", 
-        "name": "media-player-xsmall"
-    }, 
-    {
-        "url": "/images/status/media-player.png", 
-        "name": "media-player"
-    }, 
-    {
-        "url": "/images/status/media-players.png", 
-        "name": "media-players"
-    }, 
-    {
-        "url": "/images/status/megaphone--arrow.png", 
-        "name": "megaphone--arrow"
-    }, 
-    {
-        "url": "/images/status/megaphone--exclamation.png", 
-        "name": "megaphone--exclamation"
-    }, 
-    {
-        "url": "/images/status/megaphone--minus.png", 
-        "name": "megaphone--minus"
-    }, 
-    {
-        "url": "/images/status/megaphone--pencil.png", 
-        "name": "megaphone--pencil"
-    }, 
-    {
-        "url": "/images/status/megaphone--plus.png", 
-        "name": "megaphone--plus"
-    }, 
-    {
-        "url": "/images/status/megaphone.png", 
-        "name": "megaphone"
-    }, 
-    {
-        "url": "/images/status/memory.png", 
-        "name": "memory"
-    }, 
-    {
-        "url": "/images/status/metronome--arrow.png", 
-        "name": "metronome--arrow"
-    }, 
-    {
-        "url": "/images/status/metronome--exclamation.png", 
-        "name": "metronome--exclamation"
-    }, 
-    {
-        "url": "/images/status/metronome--minus.png", 
-        "name": "metronome--minus"
-    }, 
-    {
-        "url": "/images/status/metronome--pencil.png", 
-        "name": "metronome--pencil"
-    }, 
-    {
-        "url": "/images/status/metronome--plus.png", 
-        "name": "metronome--plus"
-    }, 
-    {
-        "url": "/images/status/metronome.png", 
-        "name": "metronome"
-    }, 
-    {
-        "url": "/images/status/microformats.png", 
-        "name": "microformats"
-    }, 
-    {
-        "url": "/images/status/microphone--arrow.png", 
-        "name": "microphone--arrow"
-    }, 
-    {
-        "url": "/images/status/microphone--exclamation.png", 
-        "name": "microphone--exclamation"
-    }, 
-    {
-        "url": "/images/status/microphone--minus.png", 
-        "name": "microphone--minus"
-    }, 
-    {
-        "url": "/images/status/microphone--pencil.png", 
-        "name": "microphone--pencil"
-    }, 
-    {
-        "url": "/images/status/microphone--plus.png", 
-        "name": "microphone--plus"
-    }, 
-    {
-        "url": "/images/status/microphone.png", 
-        "name": "microphone"
-    }, 
-    {
-        "url": "/images/status/minus-button.png", 
-        "name": "minus-button"
-    }, 
-    {
-        "url": "/images/status/minus-circle-frame.png", 
-        "name": "minus-circle-frame"
-    }, 
-    {
-        "url": "/images/status/minus-circle.png", 
-        "name": "minus-circle"
-    }, 
-    {
-        "url": "/images/status/minus-octagon-frame.png", 
-        "name": "minus-octagon-frame"
-    }, 
-    {
-        "url": "/images/status/minus-octagon.png", 
-        "name": "minus-octagon"
-    }, 
-    {
-        "url": "/images/status/minus-shield.png", 
-        "name": "minus-shield"
-    }, 
-    {
-        "url": "/images/status/minus-small-circle.png", 
-        "name": "minus-small-circle"
-    }, 
-    {
-        "url": "/images/status/minus-small-white.png", 
-        "name": "minus-small-white"
-    }, 
-    {
-        "url": "/images/status/minus-small.png", 
-        "name": "minus-small"
-    }, 
-    {
-        "url": "/images/status/minus-white.png", 
-        "name": "minus-white"
-    }, 
-    {
-        "url": "/images/status/minus.png", 
-        "name": "minus"
-    }, 
-    {
-        "url": "/images/status/mobile-phone--arrow.png", 
-        "name": "mobile-phone--arrow"
-    }, 
-    {
-        "url": "/images/status/mobile-phone--exclamation.png", 
-        "name": "mobile-phone--exclamation"
-    }, 
-    {
-        "url": "/images/status/mobile-phone--minus.png", 
-        "name": "mobile-phone--minus"
-    }, 
-    {
-        "url": "/images/status/mobile-phone--pencil.png", 
-        "name": "mobile-phone--pencil"
-    }, 
-    {
-        "url": "/images/status/mobile-phone--plus.png", 
-        "name": "mobile-phone--plus"
-    }, 
-    {
-        "url": "/images/status/mobile-phone-cast.png", 
-        "name": "mobile-phone-cast"
-    }, 
-    {
-        "url": "/images/status/mobile-phone-off.png", 
-        "name": "mobile-phone-off"
-    }, 
-    {
-        "url": "/images/status/mobile-phone.png", 
-        "name": "mobile-phone"
-    }, 
-    {
-        "url": "/images/status/money--arrow.png", 
-        "name": "money--arrow"
-    }, 
-    {
-        "url": "/images/status/money--exclamation.png", 
-        "name": "money--exclamation"
-    }, 
-    {
-        "url": "/images/status/money--minus.png", 
-        "name": "money--minus"
-    }, 
-    {
-        "url": "/images/status/money--pencil.png", 
-        "name": "money--pencil"
-    }, 
-    {
-        "url": "/images/status/money--plus.png", 
-        "name": "money--plus"
-    }, 
-    {
-        "url": "/images/status/money-coin.png", 
-        "name": "money-coin"
-    }, 
-    {
-        "url": "/images/status/money.png", 
-        "name": "money"
-    }, 
-    {
-        "url": "/images/status/monitor--arrow.png", 
-        "name": "monitor--arrow"
-    }, 
-    {
-        "url": "/images/status/monitor--exclamation.png", 
-        "name": "monitor--exclamation"
-    }, 
-    {
-        "url": "/images/status/monitor--minus.png", 
-        "name": "monitor--minus"
-    }, 
-    {
-        "url": "/images/status/monitor--pencil.png", 
-        "name": "monitor--pencil"
-    }, 
-    {
-        "url": "/images/status/monitor--plus.png", 
-        "name": "monitor--plus"
-    }, 
-    {
-        "url": "/images/status/monitor-cast.png", 
-        "name": "monitor-cast"
-    }, 
-    {
-        "url": "/images/status/monitor-image.png", 
-        "name": "monitor-image"
-    }, 
-    {
-        "url": "/images/status/monitor-network.png", 
-        "name": "monitor-network"
-    }, 
-    {
-        "url": "/images/status/monitor-off.png", 
-        "name": "monitor-off"
-    }, 
-    {
-        "url": "/images/status/monitor-screensaver.png", 
-        "name": "monitor-screensaver"
-    }, 
-    {
-        "url": "/images/status/monitor-sidebar.png", 
-        "name": "monitor-sidebar"
-    }, 
-    {
-        "url": "/images/status/monitor-wallpaper.png", 
-        "name": "monitor-wallpaper"
-    }, 
-    {
-        "url": "/images/status/monitor-window-3d.png", 
-        "name": "monitor-window-3d"
-    }, 
-    {
-        "url": "/images/status/monitor-window-flow.png", 
-        "name": "monitor-window-flow"
-    }, 
-    {
-        "url": "/images/status/monitor-window.png", 
-        "name": "monitor-window"
-    }, 
-    {
-        "url": "/images/status/monitor.png", 
-        "name": "monitor"
-    }, 
-    {
-        "url": "/images/status/mouse--arrow.png", 
-        "name": "mouse--arrow"
-    }, 
-    {
-        "url": "/images/status/mouse--exclamation.png", 
-        "name": "mouse--exclamation"
-    }, 
-    {
-        "url": "/images/status/mouse--minus.png", 
-        "name": "mouse--minus"
-    }, 
-    {
-        "url": "/images/status/mouse--pencil.png", 
-        "name": "mouse--pencil"
-    }, 
-    {
-        "url": "/images/status/mouse--plus.png", 
-        "name": "mouse--plus"
-    }, 
-    {
-        "url": "/images/status/mouse-select-right.png", 
-        "name": "mouse-select-right"
-    }, 
-    {
-        "url": "/images/status/mouse-select-wheel.png", 
-        "name": "mouse-select-wheel"
-    }, 
-    {
-        "url": "/images/status/mouse-select.png", 
-        "name": "mouse-select"
-    }, 
-    {
-        "url": "/images/status/mouse.png", 
-        "name": "mouse"
-    }, 
-    {
-        "url": "/images/status/music--arrow.png", 
-        "name": "music--arrow"
-    }, 
-    {
-        "url": "/images/status/music--exclamation.png", 
-        "name": "music--exclamation"
-    }, 
-    {
-        "url": "/images/status/music--minus.png", 
-        "name": "music--minus"
-    }, 
-    {
-        "url": "/images/status/music--pencil.png", 
-        "name": "music--pencil"
-    }, 
-    {
-        "url": "/images/status/music--plus.png", 
-        "name": "music--plus"
-    }, 
-    {
-        "url": "/images/status/music-beam-16.png", 
-        "name": "music-beam-16"
-    }, 
-    {
-        "url": "/images/status/music-beam.png", 
-        "name": "music-beam"
-    }, 
-    {
-        "url": "/images/status/music-small.png", 
-        "name": "music-small"
-    }, 
-    {
-        "url": "/images/status/music.png", 
-        "name": "music"
-    }, 
-    {
-        "url": "/images/status/na.png", 
-        "name": "na"
-    }, 
-    {
-        "url": "/images/status/navigation-000-button.png", 
-        "name": "navigation-000-button"
-    }, 
-    {
-        "url": "/images/status/navigation-000-frame.png", 
-        "name": "navigation-000-frame"
-    }, 
-    {
-        "url": "/images/status/navigation-000-white.png", 
-        "name": "navigation-000-white"
-    }, 
-    {
-        "url": "/images/status/navigation-090-button.png", 
-        "name": "navigation-090-button"
-    }, 
-    {
-        "url": "/images/status/navigation-090-frame.png", 
-        "name": "navigation-090-frame"
-    }, 
-    {
-        "url": "/images/status/navigation-090-white.png", 
-        "name": "navigation-090-white"
-    }, 
-    {
-        "url": "/images/status/navigation-090.png", 
-        "name": "navigation-090"
-    }, 
-    {
-        "url": "/images/status/navigation-180-button.png", 
-        "name": "navigation-180-button"
-    }, 
-    {
-        "url": "/images/status/navigation-180-frame.png", 
-        "name": "navigation-180-frame"
-    }, 
-    {
-        "url": "/images/status/navigation-180-white.png", 
-        "name": "navigation-180-white"
-    }, 
-    {
-        "url": "/images/status/navigation-180.png", 
-        "name": "navigation-180"
-    }, 
-    {
-        "url": "/images/status/navigation-270-button.png", 
-        "name": "navigation-270-button"
-    }, 
-    {
-        "url": "/images/status/navigation-270-frame.png", 
-        "name": "navigation-270-frame"
-    }, 
-    {
-        "url": "/images/status/navigation-270-white.png", 
-        "name": "navigation-270-white"
-    }, 
-    {
-        "url": "/images/status/navigation-270.png", 
-        "name": "navigation-270"
-    }, 
-    {
-        "url": "/images/status/navigation.png", 
-        "name": "navigation"
-    }, 
-    {
-        "url": "/images/status/network-cloud.png", 
-        "name": "network-cloud"
-    }, 
-    {
-        "url": "/images/status/network-clouds.png", 
-        "name": "network-clouds"
-    }, 
-    {
-        "url": "/images/status/network-ethernet.png", 
-        "name": "network-ethernet"
-    }, 
-    {
-        "url": "/images/status/network-hub.png", 
-        "name": "network-hub"
-    }, 
-    {
-        "url": "/images/status/network.png", 
-        "name": "network"
-    }, 
-    {
-        "url": "/images/status/new.png", 
-        "name": "new"
-    }, 
-    {
-        "url": "/images/status/newspaper--arrow.png", 
-        "name": "newspaper--arrow"
-    }, 
-    {
-        "url": "/images/status/newspaper--exclamation.png", 
-        "name": "newspaper--exclamation"
-    }, 
-    {
-        "url": "/images/status/newspaper--minus.png", 
-        "name": "newspaper--minus"
-    }, 
-    {
-        "url": "/images/status/newspaper--pencil.png", 
-        "name": "newspaper--pencil"
-    }, 
-    {
-        "url": "/images/status/newspaper--plus.png", 
-        "name": "newspaper--plus"
-    }, 
-    {
-        "url": "/images/status/newspaper.png", 
-        "name": "newspaper"
-    }, 
-    {
-        "url": "/images/status/newspapers.png", 
-        "name": "newspapers"
-    }, 
-    {
-        "url": "/images/status/node-delete-child.png", 
-        "name": "node-delete-child"
-    }, 
-    {
-        "url": "/images/status/node-delete-next.png", 
-        "name": "node-delete-next"
-    }, 
-    {
-        "url": "/images/status/node-delete-previous.png", 
-        "name": "node-delete-previous"
-    }, 
-    {
-        "url": "/images/status/node-delete.png", 
-        "name": "node-delete"
-    }, 
-    {
-        "url": "/images/status/node-design.png", 
-        "name": "node-design"
-    }, 
-    {
-        "url": "/images/status/node-insert-child.png", 
-        "name": "node-insert-child"
-    }, 
-    {
-        "url": "/images/status/node-insert-next.png", 
-        "name": "node-insert-next"
-    }, 
-    {
-        "url": "/images/status/node-insert-previous.png", 
-        "name": "node-insert-previous"
-    }, 
-    {
-        "url": "/images/status/node-insert.png", 
-        "name": "node-insert"
-    }, 
-    {
-        "url": "/images/status/node-magnifier.png", 
-        "name": "node-magnifier"
-    }, 
-    {
-        "url": "/images/status/node-select-all.png", 
-        "name": "node-select-all"
-    }, 
-    {
-        "url": "/images/status/node-select-child.png", 
-        "name": "node-select-child"
-    }, 
-    {
-        "url": "/images/status/node-select-next.png", 
-        "name": "node-select-next"
-    }, 
-    {
-        "url": "/images/status/node-select-previous.png", 
-        "name": "node-select-previous"
-    }, 
-    {
-        "url": "/images/status/node-select.png", 
-        "name": "node-select"
-    }, 
-    {
-        "url": "/images/status/node.png", 
-        "name": "node"
-    }, 
-    {
-        "url": "/images/status/notebook--arrow.png", 
-        "name": "notebook--arrow"
-    }, 
-    {
-        "url": "/images/status/notebook--exclamation.png", 
-        "name": "notebook--exclamation"
-    }, 
-    {
-        "url": "/images/status/notebook--minus.png", 
-        "name": "notebook--minus"
-    }, 
-    {
-        "url": "/images/status/notebook--pencil.png", 
-        "name": "notebook--pencil"
-    }, 
-    {
-        "url": "/images/status/notebook--plus.png", 
-        "name": "notebook--plus"
-    }, 
-    {
-        "url": "/images/status/notebook.png", 
-        "name": "notebook"
-    }, 
-    {
-        "url": "/images/status/notebooks.png", 
-        "name": "notebooks"
-    }, 
-    {
-        "url": "/images/status/open-share-balloon.png", 
-        "name": "open-share-balloon"
-    }, 
-    {
-        "url": "/images/status/open-share-document.png", 
-        "name": "open-share-document"
-    }, 
-    {
-        "url": "/images/status/open-share-small.png", 
-        "name": "open-share-small"
-    }, 
-    {
-        "url": "/images/status/open-share.png", 
-        "name": "open-share"
-    }, 
-    {
-        "url": "/images/status/open-source.png", 
-        "name": "open-source"
-    }, 
-    {
-        "url": "/images/status/openid.png", 
-        "name": "openid"
-    }, 
-    {
-        "url": "/images/status/opml-balloon.png", 
-        "name": "opml-balloon"
-    }, 
-    {
-        "url": "/images/status/opml-document.png", 
-        "name": "opml-document"
-    }, 
-    {
-        "url": "/images/status/opml-small.png", 
-        "name": "opml-small"
-    }, 
-    {
-        "url": "/images/status/opml.png", 
-        "name": "opml"
-    }, 
-    {
-        "url": "/images/status/paint-brush--arrow.png", 
-        "name": "paint-brush--arrow"
-    }, 
-    {
-        "url": "/images/status/paint-brush--exclamation.png", 
-        "name": "paint-brush--exclamation"
-    }, 
-    {
-        "url": "/images/status/paint-brush--minus.png", 
-        "name": "paint-brush--minus"
-    }, 
-    {
-        "url": "/images/status/paint-brush--pencil.png", 
-        "name": "paint-brush--pencil"
-    }, 
-    {
-        "url": "/images/status/paint-brush--plus.png", 
-        "name": "paint-brush--plus"
-    }, 
-    {
-        "url": "/images/status/paint-brush-color.png", 
-        "name": "paint-brush-color"
-    }, 
-    {
-        "url": "/images/status/paint-brush-small.png", 
-        "name": "paint-brush-small"
-    }, 
-    {
-        "url": "/images/status/paint-brush.png", 
-        "name": "paint-brush"
-    }, 
-    {
-        "url": "/images/status/paint-can--arrow.png", 
-        "name": "paint-can--arrow"
-    }, 
-    {
-        "url": "/images/status/paint-can--exclamation.png", 
-        "name": "paint-can--exclamation"
-    }, 
-    {
-        "url": "/images/status/paint-can--minus.png", 
-        "name": "paint-can--minus"
-    }, 
-    {
-        "url": "/images/status/paint-can--pencil.png", 
-        "name": "paint-can--pencil"
-    }, 
-    {
-        "url": "/images/status/paint-can--plus.png", 
-        "name": "paint-can--plus"
-    }, 
-    {
-        "url": "/images/status/paint-can-color.png", 
-        "name": "paint-can-color"
-    }, 
-    {
-        "url": "/images/status/paint-can-paint-brush.png", 
-        "name": "paint-can-paint-brush"
-    }, 
-    {
-        "url": "/images/status/paint-can.png", 
-        "name": "paint-can"
-    }, 
-    {
-        "url": "/images/status/paint-tube--arrow.png", 
-        "name": "paint-tube--arrow"
-    }, 
-    {
-        "url": "/images/status/paint-tube--exclamation.png", 
-        "name": "paint-tube--exclamation"
-    }, 
-    {
-        "url": "/images/status/paint-tube--minus.png", 
-        "name": "paint-tube--minus"
-    }, 
-    {
-        "url": "/images/status/paint-tube--pencil.png", 
-        "name": "paint-tube--pencil"
-    }, 
-    {
-        "url": "/images/status/paint-tube--plus.png", 
-        "name": "paint-tube--plus"
-    }, 
-    {
-        "url": "/images/status/paint-tube-color.png", 
-        "name": "paint-tube-color"
-    }, 
-    {
-        "url": "/images/status/paint-tube.png", 
-        "name": "paint-tube"
-    }, 
-    {
-        "url": "/images/status/palette--arrow.png", 
-        "name": "palette--arrow"
-    }, 
-    {
-        "url": "/images/status/palette--exclamation.png", 
-        "name": "palette--exclamation"
-    }, 
-    {
-        "url": "/images/status/palette--minus.png", 
-        "name": "palette--minus"
-    }, 
-    {
-        "url": "/images/status/palette--pencil.png", 
-        "name": "palette--pencil"
-    }, 
-    {
-        "url": "/images/status/palette--plus.png", 
-        "name": "palette--plus"
-    }, 
-    {
-        "url": "/images/status/palette-color.png", 
-        "name": "palette-color"
-    }, 
-    {
-        "url": "/images/status/palette-paint-brush.png", 
-        "name": "palette-paint-brush"
-    }, 
-    {
-        "url": "/images/status/palette.png", 
-        "name": "palette"
-    }, 
-    {
-        "url": "/images/status/paper-bag--arrow.png", 
-        "name": "paper-bag--arrow"
-    }, 
-    {
-        "url": "/images/status/paper-bag--exclamation.png", 
-        "name": "paper-bag--exclamation"
-    }, 
-    {
-        "url": "/images/status/paper-bag--minus.png", 
-        "name": "paper-bag--minus"
-    }, 
-    {
-        "url": "/images/status/paper-bag--pencil.png", 
-        "name": "paper-bag--pencil"
-    }, 
-    {
-        "url": "/images/status/paper-bag--plus.png", 
-        "name": "paper-bag--plus"
-    }, 
-    {
-        "url": "/images/status/paper-bag-label.png", 
-        "name": "paper-bag-label"
-    }, 
-    {
-        "url": "/images/status/paper-bag.png", 
-        "name": "paper-bag"
-    }, 
-    {
-        "url": "/images/status/paper-clip-small.png", 
-        "name": "paper-clip-small"
-    }, 
-    {
-        "url": "/images/status/paper-clip.png", 
-        "name": "paper-clip"
-    }, 
-    {
-        "url": "/images/status/paper-plane--arrow.png", 
-        "name": "paper-plane--arrow"
-    }, 
-    {
-        "url": "/images/status/paper-plane--exclamation.png", 
-        "name": "paper-plane--exclamation"
-    }, 
-    {
-        "url": "/images/status/paper-plane--minus.png", 
-        "name": "paper-plane--minus"
-    }, 
-    {
-        "url": "/images/status/paper-plane--pencil.png", 
-        "name": "paper-plane--pencil"
-    }, 
-    {
-        "url": "/images/status/paper-plane--plus.png", 
-        "name": "paper-plane--plus"
-    }, 
-    {
-        "url": "/images/status/paper-plane-return.png", 
-        "name": "paper-plane-return"
-    }, 
-    {
-        "url": "/images/status/paper-plane.png", 
-        "name": "paper-plane"
-    }, 
-    {
-        "url": "/images/status/party-hat.png", 
-        "name": "party-hat"
-    }, 
-    {
-        "url": "/images/status/pda--arrow.png", 
-        "name": "pda--arrow"
-    }, 
-    {
-        "url": "/images/status/pda--exclamation.png", 
-        "name": "pda--exclamation"
-    }, 
-    {
-        "url": "/images/status/pda--minus.png", 
-        "name": "pda--minus"
-    }, 
-    {
-        "url": "/images/status/pda--pencil.png", 
-        "name": "pda--pencil"
-    }, 
-    {
-        "url": "/images/status/pda--plus.png", 
-        "name": "pda--plus"
-    }, 
-    {
-        "url": "/images/status/pda-off.png", 
-        "name": "pda-off"
-    }, 
-    {
-        "url": "/images/status/pda.png", 
-        "name": "pda"
-    }, 
-    {
-        "url": "/images/status/pencil--arrow.png", 
-        "name": "pencil--arrow"
-    }, 
-    {
-        "url": "/images/status/pencil--exclamation.png", 
-        "name": "pencil--exclamation"
-    }, 
-    {
-        "url": "/images/status/pencil--minus.png", 
-        "name": "pencil--minus"
-    }, 
-    {
-        "url": "/images/status/pencil--plus.png", 
-        "name": "pencil--plus"
-    }, 
-    {
-        "url": "/images/status/pencil-color.png", 
-        "name": "pencil-color"
-    }, 
-    {
-        "url": "/images/status/pencil-field.png", 
-        "name": "pencil-field"
-    }, 
-    {
-        "url": "/images/status/pencil-ruler.png", 
-        "name": "pencil-ruler"
-    }, 
-    {
-        "url": "/images/status/pencil-small.png", 
-        "name": "pencil-small"
-    }, 
-    {
-        "url": "/images/status/pencil.png", 
-        "name": "pencil"
-    }, 
-    {
-        "url": "/images/status/photo-album--arrow.png", 
-        "name": "photo-album--arrow"
-    }, 
-    {
-        "url": "/images/status/photo-album--exclamation.png", 
-        "name": "photo-album--exclamation"
-    }, 
-    {
-        "url": "/images/status/photo-album--minus.png", 
-        "name": "photo-album--minus"
-    }, 
-    {
-        "url": "/images/status/photo-album--pencil.png", 
-        "name": "photo-album--pencil"
-    }, 
-    {
-        "url": "/images/status/photo-album--plus.png", 
-        "name": "photo-album--plus"
-    }, 
-    {
-        "url": "/images/status/photo-album-blue.png", 
-        "name": "photo-album-blue"
-    }, 
-    {
-        "url": "/images/status/photo-album.png", 
-        "name": "photo-album"
-    }, 
-    {
-        "url": "/images/status/piano--arrow.png", 
-        "name": "piano--arrow"
-    }, 
-    {
-        "url": "/images/status/piano--exclamation.png", 
-        "name": "piano--exclamation"
-    }, 
-    {
-        "url": "/images/status/piano--minus.png", 
-        "name": "piano--minus"
-    }, 
-    {
-        "url": "/images/status/piano--pencil.png", 
-        "name": "piano--pencil"
-    }, 
-    {
-        "url": "/images/status/piano--plus.png", 
-        "name": "piano--plus"
-    }, 
-    {
-        "url": "/images/status/piano.png", 
-        "name": "piano"
-    }, 
-    {
-        "url": "/images/status/picture--arrow.png", 
-        "name": "picture--arrow"
-    }, 
-    {
-        "url": "/images/status/picture--exclamation.png", 
-        "name": "picture--exclamation"
-    }, 
-    {
-        "url": "/images/status/picture--minus.png", 
-        "name": "picture--minus"
-    }, 
-    {
-        "url": "/images/status/picture--pencil.png", 
-        "name": "picture--pencil"
-    }, 
-    {
-        "url": "/images/status/picture--plus.png", 
-        "name": "picture--plus"
-    }, 
-    {
-        "url": "/images/status/picture-small-sunset.png", 
-        "name": "picture-small-sunset"
-    }, 
-    {
-        "url": "/images/status/picture-small.png", 
-        "name": "picture-small"
-    }, 
-    {
-        "url": "/images/status/picture-sunset.png", 
-        "name": "picture-sunset"
-    }, 
-    {
-        "url": "/images/status/picture.png", 
-        "name": "picture"
-    }, 
-    {
-        "url": "/images/status/pictures-stack.png", 
-        "name": "pictures-stack"
-    }, 
-    {
-        "url": "/images/status/pictures.png", 
-        "name": "pictures"
-    }, 
-    {
-        "url": "/images/status/pill--arrow.png", 
-        "name": "pill--arrow"
-    }, 
-    {
-        "url": "/images/status/pill--exclamation.png", 
-        "name": "pill--exclamation"
-    }, 
-    {
-        "url": "/images/status/pill--minus.png", 
-        "name": "pill--minus"
-    }, 
-    {
-        "url": "/images/status/pill--pencil.png", 
-        "name": "pill--pencil"
-    }, 
-    {
-        "url": "/images/status/pill--plus.png", 
-        "name": "pill--plus"
-    }, 
-    {
-        "url": "/images/status/pill-small.png", 
-        "name": "pill-small"
-    }, 
-    {
-        "url": "/images/status/pill.png", 
-        "name": "pill"
-    }, 
-    {
-        "url": "/images/status/pin--arrow.png", 
-        "name": "pin--arrow"
-    }, 
-    {
-        "url": "/images/status/pin--exclamation.png", 
-        "name": "pin--exclamation"
-    }, 
-    {
-        "url": "/images/status/pin--minus.png", 
-        "name": "pin--minus"
-    }, 
-    {
-        "url": "/images/status/pin--pencil.png", 
-        "name": "pin--pencil"
-    }, 
-    {
-        "url": "/images/status/pin--plus.png", 
-        "name": "pin--plus"
-    }, 
-    {
-        "url": "/images/status/pin-small.png", 
-        "name": "pin-small"
-    }, 
-    {
-        "url": "/images/status/pin.png", 
-        "name": "pin"
-    }, 
-    {
-        "url": "/images/status/pipette--arrow.png", 
-        "name": "pipette--arrow"
-    }, 
-    {
-        "url": "/images/status/pipette--exclamation.png", 
-        "name": "pipette--exclamation"
-    }, 
-    {
-        "url": "/images/status/pipette--minus.png", 
-        "name": "pipette--minus"
-    }, 
-    {
-        "url": "/images/status/pipette--pencil.png", 
-        "name": "pipette--pencil"
-    }, 
-    {
-        "url": "/images/status/pipette--plus.png", 
-        "name": "pipette--plus"
-    }, 
-    {
-        "url": "/images/status/pipette-color.png", 
-        "name": "pipette-color"
-    }, 
-    {
-        "url": "/images/status/pipette.png", 
-        "name": "pipette"
-    }, 
-    {
-        "url": "/images/status/playing-card--arrow.png", 
-        "name": "playing-card--arrow"
-    }, 
-    {
-        "url": "/images/status/playing-card--exclamation.png", 
-        "name": "playing-card--exclamation"
-    }, 
-    {
-        "url": "/images/status/playing-card--minus.png", 
-        "name": "playing-card--minus"
-    }, 
-    {
-        "url": "/images/status/playing-card--pencil.png", 
-        "name": "playing-card--pencil"
-    }, 
-    {
-        "url": "/images/status/playing-card--plus.png", 
-        "name": "playing-card--plus"
-    }, 
-    {
-        "url": "/images/status/playing-card.png", 
-        "name": "playing-card"
-    }, 
-    {
-        "url": "/images/status/plug--arrow.png", 
-        "name": "plug--arrow"
-    }, 
-    {
-        "url": "/images/status/plug--exclamation.png", 
-        "name": "plug--exclamation"
-    }, 
-    {
-        "url": "/images/status/plug--minus.png", 
-        "name": "plug--minus"
-    }, 
-    {
-        "url": "/images/status/plug--pencil.png", 
-        "name": "plug--pencil"
-    }, 
-    {
-        "url": "/images/status/plug--plus.png", 
-        "name": "plug--plus"
-    }, 
-    {
-        "url": "/images/status/plug.png", 
-        "name": "plug"
-    }, 
-    {
-        "url": "/images/status/plus-button.png", 
-        "name": "plus-button"
-    }, 
-    {
-        "url": "/images/status/plus-circle-frame.png", 
-        "name": "plus-circle-frame"
-    }, 
-    {
-        "url": "/images/status/plus-circle.png", 
-        "name": "plus-circle"
-    }, 
-    {
-        "url": "/images/status/plus-octagon-frame.png", 
-        "name": "plus-octagon-frame"
-    }, 
-    {
-        "url": "/images/status/plus-octagon.png", 
-        "name": "plus-octagon"
-    }, 
-    {
-        "url": "/images/status/plus-shield.png", 
-        "name": "plus-shield"
-    }, 
-    {
-        "url": "/images/status/plus-small-circle.png", 
-        "name": "plus-small-circle"
-    }, 
-    {
-        "url": "/images/status/plus-small-white.png", 
-        "name": "plus-small-white"
-    }, 
-    {
-        "url": "/images/status/plus-small.png", 
-        "name": "plus-small"
-    }, 
-    {
-        "url": "/images/status/plus-white.png", 
-        "name": "plus-white"
-    }, 
-    {
-        "url": "/images/status/plus.png", 
-        "name": "plus"
-    }, 
-    {
-        "url": "/images/status/point--arrow.png", 
-        "name": "point--arrow"
-    }, 
-    {
-        "url": "/images/status/point--exclamation.png", 
-        "name": "point--exclamation"
-    }, 
-    {
-        "url": "/images/status/point--minus.png", 
-        "name": "point--minus"
-    }, 
-    {
-        "url": "/images/status/point--pencil.png", 
-        "name": "point--pencil"
-    }, 
-    {
-        "url": "/images/status/point--plus.png", 
-        "name": "point--plus"
-    }, 
-    {
-        "url": "/images/status/point-bronze.png", 
-        "name": "point-bronze"
-    }, 
-    {
-        "url": "/images/status/point-silver.png", 
-        "name": "point-silver"
-    }, 
-    {
-        "url": "/images/status/point-small.png", 
-        "name": "point-small"
-    }, 
-    {
-        "url": "/images/status/point.png", 
-        "name": "point"
-    }, 
-    {
-        "url": "/images/status/points.png", 
-        "name": "points"
-    }, 
-    {
-        "url": "/images/status/postage-stamp--arrow.png", 
-        "name": "postage-stamp--arrow"
-    }, 
-    {
-        "url": "/images/status/postage-stamp--exclamation.png", 
-        "name": "postage-stamp--exclamation"
-    }, 
-    {
-        "url": "/images/status/postage-stamp--minus.png", 
-        "name": "postage-stamp--minus"
-    }, 
-    {
-        "url": "/images/status/postage-stamp--pencil.png", 
-        "name": "postage-stamp--pencil"
-    }, 
-    {
-        "url": "/images/status/postage-stamp--plus.png", 
-        "name": "postage-stamp--plus"
-    }, 
-    {
-        "url": "/images/status/postage-stamp.png", 
-        "name": "postage-stamp"
-    }, 
-    {
-        "url": "/images/status/present--arrow.png", 
-        "name": "present--arrow"
-    }, 
-    {
-        "url": "/images/status/present--exclamation.png", 
-        "name": "present--exclamation"
-    }, 
-    {
-        "url": "/images/status/present--minus.png", 
-        "name": "present--minus"
-    }, 
-    {
-        "url": "/images/status/present--pencil.png", 
-        "name": "present--pencil"
-    }, 
-    {
-        "url": "/images/status/present--plus.png", 
-        "name": "present--plus"
-    }, 
-    {
-        "url": "/images/status/present-label.png", 
-        "name": "present-label"
-    }, 
-    {
-        "url": "/images/status/present.png", 
-        "name": "present"
-    }, 
-    {
-        "url": "/images/status/price-tag--arrow.png", 
-        "name": "price-tag--arrow"
-    }, 
-    {
-        "url": "/images/status/price-tag--exclamation.png", 
-        "name": "price-tag--exclamation"
-    }, 
-    {
-        "url": "/images/status/price-tag--minus.png", 
-        "name": "price-tag--minus"
-    }, 
-    {
-        "url": "/images/status/price-tag--pencil.png", 
-        "name": "price-tag--pencil"
-    }, 
-    {
-        "url": "/images/status/price-tag--plus.png", 
-        "name": "price-tag--plus"
-    }, 
-    {
-        "url": "/images/status/price-tag-label.png", 
-        "name": "price-tag-label"
-    }, 
-    {
-        "url": "/images/status/price-tag.png", 
-        "name": "price-tag"
-    }, 
-    {
-        "url": "/images/status/printer--arrow.png", 
-        "name": "printer--arrow"
-    }, 
-    {
-        "url": "/images/status/printer--exclamation.png", 
-        "name": "printer--exclamation"
-    }, 
-    {
-        "url": "/images/status/printer--minus.png", 
-        "name": "printer--minus"
-    }, 
-    {
-        "url": "/images/status/printer--pencil.png", 
-        "name": "printer--pencil"
-    }, 
-    {
-        "url": "/images/status/printer--plus.png", 
-        "name": "printer--plus"
-    }, 
-    {
-        "url": "/images/status/printer-empty.png", 
-        "name": "printer-empty"
-    }, 
-    {
-        "url": "/images/status/printer-network.png", 
-        "name": "printer-network"
-    }, 
-    {
-        "url": "/images/status/printer-small.png", 
-        "name": "printer-small"
-    }, 
-    {
-        "url": "/images/status/printer.png", 
-        "name": "printer"
-    }, 
-    {
-        "url": "/images/status/processor.png", 
-        "name": "processor"
-    }, 
-    {
-        "url": "/images/status/projection-screen--arrow.png", 
-        "name": "projection-screen--arrow"
-    }, 
-    {
-        "url": "/images/status/projection-screen--exclamation.png", 
-        "name": "projection-screen--exclamation"
-    }, 
-    {
-        "url": "/images/status/projection-screen--minus.png", 
-        "name": "projection-screen--minus"
-    }, 
-    {
-        "url": "/images/status/projection-screen--pencil.png", 
-        "name": "projection-screen--pencil"
-    }, 
-    {
-        "url": "/images/status/projection-screen--plus.png", 
-        "name": "projection-screen--plus"
-    }, 
-    {
-        "url": "/images/status/projection-screen-presentation.png", 
-        "name": "projection-screen-presentation"
-    }, 
-    {
-        "url": "/images/status/projection-screen.png", 
-        "name": "projection-screen"
-    }, 
-    {
-        "url": "/images/status/property-blue.png", 
-        "name": "property-blue"
-    }, 
-    {
-        "url": "/images/status/property-export.png", 
-        "name": "property-export"
-    }, 
-    {
-        "url": "/images/status/property-import.png", 
-        "name": "property-import"
-    }, 
-    {
-        "url": "/images/status/property.png", 
-        "name": "property"
-    }, 
-    {
-        "url": "/images/status/puzzle--arrow.png", 
-        "name": "puzzle--arrow"
-    }, 
-    {
-        "url": "/images/status/puzzle--exclamation.png", 
-        "name": "puzzle--exclamation"
-    }, 
-    {
-        "url": "/images/status/puzzle--minus.png", 
-        "name": "puzzle--minus"
-    }, 
-    {
-        "url": "/images/status/puzzle--pencil.png", 
-        "name": "puzzle--pencil"
-    }, 
-    {
-        "url": "/images/status/puzzle--plus.png", 
-        "name": "puzzle--plus"
-    }, 
-    {
-        "url": "/images/status/puzzle.png", 
-        "name": "puzzle"
-    }, 
-    {
-        "url": "/images/status/question-balloon.png", 
-        "name": "question-balloon"
-    }, 
-    {
-        "url": "/images/status/question-button.png", 
-        "name": "question-button"
-    }, 
-    {
-        "url": "/images/status/question-frame.png", 
-        "name": "question-frame"
-    }, 
-    {
-        "url": "/images/status/question-octagon-frame.png", 
-        "name": "question-octagon-frame"
-    }, 
-    {
-        "url": "/images/status/question-octagon.png", 
-        "name": "question-octagon"
-    }, 
-    {
-        "url": "/images/status/question-shield.png", 
-        "name": "question-shield"
-    }, 
-    {
-        "url": "/images/status/question-small-white.png", 
-        "name": "question-small-white"
-    }, 
-    {
-        "url": "/images/status/question-small.png", 
-        "name": "question-small"
-    }, 
-    {
-        "url": "/images/status/question-white.png", 
-        "name": "question-white"
-    }, 
-    {
-        "url": "/images/status/question.png", 
-        "name": "question"
-    }, 
-    {
-        "url": "/images/status/quill--arrow.png", 
-        "name": "quill--arrow"
-    }, 
-    {
-        "url": "/images/status/quill--exclamation.png", 
-        "name": "quill--exclamation"
-    }, 
-    {
-        "url": "/images/status/quill--minus.png", 
-        "name": "quill--minus"
-    }, 
-    {
-        "url": "/images/status/quill--plus.png", 
-        "name": "quill--plus"
-    }, 
-    {
-        "url": "/images/status/quill.png", 
-        "name": "quill"
-    }, 
-    {
-        "url": "/images/status/rainbow.png", 
-        "name": "rainbow"
-    }, 
-    {
-        "url": "/images/status/receipt--arrow.png", 
-        "name": "receipt--arrow"
-    }, 
-    {
-        "url": "/images/status/receipt--exclamation.png", 
-        "name": "receipt--exclamation"
-    }, 
-    {
-        "url": "/images/status/receipt--minus.png", 
-        "name": "receipt--minus"
-    }, 
-    {
-        "url": "/images/status/receipt--pencil.png", 
-        "name": "receipt--pencil"
-    }, 
-    {
-        "url": "/images/status/receipt--plus.png", 
-        "name": "receipt--plus"
-    }, 
-    {
-        "url": "/images/status/receipt-excel-text.png", 
-        "name": "receipt-excel-text"
-    }, 
-    {
-        "url": "/images/status/receipt-excel.png", 
-        "name": "receipt-excel"
-    }, 
-    {
-        "url": "/images/status/receipt-export.png", 
-        "name": "receipt-export"
-    }, 
-    {
-        "url": "/images/status/receipt-import.png", 
-        "name": "receipt-import"
-    }, 
-    {
-        "url": "/images/status/receipt-invoice.png", 
-        "name": "receipt-invoice"
-    }, 
-    {
-        "url": "/images/status/receipt-shred.png", 
-        "name": "receipt-shred"
-    }, 
-    {
-        "url": "/images/status/receipt-stamp.png", 
-        "name": "receipt-stamp"
-    }, 
-    {
-        "url": "/images/status/receipt-text.png", 
-        "name": "receipt-text"
-    }, 
-    {
-        "url": "/images/status/receipt.png", 
-        "name": "receipt"
-    }, 
-    {
-        "url": "/images/status/receipts-text.png", 
-        "name": "receipts-text"
-    }, 
-    {
-        "url": "/images/status/receipts.png", 
-        "name": "receipts"
-    }, 
-    {
-        "url": "/images/status/report--arrow.png", 
-        "name": "report--arrow"
-    }, 
-    {
-        "url": "/images/status/report--exclamation.png", 
-        "name": "report--exclamation"
-    }, 
-    {
-        "url": "/images/status/report--minus.png", 
-        "name": "report--minus"
-    }, 
-    {
-        "url": "/images/status/report--pencil.png", 
-        "name": "report--pencil"
-    }, 
-    {
-        "url": "/images/status/report--plus.png", 
-        "name": "report--plus"
-    }, 
-    {
-        "url": "/images/status/report-excel.png", 
-        "name": "report-excel"
-    }, 
-    {
-        "url": "/images/status/report-paper.png", 
-        "name": "report-paper"
-    }, 
-    {
-        "url": "/images/status/report-word.png", 
-        "name": "report-word"
-    }, 
-    {
-        "url": "/images/status/report.png", 
-        "name": "report"
-    }, 
-    {
-        "url": "/images/status/reports-stack.png", 
-        "name": "reports-stack"
-    }, 
-    {
-        "url": "/images/status/reports.png", 
-        "name": "reports"
-    }, 
-    {
-        "url": "/images/status/robot-off.png", 
-        "name": "robot-off"
-    }, 
-    {
-        "url": "/images/status/robot.png", 
-        "name": "robot"
-    }, 
-    {
-        "url": "/images/status/rocket--arrow.png", 
-        "name": "rocket--arrow"
-    }, 
-    {
-        "url": "/images/status/rocket--exclamation.png", 
-        "name": "rocket--exclamation"
-    }, 
-    {
-        "url": "/images/status/rocket--minus.png", 
-        "name": "rocket--minus"
-    }, 
-    {
-        "url": "/images/status/rocket--pencil.png", 
-        "name": "rocket--pencil"
-    }, 
-    {
-        "url": "/images/status/rocket--plus.png", 
-        "name": "rocket--plus"
-    }, 
-    {
-        "url": "/images/status/rocket-fly.png", 
-        "name": "rocket-fly"
-    }, 
-    {
-        "url": "/images/status/rocket.png", 
-        "name": "rocket"
-    }, 
-    {
-        "url": "/images/status/ruby.png", 
-        "name": "ruby"
-    }, 
-    {
-        "url": "/images/status/ruler--arrow.png", 
-        "name": "ruler--arrow"
-    }, 
-    {
-        "url": "/images/status/ruler--exclamation.png", 
-        "name": "ruler--exclamation"
-    }, 
-    {
-        "url": "/images/status/ruler--minus.png", 
-        "name": "ruler--minus"
-    }, 
-    {
-        "url": "/images/status/ruler--pencil.png", 
-        "name": "ruler--pencil"
-    }, 
-    {
-        "url": "/images/status/ruler--plus.png", 
-        "name": "ruler--plus"
-    }, 
-    {
-        "url": "/images/status/ruler-crop.png", 
-        "name": "ruler-crop"
-    }, 
-    {
-        "url": "/images/status/ruler-triangle.png", 
-        "name": "ruler-triangle"
-    }, 
-    {
-        "url": "/images/status/ruler.png", 
-        "name": "ruler"
-    }, 
-    {
-        "url": "/images/status/safe--arrow.png", 
-        "name": "safe--arrow"
-    }, 
-    {
-        "url": "/images/status/safe--exclamation.png", 
-        "name": "safe--exclamation"
-    }, 
-    {
-        "url": "/images/status/safe--minus.png", 
-        "name": "safe--minus"
-    }, 
-    {
-        "url": "/images/status/safe--pencil.png", 
-        "name": "safe--pencil"
-    }, 
-    {
-        "url": "/images/status/safe--plus.png", 
-        "name": "safe--plus"
-    }, 
-    {
-        "url": "/images/status/safe.png", 
-        "name": "safe"
-    }, 
-    {
-        "url": "/images/status/scanner--arrow.png", 
-        "name": "scanner--arrow"
-    }, 
-    {
-        "url": "/images/status/scanner--exclamation.png", 
-        "name": "scanner--exclamation"
-    }, 
-    {
-        "url": "/images/status/scanner--minus.png", 
-        "name": "scanner--minus"
-    }, 
-    {
-        "url": "/images/status/scanner--pencil.png", 
-        "name": "scanner--pencil"
-    }, 
-    {
-        "url": "/images/status/scanner--plus.png", 
-        "name": "scanner--plus"
-    }, 
-    {
-        "url": "/images/status/scanner-off.png", 
-        "name": "scanner-off"
-    }, 
-    {
-        "url": "/images/status/scanner.png", 
-        "name": "scanner"
-    }, 
-    {
-        "url": "/images/status/scissors--arrow.png", 
-        "name": "scissors--arrow"
-    }, 
-    {
-        "url": "/images/status/scissors--exclamation.png", 
-        "name": "scissors--exclamation"
-    }, 
-    {
-        "url": "/images/status/scissors--minus.png", 
-        "name": "scissors--minus"
-    }, 
-    {
-        "url": "/images/status/scissors--pencil.png", 
-        "name": "scissors--pencil"
-    }, 
-    {
-        "url": "/images/status/scissors--plus.png", 
-        "name": "scissors--plus"
-    }, 
-    {
-        "url": "/images/status/scissors-blue.png", 
-        "name": "scissors-blue"
-    }, 
-    {
-        "url": "/images/status/scissors.png", 
-        "name": "scissors"
-    }, 
-    {
-        "url": "/images/status/screwdriver--arrow.png", 
-        "name": "screwdriver--arrow"
-    }, 
-    {
-        "url": "/images/status/screwdriver--exclamation.png", 
-        "name": "screwdriver--exclamation"
-    }, 
-    {
-        "url": "/images/status/screwdriver--minus.png", 
-        "name": "screwdriver--minus"
-    }, 
-    {
-        "url": "/images/status/screwdriver--pencil.png", 
-        "name": "screwdriver--pencil"
-    }, 
-    {
-        "url": "/images/status/screwdriver--plus.png", 
-        "name": "screwdriver--plus"
-    }, 
-    {
-        "url": "/images/status/screwdriver.png", 
-        "name": "screwdriver"
-    }, 
-    {
-        "url": "/images/status/script--arrow.png", 
-        "name": "script--arrow"
-    }, 
-    {
-        "url": "/images/status/script--exclamation.png", 
-        "name": "script--exclamation"
-    }, 
-    {
-        "url": "/images/status/script--minus.png", 
-        "name": "script--minus"
-    }, 
-    {
-        "url": "/images/status/script--pencil.png", 
-        "name": "script--pencil"
-    }, 
-    {
-        "url": "/images/status/script--plus.png", 
-        "name": "script--plus"
-    }, 
-    {
-        "url": "/images/status/script-attribute-b.png", 
-        "name": "script-attribute-b"
-    }, 
-    {
-        "url": "/images/status/script-attribute-c.png", 
-        "name": "script-attribute-c"
-    }, 
-    {
-        "url": "/images/status/script-attribute-d.png", 
-        "name": "script-attribute-d"
-    }, 
-    {
-        "url": "/images/status/script-attribute-e.png", 
-        "name": "script-attribute-e"
-    }, 
-    {
-        "url": "/images/status/script-attribute-f.png", 
-        "name": "script-attribute-f"
-    }, 
-    {
-        "url": "/images/status/script-attribute-g.png", 
-        "name": "script-attribute-g"
-    }, 
-    {
-        "url": "/images/status/script-attribute-h.png", 
-        "name": "script-attribute-h"
-    }, 
-    {
-        "url": "/images/status/script-attribute-i.png", 
-        "name": "script-attribute-i"
-    }, 
-    {
-        "url": "/images/status/script-attribute-j.png", 
-        "name": "script-attribute-j"
-    }, 
-    {
-        "url": "/images/status/script-attribute-k.png", 
-        "name": "script-attribute-k"
-    }, 
-    {
-        "url": "/images/status/script-attribute-l.png", 
-        "name": "script-attribute-l"
-    }, 
-    {
-        "url": "/images/status/script-attribute-m.png", 
-        "name": "script-attribute-m"
-    }, 
-    {
-        "url": "/images/status/script-attribute-n.png", 
-        "name": "script-attribute-n"
-    }, 
-    {
-        "url": "/images/status/script-attribute-o.png", 
-        "name": "script-attribute-o"
-    }, 
-    {
-        "url": "/images/status/script-attribute-p.png", 
-        "name": "script-attribute-p"
-    }, 
-    {
-        "url": "/images/status/script-attribute-q.png", 
-        "name": "script-attribute-q"
-    }, 
-    {
-        "url": "/images/status/script-attribute-r.png", 
-        "name": "script-attribute-r"
-    }, 
-    {
-        "url": "/images/status/script-attribute-s.png", 
-        "name": "script-attribute-s"
-    }, 
-    {
-        "url": "/images/status/script-attribute-t.png", 
-        "name": "script-attribute-t"
-    }, 
-    {
-        "url": "/images/status/script-attribute-u.png", 
-        "name": "script-attribute-u"
-    }, 
-    {
-        "url": "/images/status/script-attribute-v.png", 
-        "name": "script-attribute-v"
-    }, 
-    {
-        "url": "/images/status/script-attribute-w.png", 
-        "name": "script-attribute-w"
-    }, 
-    {
-        "url": "/images/status/script-attribute-x.png", 
-        "name": "script-attribute-x"
-    }, 
-    {
-        "url": "/images/status/script-attribute-y.png", 
-        "name": "script-attribute-y"
-    }, 
-    {
-        "url": "/images/status/script-attribute-z.png", 
-        "name": "script-attribute-z"
-    }, 
-    {
-        "url": "/images/status/script-attribute.png", 
-        "name": "script-attribute"
-    }, 
-    {
-        "url": "/images/status/script-binary.png", 
-        "name": "script-binary"
-    }, 
-    {
-        "url": "/images/status/script-block.png", 
-        "name": "script-block"
-    }, 
-    {
-        "url": "/images/status/script-code.png", 
-        "name": "script-code"
-    }, 
-    {
-        "url": "/images/status/script-excel.png", 
-        "name": "script-excel"
-    }, 
-    {
-        "url": "/images/status/script-export.png", 
-        "name": "script-export"
-    }, 
-    {
-        "url": "/images/status/script-flash.png", 
-        "name": "script-flash"
-    }, 
-    {
-        "url": "/images/status/script-globe.png", 
-        "name": "script-globe"
-    }, 
-    {
-        "url": "/images/status/script-import.png", 
-        "name": "script-import"
-    }, 
-    {
-        "url": "/images/status/script-office.png", 
-        "name": "script-office"
-    }, 
-    {
-        "url": "/images/status/script-php.png", 
-        "name": "script-php"
-    }, 
-    {
-        "url": "/images/status/script-stamp.png", 
-        "name": "script-stamp"
-    }, 
-    {
-        "url": "/images/status/script-text.png", 
-        "name": "script-text"
-    }, 
-    {
-        "url": "/images/status/script-visual-studio.png", 
-        "name": "script-visual-studio"
-    }, 
-    {
-        "url": "/images/status/script-word.png", 
-        "name": "script-word"
-    }, 
-    {
-        "url": "/images/status/script.png", 
-        "name": "script"
-    }, 
-    {
-        "url": "/images/status/scripts-text.png", 
-        "name": "scripts-text"
-    }, 
-    {
-        "url": "/images/status/scripts.png", 
-        "name": "scripts"
-    }, 
-    {
-        "url": "/images/status/selection-input.png", 
-        "name": "selection-input"
-    }, 
-    {
-        "url": "/images/status/selection-select-input.png", 
-        "name": "selection-select-input"
-    }, 
-    {
-        "url": "/images/status/selection-select.png", 
-        "name": "selection-select"
-    }, 
-    {
-        "url": "/images/status/selection.png", 
-        "name": "selection"
-    }, 
-    {
-        "url": "/images/status/server--arrow.png", 
-        "name": "server--arrow"
-    }, 
-    {
-        "url": "/images/status/server--exclamation.png", 
-        "name": "server--exclamation"
-    }, 
-    {
-        "url": "/images/status/server--minus.png", 
-        "name": "server--minus"
-    }, 
-    {
-        "url": "/images/status/server--pencil.png", 
-        "name": "server--pencil"
-    }, 
-    {
-        "url": "/images/status/server--plus.png", 
-        "name": "server--plus"
-    }, 
-    {
-        "url": "/images/status/server-cast.png", 
-        "name": "server-cast"
-    }, 
-    {
-        "url": "/images/status/server-network.png", 
-        "name": "server-network"
-    }, 
-    {
-        "url": "/images/status/server-property.png", 
-        "name": "server-property"
-    }, 
-    {
-        "url": "/images/status/server.png", 
-        "name": "server"
-    }, 
-    {
-        "url": "/images/status/servers-network.png", 
-        "name": "servers-network"
-    }, 
-    {
-        "url": "/images/status/servers.png", 
-        "name": "servers"
-    }, 
-    {
-        "url": "/images/status/service-bell--arrow.png", 
-        "name": "service-bell--arrow"
-    }, 
-    {
-        "url": "/images/status/service-bell--exclamation.png", 
-        "name": "service-bell--exclamation"
-    }, 
-    {
-        "url": "/images/status/service-bell--minus.png", 
-        "name": "service-bell--minus"
-    }, 
-    {
-        "url": "/images/status/service-bell--pencil.png", 
-        "name": "service-bell--pencil"
-    }, 
-    {
-        "url": "/images/status/service-bell--plus.png", 
-        "name": "service-bell--plus"
-    }, 
-    {
-        "url": "/images/status/service-bell.png", 
-        "name": "service-bell"
-    }, 
-    {
-        "url": "/images/status/share-balloon.png", 
-        "name": "share-balloon"
-    }, 
-    {
-        "url": "/images/status/share-document.png", 
-        "name": "share-document"
-    }, 
-    {
-        "url": "/images/status/share-small.png", 
-        "name": "share-small"
-    }, 
-    {
-        "url": "/images/status/share.png", 
-        "name": "share"
-    }, 
-    {
-        "url": "/images/status/shield--arrow.png", 
-        "name": "shield--arrow"
-    }, 
-    {
-        "url": "/images/status/shield--exclamation.png", 
-        "name": "shield--exclamation"
-    }, 
-    {
-        "url": "/images/status/shield--minus.png", 
-        "name": "shield--minus"
-    }, 
-    {
-        "url": "/images/status/shield--pencil.png", 
-        "name": "shield--pencil"
-    }, 
-    {
-        "url": "/images/status/shield--plus.png", 
-        "name": "shield--plus"
-    }, 
-    {
-        "url": "/images/status/shield.png", 
-        "name": "shield"
-    }, 
-    {
-        "url": "/images/status/shopping-basket--arrow.png", 
-        "name": "shopping-basket--arrow"
-    }, 
-    {
-        "url": "/images/status/shopping-basket--exclamation.png", 
-        "name": "shopping-basket--exclamation"
-    }, 
-    {
-        "url": "/images/status/shopping-basket--minus.png", 
-        "name": "shopping-basket--minus"
-    }, 
-    {
-        "url": "/images/status/shopping-basket--pencil.png", 
-        "name": "shopping-basket--pencil"
-    }, 
-    {
-        "url": "/images/status/shopping-basket--plus.png", 
-        "name": "shopping-basket--plus"
-    }, 
-    {
-        "url": "/images/status/shopping-basket.png", 
-        "name": "shopping-basket"
-    }, 
-    {
-        "url": "/images/status/shortcut-small.png", 
-        "name": "shortcut-small"
-    }, 
-    {
-        "url": "/images/status/shortcut.png", 
-        "name": "shortcut"
-    }, 
-    {
-        "url": "/images/status/sitemap-application-blue.png", 
-        "name": "sitemap-application-blue"
-    }, 
-    {
-        "url": "/images/status/sitemap-application.png", 
-        "name": "sitemap-application"
-    }, 
-    {
-        "url": "/images/status/sitemap-image.png", 
-        "name": "sitemap-image"
-    }, 
-    {
-        "url": "/images/status/sitemap.png", 
-        "name": "sitemap"
-    }, 
-    {
-        "url": "/images/status/slash-button.png", 
-        "name": "slash-button"
-    }, 
-    {
-        "url": "/images/status/slash-small.png", 
-        "name": "slash-small"
-    }, 
-    {
-        "url": "/images/status/slash.png", 
-        "name": "slash"
-    }, 
-    {
-        "url": "/images/status/slide--arrow.png", 
-        "name": "slide--arrow"
-    }, 
-    {
-        "url": "/images/status/slide--exclamation.png", 
-        "name": "slide--exclamation"
-    }, 
-    {
-        "url": "/images/status/slide--minus.png", 
-        "name": "slide--minus"
-    }, 
-    {
-        "url": "/images/status/slide--pencil.png", 
-        "name": "slide--pencil"
-    }, 
-    {
-        "url": "/images/status/slide--plus.png", 
-        "name": "slide--plus"
-    }, 
-    {
-        "url": "/images/status/slide-powerpoint.png", 
-        "name": "slide-powerpoint"
-    }, 
-    {
-        "url": "/images/status/slide.png", 
-        "name": "slide"
-    }, 
-    {
-        "url": "/images/status/slides-stack.png", 
-        "name": "slides-stack"
-    }, 
-    {
-        "url": "/images/status/slides.png", 
-        "name": "slides"
-    }, 
-    {
-        "url": "/images/status/smiley-confuse.png", 
-        "name": "smiley-confuse"
-    }, 
-    {
-        "url": "/images/status/smiley-cool.png", 
-        "name": "smiley-cool"
-    }, 
-    {
-        "url": "/images/status/smiley-cry.png", 
-        "name": "smiley-cry"
-    }, 
-    {
-        "url": "/images/status/smiley-draw.png", 
-        "name": "smiley-draw"
-    }, 
-    {
-        "url": "/images/status/smiley-eek.png", 
-        "name": "smiley-eek"
-    }, 
-    {
-        "url": "/images/status/smiley-evil.png", 
-        "name": "smiley-evil"
-    }, 
-    {
-        "url": "/images/status/smiley-fat.png", 
-        "name": "smiley-fat"
-    }, 
-    {
-        "url": "/images/status/smiley-grin.png", 
-        "name": "smiley-grin"
-    }, 
-    {
-        "url": "/images/status/smiley-kiss.png", 
-        "name": "smiley-kiss"
-    }, 
-    {
-        "url": "/images/status/smiley-kitty.png", 
-        "name": "smiley-kitty"
-    }, 
-    {
-        "url": "/images/status/smiley-lol.png", 
-        "name": "smiley-lol"
-    }, 
-    {
-        "url": "/images/status/smiley-mad.png", 
-        "name": "smiley-mad"
-    }, 
-    {
-        "url": "/images/status/smiley-money.png", 
-        "name": "smiley-money"
-    }, 
-    {
-        "url": "/images/status/smiley-mr-green.png", 
-        "name": "smiley-mr-green"
-    }, 
-    {
-        "url": "/images/status/smiley-neutral.png", 
-        "name": "smiley-neutral"
-    }, 
-    {
-        "url": "/images/status/smiley-razz.png", 
-        "name": "smiley-razz"
-    }, 
-    {
-        "url": "/images/status/smiley-red.png", 
-        "name": "smiley-red"
-    }, 
-    {
-        "url": "/images/status/smiley-roll-sweat.png", 
-        "name": "smiley-roll-sweat"
-    }, 
-    {
-        "url": "/images/status/smiley-roll.png", 
-        "name": "smiley-roll"
-    }, 
-    {
-        "url": "/images/status/smiley-sad.png", 
-        "name": "smiley-sad"
-    }, 
-    {
-        "url": "/images/status/smiley-sleep.png", 
-        "name": "smiley-sleep"
-    }, 
-    {
-        "url": "/images/status/smiley-slim.png", 
-        "name": "smiley-slim"
-    }, 
-    {
-        "url": "/images/status/smiley-small.png", 
-        "name": "smiley-small"
-    }, 
-    {
-        "url": "/images/status/smiley-surprise.png", 
-        "name": "smiley-surprise"
-    }, 
-    {
-        "url": "/images/status/smiley-sweat.png", 
-        "name": "smiley-sweat"
-    }, 
-    {
-        "url": "/images/status/smiley-twist.png", 
-        "name": "smiley-twist"
-    }, 
-    {
-        "url": "/images/status/smiley-wink.png", 
-        "name": "smiley-wink"
-    }, 
-    {
-        "url": "/images/status/smiley-yell.png", 
-        "name": "smiley-yell"
-    }, 
-    {
-        "url": "/images/status/smiley-zipper.png", 
-        "name": "smiley-zipper"
-    }, 
-    {
-        "url": "/images/status/smiley.png", 
-        "name": "smiley"
-    }, 
-    {
-        "url": "/images/status/snowman-hat.png", 
-        "name": "snowman-hat"
-    }, 
-    {
-        "url": "/images/status/snowman.png", 
-        "name": "snowman"
-    }, 
-    {
-        "url": "/images/status/soap-body.png", 
-        "name": "soap-body"
-    }, 
-    {
-        "url": "/images/status/soap-header.png", 
-        "name": "soap-header"
-    }, 
-    {
-        "url": "/images/status/soap.png", 
-        "name": "soap"
-    }, 
-    {
-        "url": "/images/status/socket--arrow.png", 
-        "name": "socket--arrow"
-    }, 
-    {
-        "url": "/images/status/socket--exclamation.png", 
-        "name": "socket--exclamation"
-    }, 
-    {
-        "url": "/images/status/socket--minus.png", 
-        "name": "socket--minus"
-    }, 
-    {
-        "url": "/images/status/socket--pencil.png", 
-        "name": "socket--pencil"
-    }, 
-    {
-        "url": "/images/status/socket--plus.png", 
-        "name": "socket--plus"
-    }, 
-    {
-        "url": "/images/status/socket.png", 
-        "name": "socket"
-    }, 
-    {
-        "url": "/images/status/sockets.png", 
-        "name": "sockets"
-    }, 
-    {
-        "url": "/images/status/sofa--arrow.png", 
-        "name": "sofa--arrow"
-    }, 
-    {
-        "url": "/images/status/sofa--exclamation.png", 
-        "name": "sofa--exclamation"
-    }, 
-    {
-        "url": "/images/status/sofa--minus.png", 
-        "name": "sofa--minus"
-    }, 
-    {
-        "url": "/images/status/sofa--pencil.png", 
-        "name": "sofa--pencil"
-    }, 
-    {
-        "url": "/images/status/sofa--plus.png", 
-        "name": "sofa--plus"
-    }, 
-    {
-        "url": "/images/status/sofa.png", 
-        "name": "sofa"
-    }, 
-    {
-        "url": "/images/status/sort--arrow.png", 
-        "name": "sort--arrow"
-    }, 
-    {
-        "url": "/images/status/sort--exclamation.png", 
-        "name": "sort--exclamation"
-    }, 
-    {
-        "url": "/images/status/sort--minus.png", 
-        "name": "sort--minus"
-    }, 
-    {
-        "url": "/images/status/sort--pencil.png", 
-        "name": "sort--pencil"
-    }, 
-    {
-        "url": "/images/status/sort--plus.png", 
-        "name": "sort--plus"
-    }, 
-    {
-        "url": "/images/status/sort-alphabet-descending.png", 
-        "name": "sort-alphabet-descending"
-    }, 
-    {
-        "url": "/images/status/sort-alphabet.png", 
-        "name": "sort-alphabet"
-    }, 
-    {
-        "url": "/images/status/sort-date-descending.png", 
-        "name": "sort-date-descending"
-    }, 
-    {
-        "url": "/images/status/sort-date.png", 
-        "name": "sort-date"
-    }, 
-    {
-        "url": "/images/status/sort-number-descending.png", 
-        "name": "sort-number-descending"
-    }, 
-    {
-        "url": "/images/status/sort-number.png", 
-        "name": "sort-number"
-    }, 
-    {
-        "url": "/images/status/sort-price-descending.png", 
-        "name": "sort-price-descending"
-    }, 
-    {
-        "url": "/images/status/sort-price.png", 
-        "name": "sort-price"
-    }, 
-    {
-        "url": "/images/status/sort-quantity-descending.png", 
-        "name": "sort-quantity-descending"
-    }, 
-    {
-        "url": "/images/status/sort-quantity.png", 
-        "name": "sort-quantity"
-    }, 
-    {
-        "url": "/images/status/sort-rating-descending.png", 
-        "name": "sort-rating-descending"
-    }, 
-    {
-        "url": "/images/status/sort-rating.png", 
-        "name": "sort-rating"
-    }, 
-    {
-        "url": "/images/status/sort-small.png", 
-        "name": "sort-small"
-    }, 
-    {
-        "url": "/images/status/sort.png", 
-        "name": "sort"
-    }, 
-    {
-        "url": "/images/status/speaker--arrow.png", 
-        "name": "speaker--arrow"
-    }, 
-    {
-        "url": "/images/status/speaker--exclamation.png", 
-        "name": "speaker--exclamation"
-    }, 
-    {
-        "url": "/images/status/speaker--minus.png", 
-        "name": "speaker--minus"
-    }, 
-    {
-        "url": "/images/status/speaker--pencil.png", 
-        "name": "speaker--pencil"
-    }, 
-    {
-        "url": "/images/status/speaker--plus.png", 
-        "name": "speaker--plus"
-    }, 
-    {
-        "url": "/images/status/speaker-volume-control-mute.png", 
-        "name": "speaker-volume-control-mute"
-    }, 
-    {
-        "url": "/images/status/speaker-volume-control-up.png", 
-        "name": "speaker-volume-control-up"
-    }, 
-    {
-        "url": "/images/status/speaker-volume-control.png", 
-        "name": "speaker-volume-control"
-    }, 
-    {
-        "url": "/images/status/speaker-volume-low.png", 
-        "name": "speaker-volume-low"
-    }, 
-    {
-        "url": "/images/status/speaker-volume-none.png", 
-        "name": "speaker-volume-none"
-    }, 
-    {
-        "url": "/images/status/speaker-volume.png", 
-        "name": "speaker-volume"
-    }, 
-    {
-        "url": "/images/status/speaker.png", 
-        "name": "speaker"
-    }, 
-    {
-        "url": "/images/status/spectacle-small.png", 
-        "name": "spectacle-small"
-    }, 
-    {
-        "url": "/images/status/spectacle-sunglass.png", 
-        "name": "spectacle-sunglass"
-    }, 
-    {
-        "url": "/images/status/spectacle.png", 
-        "name": "spectacle"
-    }, 
-    {
-        "url": "/images/status/spell-check-error.png", 
-        "name": "spell-check-error"
-    }, 
-    {
-        "url": "/images/status/spell-check.png", 
-        "name": "spell-check"
-    }, 
-    {
-        "url": "/images/status/spray--arrow.png", 
-        "name": "spray--arrow"
-    }, 
-    {
-        "url": "/images/status/spray--exclamation.png", 
-        "name": "spray--exclamation"
-    }, 
-    {
-        "url": "/images/status/spray--minus.png", 
-        "name": "spray--minus"
-    }, 
-    {
-        "url": "/images/status/spray--pencil.png", 
-        "name": "spray--pencil"
-    }, 
-    {
-        "url": "/images/status/spray--plus.png", 
-        "name": "spray--plus"
-    }, 
-    {
-        "url": "/images/status/spray-color.png", 
-        "name": "spray-color"
-    }, 
-    {
-        "url": "/images/status/spray.png", 
-        "name": "spray"
-    }, 
-    {
-        "url": "/images/status/sql-join-inner.png", 
-        "name": "sql-join-inner"
-    }, 
-    {
-        "url": "/images/status/sql-join-left-exclude.png", 
-        "name": "sql-join-left-exclude"
-    }, 
-    {
-        "url": "/images/status/sql-join-left.png", 
-        "name": "sql-join-left"
-    }, 
-    {
-        "url": "/images/status/sql-join-outer-exclude.png", 
-        "name": "sql-join-outer-exclude"
-    }, 
-    {
-        "url": "/images/status/sql-join-outer.png", 
-        "name": "sql-join-outer"
-    }, 
-    {
-        "url": "/images/status/sql-join-right-exclude.png", 
-        "name": "sql-join-right-exclude"
-    }, 
-    {
-        "url": "/images/status/sql-join-right.png", 
-        "name": "sql-join-right"
-    }, 
-    {
-        "url": "/images/status/sql-join.png", 
-        "name": "sql-join"
-    }, 
-    {
-        "url": "/images/status/sql.png", 
-        "name": "sql"
-    }, 
-    {
-        "url": "/images/status/stamp--arrow.png", 
-        "name": "stamp--arrow"
-    }, 
-    {
-        "url": "/images/status/stamp--exclamation.png", 
-        "name": "stamp--exclamation"
-    }, 
-    {
-        "url": "/images/status/stamp--minus.png", 
-        "name": "stamp--minus"
-    }, 
-    {
-        "url": "/images/status/stamp--pencil.png", 
-        "name": "stamp--pencil"
-    }, 
-    {
-        "url": "/images/status/stamp--plus.png", 
-        "name": "stamp--plus"
-    }, 
-    {
-        "url": "/images/status/stamp-pattern.png", 
-        "name": "stamp-pattern"
-    }, 
-    {
-        "url": "/images/status/stamp.png", 
-        "name": "stamp"
-    }, 
-    {
-        "url": "/images/status/star--arrow.png", 
-        "name": "star--arrow"
-    }, 
-    {
-        "url": "/images/status/star--exclamation.png", 
-        "name": "star--exclamation"
-    }, 
-    {
-        "url": "/images/status/star--minus.png", 
-        "name": "star--minus"
-    }, 
-    {
-        "url": "/images/status/star--pencil.png", 
-        "name": "star--pencil"
-    }, 
-    {
-        "url": "/images/status/star--plus.png", 
-        "name": "star--plus"
-    }, 
-    {
-        "url": "/images/status/star-empty.png", 
-        "name": "star-empty"
-    }, 
-    {
-        "url": "/images/status/star-half.png", 
-        "name": "star-half"
-    }, 
-    {
-        "url": "/images/status/star-small-empty.png", 
-        "name": "star-small-empty"
-    }, 
-    {
-        "url": "/images/status/star-small-half.png", 
-        "name": "star-small-half"
-    }, 
-    {
-        "url": "/images/status/star-small.png", 
-        "name": "star-small"
-    }, 
-    {
-        "url": "/images/status/star.png", 
-        "name": "star"
-    }, 
-    {
-        "url": "/images/status/status-away.png", 
-        "name": "status-away"
-    }, 
-    {
-        "url": "/images/status/status-busy.png", 
-        "name": "status-busy"
-    }, 
-    {
-        "url": "/images/status/status-offline.png", 
-        "name": "status-offline"
-    }, 
-    {
-        "url": "/images/status/status.png", 
-        "name": "status"
-    }, 
-    {
-        "url": "/images/status/sticky-note--arrow.png", 
-        "name": "sticky-note--arrow"
-    }, 
-    {
-        "url": "/images/status/sticky-note--exclamation.png", 
-        "name": "sticky-note--exclamation"
-    }, 
-    {
-        "url": "/images/status/sticky-note--minus.png", 
-        "name": "sticky-note--minus"
-    }, 
-    {
-        "url": "/images/status/sticky-note--pencil.png", 
-        "name": "sticky-note--pencil"
-    }, 
-    {
-        "url": "/images/status/sticky-note--plus.png", 
-        "name": "sticky-note--plus"
-    }, 
-    {
-        "url": "/images/status/sticky-note-pin.png", 
-        "name": "sticky-note-pin"
-    }, 
-    {
-        "url": "/images/status/sticky-note-shred.png", 
-        "name": "sticky-note-shred"
-    }, 
-    {
-        "url": "/images/status/sticky-note-small-pin.png", 
-        "name": "sticky-note-small-pin"
-    }, 
-    {
-        "url": "/images/status/sticky-note-small.png", 
-        "name": "sticky-note-small"
-    }, 
-    {
-        "url": "/images/status/sticky-note-text.png", 
-        "name": "sticky-note-text"
-    }, 
-    {
-        "url": "/images/status/sticky-note.png", 
-        "name": "sticky-note"
-    }, 
-    {
-        "url": "/images/status/sticky-notes-pin.png", 
-        "name": "sticky-notes-pin"
-    }, 
-    {
-        "url": "/images/status/sticky-notes-stack.png", 
-        "name": "sticky-notes-stack"
-    }, 
-    {
-        "url": "/images/status/sticky-notes-text.png", 
-        "name": "sticky-notes-text"
-    }, 
-    {
-        "url": "/images/status/sticky-notes.png", 
-        "name": "sticky-notes"
-    }, 
-    {
-        "url": "/images/status/store--arrow.png", 
-        "name": "store--arrow"
-    }, 
-    {
-        "url": "/images/status/store--exclamation.png", 
-        "name": "store--exclamation"
-    }, 
-    {
-        "url": "/images/status/store--minus.png", 
-        "name": "store--minus"
-    }, 
-    {
-        "url": "/images/status/store--pencil.png", 
-        "name": "store--pencil"
-    }, 
-    {
-        "url": "/images/status/store--plus.png", 
-        "name": "store--plus"
-    }, 
-    {
-        "url": "/images/status/store-label.png", 
-        "name": "store-label"
-    }, 
-    {
-        "url": "/images/status/store-network.png", 
-        "name": "store-network"
-    }, 
-    {
-        "url": "/images/status/store-open.png", 
-        "name": "store-open"
-    }, 
-    {
-        "url": "/images/status/store-small.png", 
-        "name": "store-small"
-    }, 
-    {
-        "url": "/images/status/store.png", 
-        "name": "store"
-    }, 
-    {
-        "url": "/images/status/subversion-small.png", 
-        "name": "subversion-small"
-    }, 
-    {
-        "url": "/images/status/subversion.png", 
-        "name": "subversion"
-    }, 
-    {
-        "url": "/images/status/sum.png", 
-        "name": "sum"
-    }, 
-    {
-        "url": "/images/status/switch--arrow.png", 
-        "name": "switch--arrow"
-    }, 
-    {
-        "url": "/images/status/switch--exclamation.png", 
-        "name": "switch--exclamation"
-    }, 
-    {
-        "url": "/images/status/switch--minus.png", 
-        "name": "switch--minus"
-    }, 
-    {
-        "url": "/images/status/switch--pencil.png", 
-        "name": "switch--pencil"
-    }, 
-    {
-        "url": "/images/status/switch--plus.png", 
-        "name": "switch--plus"
-    }, 
-    {
-        "url": "/images/status/switch-network.png", 
-        "name": "switch-network"
-    }, 
-    {
-        "url": "/images/status/switch-small.png", 
-        "name": "switch-small"
-    }, 
-    {
-        "url": "/images/status/switch.png", 
-        "name": "switch"
-    }, 
-    {
-        "url": "/images/status/system-monitor--arrow.png", 
-        "name": "system-monitor--arrow"
-    }, 
-    {
-        "url": "/images/status/system-monitor--exclamation.png", 
-        "name": "system-monitor--exclamation"
-    }, 
-    {
-        "url": "/images/status/system-monitor--minus.png", 
-        "name": "system-monitor--minus"
-    }, 
-    {
-        "url": "/images/status/system-monitor--pencil.png", 
-        "name": "system-monitor--pencil"
-    }, 
-    {
-        "url": "/images/status/system-monitor--plus.png", 
-        "name": "system-monitor--plus"
-    }, 
-    {
-        "url": "/images/status/system-monitor.png", 
-        "name": "system-monitor"
-    }, 
-    {
-        "url": "/images/status/t-shirt-gray.png", 
-        "name": "t-shirt-gray"
-    }, 
-    {
-        "url": "/images/status/t-shirt-print-gray.png", 
-        "name": "t-shirt-print-gray"
-    }, 
-    {
-        "url": "/images/status/t-shirt-print.png", 
-        "name": "t-shirt-print"
-    }, 
-    {
-        "url": "/images/status/t-shirt.png", 
-        "name": "t-shirt"
-    }, 
-    {
-        "url": "/images/status/table--arrow.png", 
-        "name": "table--arrow"
-    }, 
-    {
-        "url": "/images/status/table--exclamation.png", 
-        "name": "table--exclamation"
-    }, 
-    {
-        "url": "/images/status/table--minus.png", 
-        "name": "table--minus"
-    }, 
-    {
-        "url": "/images/status/table--pencil.png", 
-        "name": "table--pencil"
-    }, 
-    {
-        "url": "/images/status/table--plus.png", 
-        "name": "table--plus"
-    }, 
-    {
-        "url": "/images/status/table-delete-column.png", 
-        "name": "table-delete-column"
-    }, 
-    {
-        "url": "/images/status/table-delete-row.png", 
-        "name": "table-delete-row"
-    }, 
-    {
-        "url": "/images/status/table-delete.png", 
-        "name": "table-delete"
-    }, 
-    {
-        "url": "/images/status/table-excel.png", 
-        "name": "table-excel"
-    }, 
-    {
-        "url": "/images/status/table-export.png", 
-        "name": "table-export"
-    }, 
-    {
-        "url": "/images/status/table-import.png", 
-        "name": "table-import"
-    }, 
-    {
-        "url": "/images/status/table-insert-column.png", 
-        "name": "table-insert-column"
-    }, 
-    {
-        "url": "/images/status/table-insert-row.png", 
-        "name": "table-insert-row"
-    }, 
-    {
-        "url": "/images/status/table-insert.png", 
-        "name": "table-insert"
-    }, 
-    {
-        "url": "/images/status/table-join.png", 
-        "name": "table-join"
-    }, 
-    {
-        "url": "/images/status/table-money.png", 
-        "name": "table-money"
-    }, 
-    {
-        "url": "/images/status/table-paint-can.png", 
-        "name": "table-paint-can"
-    }, 
-    {
-        "url": "/images/status/table-select-all.png", 
-        "name": "table-select-all"
-    }, 
-    {
-        "url": "/images/status/table-select-cells.png", 
-        "name": "table-select-cells"
-    }, 
-    {
-        "url": "/images/status/table-select-column.png", 
-        "name": "table-select-column"
-    }, 
-    {
-        "url": "/images/status/table-select-row.png", 
-        "name": "table-select-row"
-    }, 
-    {
-        "url": "/images/status/table-select.png", 
-        "name": "table-select"
-    }, 
-    {
-        "url": "/images/status/table-sheet.png", 
-        "name": "table-sheet"
-    }, 
-    {
-        "url": "/images/status/table-small.png", 
-        "name": "table-small"
-    }, 
-    {
-        "url": "/images/status/table-split.png", 
-        "name": "table-split"
-    }, 
-    {
-        "url": "/images/status/table-sum.png", 
-        "name": "table-sum"
-    }, 
-    {
-        "url": "/images/status/table.png", 
-        "name": "table"
-    }, 
-    {
-        "url": "/images/status/tables-relation.png", 
-        "name": "tables-relation"
-    }, 
-    {
-        "url": "/images/status/tables-stacks.png", 
-        "name": "tables-stacks"
-    }, 
-    {
-        "url": "/images/status/tables.png", 
-        "name": "tables"
-    }, 
-    {
-        "url": "/images/status/tag--arrow.png", 
-        "name": "tag--arrow"
-    }, 
-    {
-        "url": "/images/status/tag--exclamation.png", 
-        "name": "tag--exclamation"
-    }, 
-    {
-        "url": "/images/status/tag--minus.png", 
-        "name": "tag--minus"
-    }, 
-    {
-        "url": "/images/status/tag--pencil.png", 
-        "name": "tag--pencil"
-    }, 
-    {
-        "url": "/images/status/tag--plus.png", 
-        "name": "tag--plus"
-    }, 
-    {
-        "url": "/images/status/tag-export.png", 
-        "name": "tag-export"
-    }, 
-    {
-        "url": "/images/status/tag-import.png", 
-        "name": "tag-import"
-    }, 
-    {
-        "url": "/images/status/tag-label.png", 
-        "name": "tag-label"
-    }, 
-    {
-        "url": "/images/status/tag-small.png", 
-        "name": "tag-small"
-    }, 
-    {
-        "url": "/images/status/tag.png", 
-        "name": "tag"
-    }, 
-    {
-        "url": "/images/status/tags-label.png", 
-        "name": "tags-label"
-    }, 
-    {
-        "url": "/images/status/tags.png", 
-        "name": "tags"
-    }, 
-    {
-        "url": "/images/status/target--arrow.png", 
-        "name": "target--arrow"
-    }, 
-    {
-        "url": "/images/status/target--exclamation.png", 
-        "name": "target--exclamation"
-    }, 
-    {
-        "url": "/images/status/target--minus.png", 
-        "name": "target--minus"
-    }, 
-    {
-        "url": "/images/status/target--pencil.png", 
-        "name": "target--pencil"
-    }, 
-    {
-        "url": "/images/status/target--plus.png", 
-        "name": "target--plus"
-    }, 
-    {
-        "url": "/images/status/target.png", 
-        "name": "target"
-    }, 
-    {
-        "url": "/images/status/task--arrow.png", 
-        "name": "task--arrow"
-    }, 
-    {
-        "url": "/images/status/task--exclamation.png", 
-        "name": "task--exclamation"
-    }, 
-    {
-        "url": "/images/status/task--minus.png", 
-        "name": "task--minus"
-    }, 
-    {
-        "url": "/images/status/task--pencil.png", 
-        "name": "task--pencil"
-    }, 
-    {
-        "url": "/images/status/task--plus.png", 
-        "name": "task--plus"
-    }, 
-    {
-        "url": "/images/status/task-select-first.png", 
-        "name": "task-select-first"
-    }, 
-    {
-        "url": "/images/status/task-select-last.png", 
-        "name": "task-select-last"
-    }, 
-    {
-        "url": "/images/status/task-select.png", 
-        "name": "task-select"
-    }, 
-    {
-        "url": "/images/status/task.png", 
-        "name": "task"
-    }, 
-    {
-        "url": "/images/status/telephone--arrow.png", 
-        "name": "telephone--arrow"
-    }, 
-    {
-        "url": "/images/status/telephone--exclamation.png", 
-        "name": "telephone--exclamation"
-    }, 
-    {
-        "url": "/images/status/telephone--minus.png", 
-        "name": "telephone--minus"
-    }, 
-    {
-        "url": "/images/status/telephone--pencil.png", 
-        "name": "telephone--pencil"
-    }, 
-    {
-        "url": "/images/status/telephone--plus.png", 
-        "name": "telephone--plus"
-    }, 
-    {
-        "url": "/images/status/telephone-fax.png", 
-        "name": "telephone-fax"
-    }, 
-    {
-        "url": "/images/status/telephone-off.png", 
-        "name": "telephone-off"
-    }, 
-    {
-        "url": "/images/status/telephone.png", 
-        "name": "telephone"
-    }, 
-    {
-        "url": "/images/status/television--arrow.png", 
-        "name": "television--arrow"
-    }, 
-    {
-        "url": "/images/status/television--exclamation.png", 
-        "name": "television--exclamation"
-    }, 
-    {
-        "url": "/images/status/television--minus.png", 
-        "name": "television--minus"
-    }, 
-    {
-        "url": "/images/status/television--pencil.png", 
-        "name": "television--pencil"
-    }, 
-    {
-        "url": "/images/status/television--plus.png", 
-        "name": "television--plus"
-    }, 
-    {
-        "url": "/images/status/television-image.png", 
-        "name": "television-image"
-    }, 
-    {
-        "url": "/images/status/television-off.png", 
-        "name": "television-off"
-    }, 
-    {
-        "url": "/images/status/television.png", 
-        "name": "television"
-    }, 
-    {
-        "url": "/images/status/terminal--arrow.png", 
-        "name": "terminal--arrow"
-    }, 
-    {
-        "url": "/images/status/terminal--exclamation.png", 
-        "name": "terminal--exclamation"
-    }, 
-    {
-        "url": "/images/status/terminal--minus.png", 
-        "name": "terminal--minus"
-    }, 
-    {
-        "url": "/images/status/terminal--pencil.png", 
-        "name": "terminal--pencil"
-    }, 
-    {
-        "url": "/images/status/terminal--plus.png", 
-        "name": "terminal--plus"
-    }, 
-    {
-        "url": "/images/status/terminal.png", 
-        "name": "terminal"
-    }, 
-    {
-        "url": "/images/status/thumb-up.png", 
-        "name": "thumb-up"
-    }, 
-    {
-        "url": "/images/status/thumb.png", 
-        "name": "thumb"
-    }, 
-    {
-        "url": "/images/status/tick-button.png", 
-        "name": "tick-button"
-    }, 
-    {
-        "url": "/images/status/tick-circle-frame.png", 
-        "name": "tick-circle-frame"
-    }, 
-    {
-        "url": "/images/status/tick-circle.png", 
-        "name": "tick-circle"
-    }, 
-    {
-        "url": "/images/status/tick-octagon-frame.png", 
-        "name": "tick-octagon-frame"
-    }, 
-    {
-        "url": "/images/status/tick-octagon.png", 
-        "name": "tick-octagon"
-    }, 
-    {
-        "url": "/images/status/tick-shield.png", 
-        "name": "tick-shield"
-    }, 
-    {
-        "url": "/images/status/tick-small-circle.png", 
-        "name": "tick-small-circle"
-    }, 
-    {
-        "url": "/images/status/tick-small-white.png", 
-        "name": "tick-small-white"
-    }, 
-    {
-        "url": "/images/status/tick-small.png", 
-        "name": "tick-small"
-    }, 
-    {
-        "url": "/images/status/tick-white.png", 
-        "name": "tick-white"
-    }, 
-    {
-        "url": "/images/status/tick.png", 
-        "name": "tick"
-    }, 
-    {
-        "url": "/images/status/ticket--arrow.png", 
-        "name": "ticket--arrow"
-    }, 
-    {
-        "url": "/images/status/ticket--exclamation.png", 
-        "name": "ticket--exclamation"
-    }, 
-    {
-        "url": "/images/status/ticket--minus.png", 
-        "name": "ticket--minus"
-    }, 
-    {
-        "url": "/images/status/ticket--pencil.png", 
-        "name": "ticket--pencil"
-    }, 
-    {
-        "url": "/images/status/ticket--plus.png", 
-        "name": "ticket--plus"
-    }, 
-    {
-        "url": "/images/status/ticket-small.png", 
-        "name": "ticket-small"
-    }, 
-    {
-        "url": "/images/status/ticket-stub.png", 
-        "name": "ticket-stub"
-    }, 
-    {
-        "url": "/images/status/ticket.png", 
-        "name": "ticket"
-    }, 
-    {
-        "url": "/images/status/toggle-expand.png", 
-        "name": "toggle-expand"
-    }, 
-    {
-        "url": "/images/status/toggle-small-expand.png", 
-        "name": "toggle-small-expand"
-    }, 
-    {
-        "url": "/images/status/toggle-small.png", 
-        "name": "toggle-small"
-    }, 
-    {
-        "url": "/images/status/toggle.png", 
-        "name": "toggle"
-    }, 
-    {
-        "url": "/images/status/toolbox.png", 
-        "name": "toolbox"
-    }, 
-    {
-        "url": "/images/status/traffic-cone--arrow.png", 
-        "name": "traffic-cone--arrow"
-    }, 
-    {
-        "url": "/images/status/traffic-cone--exclamation.png", 
-        "name": "traffic-cone--exclamation"
-    }, 
-    {
-        "url": "/images/status/traffic-cone--minus.png", 
-        "name": "traffic-cone--minus"
-    }, 
-    {
-        "url": "/images/status/traffic-cone--pencil.png", 
-        "name": "traffic-cone--pencil"
-    }, 
-    {
-        "url": "/images/status/traffic-cone--plus.png", 
-        "name": "traffic-cone--plus"
-    }, 
-    {
-        "url": "/images/status/traffic-cone.png", 
-        "name": "traffic-cone"
-    }, 
-    {
-        "url": "/images/status/traffic-light--arrow.png", 
-        "name": "traffic-light--arrow"
-    }, 
-    {
-        "url": "/images/status/traffic-light--exclamation.png", 
-        "name": "traffic-light--exclamation"
-    }, 
-    {
-        "url": "/images/status/traffic-light--minus.png", 
-        "name": "traffic-light--minus"
-    }, 
-    {
-        "url": "/images/status/traffic-light--pencil.png", 
-        "name": "traffic-light--pencil"
-    }, 
-    {
-        "url": "/images/status/traffic-light--plus.png", 
-        "name": "traffic-light--plus"
-    }, 
-    {
-        "url": "/images/status/traffic-light-off.png", 
-        "name": "traffic-light-off"
-    }, 
-    {
-        "url": "/images/status/traffic-light.png", 
-        "name": "traffic-light"
-    }, 
-    {
-        "url": "/images/status/trophy--arrow.png", 
-        "name": "trophy--arrow"
-    }, 
-    {
-        "url": "/images/status/trophy--exclamation.png", 
-        "name": "trophy--exclamation"
-    }, 
-    {
-        "url": "/images/status/trophy--minus.png", 
-        "name": "trophy--minus"
-    }, 
-    {
-        "url": "/images/status/trophy--pencil.png", 
-        "name": "trophy--pencil"
-    }, 
-    {
-        "url": "/images/status/trophy--plus.png", 
-        "name": "trophy--plus"
-    }, 
-    {
-        "url": "/images/status/trophy-bronze.png", 
-        "name": "trophy-bronze"
-    }, 
-    {
-        "url": "/images/status/trophy-silver.png", 
-        "name": "trophy-silver"
-    }, 
-    {
-        "url": "/images/status/trophy.png", 
-        "name": "trophy"
-    }, 
-    {
-        "url": "/images/status/ui-accordion.png", 
-        "name": "ui-accordion"
-    }, 
-    {
-        "url": "/images/status/ui-address-bar-green.png", 
-        "name": "ui-address-bar-green"
-    }, 
-    {
-        "url": "/images/status/ui-address-bar-red.png", 
-        "name": "ui-address-bar-red"
-    }, 
-    {
-        "url": "/images/status/ui-address-bar-yellow.png", 
-        "name": "ui-address-bar-yellow"
-    }, 
-    {
-        "url": "/images/status/ui-address-bar.png", 
-        "name": "ui-address-bar"
-    }, 
-    {
-        "url": "/images/status/ui-breadcrumb.png", 
-        "name": "ui-breadcrumb"
-    }, 
-    {
-        "url": "/images/status/ui-button-default.png", 
-        "name": "ui-button-default"
-    }, 
-    {
-        "url": "/images/status/ui-button-navigation-back.png", 
-        "name": "ui-button-navigation-back"
-    }, 
-    {
-        "url": "/images/status/ui-button-navigation.png", 
-        "name": "ui-button-navigation"
-    }, 
-    {
-        "url": "/images/status/ui-button-toggle.png", 
-        "name": "ui-button-toggle"
-    }, 
-    {
-        "url": "/images/status/ui-button.png", 
-        "name": "ui-button"
-    }, 
-    {
-        "url": "/images/status/ui-buttons.png", 
-        "name": "ui-buttons"
-    }, 
-    {
-        "url": "/images/status/ui-check-box-mix.png", 
-        "name": "ui-check-box-mix"
-    }, 
-    {
-        "url": "/images/status/ui-check-box-uncheck.png", 
-        "name": "ui-check-box-uncheck"
-    }, 
-    {
-        "url": "/images/status/ui-check-box.png", 
-        "name": "ui-check-box"
-    }, 
-    {
-        "url": "/images/status/ui-check-boxes-series.png", 
-        "name": "ui-check-boxes-series"
-    }, 
-    {
-        "url": "/images/status/ui-check-boxes.png", 
-        "name": "ui-check-boxes"
-    }, 
-    {
-        "url": "/images/status/ui-color-picker-default.png", 
-        "name": "ui-color-picker-default"
-    }, 
-    {
-        "url": "/images/status/ui-color-picker-switch.png", 
-        "name": "ui-color-picker-switch"
-    }, 
-    {
-        "url": "/images/status/ui-color-picker-transparent.png", 
-        "name": "ui-color-picker-transparent"
-    }, 
-    {
-        "url": "/images/status/ui-color-picker.png", 
-        "name": "ui-color-picker"
-    }, 
-    {
-        "url": "/images/status/ui-combo-box-blue.png", 
-        "name": "ui-combo-box-blue"
-    }, 
-    {
-        "url": "/images/status/ui-combo-box-calendar.png", 
-        "name": "ui-combo-box-calendar"
-    }, 
-    {
-        "url": "/images/status/ui-combo-box-edit.png", 
-        "name": "ui-combo-box-edit"
-    }, 
-    {
-        "url": "/images/status/ui-combo-box.png", 
-        "name": "ui-combo-box"
-    }, 
-    {
-        "url": "/images/status/ui-combo-boxes.png", 
-        "name": "ui-combo-boxes"
-    }, 
-    {
-        "url": "/images/status/ui-flow.png", 
-        "name": "ui-flow"
-    }, 
-    {
-        "url": "/images/status/ui-group-box.png", 
-        "name": "ui-group-box"
-    }, 
-    {
-        "url": "/images/status/ui-label-link.png", 
-        "name": "ui-label-link"
-    }, 
-    {
-        "url": "/images/status/ui-label.png", 
-        "name": "ui-label"
-    }, 
-    {
-        "url": "/images/status/ui-labels.png", 
-        "name": "ui-labels"
-    }, 
-    {
-        "url": "/images/status/ui-layout-panel.png", 
-        "name": "ui-layout-panel"
-    }, 
-    {
-        "url": "/images/status/ui-list-box-blue.png", 
-        "name": "ui-list-box-blue"
-    }, 
-    {
-        "url": "/images/status/ui-list-box.png", 
-        "name": "ui-list-box"
-    }, 
-    {
-        "url": "/images/status/ui-menu-blue.png", 
-        "name": "ui-menu-blue"
-    }, 
-    {
-        "url": "/images/status/ui-menu.png", 
-        "name": "ui-menu"
-    }, 
-    {
-        "url": "/images/status/ui-paginator.png", 
-        "name": "ui-paginator"
-    }, 
-    {
-        "url": "/images/status/ui-progress-bar-indeterminate.png", 
-        "name": "ui-progress-bar-indeterminate"
-    }, 
-    {
-        "url": "/images/status/ui-progress-bar.png", 
-        "name": "ui-progress-bar"
-    }, 
-    {
-        "url": "/images/status/ui-radio-button-uncheck.png", 
-        "name": "ui-radio-button-uncheck"
-    }, 
-    {
-        "url": "/images/status/ui-radio-button.png", 
-        "name": "ui-radio-button"
-    }, 
-    {
-        "url": "/images/status/ui-radio-buttons.png", 
-        "name": "ui-radio-buttons"
-    }, 
-    {
-        "url": "/images/status/ui-ruler.png", 
-        "name": "ui-ruler"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-bar-horizontal.png", 
-        "name": "ui-scroll-bar-horizontal"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-bar.png", 
-        "name": "ui-scroll-bar"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-blog.png", 
-        "name": "ui-scroll-pane-blog"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-both.png", 
-        "name": "ui-scroll-pane-both"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-detail.png", 
-        "name": "ui-scroll-pane-detail"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-form.png", 
-        "name": "ui-scroll-pane-form"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-horizontal.png", 
-        "name": "ui-scroll-pane-horizontal"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-icon.png", 
-        "name": "ui-scroll-pane-icon"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-image.png", 
-        "name": "ui-scroll-pane-image"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-list.png", 
-        "name": "ui-scroll-pane-list"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-table.png", 
-        "name": "ui-scroll-pane-table"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-text-image.png", 
-        "name": "ui-scroll-pane-text-image"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-text.png", 
-        "name": "ui-scroll-pane-text"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane-tree.png", 
-        "name": "ui-scroll-pane-tree"
-    }, 
-    {
-        "url": "/images/status/ui-scroll-pane.png", 
-        "name": "ui-scroll-pane"
-    }, 
-    {
-        "url": "/images/status/ui-search-field.png", 
-        "name": "ui-search-field"
-    }, 
-    {
-        "url": "/images/status/ui-slider-050.png", 
-        "name": "ui-slider-050"
-    }, 
-    {
-        "url": "/images/status/ui-slider-100.png", 
-        "name": "ui-slider-100"
-    }, 
-    {
-        "url": "/images/status/ui-slider-vertical-050.png", 
-        "name": "ui-slider-vertical-050"
-    }, 
-    {
-        "url": "/images/status/ui-slider-vertical-100.png", 
-        "name": "ui-slider-vertical-100"
-    }, 
-    {
-        "url": "/images/status/ui-slider-vertical.png", 
-        "name": "ui-slider-vertical"
-    }, 
-    {
-        "url": "/images/status/ui-slider.png", 
-        "name": "ui-slider"
-    }, 
-    {
-        "url": "/images/status/ui-spin.png", 
-        "name": "ui-spin"
-    }, 
-    {
-        "url": "/images/status/ui-splitter-horizontal.png", 
-        "name": "ui-splitter-horizontal"
-    }, 
-    {
-        "url": "/images/status/ui-splitter.png", 
-        "name": "ui-splitter"
-    }, 
-    {
-        "url": "/images/status/ui-status-bar-blue.png", 
-        "name": "ui-status-bar-blue"
-    }, 
-    {
-        "url": "/images/status/ui-status-bar.png", 
-        "name": "ui-status-bar"
-    }, 
-    {
-        "url": "/images/status/ui-tab--arrow.png", 
-        "name": "ui-tab--arrow"
-    }, 
-    {
-        "url": "/images/status/ui-tab--exclamation.png", 
-        "name": "ui-tab--exclamation"
-    }, 
-    {
-        "url": "/images/status/ui-tab--minus.png", 
-        "name": "ui-tab--minus"
-    }, 
-    {
-        "url": "/images/status/ui-tab--pencil.png", 
-        "name": "ui-tab--pencil"
-    }, 
-    {
-        "url": "/images/status/ui-tab--plus.png", 
-        "name": "ui-tab--plus"
-    }, 
-    {
-        "url": "/images/status/ui-tab-bottom.png", 
-        "name": "ui-tab-bottom"
-    }, 
-    {
-        "url": "/images/status/ui-tab-content.png", 
-        "name": "ui-tab-content"
-    }, 
-    {
-        "url": "/images/status/ui-tab-side.png", 
-        "name": "ui-tab-side"
-    }, 
-    {
-        "url": "/images/status/ui-tab.png", 
-        "name": "ui-tab"
-    }, 
-    {
-        "url": "/images/status/ui-text-field-hidden.png", 
-        "name": "ui-text-field-hidden"
-    }, 
-    {
-        "url": "/images/status/ui-text-field-password.png", 
-        "name": "ui-text-field-password"
-    }, 
-    {
-        "url": "/images/status/ui-text-field-select.png", 
-        "name": "ui-text-field-select"
-    }, 
-    {
-        "url": "/images/status/ui-text-field-suggestion.png", 
-        "name": "ui-text-field-suggestion"
-    }, 
-    {
-        "url": "/images/status/ui-text-field.png", 
-        "name": "ui-text-field"
-    }, 
-    {
-        "url": "/images/status/ui-toolbar--arrow.png", 
-        "name": "ui-toolbar--arrow"
-    }, 
-    {
-        "url": "/images/status/ui-toolbar--exclamation.png", 
-        "name": "ui-toolbar--exclamation"
-    }, 
-    {
-        "url": "/images/status/ui-toolbar--minus.png", 
-        "name": "ui-toolbar--minus"
-    }, 
-    {
-        "url": "/images/status/ui-toolbar--pencil.png", 
-        "name": "ui-toolbar--pencil"
-    }, 
-    {
-        "url": "/images/status/ui-toolbar--plus.png", 
-        "name": "ui-toolbar--plus"
-    }, 
-    {
-        "url": "/images/status/ui-toolbar-bookmark.png", 
-        "name": "ui-toolbar-bookmark"
-    }, 
-    {
-        "url": "/images/status/ui-toolbar.png", 
-        "name": "ui-toolbar"
-    }, 
-    {
-        "url": "/images/status/ui-tooltip-balloon.png", 
-        "name": "ui-tooltip-balloon"
-    }, 
-    {
-        "url": "/images/status/ui-tooltip.png", 
-        "name": "ui-tooltip"
-    }, 
-    {
-        "url": "/images/status/umbrella--arrow.png", 
-        "name": "umbrella--arrow"
-    }, 
-    {
-        "url": "/images/status/umbrella--exclamation.png", 
-        "name": "umbrella--exclamation"
-    }, 
-    {
-        "url": "/images/status/umbrella--minus.png", 
-        "name": "umbrella--minus"
-    }, 
-    {
-        "url": "/images/status/umbrella--pencil.png", 
-        "name": "umbrella--pencil"
-    }, 
-    {
-        "url": "/images/status/umbrella--plus.png", 
-        "name": "umbrella--plus"
-    }, 
-    {
-        "url": "/images/status/umbrella.png", 
-        "name": "umbrella"
-    }, 
-    {
-        "url": "/images/status/universal.png", 
-        "name": "universal"
-    }, 
-    {
-        "url": "/images/status/usb-flash-drive--arrow.png", 
-        "name": "usb-flash-drive--arrow"
-    }, 
-    {
-        "url": "/images/status/usb-flash-drive--exclamation.png", 
-        "name": "usb-flash-drive--exclamation"
-    }, 
-    {
-        "url": "/images/status/usb-flash-drive--minus.png", 
-        "name": "usb-flash-drive--minus"
-    }, 
-    {
-        "url": "/images/status/usb-flash-drive--pencil.png", 
-        "name": "usb-flash-drive--pencil"
-    }, 
-    {
-        "url": "/images/status/usb-flash-drive--plus.png", 
-        "name": "usb-flash-drive--plus"
-    }, 
-    {
-        "url": "/images/status/usb-flash-drive.png", 
-        "name": "usb-flash-drive"
-    }, 
-    {
-        "url": "/images/status/user--arrow.png", 
-        "name": "user--arrow"
-    }, 
-    {
-        "url": "/images/status/user--exclamation.png", 
-        "name": "user--exclamation"
-    }, 
-    {
-        "url": "/images/status/user--minus.png", 
-        "name": "user--minus"
-    }, 
-    {
-        "url": "/images/status/user--pencil.png", 
-        "name": "user--pencil"
-    }, 
-    {
-        "url": "/images/status/user--plus.png", 
-        "name": "user--plus"
-    }, 
-    {
-        "url": "/images/status/user-black-female.png", 
-        "name": "user-black-female"
-    }, 
-    {
-        "url": "/images/status/user-black.png", 
-        "name": "user-black"
-    }, 
-    {
-        "url": "/images/status/user-business-boss.png", 
-        "name": "user-business-boss"
-    }, 
-    {
-        "url": "/images/status/user-business-gray-boss.png", 
-        "name": "user-business-gray-boss"
-    }, 
-    {
-        "url": "/images/status/user-business-gray.png", 
-        "name": "user-business-gray"
-    }, 
-    {
-        "url": "/images/status/user-business.png", 
-        "name": "user-business"
-    }, 
-    {
-        "url": "/images/status/user-detective-gray.png", 
-        "name": "user-detective-gray"
-    }, 
-    {
-        "url": "/images/status/user-detective.png", 
-        "name": "user-detective"
-    }, 
-    {
-        "url": "/images/status/user-female.png", 
-        "name": "user-female"
-    }, 
-    {
-        "url": "/images/status/user-gray-female.png", 
-        "name": "user-gray-female"
-    }, 
-    {
-        "url": "/images/status/user-gray.png", 
-        "name": "user-gray"
-    }, 
-    {
-        "url": "/images/status/user-green-female.png", 
-        "name": "user-green-female"
-    }, 
-    {
-        "url": "/images/status/user-green.png", 
-        "name": "user-green"
-    }, 
-    {
-        "url": "/images/status/user-medium-female.png", 
-        "name": "user-medium-female"
-    }, 
-    {
-        "url": "/images/status/user-medium.png", 
-        "name": "user-medium"
-    }, 
-    {
-        "url": "/images/status/user-nude-female.png", 
-        "name": "user-nude-female"
-    }, 
-    {
-        "url": "/images/status/user-nude.png", 
-        "name": "user-nude"
-    }, 
-    {
-        "url": "/images/status/user-red-female.png", 
-        "name": "user-red-female"
-    }, 
-    {
-        "url": "/images/status/user-red.png", 
-        "name": "user-red"
-    }, 
-    {
-        "url": "/images/status/user-silhouette-question.png", 
-        "name": "user-silhouette-question"
-    }, 
-    {
-        "url": "/images/status/user-silhouette.png", 
-        "name": "user-silhouette"
-    }, 
-    {
-        "url": "/images/status/user-small-female.png", 
-        "name": "user-small-female"
-    }, 
-    {
-        "url": "/images/status/user-small.png", 
-        "name": "user-small"
-    }, 
-    {
-        "url": "/images/status/user-thief-baldie.png", 
-        "name": "user-thief-baldie"
-    }, 
-    {
-        "url": "/images/status/user-thief-female.png", 
-        "name": "user-thief-female"
-    }, 
-    {
-        "url": "/images/status/user-thief.png", 
-        "name": "user-thief"
-    }, 
-    {
-        "url": "/images/status/user-white-female.png", 
-        "name": "user-white-female"
-    }, 
-    {
-        "url": "/images/status/user-white.png", 
-        "name": "user-white"
-    }, 
-    {
-        "url": "/images/status/user-worker-boss.png", 
-        "name": "user-worker-boss"
-    }, 
-    {
-        "url": "/images/status/user-worker.png", 
-        "name": "user-worker"
-    }, 
-    {
-        "url": "/images/status/user-yellow-female.png", 
-        "name": "user-yellow-female"
-    }, 
-    {
-        "url": "/images/status/user-yellow.png", 
-        "name": "user-yellow"
-    }, 
-    {
-        "url": "/images/status/user.png", 
-        "name": "user"
-    }, 
-    {
-        "url": "/images/status/users.png", 
-        "name": "users"
-    }, 
-    {
-        "url": "/images/status/validation-document.png", 
-        "name": "validation-document"
-    }, 
-    {
-        "url": "/images/status/validation-invalid-document.png", 
-        "name": "validation-invalid-document"
-    }, 
-    {
-        "url": "/images/status/validation-invalid.png", 
-        "name": "validation-invalid"
-    }, 
-    {
-        "url": "/images/status/validation-label-html.png", 
-        "name": "validation-label-html"
-    }, 
-    {
-        "url": "/images/status/validation-label.png", 
-        "name": "validation-label"
-    }, 
-    {
-        "url": "/images/status/validation-valid-document.png", 
-        "name": "validation-valid-document"
-    }, 
-    {
-        "url": "/images/status/validation-valid.png", 
-        "name": "validation-valid"
-    }, 
-    {
-        "url": "/images/status/validation.png", 
-        "name": "validation"
-    }, 
-    {
-        "url": "/images/status/vise-drawer.png", 
-        "name": "vise-drawer"
-    }, 
-    {
-        "url": "/images/status/vise.png", 
-        "name": "vise"
-    }, 
-    {
-        "url": "/images/status/wall--arrow.png", 
-        "name": "wall--arrow"
-    }, 
-    {
-        "url": "/images/status/wall--exclamation.png", 
-        "name": "wall--exclamation"
-    }, 
-    {
-        "url": "/images/status/wall--minus.png", 
-        "name": "wall--minus"
-    }, 
-    {
-        "url": "/images/status/wall--pencil.png", 
-        "name": "wall--pencil"
-    }, 
-    {
-        "url": "/images/status/wall--plus.png", 
-        "name": "wall--plus"
-    }, 
-    {
-        "url": "/images/status/wall-break.png", 
-        "name": "wall-break"
-    }, 
-    {
-        "url": "/images/status/wall-brick.png", 
-        "name": "wall-brick"
-    }, 
-    {
-        "url": "/images/status/wall-small-brick.png", 
-        "name": "wall-small-brick"
-    }, 
-    {
-        "url": "/images/status/wall-small.png", 
-        "name": "wall-small"
-    }, 
-    {
-        "url": "/images/status/wall.png", 
-        "name": "wall"
-    }, 
-    {
-        "url": "/images/status/wallet--arrow.png", 
-        "name": "wallet--arrow"
-    }, 
-    {
-        "url": "/images/status/wallet--exclamation.png", 
-        "name": "wallet--exclamation"
-    }, 
-    {
-        "url": "/images/status/wallet--minus.png", 
-        "name": "wallet--minus"
-    }, 
-    {
-        "url": "/images/status/wallet--pencil.png", 
-        "name": "wallet--pencil"
-    }, 
-    {
-        "url": "/images/status/wallet--plus.png", 
-        "name": "wallet--plus"
-    }, 
-    {
-        "url": "/images/status/wallet.png", 
-        "name": "wallet"
-    }, 
-    {
-        "url": "/images/status/wand--arrow.png", 
-        "name": "wand--arrow"
-    }, 
-    {
-        "url": "/images/status/wand--exclamation.png", 
-        "name": "wand--exclamation"
-    }, 
-    {
-        "url": "/images/status/wand--minus.png", 
-        "name": "wand--minus"
-    }, 
-    {
-        "url": "/images/status/wand--pencil.png", 
-        "name": "wand--pencil"
-    }, 
-    {
-        "url": "/images/status/wand--plus.png", 
-        "name": "wand--plus"
-    }, 
-    {
-        "url": "/images/status/wand-hat.png", 
-        "name": "wand-hat"
-    }, 
-    {
-        "url": "/images/status/wand-small.png", 
-        "name": "wand-small"
-    }, 
-    {
-        "url": "/images/status/wand.png", 
-        "name": "wand"
-    }, 
-    {
-        "url": "/images/status/water--arrow.png", 
-        "name": "water--arrow"
-    }, 
-    {
-        "url": "/images/status/water--exclamation.png", 
-        "name": "water--exclamation"
-    }, 
-    {
-        "url": "/images/status/water--minus.png", 
-        "name": "water--minus"
-    }, 
-    {
-        "url": "/images/status/water--pencil.png", 
-        "name": "water--pencil"
-    }, 
-    {
-        "url": "/images/status/water--plus.png", 
-        "name": "water--plus"
-    }, 
-    {
-        "url": "/images/status/water.png", 
-        "name": "water"
-    }, 
-    {
-        "url": "/images/status/weather-cloud.png", 
-        "name": "weather-cloud"
-    }, 
-    {
-        "url": "/images/status/weather-clouds.png", 
-        "name": "weather-clouds"
-    }, 
-    {
-        "url": "/images/status/weather-cloudy.png", 
-        "name": "weather-cloudy"
-    }, 
-    {
-        "url": "/images/status/weather-fog.png", 
-        "name": "weather-fog"
-    }, 
-    {
-        "url": "/images/status/weather-lightning.png", 
-        "name": "weather-lightning"
-    }, 
-    {
-        "url": "/images/status/weather-moon-clouds.png", 
-        "name": "weather-moon-clouds"
-    }, 
-    {
-        "url": "/images/status/weather-moon-fog.png", 
-        "name": "weather-moon-fog"
-    }, 
-    {
-        "url": "/images/status/weather-moon.png", 
-        "name": "weather-moon"
-    }, 
-    {
-        "url": "/images/status/weather-rain.png", 
-        "name": "weather-rain"
-    }, 
-    {
-        "url": "/images/status/weather-snow.png", 
-        "name": "weather-snow"
-    }, 
-    {
-        "url": "/images/status/weather.png", 
-        "name": "weather"
-    }, 
-    {
-        "url": "/images/status/webcam--arrow.png", 
-        "name": "webcam--arrow"
-    }, 
-    {
-        "url": "/images/status/webcam--exclamation.png", 
-        "name": "webcam--exclamation"
-    }, 
-    {
-        "url": "/images/status/webcam--minus.png", 
-        "name": "webcam--minus"
-    }, 
-    {
-        "url": "/images/status/webcam--pencil.png", 
-        "name": "webcam--pencil"
-    }, 
-    {
-        "url": "/images/status/webcam--plus.png", 
-        "name": "webcam--plus"
-    }, 
-    {
-        "url": "/images/status/webcam-network.png", 
-        "name": "webcam-network"
-    }, 
-    {
-        "url": "/images/status/webcam.png", 
-        "name": "webcam"
-    }, 
-    {
-        "url": "/images/status/wheel.png", 
-        "name": "wheel"
-    }, 
-    {
-        "url": "/images/status/wooden-box--arrow.png", 
-        "name": "wooden-box--arrow"
-    }, 
-    {
-        "url": "/images/status/wooden-box--exclamation.png", 
-        "name": "wooden-box--exclamation"
-    }, 
-    {
-        "url": "/images/status/wooden-box--minus.png", 
-        "name": "wooden-box--minus"
+        "url": "/images/status/traffic-cone--exclamation.png", 
+        "name": "traffic-cone--exclamation"
     }, 
     {
-        "url": "/images/status/wooden-box--pencil.png", 
-        "name": "wooden-box--pencil"
+        "url": "/images/status/traffic-cone--minus.png", 
+        "name": "traffic-cone--minus"
     }, 
     {
-        "url": "/images/status/wooden-box--plus.png", 
-        "name": "wooden-box--plus"
+        "url": "/images/status/traffic-cone--pencil.png", 
+        "name": "traffic-cone--pencil"
     }, 
     {
-        "url": "/images/status/wooden-box-label.png", 
-        "name": "wooden-box-label"
+        "url": "/images/status/traffic-cone--plus.png", 
+        "name": "traffic-cone--plus"
     }, 
     {
-        "url": "/images/status/wooden-box.png", 
-        "name": "wooden-box"
+        "url": "/images/status/traffic-cone.png", 
+        "name": "traffic-cone"
     }, 
     {
         "url": "/images/status/wrench--arrow.png", 
@@ -10458,77 +578,5 @@ images = [
     {
         "url": "/images/status/wrench.png", 
         "name": "wrench"
-    }, 
-    {
-        "url": "/images/status/xfn-colleague-met.png", 
-        "name": "xfn-colleague-met"
-    }, 
-    {
-        "url": "/images/status/xfn-colleague.png", 
-        "name": "xfn-colleague"
-    }, 
-    {
-        "url": "/images/status/xfn-friend-met.png", 
-        "name": "xfn-friend-met"
-    }, 
-    {
-        "url": "/images/status/xfn-friend.png", 
-        "name": "xfn-friend"
-    }, 
-    {
-        "url": "/images/status/xfn-sweetheart-met.png", 
-        "name": "xfn-sweetheart-met"
-    }, 
-    {
-        "url": "/images/status/xfn-sweetheart.png", 
-        "name": "xfn-sweetheart"
-    }, 
-    {
-        "url": "/images/status/xfn.png", 
-        "name": "xfn"
-    }, 
-    {
-        "url": "/images/status/yin-yang.png", 
-        "name": "yin-yang"
-    }, 
-    {
-        "url": "/images/status/zone--arrow.png", 
-        "name": "zone--arrow"
-    }, 
-    {
-        "url": "/images/status/zone--exclamation.png", 
-        "name": "zone--exclamation"
-    }, 
-    {
-        "url": "/images/status/zone--minus.png", 
-        "name": "zone--minus"
-    }, 
-    {
-        "url": "/images/status/zone--pencil.png", 
-        "name": "zone--pencil"
-    }, 
-    {
-        "url": "/images/status/zone--plus.png", 
-        "name": "zone--plus"
-    }, 
-    {
-        "url": "/images/status/zone-money.png", 
-        "name": "zone-money"
-    }, 
-    {
-        "url": "/images/status/zone-select.png", 
-        "name": "zone-select"
-    }, 
-    {
-        "url": "/images/status/zone.png", 
-        "name": "zone"
-    }, 
-    {
-        "url": "/images/status/zones-stack.png", 
-        "name": "zones-stack"
-    }, 
-    {
-        "url": "/images/status/zones.png", 
-        "name": "zones"
     }
 ]
@@ -0,0 +1,157 @@
+# Copyright (c) 2010 Twilio Inc.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+The catalog of status images
+
+status_images lists far more icons than ship in static/images/status, so
+the catalog only keeps the ones whose file exists, and adds any file the
+list is missing. App Engine doesn't let the app read static files, so
+this happens ahead of time: run
+
+    python utils/images.py
+
+after adding or removing icons to rewrite utils/external/status_images.py.
+
+Each image is encoded to JSON once, with a marker where
+the host goes, so serving the catalog is a join and a replace.
+"""
+
+import bisect
+import logging
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if __name__ == "__main__":
+    sys.path.insert(0, ROOT_DIR)
+    sys.path.insert(1, os.path.join(ROOT_DIR, "utils", "external"))
+
+import simplejson
+
+URL_PATH = "/images/status/"
+
+# Stands in for the host. JSON encoding escapes NUL everywhere else, so it
+# can't occur in an encoded name or path.
+HOST = "\x00"
+
+class ImageCatalog(object):
+    """
+    An immutable, pre-encoded list of status images, sorted by name.
+    """
+
+    def __init__(self, images):
+        images = sorted(images, key=lambda i: i["name"].lower())
+        self.names = tuple([i["name"] for i in images])
+        self.index = tuple([n.lower() for n in self.names])
+        self.encoded = tuple([self.encode(i) for i in images])
+
+    @staticmethod
+    def encode(image):
+        return '{"name": %s, "url": "%s%s}' % (simplejson.dumps(image["name"]),
+            HOST, simplejson.dumps(image["url"])[1:])
+
+    def __len__(self):
+        return len(self.names)
+
+    def find(self, prefix=None, q=None):
+        """ Return the positions of the images whose name starts with
+        prefix and contains q, ignoring case. """
+        start, end = 0, len(self.index)
+        if prefix:
+            prefix = prefix.lower()
+            start = bisect.bisect_left(self.index, prefix)
+            end = bisect.bisect_left(self.index, prefix + u"\uffff", start)
+
+        if not q:
+            return range(start, end)
+
+        q = q.lower()
+        return [i for i in range(start, end) if q in self.index[i]]
+
+    def json(self, positions, host, extra=""):
+        """ Return the images at the given positions as a JSON object, with
+        host put in front of every url.
+
+        Arguments:
+        positions   -- list: Positions returned by find
+        host        -- string: Scheme and host, e.g. "http://example.com"
+        extra       -- string: Encoded members to add to the object
+
+        """
+        body = '{"images": [' + ", ".join([self.encoded[i] for i in positions])
+        body = body.replace(HOST, simplejson.dumps(host)[1:-1])
+        return body + "]" + extra + "}"
+
+def reconcile(images, directory):
+    """ Keep the images that exist in directory, and add the files in
+    directory that images doesn't list. """
+    try:
+        files = set([f for f in os.listdir(directory) if f.endswith(".png")])
+    except OSError:
+        logging.error("Status image directory %s is missing", directory)
+        return []
+
+    found = []
+    listed = set()
+    for image in images:
+        filename = image["url"][len(URL_PATH):]
+        if image["url"].startswith(URL_PATH) and filename in files \
+                and filename not in listed:
+            found.append({"name": image["name"], "url": image["url"]})
+            listed.add(filename)
+
+    for filename in sorted(files - listed):
+        found.append({"name": filename[:-len(".png")],
+            "url": URL_PATH + filename})
+
+    logging.debug("Status image catalog has %d of %d listed images, plus %d "
+        "unlisted files", len(listed), len(images), len(files - listed))
+    return found
+
+DIRECTORY = os.path.join(ROOT_DIR, "static", "images", "status")
+DATA_FILE = os.path.join(ROOT_DIR, "utils", "external", "status_images.py")
+
+_catalog = None
+
+def catalog():
+    """ Return this instance's catalog, building it on first use"""
+    global _catalog
+    if _catalog is None:
+        import status_images
+        _catalog = ImageCatalog(status_images.images)
+    return _catalog
+
+def main():
+    import status_images
+    images = reconcile(status_images.images, DIRECTORY)
+
+    # Keep the license header, replace the list
+    source = open(DATA_FILE).read()
+    header = source[:source.index("images = [")]
+
+    out = open(DATA_FILE, "w")
+    out.write(header + "images = " + simplejson.dumps(images, indent=4) + "\n")
+    out.close()
+    print "Wrote %d images to %s" % (len(images), DATA_FILE)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Copyright (c) 2010 Twilio Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Content patterns for service pings
+
+Patterns are compiled once per service and instance, checked for the
+nested repeats that make backtracking explode before they are saved, and
+matched against at most config.PATTERN_MAX_BYTES of a page.
+"""
+
+import re
+import sre_parse
+import sre_constants
+
+from utils.cache import LRUCache
+import config
+
+MAX_PATTERN_LENGTH = 1000
+
+# Repeats with more than this many iterations count as unbounded
+MAX_BOUNDED_REPEAT = 100
+
+REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+
+# Service key to (pattern, compiled pattern)
+compiled_patterns = LRUCache(1000)
+
+class InvalidPattern(Exception):
+    pass
+
+def nested_repeat(parsed, repeated=False):
+    """ Whether an unbounded repeat appears inside another one, which
+    is what makes patterns like (a+)+ take exponential time. """
+    for op, av in parsed:
+        if op in REPEATS:
+            low, high, body = av
+            unbounded = high > MAX_BOUNDED_REPEAT
+            if unbounded and repeated:
+                return True
+            if nested_repeat(body, repeated or unbounded):
+                return True
+        elif op == sre_constants.SUBPATTERN:
+            if nested_repeat(av[-1], repeated):
+                return True
+        elif op == sre_constants.BRANCH:
+            for branch in av[1]:
+                if nested_repeat(branch, repeated):
+                    return True
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            if nested_repeat(av[1], repeated):
+                return True
+    return False
+
+def validate(pattern):
+    """ Raise InvalidPattern if the pattern can't be used for pings"""
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        raise InvalidPattern("longer than %d characters" %
+            MAX_PATTERN_LENGTH)
+
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (sre_constants.error, OverflowError), e:
+        raise InvalidPattern(str(e))
+
+    if nested_repeat(parsed):
+        raise InvalidPattern("nested repeats can take too long to match")
+
+def compiled(service_key, pattern):
+    """ The compiled pattern of a service, compiling it only when the
+    service's pattern has changed """
+    key = str(service_key)
+    cached = compiled_patterns.get(key)
+    if cached and cached[0] == pattern:
+        return cached[1]
+
+    regex = re.compile(pattern)
+    compiled_patterns.set(key, (pattern, regex))
+    return regex
+
+def forget(service_key):
+    """ Drop a service's compiled pattern after the pattern is changed"""
+    compiled_patterns.delete(str(service_key))
+
+def search(regex, content, limit=None):
+    """ Whether regex matches the first limit bytes of content, which
+    defaults to config.PATTERN_MAX_BYTES. Stops at the first match.
+
+    The page is searched in one go, so $, \\Z, \\b and lookaheads see the
+    end of the string only where the capped content ends. The cap and
+    validate's ban on nested repeats bound the time a search takes.
+    """
+    end = min(len(content), limit or config.PATTERN_MAX_BYTES)
+    return regex.search(content, 0, end) is not None
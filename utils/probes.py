@@ -0,0 +1,145 @@
+# Copyright (c) 2010 Twilio Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Concurrent service probes
+
+Probes are fetched with asynchronous urlfetch calls, so a round of probes
+takes about as long as its slowest probe instead of the sum of them all.
+A failed fetch is retried straight away rather than after a sleep, while
+the other probes keep running.
+"""
+
+import logging
+import time
+import urlparse
+from collections import deque
+
+from google.appengine.api import urlfetch
+from google.appengine.api import apiproxy_stub_map
+
+# Fetches running at once, in total and against any one host
+MAX_CONCURRENT_PROBES = 10
+MAX_PROBES_PER_HOST = 2
+
+# Seconds a single fetch may take, and fetches tried per probe
+PROBE_DEADLINE = 10
+PROBE_ATTEMPTS = 3
+
+class Probe(object):
+    """
+    One URL to fetch. Once run, response holds the urlfetch response, or
+    None if every attempt failed, in which case error holds the last
+    exception. latency is how long the last attempt took, in seconds.
+    """
+
+    def __init__(self, url, key=None):
+        self.url = url
+        self.key = key
+        self.host = urlparse.urlparse(url)[1].lower()
+        self.attempts = 0
+        self.response = None
+        self.error = None
+        self.started = None
+        self.latency = None
+
+class ProbeExecutor(object):
+    """
+    Runs probes as asynchronous fetches, at most max_concurrent at once and
+    at most per_host against the same host.
+    """
+
+    def __init__(self, max_concurrent=MAX_CONCURRENT_PROBES,
+            per_host=MAX_PROBES_PER_HOST, deadline=PROBE_DEADLINE,
+            attempts=PROBE_ATTEMPTS):
+        self.max_concurrent = max_concurrent
+        self.per_host = per_host
+        self.deadline = deadline
+        self.attempts = attempts
+
+    def run(self, probes):
+        """ Fetch every probe and return them, once all have finished"""
+        pending = deque(probes)
+        running = []
+        hosts = {}
+
+        while pending or running:
+            # Start whatever the limits allow, leaving probes of busy hosts
+            # in the queue for later
+            waiting = deque()
+            while pending and len(running) < self.max_concurrent:
+                probe = pending.popleft()
+                if hosts.get(probe.host, 0) >= self.per_host:
+                    waiting.append(probe)
+                    continue
+                try:
+                    rpc = self.start(probe)
+                except Exception, e:
+                    # Such as a malformed URL, which retrying won't fix
+                    logging.error('fetch of %s failed: %s', probe.url, e)
+                    probe.error = e
+                    continue
+                running.append((rpc, probe))
+                hosts[probe.host] = hosts.get(probe.host, 0) + 1
+            waiting.extend(pending)
+            pending = waiting
+
+            if not running:
+                continue
+
+            rpc, probe = self.wait(running)
+            running.remove((rpc, probe))
+            hosts[probe.host] -= 1
+            probe.latency = time.time() - probe.started
+
+            try:
+                probe.response = rpc.get_result()
+                probe.error = None
+            except Exception, e:
+                logging.error('fetch num %d of %s failed: %s',
+                    probe.attempts, probe.url, e)
+                probe.error = e
+                if probe.attempts < self.attempts:
+                    pending.append(probe)
+
+        return probes
+
+    def start(self, probe):
+        probe.attempts += 1
+        probe.started = time.time()
+        rpc = urlfetch.create_rpc(deadline=self.deadline)
+        # Only the start of a page is searched, see utils/patterns.py
+        urlfetch.make_fetch_call(rpc, probe.url, allow_truncated=True)
+        return rpc
+
+    def wait(self, running):
+        """ Wait for one of the running fetches to finish and return it.
+        SDKs without UserRPC.wait_any wait for the oldest instead, which
+        still overlaps the fetches, just with less eager retries. """
+        wait_any = getattr(apiproxy_stub_map.UserRPC, "wait_any", None)
+        if wait_any:
+            rpc = wait_any([r for r, p in running])
+            for r, p in running:
+                if r is rpc:
+                    return r, p
+
+        rpc, probe = running[0]
+        rpc.wait()
+        return rpc, probe
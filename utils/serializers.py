@@ -0,0 +1,139 @@
+# Copyright (c) 2010 Twilio Inc.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Declarative REST serializers
+
+Each model declares its representation once, as a list of fields and
+relations. A Context carries what the client asked for:
+
+fields -- the names to include, e.g. ["name", "current-event.status"].
+          None includes everything.
+embed  -- the relations to include in full, e.g. ["current-event"].
+          Relations that aren't embedded are returned as a small
+          reference instead, built without loading the related entity.
+          None embeds everything.
+
+Dotted names reach into relations, so "current-event.status" means the
+status of the current event.
+"""
+
+def split_names(value):
+    """ Parse a comma separated query parameter. Absent (None) stays None,
+    and an empty value means no names at all. """
+    if value is None:
+        return None
+    return [n.strip() for n in value.split(",") if n.strip()]
+
+class Context(object):
+    """
+    What to serialize, and the shared state the serializers need.
+    """
+
+    def __init__(self, base_url, fields=None, embed=None, statuses=None):
+        self.base_url = base_url
+        self.fields = fields
+        self.embed = embed
+        self.statuses = statuses
+
+    def wants(self, name):
+        if self.fields is None:
+            return True
+        prefix = name + "."
+        for field in self.fields:
+            if field == name or field.startswith(prefix):
+                return True
+        return False
+
+    def embeds(self, name):
+        return self.embed is None or self.nested_names(self.embed, name) \
+            is not None
+
+    @staticmethod
+    def nested_names(names, name):
+        """ The names under name, or None if name isn't in names. An empty
+        list means name itself was given without any dotted names. """
+        if names is None:
+            return None
+        prefix = name + "."
+        nested = None
+        for n in names:
+            if n == name:
+                nested = nested or []
+            elif n.startswith(prefix):
+                nested = (nested or []) + [n[len(prefix):]]
+        return nested
+
+    def nested(self, name):
+        """ The context for the relation called name"""
+        fields = None
+        if self.fields is not None:
+            fields = self.nested_names(self.fields, name) or None
+
+        embed = None
+        if self.embed is not None:
+            embed = self.nested_names(self.embed, name) or []
+
+        return Context(self.base_url, fields, embed, self.statuses)
+
+class Field(object):
+    """
+    A value computed from the object by get(obj, context). Optional fields
+    are left out when the value is None.
+    """
+
+    def __init__(self, name, get, optional=False):
+        self.name = name
+        self.get = get
+        self.optional = optional
+
+    def value(self, obj, context):
+        return self.get(obj, context)
+
+class Relation(Field):
+    """
+    A related object, built in full by get(obj, context) when embedded and
+    by reference(obj, context) otherwise.
+    """
+
+    def __init__(self, name, get, reference):
+        Field.__init__(self, name, get)
+        self.reference = reference
+
+    def value(self, obj, context):
+        if context.embeds(self.name):
+            return self.get(obj, context.nested(self.name))
+        return self.reference(obj, context)
+
+class Serializer(object):
+
+    def __init__(self, fields):
+        self.fields = fields
+
+    def serialize(self, obj, context):
+        m = {}
+        for field in self.fields:
+            if not context.wants(field.name):
+                continue
+            value = field.value(obj, context)
+            if value is None and field.optional:
+                continue
+            m[field.name] = value
+        return m
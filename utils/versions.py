@@ -0,0 +1,83 @@
+# Copyright (c) 2010 Twilio Inc.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Version tags for API resources
+
+Every resource depends on a few tags, such as the list of services or one
+service and its events. Each tag has a version in memcache, which is the
+time in microseconds of the last write to anything under it. Writers bump
+the tags they touch after they commit, and readers compare versions
+instead of running queries.
+
+If memcache loses a tag it starts again from the clock, which is always
+newer than any version handed out before.
+"""
+
+import time
+
+from google.appengine.api import memcache
+
+SERVICES = "services"
+STATUSES = "statuses"
+
+def service(service_slug):
+    """ The tag for one service, its events and its summaries"""
+    return "service:" + service_slug
+
+def status(status_slug):
+    """ The tag for one status. STATUSES covers the list of them all."""
+    return "status:" + status_slug
+
+def ping_shard(shard):
+    """ The tag for the ping schedule of one shard"""
+    return "ping-shard:%d" % shard
+
+def now():
+    return int(time.time() * 1000000)
+
+def get(tags):
+    """ Return a dict of tag to version, starting any missing tags"""
+    versions = memcache.get_multi(tags, key_prefix="version:")
+
+    missing = [t for t in tags if t not in versions]
+    if missing:
+        stamp = now()
+        memcache.add_multi(dict((t, stamp) for t in missing),
+            key_prefix="version:")
+        # Another request may have started the tags first
+        added = memcache.get_multi(missing, key_prefix="version:")
+        for tag in missing:
+            versions[tag] = added.get(tag, stamp)
+
+    return versions
+
+def bump(*tags):
+    """ Mark everything under the given tags as changed"""
+    tags = list(tags)
+    current = memcache.get_multi(tags, key_prefix="version:")
+    stamp = now()
+
+    # Never go backwards, even if this instance's clock is behind
+    versions = {}
+    for tag in tags:
+        versions[tag] = max(stamp, current.get(tag, 0) + 1)
+
+    memcache.set_multi(versions, key_prefix="version:")